@@ -0,0 +1,9 @@
+# backend/benchmarks/__init__.py
+"""
+ArcoirisPOS benchmark tooling.
+
+Everything in this package runs from the backend directory, next to
+seed_dev_data.py, e.g.:
+
+    python -m benchmarks.scale_data --profile medium --workers 8
+"""
@@ -0,0 +1,11 @@
+# backend/benchmarks/loadtest/__init__.py
+"""
+End-to-end load harness for the POS API.
+
+Virtual users are asyncio tasks sharing one httpx.AsyncClient, either
+against a running server (--base-url) or in-process via ASGITransport.
+"""
+
+from benchmarks.loadtest.runner import LoadTestConfig, run
+
+__all__ = ["LoadTestConfig", "run"]
@@ -0,0 +1,99 @@
+# backend/benchmarks/loadtest/__main__.py
+"""
+Run a POS load test and print / save the JSON report.
+
+    # In-process (no server needed)
+    python -m benchmarks.loadtest --concurrency 50 --duration 120 -o before.json
+
+    # Against a running server
+    python -m benchmarks.loadtest --base-url http://localhost:8000 --mix cashier_checkout=1
+
+Exits 1 if any scenario had an iteration with a failed (non-2xx) request.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from typing import Dict, Sequence
+
+from benchmarks.loadtest.runner import DEFAULT_MIX, LoadTestConfig, run
+from benchmarks.scale_data import DEFAULT_PASSWORD, bench_admin_email
+
+
+def parse_mix(raw: str) -> Dict[str, float]:
+    """'cashier_checkout=6,terminal_sync=2' -> {'cashier_checkout': 6.0, ...}"""
+    mix = {}
+    for part in raw.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight) if weight else 1.0
+    return mix
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="ArcoirisPOS load test harness.")
+    parser.add_argument("--base-url", help="Target server; omit to run the app in-process (ASGI)")
+    parser.add_argument("--email", default=bench_admin_email(0))
+    parser.add_argument("--password", default=DEFAULT_PASSWORD)
+    parser.add_argument("--org-id", help="X-Org-ID to send (looked up from the DB when omitted)")
+    parser.add_argument("--concurrency", type=int, default=20, help="Virtual users")
+    parser.add_argument("--ramp", type=float, default=10.0, help="Seconds to start all users")
+    parser.add_argument("--duration", type=float, default=60.0, help="Total seconds, including ramp")
+    parser.add_argument("--warmup", type=float, help="Seconds of samples to discard (default: --ramp)")
+    parser.add_argument(
+        "--mix",
+        default=",".join(f"{k}={v}" for k, v in DEFAULT_MIX.items()),
+        help="Scenario weights, e.g. cashier_checkout=6,terminal_sync=2",
+    )
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--think-time", type=float, default=0.0, help="Mean seconds between actions")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("-o", "--output", help="Write the JSON report here instead of stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = parse_args(argv)
+    config = LoadTestConfig(
+        base_url=args.base_url,
+        email=args.email,
+        password=args.password,
+        org_id=args.org_id,
+        concurrency=args.concurrency,
+        ramp=args.ramp,
+        duration=args.duration,
+        warmup=args.warmup,
+        mix=parse_mix(args.mix),
+        page_size=args.page_size,
+        think_time=args.think_time,
+        seed=args.seed,
+    )
+
+    report = asyncio.run(run(config))
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+        totals = report["totals"]
+        print(
+            f"{totals['requests']} requests, {totals['throughput_rps']} req/s, "
+            f"p95 {totals['p95_ms']} ms, errors {totals['error_rate']:.2%} -> {args.output}",
+            file=sys.stderr,
+        )
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if report["failed_scenarios"]:
+        print(
+            f"FAILED: non-2xx responses in {', '.join(report['failed_scenarios'])}; "
+            "see status_codes per endpoint",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# backend/benchmarks/loadtest/client.py
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+
+from benchmarks.loadtest.metrics import Recorder, is_success
+
+
+class ApiClient:
+    """
+    Thin timed wrapper around httpx.AsyncClient for one virtual user.
+
+    Requests are labelled by their path *template* ("GET /items/{item_id}")
+    so every call to the same route lands in the same latency bucket.
+    `failures` counts the non-2xx responses and transport errors seen.
+    """
+
+    def __init__(
+        self,
+        http: httpx.AsyncClient,
+        recorder: Recorder,
+        org_id: Optional[str] = None,
+    ) -> None:
+        self.http = http
+        self.recorder = recorder
+        self.org_id = org_id
+        self.token: Optional[str] = None
+        self.failures = 0
+
+    def _headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        if self.org_id:
+            headers["X-Org-ID"] = str(self.org_id)
+        return headers
+
+    async def request(
+        self,
+        method: str,
+        template: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        **path: Any,
+    ) -> Optional[httpx.Response]:
+        """Send one request and record it; returns None on transport errors."""
+        url = template.format(**path)
+        label = f"{method} {template}"
+        merged = self._headers()
+        if headers:
+            merged.update(headers)
+
+        started = time.perf_counter()
+        try:
+            response = await self.http.request(method, url, params=params, json=json, headers=merged)
+        except httpx.HTTPError:
+            self.recorder.record(label, started, time.perf_counter() - started, None)
+            self.failures += 1
+            return None
+
+        if not is_success(response.status_code):
+            self.failures += 1
+
+        self.recorder.record(
+            label,
+            started,
+            time.perf_counter() - started,
+            response.status_code,
+            len(response.content),
+        )
+        return response
+
+    async def get(self, template: str, **kwargs: Any) -> Optional[httpx.Response]:
+        return await self.request("GET", template, **kwargs)
+
+    async def post(self, template: str, **kwargs: Any) -> Optional[httpx.Response]:
+        return await self.request("POST", template, **kwargs)
+
+    async def login(self, email: str, password: str) -> bool:
+        response = await self.post("/auth/login", json={"email": email, "password": password})
+        if response is None or response.status_code != 200:
+            return False
+        self.token = response.json()["access_token"]
+        return True
+
+
+def json_or_empty(response: Optional[httpx.Response]) -> Any:
+    """Decode a successful JSON body; anything else reads as an empty list."""
+    if response is None or not is_success(response.status_code):
+        return []
+    try:
+        return response.json()
+    except ValueError:
+        return []
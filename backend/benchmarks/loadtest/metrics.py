@@ -0,0 +1,149 @@
+# backend/benchmarks/loadtest/metrics.py
+
+from __future__ import annotations
+
+import math
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+def is_success(status_code: Optional[int]) -> bool:
+    """2xx only: a redirect, client error or server error is a failed request."""
+    return status_code is not None and 200 <= status_code < 300
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Linear-interpolated percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * pct / 100.0
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    if low == high:
+        return sorted_values[low]
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+@dataclass
+class EndpointStats:
+    latencies_ms: List[float] = field(default_factory=list)
+    status_codes: Counter = field(default_factory=Counter)
+    errors: int = 0
+    bytes_received: int = 0
+
+
+class Recorder:
+    """
+    Collects per-endpoint latencies.
+
+    Samples taken before `warmup_until` (perf_counter time) are dropped so
+    connection setup and cold caches don't skew the percentiles. Failed
+    (non-2xx) requests are counted as errors but kept out of the latency
+    percentiles: timing a fast 500 is not timing the endpoint.
+    """
+
+    def __init__(self, warmup_until: float = 0.0) -> None:
+        self.warmup_until = warmup_until
+        self.endpoints: Dict[str, EndpointStats] = defaultdict(EndpointStats)
+        self.iterations: Counter = Counter()
+        self.failed_iterations: Counter = Counter()
+        self.idle_users: Counter = Counter()
+        self.first_sample: Optional[float] = None
+        self.last_sample: Optional[float] = None
+
+    def record(
+        self,
+        label: str,
+        started: float,
+        elapsed: float,
+        status_code: Optional[int],
+        size: int = 0,
+    ) -> None:
+        if started < self.warmup_until:
+            return
+
+        stats = self.endpoints[label]
+        stats.bytes_received += size
+        stats.status_codes["error" if status_code is None else str(status_code)] += 1
+        if is_success(status_code):
+            stats.latencies_ms.append(elapsed * 1000.0)
+        else:
+            stats.errors += 1
+
+        end = started + elapsed
+        if self.first_sample is None or started < self.first_sample:
+            self.first_sample = started
+        if self.last_sample is None or end > self.last_sample:
+            self.last_sample = end
+
+    def iteration(self, scenario: str, ok: bool = True) -> None:
+        """One pass of a scenario's loop; not ok if any of its requests failed."""
+        if time.perf_counter() >= self.warmup_until:
+            if ok:
+                self.iterations[scenario] += 1
+            else:
+                self.failed_iterations[scenario] += 1
+
+    def idle(self, scenario: str) -> None:
+        """A virtual user stopped early because it had no work to do."""
+        self.idle_users[scenario] += 1
+
+    # ---------------------------------------------------------
+    # REPORT
+    # ---------------------------------------------------------
+    def window_seconds(self) -> float:
+        if self.first_sample is None or self.last_sample is None:
+            return 0.0
+        return max(self.last_sample - self.first_sample, 1e-9)
+
+    def summary(self) -> Dict[str, dict]:
+        window = self.window_seconds()
+        endpoints = {}
+        for label in sorted(self.endpoints):
+            stats = self.endpoints[label]
+            values = sorted(stats.latencies_ms)
+            count = len(values) + stats.errors
+            endpoints[label] = {
+                "count": count,
+                "errors": stats.errors,
+                "error_rate": round(stats.errors / count, 4) if count else 0.0,
+                "status_codes": dict(stats.status_codes),
+                "throughput_rps": round(count / window, 2) if window else 0.0,
+                "mean_ms": round(sum(values) / len(values), 3) if values else 0.0,
+                "p50_ms": round(percentile(values, 50), 3),
+                "p95_ms": round(percentile(values, 95), 3),
+                "p99_ms": round(percentile(values, 99), 3),
+                "max_ms": round(values[-1], 3) if values else 0.0,
+                "avg_bytes": round(stats.bytes_received / count) if count else 0,
+            }
+
+        all_values = sorted(v for s in self.endpoints.values() for v in s.latencies_ms)
+        errors = sum(s.errors for s in self.endpoints.values())
+        total = len(all_values) + errors
+        scenarios = sorted(set(self.iterations) | set(self.failed_iterations) | set(self.idle_users))
+        return {
+            "endpoints": endpoints,
+            "scenarios": {
+                name: {
+                    "iterations": self.iterations[name],
+                    "iterations_per_s": round(self.iterations[name] / window, 2) if window else 0.0,
+                    "failed_iterations": self.failed_iterations[name],
+                    "idle_users": self.idle_users[name],
+                }
+                for name in scenarios
+            },
+            # Any failed request makes the run's numbers suspect for that scenario
+            "failed_scenarios": [name for name in scenarios if self.failed_iterations[name]],
+            "totals": {
+                "requests": total,
+                "errors": errors,
+                "error_rate": round(errors / total, 4) if total else 0.0,
+                "throughput_rps": round(total / window, 2) if window else 0.0,
+                "window_s": round(window, 3),
+                "p50_ms": round(percentile(all_values, 50), 3),
+                "p95_ms": round(percentile(all_values, 95), 3),
+                "p99_ms": round(percentile(all_values, 99), 3),
+            },
+        }
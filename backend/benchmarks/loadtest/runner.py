@@ -0,0 +1,214 @@
+# backend/benchmarks/loadtest/runner.py
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import platform
+import random
+import subprocess
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import httpx
+
+from benchmarks.loadtest.client import ApiClient
+from benchmarks.loadtest.metrics import Recorder
+from benchmarks.loadtest.scenarios import SCENARIOS, Scenario
+from benchmarks.scale_data import DEFAULT_PASSWORD, bench_admin_email
+
+
+DEFAULT_MIX = {
+    "cashier_checkout": 6,
+    "terminal_sync": 2,
+    "manager_reporting": 1,
+    "inventory_adjustment": 1,
+}
+
+
+@dataclass
+class LoadTestConfig:
+    base_url: Optional[str] = None          # None -> in-process ASGI transport
+    email: str = bench_admin_email(0)
+    password: str = DEFAULT_PASSWORD
+    org_id: Optional[str] = None            # resolved from the DB when omitted
+    concurrency: int = 20
+    ramp: float = 10.0                      # seconds to bring all users online
+    duration: float = 60.0                  # seconds, including ramp
+    warmup: Optional[float] = None          # seconds of samples to discard (default: ramp)
+    mix: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    page_size: int = 500
+    think_time: float = 0.0                 # mean seconds between user actions
+    seed: int = 1
+
+
+# ---------------------------------------------------------
+# HELPERS
+# ---------------------------------------------------------
+def assign_scenarios(mix: Dict[str, float], concurrency: int) -> List[str]:
+    """
+    Spread `concurrency` users over the mix by largest remainder, then
+    interleave them so the ramp brings every scenario up together.
+    """
+    unknown = set(mix) - set(SCENARIOS)
+    if unknown:
+        raise ValueError(f"Unknown scenario(s): {', '.join(sorted(unknown))}")
+
+    total = sum(mix.values())
+    exact = {name: concurrency * weight / total for name, weight in mix.items()}
+    counts = {name: int(value) for name, value in exact.items()}
+    leftover = concurrency - sum(counts.values())
+    for name in sorted(exact, key=lambda n: exact[n] - counts[n], reverse=True)[:leftover]:
+        counts[name] += 1
+
+    order: List[str] = []
+    while len(order) < concurrency:
+        for name in mix:
+            if counts[name]:
+                order.append(name)
+                counts[name] -= 1
+    return order
+
+
+async def resolve_org_id(email: str) -> str:
+    """Look up the primary org of a login directly in the database."""
+    import asyncpg
+
+    from benchmarks.scale_data import asyncpg_dsn
+    from src.app.core.config import settings
+
+    conn = await asyncpg.connect(asyncpg_dsn(settings.database_url))
+    try:
+        org_id = await conn.fetchval(
+            """
+            SELECT r.org_id
+              FROM core.user_org_roles r
+              JOIN core.users u ON u.user_id = r.user_id
+             WHERE lower(u.email::text) = lower($1::text)
+             ORDER BY r.is_primary DESC
+             LIMIT 1
+            """,
+            email,
+        )
+    finally:
+        await conn.close()
+
+    if org_id is None:
+        raise RuntimeError(f"No organization found for {email}; pass --org-id explicitly")
+    return str(org_id)
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+@contextlib.asynccontextmanager
+async def _http_client(config: LoadTestConfig):
+    limits = httpx.Limits(
+        max_connections=config.concurrency,
+        max_keepalive_connections=config.concurrency,
+    )
+    timeout = httpx.Timeout(30.0)
+
+    if config.base_url:
+        async with httpx.AsyncClient(base_url=config.base_url, limits=limits, timeout=timeout) as http:
+            yield http
+        return
+
+    # In-process: drive the ASGI app directly (no sockets, no uvicorn)
+    from src.app.core.database import engine
+    from src.app.main import app
+
+    engine.sync_engine.echo = False   # statement logging would dominate the profile
+    # Unhandled app errors become 500s, exactly as a real server would report them
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport,
+            base_url="http://loadtest",
+            limits=limits,
+            timeout=timeout,
+        ) as http:
+            yield http
+
+
+# ---------------------------------------------------------
+# VIRTUAL USER
+# ---------------------------------------------------------
+async def _virtual_user(
+    index: int,
+    scenario: Scenario,
+    http: httpx.AsyncClient,
+    recorder: Recorder,
+    config: LoadTestConfig,
+    deadline: float,
+) -> None:
+    await asyncio.sleep(config.ramp * index / max(config.concurrency, 1))
+
+    rng = random.Random(f"{config.seed}:{index}")
+    client = ApiClient(http, recorder, config.org_id)
+    if not await client.login(config.email, config.password):
+        return
+
+    state: Dict = {}
+    await scenario.setup(client, state, rng)
+
+    while time.perf_counter() < deadline:
+        failures = client.failures
+        if not await scenario.run_once(client, state, rng):
+            # e.g. no catalog visible to this login: don't spin on an empty loop
+            recorder.idle(scenario.name)
+            return
+        recorder.iteration(scenario.name, ok=client.failures == failures)
+
+
+# ---------------------------------------------------------
+# ENTRY POINT
+# ---------------------------------------------------------
+async def run(config: LoadTestConfig) -> dict:
+    """Run one load test and return the JSON-serialisable report."""
+    if config.org_id is None:
+        config.org_id = await resolve_org_id(config.email)
+
+    assignments = assign_scenarios(config.mix, config.concurrency)
+    scenarios = {
+        name: SCENARIOS[name](page_size=config.page_size, think_time=config.think_time)
+        for name in set(assignments)
+    }
+
+    started_at = datetime.now(timezone.utc)
+    start = time.perf_counter()
+    deadline = start + config.duration
+    warmup = config.ramp if config.warmup is None else config.warmup
+    recorder = Recorder(warmup_until=start + warmup)
+
+    async with _http_client(config) as http:
+        await asyncio.gather(*(
+            _virtual_user(i, scenarios[name], http, recorder, config, deadline)
+            for i, name in enumerate(assignments)
+        ))
+
+    report = recorder.summary()
+    report["meta"] = {
+        "started_at": started_at.isoformat(),
+        "elapsed_s": round(time.perf_counter() - start, 3),
+        "mode": "http" if config.base_url else "asgi",
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "host": platform.node(),
+        "config": {k: v for k, v in asdict(config).items() if k != "password"},
+        "users_per_scenario": {name: assignments.count(name) for name in sorted(set(assignments))},
+    }
+    return report
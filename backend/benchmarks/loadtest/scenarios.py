@@ -0,0 +1,194 @@
+# backend/benchmarks/loadtest/scenarios.py
+"""
+POS workload scenarios.
+
+Each scenario models one kind of user. `setup` runs once per virtual user
+(login + whatever reference data the user would have cached), `run_once`
+is one iteration of the user's loop and is what the runner repeats until
+the test window closes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Dict, List
+
+from benchmarks.loadtest.client import ApiClient, json_or_empty
+
+
+class Scenario:
+    name = "base"
+
+    def __init__(self, page_size: int = 500, think_time: float = 0.0) -> None:
+        self.page_size = page_size
+        self.think_time = think_time
+
+    async def setup(self, client: ApiClient, state: Dict[str, Any], rng: random.Random) -> None:
+        pass
+
+    async def run_once(self, client: ApiClient, state: Dict[str, Any], rng: random.Random) -> bool:
+        """Run one iteration; return False when the user has nothing left to do."""
+        raise NotImplementedError
+
+    async def think(self, rng: random.Random) -> None:
+        """Randomised pause between user actions (exponential around think_time)."""
+        if self.think_time > 0:
+            await asyncio.sleep(rng.expovariate(1.0 / self.think_time))
+
+
+# ---------------------------------------------------------
+# CASHIER CHECKOUT LOOP
+# ---------------------------------------------------------
+class CashierCheckout(Scenario):
+    """Sync catalog once, then: scan items -> quote -> create sale."""
+
+    name = "cashier_checkout"
+    mean_basket = 3.5
+
+    async def setup(self, client, state, rng):
+        state["items"] = json_or_empty(
+            await client.get("/items/", params={"limit": self.page_size})
+        )
+        state["terminals"] = json_or_empty(await client.get("/terminals/"))
+
+    def _basket_size(self, rng: random.Random) -> int:
+        p = 1.0 / self.mean_basket
+        return min(1 + int(math.log(1.0 - rng.random()) / math.log(1.0 - p)), 40)
+
+    def _sale_payload(self, client: ApiClient, state, basket: List[dict], rng: random.Random) -> dict:
+        terminals = state.get("terminals") or []
+        lines = []
+        for line_number, item in enumerate(basket, start=1):
+            qty = Decimal(rng.choice((1, 1, 1, 2, 3)))
+            price = Decimal(str(item["default_price"]))
+            lines.append({
+                "org_id": client.org_id,
+                "item_id": item["item_id"],
+                "line_number": line_number,
+                "description": item["name"],
+                "quantity": str(qty),
+                "unit_price": str(price),
+                "discount_amount": "0",
+                "tax_id": item.get("tax_id"),
+                "line_total": str(qty * price),
+            })
+
+        return {
+            "org_id": client.org_id,
+            "terminal_id": rng.choice(terminals)["terminal_id"] if terminals else None,
+            "status": "completed",
+            "sale_type": "pos",
+            "sale_date": datetime.now(timezone.utc).isoformat(),
+            "lines": lines,
+            "payments": [],
+        }
+
+    async def run_once(self, client, state, rng):
+        items = state.get("items") or []
+        if not items:
+            return False
+
+        basket = []
+        for _ in range(self._basket_size(rng)):
+            item = rng.choice(items)
+            await client.get("/items/{item_id}", item_id=item["item_id"])
+            basket.append(item)
+            await self.think(rng)
+
+        payload = self._sale_payload(client, state, basket, rng)
+        await client.post("/sales/quote", json=payload)
+        await self.think(rng)
+        await client.post("/sales/", json=payload)
+        return True
+
+
+# ---------------------------------------------------------
+# MANAGER REPORTING
+# ---------------------------------------------------------
+class ManagerReporting(Scenario):
+    """Page through recent sales, open a few, check stock."""
+
+    name = "manager_reporting"
+
+    async def run_once(self, client, state, rng):
+        sales = json_or_empty(
+            await client.get("/sales/", params={"limit": 100, "offset": rng.randrange(0, 1000, 100)})
+        )
+        for sale in rng.sample(sales, min(3, len(sales))):
+            await client.get("/sales/{sale_id}", sale_id=sale["sale_id"])
+            await self.think(rng)
+
+        await client.get("/stock-levels/", params={"limit": 100})
+        await client.get("/stock-movements/", params={"limit": 100})
+        return True
+
+
+# ---------------------------------------------------------
+# INVENTORY ADJUSTMENTS
+# ---------------------------------------------------------
+class InventoryAdjustment(Scenario):
+    """Post small admin stock corrections and re-read stock levels."""
+
+    name = "inventory_adjustment"
+
+    async def setup(self, client, state, rng):
+        state["items"] = json_or_empty(
+            await client.get("/items/", params={"limit": self.page_size})
+        )
+        state["locations"] = json_or_empty(await client.get("/locations/"))
+
+    async def run_once(self, client, state, rng):
+        items = state.get("items") or []
+        locations = state.get("locations") or []
+        if not items or not locations:
+            return False
+
+        await client.post(
+            "/admin/stock-adjustments/",
+            json={
+                "item_id": rng.choice(items)["item_id"],
+                "location_id": rng.choice(locations)["location_id"],
+                "quantity_delta": str(rng.choice((-2, -1, 1, 2, 5))),
+                "reason": "load test cycle count",
+            },
+        )
+        await self.think(rng)
+        await client.get("/stock-levels/", params={"limit": 100})
+        return True
+
+
+# ---------------------------------------------------------
+# TERMINAL SYNC
+# ---------------------------------------------------------
+class TerminalSync(Scenario):
+    """A terminal refreshing its catalog and configuration."""
+
+    name = "terminal_sync"
+    max_pages = 10
+
+    async def run_once(self, client, state, rng):
+        for page in range(self.max_pages):
+            items = json_or_empty(
+                await client.get(
+                    "/items/",
+                    params={"limit": self.page_size, "offset": page * self.page_size},
+                )
+            )
+            if len(items) < self.page_size:
+                break
+
+        await client.get("/tax-rates/")
+        await client.get("/terminals/")
+        await client.get("/locations/")
+        await client.get("/org/settings/")
+        return True
+
+
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in (CashierCheckout, ManagerReporting, InventoryAdjustment, TerminalSync)
+}
@@ -0,0 +1,10 @@
+# backend/benchmarks/micro/__init__.py
+"""
+Micro-benchmarks for POS hot paths (checkout math, schema validation and
+serialization, JWT decoding, repository reads, stock adjustments), with
+JSON baselines and a regression gate. See benchmarks/README.md.
+"""
+
+from benchmarks.micro.harness import REGISTRY, benchmark, compare, measure, run_suite
+
+__all__ = ["REGISTRY", "benchmark", "compare", "measure", "run_suite"]
@@ -0,0 +1,181 @@
+# backend/benchmarks/micro/__main__.py
+"""
+Run micro-benchmarks and gate on regressions.
+
+    # Run everything and store a named baseline (benchmarks/baselines/main.json)
+    python -m benchmarks.micro run --save-baseline main
+
+    # Run pure-Python cases only and compare against it (exit 1 on regression)
+    python -m benchmarks.micro run --no-db --compare main --threshold 0.10
+
+    # Compare two saved result files
+    python -m benchmarks.micro compare before.json after.json
+
+    # Also report the memory blocks each case allocates
+    python -m benchmarks.micro run --no-db -k checkout --allocations
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import fnmatch
+import json
+import os
+import platform
+import sys
+from datetime import datetime, timezone
+from typing import List, Sequence
+
+from benchmarks.micro import cases  # noqa: F401  (registers the benchmarks)
+from benchmarks.micro.harness import REGISTRY, compare, run_suite
+
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "baselines")
+
+
+# ---------------------------------------------------------
+# FILES
+# ---------------------------------------------------------
+def baseline_path(name_or_path: str) -> str:
+    """'main' -> benchmarks/baselines/main.json; explicit paths pass through."""
+    if name_or_path.endswith(".json") or os.sep in name_or_path:
+        return name_or_path
+    return os.path.join(BASELINE_DIR, f"{name_or_path}.json")
+
+
+def load_results(path: str) -> dict:
+    with open(baseline_path(path)) as fh:
+        return json.load(fh)
+
+
+def write_results(path: str, report: dict) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as fh:
+        json.dump(report, fh, indent=2, sort_keys=True)
+        fh.write("\n")
+
+
+# ---------------------------------------------------------
+# OUTPUT
+# ---------------------------------------------------------
+def print_comparison(rows: List[dict]) -> None:
+    width = max((len(r["name"]) for r in rows), default=10)
+    print(f"{'benchmark':<{width}}  {'baseline µs':>12}  {'current µs':>12}  {'ratio':>7}  status")
+    for r in rows:
+        print(
+            f"{r['name']:<{width}}  "
+            f"{r.get('baseline_us', ''):>12}  "
+            f"{r.get('current_us', ''):>12}  "
+            f"{r.get('ratio', ''):>7}  "
+            f"{r['status'].upper() if r['status'] == 'regressed' else r['status']}"
+        )
+
+
+def gate(baseline: dict, current: dict, threshold: float) -> int:
+    overrides = {c.name: c.threshold for c in REGISTRY.values() if c.threshold is not None}
+    rows = compare(baseline["results"], current["results"], threshold, overrides)
+    print_comparison(rows)
+
+    regressed = [r["name"] for r in rows if r["status"] == "regressed"]
+    if regressed:
+        print(f"\n{len(regressed)} benchmark(s) regressed beyond threshold", file=sys.stderr)
+        return 1
+    return 0
+
+
+# ---------------------------------------------------------
+# COMMANDS
+# ---------------------------------------------------------
+def cmd_list(args) -> int:
+    for case in REGISTRY.values():
+        print(f"{case.name}{'  [db]' if case.requires_db else ''}")
+    return 0
+
+
+def cmd_run(args) -> int:
+    selected = [
+        case for case in REGISTRY.values()
+        if (not args.filter or any(p in case.name or fnmatch.fnmatch(case.name, p) for p in args.filter))
+        and not (args.no_db and case.requires_db)
+    ]
+    if not selected:
+        print("No benchmarks selected", file=sys.stderr)
+        return 2
+
+    def progress(name, timing):
+        memory = ""
+        if "retained_blocks" in timing:
+            memory = f"  {timing['retained_blocks']} blocks retained, peak {timing['peak_kib']} KiB"
+        print(f"{name:<70} {timing['median_us']:>12.3f} µs  ({timing['loops']} loops){memory}", file=sys.stderr)
+
+    results = asyncio.run(run_suite(
+        selected,
+        repeat=args.repeat,
+        min_time=args.min_time,
+        progress=progress,
+        allocations=args.allocations,
+    ))
+    report = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "host": platform.node(),
+            "repeat": args.repeat,
+            "min_time": args.min_time,
+        },
+        "results": results,
+    }
+
+    if args.output:
+        write_results(args.output, report)
+    if args.save_baseline:
+        write_results(baseline_path(args.save_baseline), report)
+    if not args.output and not args.save_baseline and not args.compare:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        print()
+
+    if args.compare:
+        return gate(load_results(args.compare), report, args.threshold)
+    return 0
+
+
+def cmd_compare(args) -> int:
+    return gate(load_results(args.baseline), load_results(args.current), args.threshold)
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="ArcoirisPOS micro-benchmarks.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_list = sub.add_parser("list", help="List registered benchmarks")
+    p_list.set_defaults(func=cmd_list)
+
+    p_run = sub.add_parser("run", help="Run benchmarks")
+    p_run.add_argument("-k", "--filter", action="append", help="Substring or glob on benchmark name (repeatable)")
+    p_run.add_argument("--no-db", action="store_true", help="Skip cases that need Postgres")
+    p_run.add_argument("--repeat", type=int, default=7)
+    p_run.add_argument("--min-time", type=float, default=0.2, help="Seconds per repeat")
+    p_run.add_argument("--allocations", action="store_true", help="Also count memory blocks per call")
+    p_run.add_argument("-o", "--output", help="Write the JSON results here")
+    p_run.add_argument("--save-baseline", metavar="NAME", help="Store results as benchmarks/baselines/NAME.json")
+    p_run.add_argument("--compare", metavar="BASELINE", help="Baseline name or path to gate against")
+    p_run.add_argument("--threshold", type=float, default=0.10, help="Allowed slowdown (0.10 = 10%%)")
+    p_run.set_defaults(func=cmd_run)
+
+    p_cmp = sub.add_parser("compare", help="Compare two result files")
+    p_cmp.add_argument("baseline")
+    p_cmp.add_argument("current")
+    p_cmp.add_argument("--threshold", type=float, default=0.10, help="Allowed slowdown (0.10 = 10%%)")
+    p_cmp.set_defaults(func=cmd_compare)
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = parse_args(argv)
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
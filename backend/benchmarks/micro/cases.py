@@ -0,0 +1,793 @@
+# backend/benchmarks/micro/cases.py
+"""
+Hot-path benchmark definitions.
+
+Pure cases build their fixtures in memory. DB cases (requires_db=True)
+read one existing row id from the current database — run
+`python -m benchmarks.scale_data` first — and all their writes are
+rolled back when the case finishes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import List, Tuple
+
+from pydantic import TypeAdapter
+from sqlalchemy import func, select, text, update as sa_update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks.micro.harness import benchmark
+
+# Register every mapped class (same set the app and seed_dev_data.py load)
+import src.app.core.base  # noqa: F401
+import src.app.org.models.organization_settings_model  # noqa: F401
+import src.app.org.models.user_models  # noqa: F401
+from src.app.auth.services.jwt_utils import create_access_token, decode_token
+from src.app.core.database import AsyncSessionLocal
+from src.app.core.optimistic import with_retries
+from src.app.core.projection import FieldSet
+from src.app.inventory.models.item_models import Item
+from src.app.inventory.models.location_models import Location
+from src.app.inventory.models.stock_level_models import StockLevel
+from src.app.inventory.models.stock_movement_models import StockMovement
+from src.app.inventory.schemas.inv_schemas import (
+    ItemRead,
+    StockAdjustmentCreate,
+    StockMovementRead,
+    StocktakeCreate,
+    StockTransferCreate,
+    StockTransferLine,
+)
+from src.app.inventory.services.item_service import item_service
+from src.app.inventory.services.stock_adjustments import stock_adjustment_service
+from src.app.inventory.services.stock_ledger import StockLedgerService
+from src.app.inventory.services.stock_movement_service import stock_movement_service
+from src.app.inventory.services.stock_snapshots import stock_snapshot_service
+from src.app.inventory.services.stock_transfers import stock_transfer_service
+from src.app.inventory.services.stocktakes import stocktake_service
+from src.app.pos.models.sale_models import Sale
+from src.app.pos.models.sale_number_models import SaleNumberCounter
+from src.app.pos.models.tax_rate_models import TaxRate
+from src.app.pos.schemas.pos_schemas import SaleCreate, SaleRead, SaleReadWithLinesAndPayments
+from src.app.pos.services.carts import Cart, CartLine
+from src.app.pos.services.checkout import CheckoutCalculator
+from src.app.pos.services.checkout_service import CheckoutContext
+from src.app.pos.services.compiled_tax import compile_rate
+from src.app.pos.services.promotions import (
+    BOGO,
+    MIX_AND_MATCH,
+    PERCENT_OFF,
+    CompiledPromotion,
+    PromoLine,
+    PromotionIndex,
+)
+from src.app.pos.services.pricing_executor import PricingExecutor
+from src.app.pos.services.sale_number_service import SaleNumberService
+from src.app.pos.services.sales_service import sales_service
+
+
+ORG_ID = uuid.UUID(int=1)
+NOW = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+TAX_PERCENTS = (Decimal("8.2500"), Decimal("6.2500"), Decimal("0.0000"))
+
+
+# ---------------------------------------------------------
+# FIXTURES
+# ---------------------------------------------------------
+def _id(n: int) -> uuid.UUID:
+    return uuid.UUID(int=(1 << 64) + n)
+
+
+def make_catalog(n_items: int) -> Tuple[List[Item], List[TaxRate]]:
+    """Transient ORM objects, exactly what CheckoutService loads from the DB."""
+    taxes = [
+        TaxRate(
+            tax_id=_id(10_000_000 + i),
+            org_id=ORG_ID,
+            name=f"Tax {i}",
+            rate_percent=rate,
+            is_compound=False,
+            is_default=i == 0,
+        )
+        for i, rate in enumerate(TAX_PERCENTS)
+    ]
+    items = [
+        Item(
+            item_id=_id(i),
+            org_id=ORG_ID,
+            sku=f"SKU-{i:07d}",
+            name=f"Item {i}",
+            item_type="product",
+            default_price=Decimal(f"{(i % 5000) / 100 + 0.99:.2f}"),
+            tax_id=taxes[i % len(taxes)].tax_id,
+            is_active=True,
+        )
+        for i in range(n_items)
+    ]
+    return items, taxes
+
+
+def make_sale_payload(n_lines: int) -> dict:
+    """JSON-shaped SaleCreate body, as a terminal would send it."""
+    items, taxes = make_catalog(n_lines)
+    lines = []
+    for i, item in enumerate(items):
+        qty = Decimal(1 + i % 3)
+        lines.append({
+            "org_id": str(ORG_ID),
+            "item_id": str(item.item_id),
+            "line_number": i + 1,
+            "description": item.name,
+            "quantity": str(qty),
+            "unit_price": str(item.default_price),
+            "discount_amount": "0.50" if i % 7 == 0 else "0",
+            "tax_id": str(item.tax_id),
+            "tax_amount": "0",
+            "line_total": str(qty * item.default_price),
+        })
+    return {
+        "org_id": str(ORG_ID),
+        "terminal_id": str(_id(20_000_000)),
+        "sale_number": "S-000001",
+        "status": "completed",
+        "sale_type": "pos",
+        "sale_date": NOW.isoformat(),
+        "lines": lines,
+        "payments": [],
+    }
+
+
+def make_sale_read_payload(n_lines: int) -> dict:
+    """Fully populated SaleReadWithLinesAndPayments body."""
+    payload = make_sale_payload(n_lines)
+    sale_id = str(_id(30_000_000))
+    for i, line in enumerate(payload["lines"]):
+        line.update({
+            "sale_line_id": str(_id(40_000_000 + i)),
+            "sale_id": sale_id,
+            "tax_amount": "0.8250",
+            "created_at": NOW.isoformat(),
+        })
+    payload.update({
+        "sale_id": sale_id,
+        "subtotal": "1234.5600",
+        "tax_total": "101.8500",
+        "grand_total": "1336.4100",
+        "amount_paid": "1336.4100",
+        "created_at": NOW.isoformat(),
+        "updated_at": NOW.isoformat(),
+        "version": 1,
+        "payments": [
+            {
+                "payment_id": str(_id(50_000_000 + i)),
+                "sale_id": sale_id,
+                "org_id": str(ORG_ID),
+                "payment_method": method,
+                "amount": "668.2050",
+                "currency": "USD",
+                "processed_at": NOW.isoformat(),
+                "created_at": NOW.isoformat(),
+            }
+            for i, method in enumerate(("card", "cash"))
+        ],
+    })
+    return payload
+
+
+# ---------------------------------------------------------
+# CHECKOUT ENGINE
+# ---------------------------------------------------------
+def _calculate_sale(n_lines: int):
+    calculator = CheckoutCalculator()
+    items, taxes = make_catalog(n_lines)
+    sale = SaleCreate.model_validate(make_sale_payload(n_lines))
+    return lambda: calculator.calculate_sale(sale, items, taxes)
+
+
+@benchmark("checkout.calculate_sale[10_lines]")
+def calculate_sale_10():
+    return _calculate_sale(10)
+
+
+@benchmark("checkout.calculate_sale[100_lines]")
+def calculate_sale_100():
+    return _calculate_sale(100)
+
+
+@benchmark("checkout.calculate_sale[1000_lines]")
+def calculate_sale_1000():
+    return _calculate_sale(1000)
+
+
+# ---------------------------------------------------------
+# PROMOTIONS (10k active rules over a 50k-item catalog)
+# ---------------------------------------------------------
+PROMO_RULES = 10_000
+PROMO_CATALOG = 50_000
+PROMO_ITEMS_PER_RULE = 5
+
+
+def make_promotions(n_rules: int = PROMO_RULES) -> List[Tuple[CompiledPromotion, List[uuid.UUID]]]:
+    """A mix of every rule kind, each scoped to a few random catalog items."""
+    rng = random.Random(39)
+    rules = []
+    for i in range(n_rules):
+        kind = (PERCENT_OFF, BOGO, MIX_AND_MATCH)[i % 3]
+        promo = CompiledPromotion(
+            promotion_id=_id(60_000_000 + i),
+            kind=kind,
+            priority=i % 10,
+            fraction_off=Decimal("0.15") if kind == PERCENT_OFF else Decimal("1"),
+            buy_quantity=2,
+            get_quantity=1,
+            bundle_quantity=3,
+            bundle_price=Decimal("9.99"),
+            starts_at=NOW if i % 4 == 0 else None,
+        )
+        item_ids = [_id(rng.randrange(PROMO_CATALOG)) for _ in range(PROMO_ITEMS_PER_RULE)]
+        rules.append((promo, item_ids))
+    return rules
+
+
+@benchmark("promotions.build_index[10k_rules]")
+def promotions_build_index():
+    rules = make_promotions()
+    return lambda: PromotionIndex(rules)
+
+
+@benchmark("promotions.apply[10k_rules_200_lines]")
+def promotions_apply():
+    index = PromotionIndex(make_promotions())
+    items, _ = make_catalog(200)
+    lines = [
+        PromoLine(i, item.item_id, Decimal(1 + i % 3), item.default_price, (1 + i % 3) * item.default_price)
+        for i, item in enumerate(items)
+    ]
+    return lambda: index.apply(lines, NOW)
+
+
+@benchmark("checkout.calculate_sale[200_lines_10k_promotions]")
+def calculate_sale_promotions():
+    calculator = CheckoutCalculator()
+    index = PromotionIndex(make_promotions())
+    items, taxes = make_catalog(200)
+    sale = SaleCreate.model_validate(make_sale_payload(200))
+    return lambda: calculator.calculate_sale(sale, items, taxes, promotions=index)
+
+
+# ---------------------------------------------------------
+# CARTS (one change on an open cart vs. repricing the sale)
+# ---------------------------------------------------------
+@benchmark("carts.change_quantity[200_lines]")
+def cart_change_quantity():
+    items, taxes = make_catalog(200)
+    compiled = {tax.tax_id: compile_rate(tax) for tax in taxes}
+    cart = Cart(ORG_ID)
+    for i, item in enumerate(items):
+        cart.add_line(CartLine(
+            item_id=item.item_id,
+            quantity=Decimal(1 + i % 3),
+            unit_price=item.default_price,
+            tax=compiled[item.tax_id],
+            tax_id=item.tax_id,
+        ))
+
+    quantities = (Decimal(2), Decimal(3))
+    state = {"n": 0}
+
+    def change():
+        state["n"] += 1
+        cart.update_line(100, quantity=quantities[state["n"] % 2])
+
+    return change
+
+
+# ---------------------------------------------------------
+# PRICING POOL (re-pricing 8 sales x 2500 lines, by worker count)
+# ---------------------------------------------------------
+POOL_SALES = 8
+POOL_LINES = 2500
+
+
+def _pricing_pool(workers: int):
+    items, taxes = make_catalog(POOL_LINES)
+    context = CheckoutContext(
+        items={item.item_id: item for item in items},
+        tax_rates={tax.tax_id: tax for tax in taxes},
+        promotions=PromotionIndex(make_promotions()),
+    )
+    sales = [SaleCreate.model_validate(make_sale_payload(POOL_LINES)) for _ in range(POOL_SALES)]
+    executor = PricingExecutor(min_lines=1, workers=workers)
+
+    async def price():
+        await executor.calculate_many(context, sales)
+
+    return price
+
+
+@benchmark("pricing_pool.calculate_many[8x2500_lines_inline]")
+def pricing_pool_inline():
+    return _pricing_pool(0)
+
+
+@benchmark("pricing_pool.calculate_many[8x2500_lines_1_worker]")
+def pricing_pool_1():
+    return _pricing_pool(1)
+
+
+@benchmark("pricing_pool.calculate_many[8x2500_lines_2_workers]")
+def pricing_pool_2():
+    return _pricing_pool(2)
+
+
+@benchmark("pricing_pool.calculate_many[8x2500_lines_4_workers]")
+def pricing_pool_4():
+    return _pricing_pool(4)
+
+
+# ---------------------------------------------------------
+# PYDANTIC SCHEMAS
+# ---------------------------------------------------------
+@benchmark("schemas.SaleCreate.validate_python[100_lines]")
+def sale_create_validate_python():
+    payload = make_sale_payload(100)
+    return lambda: SaleCreate.model_validate(payload)
+
+
+@benchmark("schemas.SaleCreate.validate_json[100_lines]")
+def sale_create_validate_json():
+    raw = SaleCreate.model_validate(make_sale_payload(100)).model_dump_json()
+    return lambda: SaleCreate.model_validate_json(raw)
+
+
+@benchmark("schemas.SaleReadWithLinesAndPayments.validate_python[100_lines]")
+def sale_read_validate_python():
+    payload = make_sale_read_payload(100)
+    return lambda: SaleReadWithLinesAndPayments.model_validate(payload)
+
+
+@benchmark("schemas.SaleReadWithLinesAndPayments.dump_json[100_lines]")
+def sale_read_dump_json():
+    sale = SaleReadWithLinesAndPayments.model_validate(make_sale_read_payload(100))
+    return lambda: sale.model_dump_json()
+
+
+@benchmark("schemas.SaleReadWithLinesAndPayments.dump_python_json_mode[100_lines]")
+def sale_read_dump_python():
+    # What FastAPI's response_model path does before json.dumps
+    sale = SaleReadWithLinesAndPayments.model_validate(make_sale_read_payload(100))
+    return lambda: sale.model_dump(mode="json")
+
+
+# ---------------------------------------------------------
+# AUTH
+# ---------------------------------------------------------
+@benchmark("auth.decode_token")
+def jwt_decode():
+    token = create_access_token(str(_id(60_000_000)))
+    return lambda: decode_token(token)
+
+
+# ---------------------------------------------------------
+# REPOSITORY / SERVICES (Postgres)
+# ---------------------------------------------------------
+@benchmark("repository.get", requires_db=True)
+async def repository_get(session):
+    item_id = await session.scalar(
+        select(Item.item_id).where(Item.deleted_at.is_(None)).limit(1)
+    )
+    if item_id is None:
+        raise LookupError("inv.items is empty; load a dataset first")
+
+    async def op():
+        await item_service.get(session, item_id)
+        session.expunge_all()   # every request starts with an empty identity map
+
+    return op
+
+
+@benchmark("repository.list[100]", requires_db=True)
+async def repository_list_100(session):
+    async def op():
+        await item_service.list(session, limit=100)
+        session.expunge_all()
+
+    return op
+
+
+# ---------------------------------------------------------
+# LIST PAGES: ORM entities + response_model vs projected rows + orjson
+# ---------------------------------------------------------
+async def _org_with(session, model):
+    org_id = await session.scalar(
+        select(model.org_id).group_by(model.org_id).order_by(func.count().desc()).limit(1)
+    )
+    if org_id is None:
+        raise LookupError(f"{model.__table__.fullname} is empty; load a dataset first")
+    return org_id
+
+
+def _list_entities(service, schema, model, limit):
+    # The pre-projection route: ORM entities, response_model validate + dump
+    adapter = TypeAdapter(List[schema])
+
+    async def factory(session):
+        org_id = await _org_with(session, model)
+
+        async def op():
+            rows = await service.get_by_org(session, org_id, limit=limit)
+            adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+            session.expunge_all()
+
+        return op
+
+    return factory
+
+
+def _list_rows(service, schema, model, limit, fields=None):
+    # What the list routes do now (optionally with ?fields=...)
+    field_set = FieldSet(schema, model)
+    columns = field_set(fields)
+
+    async def factory(session):
+        org_id = await _org_with(session, model)
+
+        async def op():
+            rows = await service.get_by_org(session, org_id, limit=limit, fields=columns)
+            field_set.render(rows)
+
+        return op
+
+    return factory
+
+
+for _name, _service, _schema, _model, _limit in (
+    ("items", item_service, ItemRead, Item, 500),
+    ("sales", sales_service, SaleRead, Sale, 1000),
+    ("stock_movements", stock_movement_service, StockMovementRead, StockMovement, 1000),
+):
+    benchmark(f"list.{_name}[entities_{_limit}]", requires_db=True)(
+        _list_entities(_service, _schema, _model, _limit)
+    )
+    benchmark(f"list.{_name}[rows_{_limit}]", requires_db=True)(
+        _list_rows(_service, _schema, _model, _limit)
+    )
+
+benchmark("list.items[fields_500]", requires_db=True)(
+    _list_rows(item_service, ItemRead, Item, 500, fields="name,default_price,barcode")
+)
+
+
+@benchmark("stock.adjust", requires_db=True)
+async def stock_adjust(session):
+    level = await session.scalar(select(StockLevel).limit(1))
+    if level is None:
+        raise LookupError("inv.stock_levels is empty; load a dataset first")
+
+    payload = StockAdjustmentCreate(
+        item_id=level.item_id,
+        location_id=level.location_id,
+        quantity_delta=Decimal("1"),
+        reason="benchmark",
+    )
+    org_id = level.org_id
+
+    async def op():
+        await stock_adjustment_service.adjust(session, payload, org_id=org_id)
+
+    return op
+
+
+async def _transfer_lines(session, n_lines: int) -> Tuple[uuid.UUID, List[StockTransferLine]]:
+    org_id = await _org_with(session, StockLevel)
+    locations = (await session.execute(
+        select(Location.location_id).where(Location.org_id == org_id).limit(2)
+    )).scalars().all()
+    items = (await session.execute(
+        select(Item.item_id).where(Item.org_id == org_id, Item.deleted_at.is_(None))
+    )).scalars().all()
+    if len(locations) < 2 or not items:
+        raise LookupError("need an org with two locations and items; load a dataset first")
+
+    source, destination = locations
+    lines = [
+        StockTransferLine(
+            item_id=items[n % len(items)],
+            from_location_id=source,
+            to_location_id=destination,
+            quantity=Decimal("0.0001"),
+        )
+        for n in range(n_lines)
+    ]
+    return org_id, lines
+
+
+def _stock_transfer(n_lines: int):
+    async def factory(session):
+        org_id, lines = await _transfer_lines(session, n_lines)
+        payload = StockTransferCreate(lines=lines, allow_negative=True)
+
+        async def op():
+            await stock_transfer_service.transfer(session, payload, org_id=org_id)
+
+        return op
+
+    return factory
+
+
+for _lines in (100, 10_000):
+    benchmark(f"stock.transfer[{_lines}_lines]", requires_db=True)(_stock_transfer(_lines))
+
+
+@benchmark("stock.transfer[100_lines_as_adjustment_pairs]", requires_db=True)
+async def stock_transfer_as_adjustments(session):
+    # The pre-transfer way: two admin adjustments (two commits) per line
+    org_id, lines = await _transfer_lines(session, 100)
+    pairs = [
+        StockAdjustmentCreate(item_id=line.item_id, location_id=location_id, quantity_delta=delta, reason="transfer")
+        for line in lines
+        for location_id, delta in ((line.from_location_id, -line.quantity), (line.to_location_id, line.quantity))
+    ]
+
+    async def op():
+        for adjustment in pairs:
+            await stock_adjustment_service.adjust(session, adjustment, org_id=org_id)
+
+    return op
+
+
+# ---------------------------------------------------------
+# SALE NUMBERS: leased blocks vs one counter row per sale
+# ---------------------------------------------------------
+SALE_NUMBER_TASKS = 32
+
+
+def _sale_numbers(leased: bool):
+    # One op = 32 concurrent checkouts each taking a number. The counter
+    # baseline's UPDATEs share the harness connection, which serializes
+    # them the way the counter row's lock would across connections.
+    async def factory(session):
+        org_id = await _org_with(session, Sale)
+        conn = await session.connection()
+        counter = SaleNumberCounter.__table__
+        bump = (
+            pg_insert(counter)
+            .values(org_id=org_id, high_water=1)
+            .on_conflict_do_update(
+                index_elements=[counter.c.org_id],
+                set_={"high_water": counter.c.high_water + 1},
+            )
+            .returning(counter.c.high_water)
+        )
+
+        if leased:
+            service = SaleNumberService(
+                block_size=100,
+                width=6,
+                session_factory=lambda: AsyncSession(bind=conn, join_transaction_mode="create_savepoint"),
+            )
+
+            async def take():
+                await service.allocate(org_id)
+        else:
+            async def take():
+                (await session.execute(bump)).scalar_one()
+
+        async def op():
+            await asyncio.gather(*(take() for _ in range(SALE_NUMBER_TASKS)))
+
+        return op
+
+    return factory
+
+
+benchmark("sale_numbers.allocate[32_concurrent_leased]", requires_db=True)(_sale_numbers(True))
+benchmark("sale_numbers.allocate[32_concurrent_counter_row]", requires_db=True)(_sale_numbers(False))
+
+
+# ---------------------------------------------------------
+# OCC: row lock vs version compare-and-swap under contention
+# ---------------------------------------------------------
+OCC_WRITERS = 8
+
+
+def _contended_updates(n_rows: int, optimistic: bool):
+    # One op = 8 concurrent read-modify-write transactions, each on its own
+    # connection and committed (a rolled-back write never conflicts), over
+    # `n_rows` stock levels. cleanup() puts the rows back as they were.
+    async def factory(session):
+        org_id = await _org_with(session, StockLevel)
+        rows = (await session.execute(
+            select(StockLevel.stock_level_id, StockLevel.quantity_on_hand,
+                   StockLevel.updated_at, StockLevel.version)
+            .where(StockLevel.org_id == org_id)
+            .limit(n_rows)
+        )).all()
+        row_ids = [row.stock_level_id for row in rows]
+        rng = random.Random(7)
+
+        async def write(stock_level_id):
+            async with AsyncSessionLocal() as writer:
+                async def attempt():
+                    stmt = select(StockLevel).where(StockLevel.stock_level_id == stock_level_id)
+                    if not optimistic:
+                        stmt = stmt.with_for_update()
+                    level = (await writer.execute(stmt)).scalar_one()
+                    level.quantity_on_hand = level.quantity_on_hand + 1
+                    await writer.commit()
+
+                await with_retries(writer, attempt, retries=100)
+
+        async def op():
+            await asyncio.gather(*(write(rng.choice(row_ids)) for _ in range(OCC_WRITERS)))
+
+        async def cleanup():
+            async with AsyncSessionLocal() as writer:
+                for row in rows:
+                    await writer.execute(
+                        sa_update(StockLevel)
+                        .where(StockLevel.stock_level_id == row.stock_level_id)
+                        .values(quantity_on_hand=row.quantity_on_hand,
+                                updated_at=row.updated_at, version=row.version)
+                    )
+                await writer.commit()
+
+        return op, cleanup
+
+    return factory
+
+
+for _rows, _label in ((1, "hot_row"), (64, "64_rows")):
+    benchmark(f"occ.stock_level_update[8_writers_{_label}_for_update]", requires_db=True)(
+        _contended_updates(_rows, optimistic=False)
+    )
+    benchmark(f"occ.stock_level_update[8_writers_{_label}_version_cas]", requires_db=True)(
+        _contended_updates(_rows, optimistic=True)
+    )
+
+
+# ---------------------------------------------------------
+# STOCKTAKE: 100k distinct SKUs counted at one location
+# ---------------------------------------------------------
+STOCKTAKE_SKUS = 100_000
+
+_STOCKTAKE_ITEMS_SQL = text("""
+    INSERT INTO inv.items (org_id, sku, name, item_type, default_price)
+    SELECT :org_id, 'STK-' || g, 'Stocktake item ' || g, 'product', 0
+    FROM generate_series(1, :n) g
+""")
+
+# Half the SKUs already have a level at the location
+_STOCKTAKE_LEVELS_SQL = text("""
+    INSERT INTO inv.stock_levels (org_id, item_id, location_id, quantity_on_hand)
+    SELECT org_id, item_id, :location_id, 3
+    FROM inv.items
+    WHERE org_id = :org_id AND sku LIKE 'STK-%' AND substr(sku, 5)::int % 2 = 0
+""")
+
+
+def _stocktake_csv(quantity: int) -> bytes:
+    rows = "".join(f"STK-{n},{quantity}\n" for n in range(1, STOCKTAKE_SKUS + 1))
+    return ("sku,quantity\n" + rows).encode()
+
+
+async def _stream(body: bytes, chunk: int = 65536):
+    for start in range(0, len(body), chunk):
+        yield body[start:start + chunk]
+
+
+def _stocktake(preview: bool = False, apply: bool = False):
+    async def factory(session):
+        org_id = await _org_with(session, StockLevel)
+        location_id = await session.scalar(
+            select(Location.location_id).where(Location.org_id == org_id).limit(1)
+        )
+        params = {"org_id": org_id, "location_id": location_id, "n": STOCKTAKE_SKUS}
+        await session.execute(_STOCKTAKE_ITEMS_SQL, params)
+        await session.execute(_STOCKTAKE_LEVELS_SQL, params)
+        payload = StocktakeCreate(location_id=location_id)
+        # Alternate counts so every apply has a variance on every SKU
+        bodies = [_stocktake_csv(5), _stocktake_csv(6)]
+        runs = 0
+
+        async def upload() -> uuid.UUID:
+            nonlocal runs
+            stocktake = await stocktake_service.open(session, payload, org_id=org_id)
+            body = bodies[runs % 2]
+            runs += 1
+            await stocktake_service.upload(
+                session, stocktake.stocktake_id, _stream(body), "text/csv", org_id=org_id
+            )
+            return stocktake.stocktake_id
+
+        if preview:
+            stocktake_id = await upload()
+
+            async def op():
+                await stocktake_service.preview(session, stocktake_id, org_id=org_id)
+
+            return op
+
+        async def op():
+            stocktake_id = await upload()
+            if apply:
+                await stocktake_service.apply(session, stocktake_id, org_id=org_id)
+
+        return op
+
+    return factory
+
+
+benchmark("stocktake.upload[100k_rows_csv]", requires_db=True)(_stocktake())
+benchmark("stocktake.preview[100k_skus]", requires_db=True)(_stocktake(preview=True))
+benchmark("stocktake.upload_and_apply[100k_skus]", requires_db=True)(_stocktake(apply=True))
+
+
+# ---------------------------------------------------------
+# AS OF: point-in-time levels over a two-year, 500-movements-per-level
+# ledger, from the nearest snapshot vs walking back from the current
+# levels through the whole ledger
+# ---------------------------------------------------------
+AS_OF_MOVEMENTS_PER_LEVEL = 500
+
+_AS_OF_LEDGER_SQL = text("""
+    INSERT INTO inv.stock_movements
+        (org_id, item_id, location_id, source_type, quantity_delta, occurred_at, created_at)
+    SELECT sl.org_id, sl.item_id, sl.location_id, 'bench', 1, g.t, g.t
+    FROM inv.stock_levels sl
+    CROSS JOIN LATERAL (
+        SELECT now() - interval '730 days' * random() AS t
+        FROM generate_series(1, :n)
+    ) g
+    WHERE sl.org_id = :org_id
+""")
+
+
+def _as_of(snapshot: bool):
+    async def factory(session):
+        org_id = await _org_with(session, StockLevel)
+        await session.execute(_AS_OF_LEDGER_SQL, {"org_id": org_id, "n": AS_OF_MOVEMENTS_PER_LEVEL})
+        at = await session.scalar(select(func.now()))
+        if snapshot:
+            await stock_snapshot_service.take(session, org_id)
+        else:
+            at -= timedelta(days=730)
+
+        async def op():
+            await stock_snapshot_service.as_of(session, org_id, at, limit=1000)
+
+        return op
+
+    return factory
+
+
+benchmark("stock_levels.as_of[200k_movements_walk_back]", requires_db=True)(_as_of(snapshot=False))
+benchmark("stock_levels.as_of[200k_movements_snapshot]", requires_db=True)(_as_of(snapshot=True))
+
+
+# ---------------------------------------------------------
+# LEDGER VERIFY: levels vs. movement totals for the org over the same
+# ~200k-movement ledger, scanned as one item range vs sixteen
+# ---------------------------------------------------------
+def _ledger_verify(partitions: int):
+    async def factory(session):
+        org_id = await _org_with(session, StockLevel)
+        await session.execute(_AS_OF_LEDGER_SQL, {"org_id": org_id, "n": AS_OF_MOVEMENTS_PER_LEVEL})
+        service = StockLedgerService(partitions, batch_rows=5000, concurrency=1)
+
+        async def op():
+            await service.verify_org(session, org_id)
+
+        return op
+
+    return factory
+
+
+benchmark("stock_ledger.verify[200k_movements_1_range]", requires_db=True)(_ledger_verify(1))
+benchmark("stock_ledger.verify[200k_movements_16_ranges]", requires_db=True)(_ledger_verify(16))
@@ -0,0 +1,243 @@
+# backend/benchmarks/micro/harness.py
+
+from __future__ import annotations
+
+import contextlib
+import gc
+import inspect
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+
+# ---------------------------------------------------------
+# REGISTRY
+# ---------------------------------------------------------
+@dataclass
+class BenchmarkCase:
+    name: str
+    factory: Callable[..., Any]
+    requires_db: bool = False
+    threshold: Optional[float] = None   # overrides the global regression threshold
+
+
+REGISTRY: Dict[str, BenchmarkCase] = {}
+
+
+def benchmark(name: str, *, requires_db: bool = False, threshold: Optional[float] = None):
+    """
+    Register a benchmark factory.
+
+    The factory does all setup and returns the zero-argument operation to
+    time (a plain function or a coroutine function). DB factories are
+    async and receive an AsyncSession whose work is rolled back afterwards;
+    one that must commit on other connections returns (op, cleanup) and
+    cleanup() is awaited once the case has been measured.
+    """
+
+    def decorator(factory):
+        if name in REGISTRY:
+            raise ValueError(f"Duplicate benchmark name: {name}")
+        REGISTRY[name] = BenchmarkCase(name, factory, requires_db, threshold)
+        return factory
+
+    return decorator
+
+
+# ---------------------------------------------------------
+# TIMING
+# ---------------------------------------------------------
+@dataclass
+class Timing:
+    loops: int
+    samples: List[float]   # seconds per operation, one per repeat
+
+    def as_dict(self) -> Dict[str, float]:
+        median = statistics.median(self.samples)
+        return {
+            "median_us": round(median * 1e6, 3),
+            "mean_us": round(statistics.fmean(self.samples) * 1e6, 3),
+            "min_us": round(min(self.samples) * 1e6, 3),
+            "stdev_us": round(statistics.pstdev(self.samples) * 1e6, 3),
+            "ops_per_s": round(1.0 / median, 1) if median else 0.0,
+            "loops": self.loops,
+            "repeat": len(self.samples),
+        }
+
+
+async def _run_loops(op: Callable[[], Any], is_async: bool, loops: int) -> float:
+    perf = time.perf_counter
+    if is_async:
+        started = perf()
+        for _ in range(loops):
+            await op()
+        return perf() - started
+
+    started = perf()
+    for _ in range(loops):
+        op()
+    return perf() - started
+
+
+async def measure(op: Callable[[], Any], repeat: int = 7, min_time: float = 0.2) -> Timing:
+    """
+    timeit-style measurement: grow the loop count until one repeat takes at
+    least `min_time`, then take `repeat` samples of that many loops.
+    """
+    is_async = inspect.iscoroutinefunction(op)
+
+    # Warm caches / lazy imports / prepared statements
+    await _run_loops(op, is_async, 1)
+
+    loops = 1
+    while True:
+        elapsed = await _run_loops(op, is_async, loops)
+        if elapsed >= min_time or loops >= 1_000_000:
+            break
+        loops *= 10 if elapsed < min_time / 10 else 2
+
+    samples = []
+    for _ in range(repeat):
+        samples.append(await _run_loops(op, is_async, loops) / loops)
+    return Timing(loops, samples)
+
+
+# ---------------------------------------------------------
+# ALLOCATIONS
+# ---------------------------------------------------------
+async def measure_allocations(op: Callable[[], Any]) -> Dict[str, float]:
+    """
+    Memory one call allocates: `retained_blocks` are the blocks still alive
+    while its result is held (what the result itself costs), `peak_kib` is
+    tracemalloc's high-water mark during the call. Run after timing, so
+    caches and lazy imports are already warm.
+    """
+    is_async = inspect.iscoroutinefunction(op)
+
+    gc.collect()
+    before = sys.getallocatedblocks()
+    result = await op() if is_async else op()
+    retained = sys.getallocatedblocks() - before
+    del result
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = await op() if is_async else op()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+
+    return {"retained_blocks": retained, "peak_kib": round(peak / 1024, 1)}
+
+
+# ---------------------------------------------------------
+# COMPARISON
+# ---------------------------------------------------------
+def compare(
+    baseline: Dict[str, dict],
+    current: Dict[str, dict],
+    threshold: float,
+    overrides: Optional[Dict[str, float]] = None,
+) -> List[dict]:
+    """
+    Compare median times per benchmark. A benchmark regresses when
+    current / baseline > 1 + threshold.
+    """
+    overrides = overrides or {}
+    rows = []
+    for name in sorted(set(baseline) | set(current)):
+        if name not in current:
+            rows.append({"name": name, "status": "missing"})
+            continue
+        if name not in baseline:
+            rows.append({"name": name, "status": "new", "current_us": current[name]["median_us"]})
+            continue
+
+        limit = overrides.get(name, threshold)
+        before = baseline[name]["median_us"]
+        after = current[name]["median_us"]
+        ratio = after / before if before else float("inf")
+        if ratio > 1 + limit:
+            status = "regressed"
+        elif ratio < 1 - limit:
+            status = "improved"
+        else:
+            status = "ok"
+
+        rows.append({
+            "name": name,
+            "status": status,
+            "baseline_us": before,
+            "current_us": after,
+            "ratio": round(ratio, 3),
+            "threshold": limit,
+        })
+    return rows
+
+
+# ---------------------------------------------------------
+# SUITE RUNNER
+# ---------------------------------------------------------
+@contextlib.asynccontextmanager
+async def rollback_session():
+    """
+    AsyncSession bound to one connection inside an outer transaction.
+    Service-level commits only release savepoints; everything is rolled
+    back on exit so DB benchmarks leave the dataset untouched.
+    """
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from src.app.core.database import engine
+
+    engine.sync_engine.echo = False   # statement logging would dominate the timings
+    async with engine.connect() as conn:
+        outer = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await outer.rollback()
+
+
+async def run_suite(
+    cases: List[BenchmarkCase],
+    repeat: int = 7,
+    min_time: float = 0.2,
+    progress: Optional[Callable[[str, Dict[str, float]], None]] = None,
+    allocations: bool = False,
+) -> Dict[str, dict]:
+    """
+    Run each case in isolation and return {name: Timing.as_dict()}, plus
+    measure_allocations() fields when `allocations` is set.
+    """
+    results: Dict[str, dict] = {}
+    for case in cases:
+        if case.requires_db:
+            async with rollback_session() as session:
+                op = await case.factory(session)
+                op, cleanup = op if isinstance(op, tuple) else (op, None)
+                try:
+                    timing = await measure(op, repeat=repeat, min_time=min_time)
+                    memory = await measure_allocations(op) if allocations else {}
+                finally:
+                    if cleanup is not None:
+                        await cleanup()
+        else:
+            op = case.factory()
+            timing = await measure(op, repeat=repeat, min_time=min_time)
+            memory = await measure_allocations(op) if allocations else {}
+
+        results[case.name] = {**timing.as_dict(), **memory}
+        if progress:
+            progress(case.name, results[case.name])
+    return results
@@ -0,0 +1,19 @@
+# backend/benchmarks/plans/__init__.py
+"""
+Query plan regression suite: capture the SQL the repository / service layer
+issues against a generated dataset, EXPLAIN (ANALYZE, BUFFERS) each
+statement, flag bad plan shapes and compare plan fingerprints against a
+stored baseline. See benchmarks/README.md.
+"""
+
+from benchmarks.plans.analyze import PlanThresholds, analyze_plan, fingerprint
+from benchmarks.plans.capture import CapturedStatement, StatementRecorder, normalize_sql
+
+__all__ = [
+    "CapturedStatement",
+    "PlanThresholds",
+    "StatementRecorder",
+    "analyze_plan",
+    "fingerprint",
+    "normalize_sql",
+]
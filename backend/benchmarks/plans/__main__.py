@@ -0,0 +1,114 @@
+# backend/benchmarks/plans/__main__.py
+"""
+Capture and EXPLAIN the repository / service layer's SQL.
+
+    # Report flags for the current tree
+    python -m benchmarks.plans
+
+    # Store fingerprints for review (benchmarks/baselines/plans-small.json)
+    python -m benchmarks.plans --save-baseline plans-small
+
+    # Fail (exit 1) when a plan changed or picked up a new flag
+    python -m benchmarks.plans --check plans-small
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from typing import Sequence
+from uuid import UUID
+
+from benchmarks.micro.__main__ import baseline_path, write_results
+from benchmarks.plans.analyze import PlanThresholds
+from benchmarks.plans.runner import baseline_view, compare, run
+
+
+def print_report(report: dict) -> None:
+    out = sys.stderr
+    for label, error in report["step_errors"].items():
+        print(f"! step {label} failed: {error}", file=out)
+
+    for qid, entry in report["queries"].items():
+        flags = entry.get("flags", [])
+        marker = "!!" if flags or "error" in entry else "  "
+        timing = f"{entry['execution_ms']:>9.3f} ms" if "execution_ms" in entry else f"{'-':>12}"
+        print(f"{marker} {qid}  {timing}  {', '.join(entry['labels'])}", file=out)
+        if "error" in entry:
+            print(f"      error: {entry['error']}", file=out)
+        for flag in flags:
+            print(f"      {flag['kind']}: {flag.get('relation') or ''} {flag['detail']}", file=out)
+
+
+def print_comparison(rows) -> int:
+    failures = 0
+    for row in rows:
+        if row["status"] == "ok":
+            continue
+        print(f"{row['status'].upper():<13} {row['query_id']}  {row['label']}")
+        if row["status"] in ("plan_changed", "new_flags", "new"):
+            if row["status"] != "new":
+                print("  before:")
+                for line in row["before"].get("shape", []):
+                    print(f"    {line}")
+            print("  after:")
+            for line in row["after"].get("shape", []):
+                print(f"    {line}")
+            for flag in row["after"].get("flags", []):
+                print(f"    ! {flag['kind']}: {flag['detail']}")
+        if row["status"] in ("plan_changed", "new_flags"):
+            failures += 1
+    if not failures:
+        print("All captured plans match the baseline")
+    return failures
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="ArcoirisPOS query plan regression suite.")
+    parser.add_argument("--dsn", help="Postgres URL (default: settings.database_url)")
+    parser.add_argument("--org-id", type=UUID, help="Org to sample ids from (default: the one with most sales)")
+    parser.add_argument("-k", "--filter", action="append", help="Only run workload steps containing this text")
+    parser.add_argument("--large-table-rows", type=int, default=PlanThresholds.large_table_rows)
+    parser.add_argument("--estimate-factor", type=float, default=PlanThresholds.estimate_factor)
+    parser.add_argument("--estimate-min-rows", type=int, default=PlanThresholds.estimate_min_rows)
+    parser.add_argument("-o", "--output", help="Write the full JSON report here")
+    parser.add_argument("--save-baseline", metavar="NAME", help="Store fingerprints as benchmarks/baselines/NAME.json")
+    parser.add_argument("--check", metavar="BASELINE", help="Baseline name or path to compare against")
+    parser.add_argument("--fail-on-flags", action="store_true", help="Exit 1 if any query is flagged")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = parse_args(argv)
+
+    if args.dsn is None:
+        from src.app.core.config import settings
+
+        args.dsn = settings.database_url
+
+    thresholds = PlanThresholds(
+        large_table_rows=args.large_table_rows,
+        estimate_factor=args.estimate_factor,
+        estimate_min_rows=args.estimate_min_rows,
+    )
+    report = asyncio.run(run(args.dsn, args.org_id, thresholds, args.filter))
+    print_report(report)
+
+    if args.output:
+        write_results(args.output, report)
+    if args.save_baseline:
+        write_results(baseline_path(args.save_baseline), baseline_view(report))
+
+    status = 0
+    if args.check:
+        with open(baseline_path(args.check)) as fh:
+            status = 1 if print_comparison(compare(json.load(fh), report)) else 0
+    if args.fail_on_flags and any(q.get("flags") for q in report["queries"].values()):
+        status = 1
+    sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+# backend/benchmarks/plans/analyze.py
+"""
+Plan inspection for EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) output.
+
+A plan's *shape* is its tree of node types, relations, indexes and join
+strategies — no costs or row counts — so its fingerprint only changes when
+the planner picks a different plan, not when timings wobble.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+# Keys that identify *what* a node does (never how much it cost)
+SHAPE_KEYS = (
+    "Node Type",
+    "Strategy",
+    "Join Type",
+    "Parent Relationship",
+    "Relation Name",
+    "Index Name",
+    "Scan Direction",
+    "CTE Name",
+)
+
+
+@dataclass(frozen=True)
+class PlanThresholds:
+    large_table_rows: int = 10_000      # seq scans below this are fine
+    estimate_factor: float = 10.0       # rows off by this factor or more ...
+    estimate_min_rows: int = 1_000      # ... on a node that touched at least this many
+
+
+# ---------------------------------------------------------
+# WALKING
+# ---------------------------------------------------------
+def iter_nodes(node: Dict[str, Any], depth: int = 0) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    yield depth, node
+    for child in node.get("Plans", ()):
+        yield from iter_nodes(child, depth + 1)
+
+
+def _describe(node: Dict[str, Any]) -> str:
+    text = node["Node Type"]
+    if node.get("Strategy") and node["Strategy"] != "Plain":
+        text = f"{node['Strategy']} {text}"
+    if node.get("Join Type") and node["Join Type"] != "Inner":
+        text += f" ({node['Join Type']})"
+    if node.get("Index Name"):
+        text += f" using {node['Index Name']}"
+    if node.get("Relation Name"):
+        text += f" on {node['Relation Name']}"
+    if node.get("Sort Key"):
+        text += f" [{', '.join(node['Sort Key'])}]"
+    return text
+
+
+def shape(root: Dict[str, Any]) -> List[str]:
+    """Indented one-line-per-node rendering, stored in baselines for review diffs."""
+    return [f"{'  ' * depth}{_describe(node)}" for depth, node in iter_nodes(root)]
+
+
+def _shape_tree(node: Dict[str, Any]) -> list:
+    return [
+        [node.get(key) for key in SHAPE_KEYS] + [node.get("Sort Key")],
+        [_shape_tree(child) for child in node.get("Plans", ())],
+    ]
+
+
+def fingerprint(root: Dict[str, Any]) -> str:
+    raw = json.dumps(_shape_tree(root), separators=(",", ":"))
+    return hashlib.sha1(raw.encode()).hexdigest()[:16]
+
+
+# ---------------------------------------------------------
+# FLAGS
+# ---------------------------------------------------------
+def _iter_with_limit(
+    node: Dict[str, Any],
+    under_limit: bool = False,
+) -> Iterator[Tuple[Dict[str, Any], bool]]:
+    yield node, under_limit
+    under_limit = under_limit or node["Node Type"] == "Limit"
+    for child in node.get("Plans", ()):
+        yield from _iter_with_limit(child, under_limit)
+
+
+def find_flags(
+    root: Dict[str, Any],
+    table_rows: Dict[str, float],
+    thresholds: PlanThresholds,
+) -> List[Dict[str, Any]]:
+    flags = []
+    for node, under_limit in _iter_with_limit(root):
+        node_type = node["Node Type"]
+        relation = node.get("Relation Name")
+
+        if node_type == "Seq Scan" and table_rows.get(relation, 0) >= thresholds.large_table_rows:
+            flags.append({
+                "kind": "seq_scan",
+                "relation": relation,
+                "detail": f"~{int(table_rows[relation])} rows in table",
+            })
+
+        if node.get("Sort Space Type") == "Disk":
+            flags.append({
+                "kind": "sort_spill",
+                "relation": relation,
+                "detail": f"{node.get('Sort Method')} {node.get('Sort Space Used')} kB",
+            })
+
+        if node.get("Hash Batches", 1) > 1:
+            flags.append({
+                "kind": "hash_spill",
+                "relation": relation,
+                "detail": f"{node['Hash Batches']} batches",
+            })
+
+        loops = node.get("Actual Loops", 0)
+        if loops:
+            estimated = node.get("Plan Rows", 0)
+            actual = node.get("Actual Rows", 0)
+            high, low = max(estimated, actual), max(min(estimated, actual), 1)
+            # Below a LIMIT the executor stops early by design: fewer rows than
+            # estimated is expected there, more is still a misestimate.
+            truncated = under_limit and actual < estimated
+            if (
+                not truncated
+                and high >= thresholds.estimate_min_rows
+                and high / low >= thresholds.estimate_factor
+            ):
+                flags.append({
+                    "kind": "estimate_error",
+                    "relation": relation,
+                    "detail": f"{_describe(node)}: estimated {estimated}, actual {actual}",
+                })
+    return flags
+
+
+# ---------------------------------------------------------
+# ENTRY POINT
+# ---------------------------------------------------------
+def analyze_plan(
+    explain_output: List[Dict[str, Any]],
+    table_rows: Dict[str, float],
+    thresholds: PlanThresholds = PlanThresholds(),
+) -> Dict[str, Any]:
+    """Summarise one EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) result."""
+    top = explain_output[0]
+    root = top["Plan"]
+    return {
+        "fingerprint": fingerprint(root),
+        "shape": shape(root),
+        "flags": find_flags(root, table_rows, thresholds),
+        "planning_ms": top.get("Planning Time"),
+        "execution_ms": top.get("Execution Time"),
+        "actual_rows": root.get("Actual Rows"),
+        "shared_hit_blocks": root.get("Shared Hit Blocks", 0),
+        "shared_read_blocks": root.get("Shared Read Blocks", 0),
+        "temp_written_blocks": root.get("Temp Written Blocks", 0),
+    }
@@ -0,0 +1,101 @@
+# backend/benchmarks/plans/capture.py
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import re
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+_PLANNABLE = ("select", "with", "insert", "update", "delete")
+
+_current_label: ContextVar[Optional[str]] = ContextVar("plan_capture_label", default=None)
+
+
+# ---------------------------------------------------------
+# NORMALISATION
+# ---------------------------------------------------------
+_WS = re.compile(r"\s+")
+_PARAM = re.compile(r"\$\d+(::[\w\[\]]+)?")
+_PARAM_LIST = re.compile(r"\$\?(?:, \$\?)+")
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    Collapse whitespace and parameter numbering so the same query built with
+    different bind values (or a different IN-list length) has one identity.
+    """
+    sql = _WS.sub(" ", statement).strip()
+    sql = _PARAM.sub("$?", sql)
+    return _PARAM_LIST.sub("$?...", sql)
+
+
+def query_id(normalized: str) -> str:
+    return hashlib.sha1(normalized.encode()).hexdigest()[:12]
+
+
+# ---------------------------------------------------------
+# RECORDER
+# ---------------------------------------------------------
+@dataclass
+class CapturedStatement:
+    query_id: str
+    normalized: str
+    statement: str                      # first concrete statement seen ($n placeholders)
+    parameters: Tuple[Any, ...]         # and its DBAPI parameters
+    labels: List[str] = field(default_factory=list)
+    calls: int = 0
+
+
+class StatementRecorder:
+    """
+    Collects every plannable statement an engine executes while `listening()`,
+    deduplicated by normalized SQL and tagged with the active `step()` label.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+        self.statements: Dict[str, CapturedStatement] = {}
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        label = _current_label.get()
+        if label is None or not statement.lstrip().lower().startswith(_PLANNABLE):
+            return
+        if "pg_catalog" in statement:   # dialect introspection, not app queries
+            return
+
+        normalized = normalize_sql(statement)
+        qid = query_id(normalized)
+        captured = self.statements.get(qid)
+        if captured is None:
+            if executemany:
+                parameters = parameters[0] if parameters else ()
+            captured = CapturedStatement(qid, normalized, statement, tuple(parameters or ()))
+            self.statements[qid] = captured
+
+        captured.calls += 1
+        if label not in captured.labels:
+            captured.labels.append(label)
+
+    @contextlib.contextmanager
+    def listening(self) -> Iterator["StatementRecorder"]:
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        try:
+            yield self
+        finally:
+            event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def step(label: str) -> Iterator[None]:
+        token = _current_label.set(label)
+        try:
+            yield
+        finally:
+            _current_label.reset(token)
@@ -0,0 +1,166 @@
+# backend/benchmarks/plans/runner.py
+
+from __future__ import annotations
+
+import json
+import traceback
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+import asyncpg
+
+from benchmarks.micro.harness import rollback_session
+from benchmarks.plans.analyze import PlanThresholds, analyze_plan
+from benchmarks.plans.capture import StatementRecorder
+from benchmarks.plans.workload import STEPS, sample_context
+from benchmarks.scale_data import asyncpg_dsn
+
+
+EXPLAIN = "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) "
+
+
+# ---------------------------------------------------------
+# CAPTURE
+# ---------------------------------------------------------
+async def capture(org_id: Optional[UUID] = None, only: Optional[List[str]] = None):
+    """Run the workload once and return (recorder, sampled org_id, step errors)."""
+    from src.app.core.database import engine
+
+    recorder = StatementRecorder(engine.sync_engine)
+    errors: Dict[str, str] = {}
+
+    async with rollback_session() as session:
+        ctx = await sample_context(session, org_id)
+        with recorder.listening():
+            for label, fn in STEPS.items():
+                if only and not any(pattern in label for pattern in only):
+                    continue
+                try:
+                    with recorder.step(label):
+                        await fn(session, ctx)
+                except Exception as exc:   # a broken service is a finding, not a crash
+                    errors[label] = "".join(traceback.format_exception_only(type(exc), exc)).strip()
+                    await session.rollback()
+                session.expunge_all()
+
+    await engine.dispose()
+    return recorder, ctx.org_id, errors
+
+
+# ---------------------------------------------------------
+# EXPLAIN
+# ---------------------------------------------------------
+async def table_row_estimates(conn: asyncpg.Connection) -> Dict[str, float]:
+    rows = await conn.fetch(
+        """
+        SELECT c.relname, c.reltuples
+          FROM pg_class c
+          JOIN pg_namespace n ON n.oid = c.relnamespace
+         WHERE c.relkind IN ('r', 'p')
+           AND n.nspname IN ('core', 'acct', 'inv', 'pos')
+        """
+    )
+    return {row["relname"]: max(row["reltuples"], 0) for row in rows}
+
+
+async def explain(conn: asyncpg.Connection, statement: str, parameters) -> List[Dict[str, Any]]:
+    """EXPLAIN ANALYZE one statement inside a transaction that is always rolled back."""
+    tx = conn.transaction()
+    await tx.start()
+    try:
+        raw = await conn.fetchval(EXPLAIN + statement, *parameters)
+    finally:
+        await tx.rollback()
+    return json.loads(raw) if isinstance(raw, str) else raw
+
+
+async def run(
+    dsn: str,
+    org_id: Optional[UUID] = None,
+    thresholds: PlanThresholds = PlanThresholds(),
+    only: Optional[List[str]] = None,
+) -> dict:
+    recorder, sampled_org, step_errors = await capture(org_id, only)
+
+    conn = await asyncpg.connect(asyncpg_dsn(dsn))
+    try:
+        table_rows = await table_row_estimates(conn)
+        server_version = await conn.fetchval("SHOW server_version")
+        queries: Dict[str, dict] = {}
+        for qid, captured in sorted(recorder.statements.items(), key=lambda kv: kv[1].labels[0]):
+            entry: Dict[str, Any] = {
+                "labels": captured.labels,
+                "calls": captured.calls,
+                "sql": captured.normalized,
+            }
+            try:
+                entry.update(analyze_plan(
+                    await explain(conn, captured.statement, captured.parameters),
+                    table_rows,
+                    thresholds,
+                ))
+            except asyncpg.PostgresError as exc:
+                entry["error"] = f"{type(exc).__name__}: {exc}"
+            queries[qid] = entry
+    finally:
+        await conn.close()
+
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "org_id": str(sampled_org),
+            "server_version": server_version,
+            "thresholds": thresholds.__dict__,
+            "table_rows": {name: int(n) for name, n in sorted(table_rows.items()) if n >= 1},
+        },
+        "step_errors": step_errors,
+        "queries": queries,
+    }
+
+
+# ---------------------------------------------------------
+# BASELINE COMPARISON
+# ---------------------------------------------------------
+def _flag_keys(entry: dict) -> set:
+    return {(flag["kind"], flag.get("relation")) for flag in entry.get("flags", ())}
+
+
+def compare(baseline: dict, current: dict) -> List[dict]:
+    """
+    Per query: plan_changed when the fingerprint differs, new_flags when a
+    flag kind/relation appears that the baseline did not have.
+    """
+    rows = []
+    before_q, after_q = baseline["queries"], current["queries"]
+    for qid in sorted(set(before_q) | set(after_q)):
+        before, after = before_q.get(qid), after_q.get(qid)
+        label = (after or before)["labels"][0]
+        if after is None:
+            rows.append({"query_id": qid, "label": label, "status": "missing"})
+            continue
+        if before is None:
+            status = "new_flags" if after.get("flags") else "new"
+            rows.append({"query_id": qid, "label": label, "status": status, "after": after})
+            continue
+
+        status = "ok"
+        if after.get("fingerprint") != before.get("fingerprint"):
+            status = "plan_changed"
+        elif _flag_keys(after) - _flag_keys(before):
+            status = "new_flags"
+        rows.append({"query_id": qid, "label": label, "status": status, "before": before, "after": after})
+    return rows
+
+
+def baseline_view(report: dict) -> dict:
+    """Strip run-to-run noise (timings, buffers) so baseline diffs show plan changes only."""
+    keep = ("labels", "sql", "fingerprint", "shape", "flags", "error")
+    return {
+        "meta": {k: v for k, v in report["meta"].items() if k != "created_at"},
+        "step_errors": report["step_errors"],
+        "queries": {
+            qid: {k: entry[k] for k in keep if k in entry}
+            for qid, entry in report["queries"].items()
+        },
+    }
@@ -0,0 +1,293 @@
+# backend/benchmarks/plans/workload.py
+"""
+The repository / service calls whose SQL gets captured.
+
+Each step calls the same service method a route would, with ids sampled
+from one org of the generated dataset (the org with the most sales, so its
+plans are the ones that degrade first). Writes are rolled back.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Register every mapped class (same set the app and seed_dev_data.py load)
+import src.app.core.base  # noqa: F401
+import src.app.org.models.organization_settings_model  # noqa: F401
+from src.app.org.models.user_models import User
+from src.app.org.models.role_models import UserOrgRole
+from src.app.inventory.models.item_models import Item
+from src.app.inventory.models.stock_level_models import StockLevel
+from src.app.pos.models.customer_models import Customer
+from src.app.pos.models.sale_models import Sale
+from src.app.pos.models.tax_rate_models import TaxRate
+
+from src.app.inventory.schemas.inv_schemas import StockAdjustmentCreate
+from src.app.pos.schemas.pos_schemas import SaleCreate
+from src.app.inventory.services.item_service import item_service
+from src.app.inventory.services.location_service import location_service
+from src.app.inventory.services.stock_adjustments import stock_adjustment_service
+from src.app.inventory.services.stock_level_service import stock_level_service
+from src.app.inventory.services.stock_movement_service import stock_movement_service
+from src.app.org.repositories.org_repository import get_org_by_id
+from src.app.org.repositories.role_repository import get_roles_for_user_in_org
+from src.app.org.repositories.user_repository import get_user_by_email, get_user_by_id
+from src.app.org.services.organization_settings_service import get_or_create_org_settings
+from src.app.pos.services.checkout_service import checkout_service
+from src.app.pos.services.customer_service import customer_service
+from src.app.pos.services.payment_service import payment_service
+from src.app.pos.services.sale_line_service import sale_line_service
+from src.app.pos.services.sales_service import sales_service
+from src.app.pos.services.tax_rate_service import tax_rate_service
+from src.app.pos.services.terminal_service import terminal_service
+
+
+@dataclass
+class WorkloadContext:
+    org_id: UUID
+    user_id: UUID
+    email: str
+    item_ids: List[UUID]
+    tax_ids: List[UUID]
+    sale_id: Optional[UUID]
+    customer_id: Optional[UUID]
+    stock_level: Optional[StockLevel]
+
+
+Step = Callable[[AsyncSession, WorkloadContext], Awaitable[Any]]
+STEPS: Dict[str, Step] = {}
+
+
+def step(label: str):
+    def decorator(fn: Step) -> Step:
+        STEPS[label] = fn
+        return fn
+
+    return decorator
+
+
+# ---------------------------------------------------------
+# SAMPLING
+# ---------------------------------------------------------
+async def sample_context(session: AsyncSession, org_id: Optional[UUID] = None) -> WorkloadContext:
+    if org_id is None:
+        org_id = await session.scalar(
+            select(Sale.org_id).group_by(Sale.org_id).order_by(func.count().desc()).limit(1)
+        )
+        if org_id is None:
+            raise LookupError("pos.sales is empty; load a dataset with benchmarks.scale_data first")
+
+    user = (await session.execute(
+        select(User.user_id, User.email)
+        .join(UserOrgRole, UserOrgRole.user_id == User.user_id)
+        .where(UserOrgRole.org_id == org_id)
+        .order_by(UserOrgRole.is_primary.desc())
+        .limit(1)
+    )).one()
+
+    item_ids = list(await session.scalars(
+        select(Item.item_id).where(Item.org_id == org_id, Item.deleted_at.is_(None)).limit(30)
+    ))
+    tax_ids = list(await session.scalars(select(TaxRate.tax_id).where(TaxRate.org_id == org_id)))
+    sale_id = await session.scalar(
+        select(Sale.sale_id)
+        .where(Sale.org_id == org_id, Sale.status != "archived")
+        .order_by(Sale.sale_date.desc())
+        .limit(1)
+    )
+    customer_id = await session.scalar(
+        select(Customer.customer_id).where(Customer.org_id == org_id).limit(1)
+    )
+    stock_level = await session.scalar(select(StockLevel).where(StockLevel.org_id == org_id).limit(1))
+
+    session.expunge_all()
+    return WorkloadContext(
+        org_id=org_id,
+        user_id=user.user_id,
+        email=user.email,
+        item_ids=item_ids,
+        tax_ids=tax_ids,
+        sale_id=sale_id,
+        customer_id=customer_id,
+        stock_level=stock_level,
+    )
+
+
+# ---------------------------------------------------------
+# AUTH / ORG
+# ---------------------------------------------------------
+@step("auth.get_user_by_email")
+async def _user_by_email(session, ctx):
+    await get_user_by_email(session, ctx.email)
+
+
+@step("auth.get_user_by_id")
+async def _user_by_id(session, ctx):
+    await get_user_by_id(session, ctx.user_id)
+
+
+@step("org.get_roles_for_user_in_org")
+async def _roles(session, ctx):
+    await get_roles_for_user_in_org(session, ctx.user_id, ctx.org_id)
+
+
+@step("org.get_org_by_id")
+async def _org(session, ctx):
+    await get_org_by_id(session, ctx.org_id)
+
+
+@step("org.settings.get_or_create")
+async def _settings(session, ctx):
+    await get_or_create_org_settings(session, ctx.org_id)
+
+
+# ---------------------------------------------------------
+# CATALOG
+# ---------------------------------------------------------
+@step("items.get_by_org")
+async def _items(session, ctx):
+    await item_service.get_by_org(session, ctx.org_id, limit=500)
+
+
+@step("items.get_by_org[deep_page]")
+async def _items_deep(session, ctx):
+    await item_service.get_by_org(session, ctx.org_id, limit=500, offset=5_000)
+
+
+@step("items.get_by_id")
+async def _item(session, ctx):
+    await item_service.get_by_id(session, ctx.item_ids[0])
+
+
+@step("tax_rates.get_by_org")
+async def _taxes(session, ctx):
+    await tax_rate_service.get_by_org(session, ctx.org_id)
+
+
+@step("terminals.get_by_org")
+async def _terminals(session, ctx):
+    await terminal_service.get_by_org(session, ctx.org_id)
+
+
+@step("locations.get_by_org")
+async def _locations(session, ctx):
+    await location_service.get_by_org(session, ctx.org_id)
+
+
+@step("customers.get_by_org")
+async def _customers(session, ctx):
+    await customer_service.get_by_org(session, ctx.org_id)
+
+
+@step("customers.get_by_id")
+async def _customer(session, ctx):
+    await customer_service.get_by_id(session, ctx.customer_id)
+
+
+# ---------------------------------------------------------
+# SALES
+# ---------------------------------------------------------
+@step("sales.get_by_org")
+async def _sales(session, ctx):
+    await sales_service.get_by_org(session, ctx.org_id)
+
+
+@step("sales.get_by_org[deep_page]")
+async def _sales_deep(session, ctx):
+    await sales_service.get_by_org(session, ctx.org_id, offset=10_000)
+
+
+@step("sales.get_with_relations")
+async def _sale(session, ctx):
+    await sales_service.get_with_relations(session, ctx.sale_id)
+
+
+@step("sale_lines.get_by_sale")
+async def _sale_lines(session, ctx):
+    await sale_line_service.get_by_sale(session, ctx.sale_id)
+
+
+@step("sale_lines.get_by_org")
+async def _sale_lines_org(session, ctx):
+    await sale_line_service.get_by_org(session, ctx.org_id)
+
+
+@step("payments.get_by_sale")
+async def _payments(session, ctx):
+    await payment_service.get_by_sale(session, ctx.sale_id)
+
+
+@step("payments.get_by_org")
+async def _payments_org(session, ctx):
+    await payment_service.get_by_org(session, ctx.org_id)
+
+
+@step("checkout.load_items")
+async def _load_items(session, ctx):
+    await checkout_service.load_items(session, ctx.org_id, ctx.item_ids)
+
+
+@step("checkout.load_tax_rates")
+async def _load_taxes(session, ctx):
+    await checkout_service.load_tax_rates(session, ctx.org_id, ctx.tax_ids)
+
+
+@step("checkout.load_context")
+async def _load_context(session, ctx):
+    sale = SaleCreate(
+        org_id=ctx.org_id,
+        status="completed",
+        sale_date=datetime.now(timezone.utc),
+        lines=[
+            {
+                "org_id": ctx.org_id,
+                "item_id": item_id,
+                "line_number": n,
+                "quantity": Decimal(1),
+                "unit_price": Decimal(0),
+                "line_total": Decimal(0),
+            }
+            for n, item_id in enumerate(ctx.item_ids, start=1)
+        ],
+    )
+    await checkout_service.load_context(session, sale, ctx.org_id)
+
+
+@step("sales.archive_sale")
+async def _archive(session, ctx):
+    await sales_service.archive_sale(session, ctx.sale_id, org_id=ctx.org_id)
+
+
+# ---------------------------------------------------------
+# INVENTORY
+# ---------------------------------------------------------
+@step("stock_levels.get_by_org")
+async def _stock_levels(session, ctx):
+    await stock_level_service.get_by_org(session, ctx.org_id)
+
+
+@step("stock_movements.get_by_org")
+async def _stock_movements(session, ctx):
+    await stock_movement_service.get_by_org(session, ctx.org_id)
+
+
+@step("stock.adjust")
+async def _adjust(session, ctx):
+    level = ctx.stock_level
+    await stock_adjustment_service.adjust(
+        session,
+        StockAdjustmentCreate(
+            item_id=level.item_id,
+            location_id=level.location_id,
+            quantity_delta=Decimal("1"),
+            reason="plan capture",
+        ),
+        org_id=ctx.org_id,
+    )
@@ -0,0 +1,768 @@
+#!/usr/bin/env python3
+# backend/benchmarks/scale_data.py
+"""
+ArcoirisPOS Scale Data Generator
+--------------------------------
+Builds the standard benchmark dataset on top of the seed_dev_data.py
+schema: N organizations, each with a realistic catalog, customers,
+terminals, locations, sales history and stock ledger.
+
+Every row is derived from (seed, org index), so the same profile + seed
+always produces the same dataset. Organizations are generated and loaded
+by parallel worker processes, each streaming its rows with COPY.
+
+Run from the backend directory:
+
+    python -m benchmarks.scale_data --profile medium --workers 8 --truncate
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import re
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timedelta, timezone
+from decimal import ROUND_HALF_UP, Decimal
+from itertools import accumulate
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+import asyncpg
+
+
+# ---------------------------------------------------------
+# PROFILES
+# ---------------------------------------------------------
+@dataclass(frozen=True)
+class ScaleProfile:
+    orgs: int
+    items_per_org: int
+    customers_per_org: int
+    terminals_per_org: int
+    locations_per_org: int
+    tax_rates_per_org: int
+    sales_per_org: int
+    days: int = 365
+    mean_lines_per_sale: float = 3.5
+    max_lines_per_sale: int = 40
+    customer_attach_rate: float = 0.35
+    split_payment_rate: float = 0.06
+    discount_rate: float = 0.07
+    soft_delete_rate: float = 0.02
+    restock_every_days: int = 14
+    item_popularity_skew: float = 1.1   # Zipf exponent for item demand
+
+
+PROFILES: Dict[str, ScaleProfile] = {
+    # ~40k rows — smoke runs and CI
+    "tiny": ScaleProfile(
+        orgs=2, items_per_org=200, customers_per_org=500, terminals_per_org=2,
+        locations_per_org=2, tax_rates_per_org=2, sales_per_org=2_000, days=30,
+    ),
+    # ~2.5M rows
+    "small": ScaleProfile(
+        orgs=5, items_per_org=2_000, customers_per_org=5_000, terminals_per_org=4,
+        locations_per_org=2, tax_rates_per_org=3, sales_per_org=50_000,
+    ),
+    # ~60M rows — the standard benchmark dataset
+    "medium": ScaleProfile(
+        orgs=20, items_per_org=10_000, customers_per_org=25_000, terminals_per_org=8,
+        locations_per_org=4, tax_rates_per_org=4, sales_per_org=250_000,
+    ),
+    # ~450M rows
+    "large": ScaleProfile(
+        orgs=50, items_per_org=25_000, customers_per_org=60_000, terminals_per_org=16,
+        locations_per_org=6, tax_rates_per_org=5, sales_per_org=600_000,
+    ),
+}
+
+DEFAULT_SEED = 20251128
+DEFAULT_START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+DEFAULT_PASSWORD = "BenchPass123!"
+
+
+# ---------------------------------------------------------
+# TARGET TABLES (load order respects foreign keys)
+# ---------------------------------------------------------
+COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "core.organizations": (
+        "org_id", "name", "legal_name", "display_name", "is_active",
+        "created_at", "updated_at",
+    ),
+    "core.organization_settings": (
+        "settings_id", "org_id", "rounding_mode", "rounding_apply_to",
+        "inventory_mode", "created_at", "updated_at",
+    ),
+    "core.users": (
+        "user_id", "email", "password_hash", "display_name", "is_active",
+        "created_at", "updated_at",
+    ),
+    "core.user_org_roles": (
+        "user_org_role_id", "org_id", "user_id", "role", "is_primary", "created_at",
+    ),
+    "pos.tax_rates": (
+        "tax_id", "org_id", "name", "rate_percent", "is_compound", "is_default",
+        "created_at", "updated_at",
+    ),
+    "inv.locations": (
+        "location_id", "org_id", "name", "code", "created_at", "updated_at", "deleted_at",
+    ),
+    "inv.items": (
+        "item_id", "org_id", "sku", "barcode", "name", "description", "item_type",
+        "default_price", "cost_basis", "tax_id", "is_active",
+        "created_at", "updated_at", "deleted_at",
+    ),
+    "pos.customers": (
+        "customer_id", "org_id", "first_name", "middle_name", "last_name", "email",
+        "phone", "street_address", "city", "state", "zip",
+        "created_at", "updated_at", "deleted_at",
+    ),
+    "pos.terminals": (
+        "terminal_id", "org_id", "name", "location_label", "is_active",
+        "created_at", "updated_at",
+    ),
+    "inv.stock_levels": (
+        "stock_level_id", "org_id", "item_id", "location_id", "quantity_on_hand", "updated_at",
+    ),
+    "pos.sales": (
+        "sale_id", "org_id", "terminal_id", "customer_id", "sale_number", "status",
+        "sale_type", "subtotal", "tax_total", "discount_total", "grand_total",
+        "amount_paid", "balance_due", "sale_date", "notes", "created_by",
+        "created_at", "updated_at",
+    ),
+    "pos.sale_lines": (
+        "sale_line_id", "org_id", "sale_id", "line_number", "item_id", "description",
+        "quantity", "unit_price", "discount_amount", "tax_id", "tax_amount",
+        "line_total", "created_at",
+    ),
+    "pos.payments": (
+        "payment_id", "org_id", "sale_id", "payment_method", "amount", "reference",
+        "created_at", "terminal_id",
+    ),
+    "inv.stock_movements": (
+        "movement_id", "org_id", "item_id", "location_id", "stock_level_id",
+        "source_type", "source_id", "quantity_delta", "unit_cost", "occurred_at",
+        "created_at",
+    ),
+}
+
+# Stock levels are loaded at zero and then set from the ledger in one
+# grouped pass, so quantity_on_hand always equals SUM(quantity_delta).
+SYNC_STOCK_LEVELS_SQL = """
+UPDATE inv.stock_levels AS sl
+   SET quantity_on_hand = m.qty
+  FROM (
+        SELECT stock_level_id, SUM(quantity_delta) AS qty
+          FROM inv.stock_movements
+         WHERE org_id = $1
+         GROUP BY stock_level_id
+       ) AS m
+ WHERE sl.stock_level_id = m.stock_level_id
+"""
+
+
+# ---------------------------------------------------------
+# VOCABULARY
+# ---------------------------------------------------------
+FIRST_NAMES = (
+    "Ana", "Luis", "Maria", "James", "Sofia", "Mateo", "Emma", "Noah", "Olivia",
+    "Liam", "Camila", "Diego", "Ava", "Lucas", "Isabella", "Ethan", "Valentina",
+    "Daniel", "Mia", "Gabriel",
+)
+LAST_NAMES = (
+    "Garcia", "Smith", "Martinez", "Johnson", "Lopez", "Brown", "Gonzalez",
+    "Davis", "Rodriguez", "Miller", "Hernandez", "Wilson", "Perez", "Moore",
+    "Sanchez", "Taylor", "Ramirez", "Anderson", "Torres", "Thomas",
+)
+CITIES = (
+    ("Springfield", "IL"), ("Austin", "TX"), ("Tucson", "AZ"), ("Fresno", "CA"),
+    ("Miami", "FL"), ("Denver", "CO"), ("Albany", "NY"), ("Salem", "OR"),
+)
+ITEM_ADJECTIVES = (
+    "Classic", "Organic", "Deluxe", "Mini", "Family", "Spicy", "Fresh", "Premium",
+    "Light", "Double", "Rainbow", "Golden",
+)
+ITEM_NOUNS = (
+    "Coffee", "Tortillas", "Salsa", "Notebook", "Candle", "Soap", "Granola",
+    "Tea", "Chocolate", "Batteries", "Socks", "Mug", "Cable", "Juice", "Bread",
+)
+TAX_RATES = (
+    ("State Sales Tax", Decimal("6.2500")),
+    ("Combined Local Tax", Decimal("8.2500")),
+    ("Prepared Food Tax", Decimal("9.5000")),
+    ("Reduced Grocery Tax", Decimal("2.2500")),
+    ("Exempt", Decimal("0.0000")),
+)
+ROUNDING_MODES = ("none", "nickel", "dime", "quarter", "dollar")
+SALE_STATUSES = ("completed", "archived", "voided", "open")
+SALE_STATUS_WEIGHTS = (90, 5, 3, 2)
+PAYMENT_METHODS = ("card", "cash", "gift_card")
+PAYMENT_METHOD_WEIGHTS = (52, 43, 5)
+# Relative store traffic per hour of day (07:00 .. 21:00)
+HOUR_WEIGHTS = (2, 4, 6, 7, 8, 10, 11, 9, 7, 7, 8, 10, 9, 6, 3)
+
+Q2 = Decimal("0.01")
+Q4 = Decimal("0.0001")
+HUNDRED = Decimal("100")
+
+
+def bench_admin_email(org_index: int) -> str:
+    """Login of the generated admin user for an organization."""
+    return f"admin@org{org_index:05d}.bench.arcoirispos.com"
+
+
+def bench_cashier_email(org_index: int, terminal_index: int) -> str:
+    """Login of the cashier assigned to a generated terminal."""
+    return f"cashier{terminal_index:03d}@org{org_index:05d}.bench.arcoirispos.com"
+
+
+# ---------------------------------------------------------
+# GENERATION (pure, deterministic)
+# ---------------------------------------------------------
+def _uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def _zipf_cum_weights(n: int, skew: float) -> List[float]:
+    return list(accumulate(1.0 / (rank + 1) ** skew for rank in range(n)))
+
+
+def _line_count(rng: random.Random, profile: ScaleProfile) -> int:
+    """Geometric basket size with the profile's mean, capped."""
+    p = 1.0 / profile.mean_lines_per_sale
+    n = 1 + int(math.log(1.0 - rng.random()) / math.log(1.0 - p))
+    return min(n, profile.max_lines_per_sale)
+
+
+def _quantity(rng: random.Random) -> Decimal:
+    roll = rng.random()
+    if roll < 0.80:
+        return Decimal(1)
+    if roll < 0.95:
+        return Decimal(2)
+    return Decimal(rng.randint(3, 12))
+
+
+def generate_org(
+    profile: ScaleProfile,
+    seed: int,
+    org_index: int,
+    start: datetime,
+    password_hash: str,
+    batch_size: int = 5_000,
+) -> Iterator[Tuple[str, List[tuple]]]:
+    """
+    Yield (table, rows) batches for one organization in load order.
+
+    Reference data is yielded first; sales and their lines, payments and
+    stock movements are then yielded in batches of `batch_size` sales so
+    memory stays flat regardless of history length.
+    """
+    rng = random.Random(f"arcoirispos:{seed}:{org_index}")
+    created = start - timedelta(days=30)
+
+    # -----------------------------------------------------
+    # 1. ORGANIZATION + SETTINGS
+    # -----------------------------------------------------
+    org_id = _uuid(rng)
+    org_name = f"Bench Org {org_index:05d}"
+    yield "core.organizations", [
+        (org_id, org_name, f"{org_name} LLC", org_name, True, created, created)
+    ]
+
+    rounding_mode = rng.choice(ROUNDING_MODES)
+    rounding_apply_to = "none" if rounding_mode == "none" else rng.choice(("cash_only", "all_payments"))
+    yield "core.organization_settings", [(
+        _uuid(rng), org_id, rounding_mode, rounding_apply_to,
+        rng.choice(("deduct_on_cart", "deduct_on_sale")), created, created,
+    )]
+
+    # -----------------------------------------------------
+    # 2. USERS + ROLES (one admin, one cashier per terminal)
+    # -----------------------------------------------------
+    admin_id = _uuid(rng)
+    users = [(admin_id, bench_admin_email(org_index), password_hash, "Bench Admin", True, created, created)]
+    roles = [(_uuid(rng), org_id, admin_id, "admin", True, created)]
+
+    cashier_ids = []
+    for t in range(profile.terminals_per_org):
+        user_id = _uuid(rng)
+        cashier_ids.append(user_id)
+        users.append((
+            user_id, bench_cashier_email(org_index, t), password_hash,
+            f"Cashier {t + 1}", True, created, created,
+        ))
+        roles.append((_uuid(rng), org_id, user_id, "cashier", True, created))
+
+    yield "core.users", users
+    yield "core.user_org_roles", roles
+
+    # -----------------------------------------------------
+    # 3. TAX RATES (first is the org default)
+    # -----------------------------------------------------
+    tax_rows = []
+    tax_percent: Dict[uuid.UUID, Decimal] = {}
+    for i in range(min(profile.tax_rates_per_org, len(TAX_RATES))):
+        name, rate = TAX_RATES[i]
+        tax_id = _uuid(rng)
+        tax_percent[tax_id] = rate
+        tax_rows.append((tax_id, org_id, name, rate, False, i == 0, created, created))
+    yield "pos.tax_rates", tax_rows
+    tax_ids = list(tax_percent)
+
+    # -----------------------------------------------------
+    # 4. LOCATIONS (warehouse + stores)
+    # -----------------------------------------------------
+    location_ids = []
+    location_rows = []
+    for i in range(profile.locations_per_org):
+        location_id = _uuid(rng)
+        location_ids.append(location_id)
+        if i == 0:
+            location_rows.append((location_id, org_id, "Main Warehouse", "MAIN-WH", created, created, None))
+        else:
+            location_rows.append((location_id, org_id, f"Store {i}", f"STORE-{i:03d}", created, created, None))
+    yield "inv.locations", location_rows
+    store_ids = location_ids[1:] or location_ids
+
+    # -----------------------------------------------------
+    # 5. ITEMS
+    # -----------------------------------------------------
+    item_ids: List[uuid.UUID] = []
+    item_price: List[Decimal] = []
+    item_cost: List[Decimal] = []
+    item_tax: List[uuid.UUID | None] = []
+    item_name: List[str] = []
+    rows = []
+    for i in range(profile.items_per_org):
+        item_id = _uuid(rng)
+        price = Decimal(str(min(max(rng.lognormvariate(2.2, 0.9), 0.25), 2500.0))).quantize(Q2)
+        cost = (price * Decimal(str(rng.uniform(0.35, 0.75)))).quantize(Q4)
+        roll = rng.random()
+        tax_id = tax_ids[0] if roll < 0.85 or len(tax_ids) == 1 else rng.choice(tax_ids[1:])
+        name = f"{rng.choice(ITEM_ADJECTIVES)} {rng.choice(ITEM_NOUNS)} {i:05d}"
+        deleted_at = created + timedelta(days=rng.randint(1, profile.days)) if rng.random() < profile.soft_delete_rate else None
+
+        item_ids.append(item_id)
+        item_price.append(price)
+        item_cost.append(cost)
+        item_tax.append(tax_id)
+        item_name.append(name)
+        rows.append((
+            item_id, org_id, f"SKU-{org_index:05d}-{i:07d}", f"{rng.getrandbits(40):012d}",
+            name, None, "service" if rng.random() < 0.05 else "product",
+            price, cost, tax_id, rng.random() > 0.03, created, created, deleted_at,
+        ))
+        if len(rows) >= batch_size:
+            yield "inv.items", rows
+            rows = []
+    if rows:
+        yield "inv.items", rows
+
+    # -----------------------------------------------------
+    # 6. CUSTOMERS
+    # -----------------------------------------------------
+    customer_ids: List[uuid.UUID] = []
+    rows = []
+    for i in range(profile.customers_per_org):
+        customer_id = _uuid(rng)
+        customer_ids.append(customer_id)
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        city, state = rng.choice(CITIES)
+        deleted_at = created + timedelta(days=rng.randint(1, profile.days)) if rng.random() < profile.soft_delete_rate else None
+        rows.append((
+            customer_id, org_id, first, None, last,
+            f"{first}.{last}.{i}@customers.example.com".lower(),
+            f"555-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+            f"{rng.randint(1, 9999)} Main St", city, state, f"{rng.randint(10000, 99999)}",
+            created, created, deleted_at,
+        ))
+        if len(rows) >= batch_size:
+            yield "pos.customers", rows
+            rows = []
+    if rows:
+        yield "pos.customers", rows
+
+    # -----------------------------------------------------
+    # 7. TERMINALS (each bound to a store)
+    # -----------------------------------------------------
+    terminal_ids = []
+    terminal_location = []
+    rows = []
+    for t in range(profile.terminals_per_org):
+        terminal_id = _uuid(rng)
+        location_id = store_ids[t % len(store_ids)]
+        terminal_ids.append(terminal_id)
+        terminal_location.append(location_id)
+        rows.append((terminal_id, org_id, f"Terminal {t + 1}", f"Store lane {t + 1}", True, created, created))
+    yield "pos.terminals", rows
+
+    # -----------------------------------------------------
+    # 8. STOCK LEVELS (item x location, synced from ledger after load)
+    # -----------------------------------------------------
+    stock_level_ids: Dict[Tuple[int, int], uuid.UUID] = {}
+    rows = []
+    for i, item_id in enumerate(item_ids):
+        for li, location_id in enumerate(location_ids):
+            stock_level_id = _uuid(rng)
+            stock_level_ids[(i, li)] = stock_level_id
+            rows.append((stock_level_id, org_id, item_id, location_id, Decimal(0), start))
+            if len(rows) >= batch_size:
+                yield "inv.stock_levels", rows
+                rows = []
+    if rows:
+        yield "inv.stock_levels", rows
+
+    # -----------------------------------------------------
+    # 9. OPENING BALANCES + PERIODIC RESTOCKS
+    # -----------------------------------------------------
+    # Demand is Zipf-distributed, so restock quantities follow the same
+    # weights to keep on-hand quantities mostly positive.
+    cum_weights = _zipf_cum_weights(len(item_ids), profile.item_popularity_skew)
+    total_weight = cum_weights[-1]
+    # Popularity rank -> item index, shuffled so popular items are spread over the catalog
+    popularity = list(range(len(item_ids)))
+    rng.shuffle(popularity)
+
+    units_per_store_day = (
+        profile.sales_per_org * profile.mean_lines_per_sale * 1.3
+        / profile.days / len(store_ids)
+    )
+    rows = []
+    store_indexes = [location_ids.index(s) for s in store_ids]
+    for rank, i in enumerate(popularity):
+        weight = (cum_weights[rank] - (cum_weights[rank - 1] if rank else 0.0)) / total_weight
+        per_period = max(1, math.ceil(weight * units_per_store_day * profile.restock_every_days * 1.25))
+        for li in store_indexes:
+            rows.append((
+                _uuid(rng), org_id, item_ids[i], location_ids[li], stock_level_ids[(i, li)],
+                "opening_balance", None, Decimal(per_period * 2), item_cost[i], start, start,
+            ))
+            for day in range(profile.restock_every_days, profile.days, profile.restock_every_days):
+                occurred = start + timedelta(days=day, hours=6)
+                rows.append((
+                    _uuid(rng), org_id, item_ids[i], location_ids[li], stock_level_ids[(i, li)],
+                    "purchase_receipt", None, Decimal(per_period + rng.randint(0, per_period // 4 + 1)),
+                    item_cost[i], occurred, occurred,
+                ))
+            if len(rows) >= batch_size:
+                yield "inv.stock_movements", rows
+                rows = []
+    if rows:
+        yield "inv.stock_movements", rows
+
+    # -----------------------------------------------------
+    # 10. SALES + LINES + PAYMENTS + SALE MOVEMENTS
+    # -----------------------------------------------------
+    hour_cum = list(accumulate(HOUR_WEIGHTS))
+    status_cum = list(accumulate(SALE_STATUS_WEIGHTS))
+    method_cum = list(accumulate(PAYMENT_METHOD_WEIGHTS))
+    location_index = {location_id: li for li, location_id in enumerate(location_ids)}
+
+    sales, lines, payments, movements = [], [], [], []
+    for n in range(profile.sales_per_org):
+        sale_id = _uuid(rng)
+        t = rng.randrange(len(terminal_ids))
+        day = n * profile.days // profile.sales_per_org
+        hour = 7 + rng.choices(range(len(HOUR_WEIGHTS)), cum_weights=hour_cum)[0]
+        sale_date = start + timedelta(days=day, hours=hour, seconds=rng.randrange(3600))
+        status = rng.choices(SALE_STATUSES, cum_weights=status_cum)[0]
+        customer_id = rng.choice(customer_ids) if customer_ids and rng.random() < profile.customer_attach_rate else None
+        li = location_index[terminal_location[t]]
+
+        subtotal = tax_total = discount_total = Decimal(0)
+        picks = rng.choices(popularity, cum_weights=cum_weights, k=_line_count(rng, profile))
+        for line_number, i in enumerate(picks, start=1):
+            qty = _quantity(rng)
+            price = item_price[i]
+            discount = (
+                (qty * price * Decimal(rng.choice((10, 15, 20))) / HUNDRED).quantize(Q4)
+                if rng.random() < profile.discount_rate else Decimal(0)
+            )
+            line_subtotal = qty * price - discount
+            tax_id = item_tax[i]
+            tax_amount = (line_subtotal * tax_percent[tax_id] / HUNDRED).quantize(Q4) if tax_id else Decimal(0)
+            line_total = line_subtotal + tax_amount
+
+            subtotal += line_subtotal
+            tax_total += tax_amount
+            discount_total += discount
+            lines.append((
+                _uuid(rng), org_id, sale_id, line_number, item_ids[i], item_name[i],
+                qty, price, discount, tax_id, tax_amount, line_total, sale_date,
+            ))
+
+            if status in ("completed", "archived"):
+                movements.append((
+                    _uuid(rng), org_id, item_ids[i], location_ids[li], stock_level_ids[(i, li)],
+                    "sale", sale_id, -qty, item_cost[i], sale_date, sale_date,
+                ))
+
+        grand_total = subtotal + tax_total
+        amount_paid = Decimal(0)
+        if status in ("completed", "archived"):
+            amount_paid = grand_total.quantize(Q2, rounding=ROUND_HALF_UP)
+            if rng.random() < profile.split_payment_rate and amount_paid > Q2:
+                first = (amount_paid * Decimal(str(rng.uniform(0.2, 0.8)))).quantize(Q2)
+                splits = (("cash", first), ("card", amount_paid - first))
+            else:
+                splits = ((rng.choices(PAYMENT_METHODS, cum_weights=method_cum)[0], amount_paid),)
+            for method, amount in splits:
+                payments.append((
+                    _uuid(rng), org_id, sale_id, method, amount,
+                    f"AUTH{rng.getrandbits(32):010d}" if method == "card" else None,
+                    sale_date, terminal_ids[t],
+                ))
+
+        sales.append((
+            sale_id, org_id, terminal_ids[t], customer_id, f"S-{org_index:05d}-{n + 1:09d}",
+            status, "pos", subtotal, tax_total, discount_total, grand_total,
+            amount_paid, grand_total - amount_paid, sale_date, None, cashier_ids[t],
+            sale_date, sale_date,
+        ))
+
+        if len(sales) >= batch_size:
+            yield "pos.sales", sales
+            yield "pos.sale_lines", lines
+            yield "pos.payments", payments
+            yield "inv.stock_movements", movements
+            sales, lines, payments, movements = [], [], [], []
+
+    if sales:
+        yield "pos.sales", sales
+        yield "pos.sale_lines", lines
+        if payments:
+            yield "pos.payments", payments
+        if movements:
+            yield "inv.stock_movements", movements
+
+
+# ---------------------------------------------------------
+# LOADING (one worker process per org at a time)
+# ---------------------------------------------------------
+def asyncpg_dsn(url: str) -> str:
+    """Strip the SQLAlchemy driver suffix (postgresql+asyncpg:// -> postgresql://)."""
+    return re.sub(r"^postgresql\+\w+://", "postgresql://", url)
+
+
+async def _register_codecs(conn: asyncpg.Connection) -> None:
+    """
+    COPY uses the binary protocol; citext is an extension type asyncpg has
+    no binary codec for. Its wire format is plain UTF-8, so map it to str.
+    """
+    is_base_type = await conn.fetchval(
+        "SELECT typtype = 'b' FROM pg_type WHERE typname = 'citext' LIMIT 1"
+    )
+    if is_base_type:
+        schema = await conn.fetchval(
+            "SELECT n.nspname FROM pg_type t JOIN pg_namespace n ON n.oid = t.typnamespace "
+            "WHERE t.typname = 'citext' LIMIT 1"
+        )
+        await conn.set_type_codec(
+            "citext",
+            schema=schema,
+            encoder=lambda value: value.encode("utf-8"),
+            decoder=lambda value: value.decode("utf-8"),
+            format="binary",
+        )
+
+
+async def _load_org(
+    dsn: str,
+    profile: ScaleProfile,
+    seed: int,
+    org_index: int,
+    start: datetime,
+    password_hash: str,
+    batch_size: int,
+    skip_fk_checks: bool = False,
+) -> Dict[str, int]:
+    counts: Dict[str, int] = {table: 0 for table in COLUMNS}
+    conn = await asyncpg.connect(dsn)
+    try:
+        await _register_codecs(conn)
+        # Bulk load: no need to wait for WAL flush on every batch
+        await conn.execute("SET synchronous_commit = off")
+        if skip_fk_checks:
+            # Rows are consistent by construction; skipping the per-row FK
+            # triggers is the single biggest COPY speedup (superuser only).
+            await conn.execute("SET session_replication_role = replica")
+
+        async with conn.transaction():
+            org_id = None
+            for table, rows in generate_org(profile, seed, org_index, start, password_hash, batch_size):
+                schema, name = table.split(".")
+                await conn.copy_records_to_table(
+                    name,
+                    schema_name=schema,
+                    columns=COLUMNS[table],
+                    records=rows,
+                )
+                counts[table] += len(rows)
+                if org_id is None:
+                    org_id = rows[0][0]
+
+            await conn.execute(SYNC_STOCK_LEVELS_SQL, org_id)
+    finally:
+        await conn.close()
+
+    return counts
+
+
+def _load_org_worker(args: tuple) -> Tuple[int, Dict[str, int], float]:
+    """Process-pool entry point (must be a top-level function)."""
+    org_index = args[3]
+    started = time.perf_counter()
+    counts = asyncio.run(_load_org(*args))
+    return org_index, counts, time.perf_counter() - started
+
+
+async def _prepare_database(dsn: str, create_schema: bool, truncate: bool) -> None:
+    if create_schema:
+        # Same bootstrap as seed_dev_data.py
+        from sqlalchemy import text
+        from src.app.core.base import Base
+        from src.app.core.database import engine
+
+        async with engine.begin() as conn:
+            for schema in ("core", "acct", "inv", "pos"):
+                await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema}"))
+            await conn.run_sync(Base.metadata.create_all)
+        await engine.dispose()
+
+    if truncate:
+        conn = await asyncpg.connect(dsn)
+        try:
+            await conn.execute(f"TRUNCATE {', '.join(reversed(list(COLUMNS)))} CASCADE")
+        finally:
+            await conn.close()
+
+
+async def _analyze(dsn: str) -> None:
+    conn = await asyncpg.connect(dsn)
+    try:
+        for table in COLUMNS:
+            await conn.execute(f"ANALYZE {table}")
+    finally:
+        await conn.close()
+
+
+def load(
+    dsn: str,
+    profile: ScaleProfile,
+    seed: int = DEFAULT_SEED,
+    workers: int = 4,
+    start: datetime = DEFAULT_START,
+    batch_size: int = 5_000,
+    password: str = DEFAULT_PASSWORD,
+    skip_fk_checks: bool = False,
+) -> Dict[str, int]:
+    """Generate and COPY every org of `profile`; returns total rows per table."""
+    from src.app.auth.services.hashing import hash_password
+
+    # One bcrypt hash for every generated user (hashing is deliberately slow)
+    password_hash = hash_password(password)
+    totals: Dict[str, int] = {table: 0 for table in COLUMNS}
+
+    jobs = [
+        (dsn, profile, seed, org_index, start, password_hash, batch_size, skip_fk_checks)
+        for org_index in range(profile.orgs)
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_load_org_worker, job) for job in jobs]
+        for done, future in enumerate(as_completed(futures), start=1):
+            org_index, counts, elapsed = future.result()
+            rows = sum(counts.values())
+            print(f"  org {org_index:05d}: {rows:>12,} rows in {elapsed:6.1f}s  ({done}/{len(jobs)})")
+            for table, n in counts.items():
+                totals[table] += n
+
+    return totals
+
+
+# ---------------------------------------------------------
+# CLI
+# ---------------------------------------------------------
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate the ArcoirisPOS benchmark dataset.")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="small")
+    parser.add_argument("--orgs", type=int, help="Override the profile's org count")
+    parser.add_argument("--sales-per-org", type=int, help="Override the profile's sales per org")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--workers", type=int, default=4, help="Parallel loader processes")
+    parser.add_argument("--batch-size", type=int, default=5_000, help="Sales per COPY batch")
+    parser.add_argument("--start-date", default=DEFAULT_START.date().isoformat(), help="First sales day (UTC)")
+    parser.add_argument("--dsn", help="Postgres DSN (defaults to DATABASE_URL)")
+    parser.add_argument("--create-schema", action="store_true", help="Create schemas/tables first")
+    parser.add_argument("--truncate", action="store_true", help="Empty the target tables first")
+    parser.add_argument("--skip-fk-checks", action="store_true", help="Disable FK triggers while loading (superuser)")
+    parser.add_argument("--no-analyze", action="store_true", help="Skip ANALYZE after loading")
+    parser.add_argument("--manifest", help="Write profile, seed and row counts to this JSON file")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = parse_args(argv)
+
+    profile = PROFILES[args.profile]
+    if args.orgs:
+        profile = replace(profile, orgs=args.orgs)
+    if args.sales_per_org is not None:
+        profile = replace(profile, sales_per_org=args.sales_per_org)
+
+    if args.dsn:
+        dsn = asyncpg_dsn(args.dsn)
+    else:
+        from src.app.core.config import settings
+        dsn = asyncpg_dsn(settings.database_url)
+
+    start = datetime.fromisoformat(args.start_date).replace(tzinfo=timezone.utc)
+
+    print("\n=== Generating Benchmark Dataset ===\n")
+    print(f"Profile: {args.profile}  seed={args.seed}  workers={args.workers}")
+    print(json.dumps(asdict(profile), indent=2), "\n")
+
+    asyncio.run(_prepare_database(dsn, args.create_schema, args.truncate))
+
+    started = time.perf_counter()
+    totals = load(
+        dsn, profile, args.seed, args.workers, start, args.batch_size,
+        skip_fk_checks=args.skip_fk_checks,
+    )
+    elapsed = time.perf_counter() - started
+
+    if not args.no_analyze:
+        asyncio.run(_analyze(dsn))
+
+    print()
+    for table, n in totals.items():
+        print(f"  {table:<28} {n:>14,}")
+    total_rows = sum(totals.values())
+    print(f"\n✨ Loaded {total_rows:,} rows in {elapsed:.1f}s ({total_rows / elapsed:,.0f} rows/s) ✨\n")
+    print("Login Credentials (every org):")
+    print(f"  Email:    {bench_admin_email(0)}")
+    print(f"  Password: {DEFAULT_PASSWORD}\n")
+
+    if args.manifest:
+        with open(args.manifest, "w") as fh:
+            json.dump(
+                {
+                    "profile": args.profile,
+                    "seed": args.seed,
+                    "start_date": args.start_date,
+                    "settings": asdict(profile),
+                    "rows": totals,
+                },
+                fh,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
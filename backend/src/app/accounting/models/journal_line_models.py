@@ -12,6 +12,7 @@ from sqlalchemy import (
     Numeric,
     Text,
     ForeignKey,
+    Index,
     Integer,
     UniqueConstraint,
     text,
@@ -28,6 +29,8 @@ class JournalLine(Base):
     __table_args__ = (
         UniqueConstraint("journal_id", "line_number"),
         CheckConstraint("amount > 0"),
+        Index("idx_journal_lines_account", "account_id"),
+        Index("idx_journal_lines_org", "org_id"),
         {"schema": "acct"},
     )
 
@@ -12,6 +12,7 @@ from sqlalchemy import (
     DateTime,
     Text,
     ForeignKey,
+    Index,
     text,
 )
 from sqlalchemy.dialects.postgresql import UUID
@@ -22,7 +23,11 @@ from src.app.core.base import Base
 
 class JournalEntry(Base):
     __tablename__ = "journal_entries"
-    __table_args__ = {"schema": "acct"}
+    __table_args__ = (
+        Index("idx_journal_entries_org_date", "org_id", "journal_date"),
+        Index("idx_journal_entries_source", "source_type", "source_id"),
+        {"schema": "acct"},
+    )
 
     journal_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -15,6 +15,10 @@ from src.app.inventory.routes.locations_routes import router as locations_routes
 from src.app.inventory.routes.stock_levels_routes import router as stock_levels_routes
 from src.app.inventory.routes.stock_movements_routes import router as stock_movements_routes
 from src.app.inventory.routes.admin_stock_adjust_routes import router as admin_stock_adjust_routes
+from src.app.inventory.routes.stock_transfers_routes import router as stock_transfers_routes
+from src.app.inventory.routes.stocktakes_routes import router as stocktakes_routes
+from src.app.inventory.routes.stock_snapshots_routes import router as stock_snapshots_routes
+from src.app.inventory.routes.stock_ledger_routes import router as stock_ledger_routes
 
 # ---------------------------------------------------------
 # ORGANIZATION ROUTES 
@@ -29,6 +33,9 @@ from src.app.pos.routes.payments_routes import router as payments_routes
 from src.app.pos.routes.sale_lines_routes import router as sale_lines_routes
 from src.app.pos.routes.sales_routes import router as sales_routes
 from src.app.pos.routes.tax_rates_routes import router as tax_rates_routes
+from src.app.pos.routes.tax_groups_routes import router as tax_groups_routes
+from src.app.pos.routes.promotions_routes import router as promotions_routes
+from src.app.pos.routes.carts_routes import router as carts_routes
 from src.app.pos.routes.terminals_routes import router as terminals_routes
 
 
@@ -47,10 +54,17 @@ api_router.include_router(locations_routes)
 api_router.include_router(stock_levels_routes)
 api_router.include_router(stock_movements_routes)
 api_router.include_router(admin_stock_adjust_routes)
+api_router.include_router(stock_transfers_routes)
+api_router.include_router(stocktakes_routes)
+api_router.include_router(stock_snapshots_routes)
+api_router.include_router(stock_ledger_routes)
 api_router.include_router(org_settings_router)
 api_router.include_router(customer_routes)
 api_router.include_router(payments_routes)
 api_router.include_router(sale_lines_routes)
 api_router.include_router(sales_routes)
 api_router.include_router(tax_rates_routes)
+api_router.include_router(tax_groups_routes)
+api_router.include_router(promotions_routes)
+api_router.include_router(carts_routes)
 api_router.include_router(terminals_routes)
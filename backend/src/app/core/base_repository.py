@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+from typing import Any, Dict, Generic, Iterable, List, Optional, Sequence, Type, TypeVar
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import delete as sa_delete, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.core.base import Base  # ✅ FIXED import
@@ -14,22 +14,53 @@ from src.app.core.base import Base  # ✅ FIXED import
 ModelType = TypeVar("ModelType", bound=Base)
 
 
+def _unique(values: Sequence[Any]) -> List[Any]:
+    """De-duplicate while keeping order (IN lists and RETURNING stay small)."""
+    return list(dict.fromkeys(values))
+
+
 class BaseRepository(Generic[ModelType]):
     """
     Shared CRUD behavior.
     Automatically handles:
       - Primary key discovery
       - Soft delete (if model has deleted_at column)
+      - Batch operations that cost one round-trip regardless of row count
+
+    Batch methods take `where=` for extra criteria (e.g. Model.org_id == org_id)
+    so callers can scope them to a tenant without a prior fetch.
     """
 
     def __init__(self, model: Type[ModelType]):
         self.model = model
         self._has_deleted_at = hasattr(model, "deleted_at")
+        self._has_updated_at = hasattr(model, "updated_at")
+        self._version_col = model.__mapper__.version_id_col
+
+    def _version_bump(self) -> Dict[str, Any]:
+        """Statement UPDATEs skip the ORM's version counter (version_id_col); bump it by hand."""
+        if self._version_col is None:
+            return {}
+        return {self._version_col.key: self._version_col + 1}
 
     def _pk(self):
         """Dynamically return the model's primary key column."""
         return list(self.model.__table__.primary_key.columns)[0]
 
+    # ---------------------------------------------------------
+    # PROJECTION (sparse fieldsets)
+    # ---------------------------------------------------------
+    def _select(self, fields: Optional[Sequence[str]] = None):
+        """select(Model), or only the named columns when `fields` is given."""
+        if not fields:
+            return select(self.model)
+        return select(*(getattr(self.model, name) for name in fields))
+
+    @staticmethod
+    def _rows(result, fields: Optional[Sequence[str]] = None) -> List[Any]:
+        """Entities for a full select; plain Rows (no ORM hydration) for a projected one."""
+        return result.all() if fields else result.scalars().all()
+
     # ---------------------------------------------------------
     # GET
     # ---------------------------------------------------------
@@ -91,4 +122,132 @@ class BaseRepository(Generic[ModelType]):
 
         # Hard delete fallback
         await session.delete(obj)
-        return obj
\ No newline at end of file
+        return obj
+
+
+    # ---------------------------------------------------------
+    # CREATE (INSERT ... RETURNING — no refresh round-trip)
+    # ---------------------------------------------------------
+    async def create_returning(
+        self,
+        session: AsyncSession,
+        obj_in: Dict[str, Any],
+    ) -> ModelType:
+        """
+        Same result as create(), but server defaults come back on the
+        INSERT itself instead of a flush followed by a refresh SELECT.
+        """
+        stmt = insert(self.model).values(**obj_in).returning(self.model)
+        result = await session.execute(stmt)
+        return result.scalar_one()
+
+    # ---------------------------------------------------------
+    # BATCH: GET
+    # ---------------------------------------------------------
+    async def get_many(
+        self,
+        session: AsyncSession,
+        pks: Sequence[Any],
+        *,
+        where: Iterable[Any] = (),
+        include_deleted: bool = False,
+    ) -> List[ModelType]:
+        """Fetch many rows by primary key in one SELECT (order not guaranteed)."""
+        if not pks:
+            return []
+
+        stmt = select(self.model).where(self._pk().in_(_unique(pks)), *where)
+
+        if self._has_deleted_at and not include_deleted:
+            stmt = stmt.where(self.model.deleted_at.is_(None))
+
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
+    # ---------------------------------------------------------
+    # BATCH: CREATE
+    # ---------------------------------------------------------
+    async def create_many(
+        self,
+        session: AsyncSession,
+        rows: Sequence[Dict[str, Any]],
+    ) -> List[ModelType]:
+        """
+        Bulk INSERT ... RETURNING. Rows come back fully populated (server
+        defaults included) and in the same order as `rows`.
+        """
+        if not rows:
+            return []
+
+        stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        result = await session.scalars(stmt, list(rows))
+        return list(result.all())
+
+    # ---------------------------------------------------------
+    # BATCH: UPDATE
+    # ---------------------------------------------------------
+    async def update_many(
+        self,
+        session: AsyncSession,
+        pks: Sequence[Any],
+        values: Dict[str, Any],
+        *,
+        where: Iterable[Any] = (),
+    ) -> List[ModelType]:
+        """
+        Apply the same `values` to every row in `pks` with a single
+        UPDATE ... RETURNING. Soft-deleted rows are skipped; updated_at is
+        bumped unless given. Returns only the rows that were updated.
+        """
+        if not pks or not values:
+            return await self.get_many(session, pks, where=where)
+
+        values = dict(values)
+        if self._has_updated_at:
+            values.setdefault("updated_at", func.now())
+        values = {**self._version_bump(), **values}
+
+        stmt = (
+            update(self.model)
+            .where(self._pk().in_(_unique(pks)), *where)
+            .values(**values)
+            .returning(self.model)
+            .execution_options(synchronize_session="fetch")
+        )
+        if self._has_deleted_at:
+            stmt = stmt.where(self.model.deleted_at.is_(None))
+
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
+    # ---------------------------------------------------------
+    # BATCH: DELETE (soft or hard)
+    # ---------------------------------------------------------
+    async def soft_delete_many(
+        self,
+        session: AsyncSession,
+        pks: Sequence[Any],
+        *,
+        where: Iterable[Any] = (),
+    ) -> List[Any]:
+        """
+        Soft delete many rows with a single UPDATE (hard DELETE for models
+        without deleted_at). Returns the primary keys actually deleted;
+        rows already deleted or outside `where` are left out.
+        """
+        if not pks:
+            return []
+
+        pk = self._pk()
+        if self._has_deleted_at:
+            stmt = (
+                update(self.model)
+                .where(pk.in_(_unique(pks)), self.model.deleted_at.is_(None), *where)
+                .values(deleted_at=func.now(), **self._version_bump())
+            )
+        else:
+            stmt = sa_delete(self.model).where(pk.in_(_unique(pks)), *where)
+
+        stmt = stmt.returning(pk).execution_options(synchronize_session="fetch")
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
@@ -0,0 +1,78 @@
+# backend/src/app/core/conditional.py
+"""
+Conditional GETs for slowly changing, org-scoped resources.
+
+The ETag is a hash of the org's counter in core.resource_versions (bumped
+by triggers on every write to the table) and the request's query string,
+so it is computed with one primary-key lookup and no row reads. A matching
+If-None-Match short-circuits the route with a bodiless 304.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Dict, Optional
+
+from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.auth.services.org_context import get_current_org
+from src.app.core.database import get_session
+from src.app.org.models.resource_version_model import ResourceVersion
+
+
+def _etag(resource: str, org_id: Any, version: int, query: str) -> str:
+    raw = f"{resource}:{org_id}:{version}:{query}".encode()
+    return f'"{hashlib.sha1(raw).hexdigest()[:20]}"'
+
+
+def _matches(if_none_match: Optional[str], etag: str) -> bool:
+    # If-None-Match uses weak comparison: W/"x" matches "x"
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class ConditionalGet:
+    """
+    FastAPI dependency for one resource (one per router, so each router
+    picks its own Cache-Control). Raises 304 when the client's copy is
+    current; otherwise resolves to the ETag / Cache-Control headers the
+    route attaches to its 200 response.
+
+    Reads the version before the route reads its rows, so a concurrent
+    write can only make the ETag older than the body (costing the client
+    one extra 200), never newer.
+    """
+
+    def __init__(self, model: Any, *, cache_control: str = "private, no-cache"):
+        self.resource = model.__table__.fullname
+        self.cache_control = cache_control
+
+    async def __call__(
+        self,
+        request: Request,
+        session: AsyncSession = Depends(get_session),
+        org_ctx = Depends(get_current_org),
+    ) -> Dict[str, str]:
+        org_id = org_ctx["org"].org_id
+
+        version = await session.scalar(
+            select(ResourceVersion.version).where(
+                ResourceVersion.org_id == org_id,
+                ResourceVersion.resource == self.resource,
+            )
+        )
+
+        headers = {
+            "ETag": _etag(self.resource, org_id, version or 0, request.url.query),
+            "Cache-Control": self.cache_control,
+        }
+        if _matches(request.headers.get("if-none-match"), headers["ETag"]):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return headers
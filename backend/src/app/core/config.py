@@ -20,6 +20,59 @@ class Settings(BaseSettings):
     # Optional development override
     dev_admin_secret: str | None = None
 
+    # Upper bound on rows per bulk request (one INSERT/UPDATE each)
+    bulk_max_rows: int = 1000
+
+    # Upper bound on lines per stock transfer (applied set-based, so a
+    # warehouse move costs the same few statements as a small one)
+    stock_transfer_max_lines: int = 10000
+
+    # Stocktake uploads: count rows per stocktake, and rows per COPY batch
+    # while the upload body streams in
+    stocktake_max_rows: int = 500000
+    stocktake_batch_rows: int = 10000
+
+    # Stock snapshots for ?as_of= queries: taken per org once the latest is
+    # older than the interval (0 = no scheduler), cut `settle` seconds
+    # behind now so in-flight writes land first; the newest `keep` are kept
+    stock_snapshot_interval_seconds: int = 86400
+    stock_snapshot_settle_seconds: int = 300
+    stock_snapshot_keep: int = 90
+
+    # Ledger verifier: item-id ranges scanned per org (one short transaction
+    # each), rows per repair statement, and orgs / ranges run at once
+    stock_ledger_partitions: int = 16
+    stock_ledger_batch_rows: int = 5000
+    stock_ledger_concurrency: int = 4
+
+    # gzip responses at least this many bytes (0 = off, e.g. behind a
+    # compressing proxy)
+    gzip_min_bytes: int = 0
+    gzip_level: int = 6
+
+    # Open carts are held per worker; idle ones expire after the TTL.
+    # cart_persist also snapshots them to pos.cart_snapshots so they
+    # outlive a restart or a worker that dropped them.
+    cart_ttl_seconds: int = 1800
+    cart_max_open: int = 10000
+    cart_persist: bool = False
+
+    # Pricing calls carrying at least this many lines (one sale or a
+    # batch) run in a process pool instead of on the event loop.
+    # Workers default to the CPU count; 0 prices everything inline.
+    pricing_pool_min_lines: int = 5000
+    pricing_pool_workers: int | None = None
+
+    # Sale numbers are leased to each worker in blocks per terminal (one
+    # counter UPDATE per block, not per sale) and zero-padded to width.
+    sale_number_block_size: int = 100
+    sale_number_width: int = 6
+
+    # Sale and stock-level PATCHes without If-Match re-read and re-apply
+    # this many times when they lose a version race, then answer 409.
+    # Stock adjustments are one versioned UPDATE and never retry.
+    occ_max_retries: int = 3
+
     @property
     def DATABASE_URL(self) -> str:
         """Legacy uppercase alias for Alembic."""
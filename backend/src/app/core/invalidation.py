@@ -0,0 +1,287 @@
+# backend/src/app/core/invalidation.py
+"""
+Cross-worker cache invalidation over Postgres LISTEN/NOTIFY.
+
+Each uvicorn worker holds one dedicated asyncpg connection LISTENing on a
+single channel. Writers publish inside their own transaction, so Postgres
+only delivers the message once the write commits (and never if it rolls
+back). Every worker, including the publisher, then runs the subscribers
+registered for that resource.
+
+- Messages are typed: Invalidation(resource, org_id, ids). No org means
+  every org; no ids means everything in scope.
+- Bursts are coalesced: notifications arriving within `coalesce_window`
+  are merged per (resource, org) before subscribers run.
+- NOTIFYs sent while the listener is down are lost, so on every
+  (re)connect all subscribers are flushed before caching resumes. A
+  periodic keepalive catches connections that died silently.
+
+In-process caches must check `invalidation_bus.listening` and bypass
+themselves while it is False.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+import asyncpg
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "arcoiris_invalidate"
+MAX_PAYLOAD_BYTES = 7_900   # Postgres rejects NOTIFY payloads of 8000+ bytes
+
+
+def _asyncpg_dsn(url: str) -> str:
+    # asyncpg.connect() wants a plain libpq URL, not SQLAlchemy's dialect form
+    return url.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+
+# ---------------------------------------------------------
+# MESSAGES
+# ---------------------------------------------------------
+@dataclass(frozen=True)
+class Invalidation:
+    resource: str
+    org_id: Optional[UUID] = None                 # None: every org
+    ids: FrozenSet[str] = frozenset()             # empty: everything in scope
+
+    def to_payload(self) -> str:
+        body = {
+            "resource": self.resource,
+            "org_id": str(self.org_id) if self.org_id else None,
+            "ids": sorted(self.ids),
+        }
+        payload = json.dumps(body, separators=(",", ":"))
+        if len(payload.encode()) > MAX_PAYLOAD_BYTES:
+            # Too many ids for one NOTIFY: widen to the whole org
+            body["ids"] = []
+            payload = json.dumps(body, separators=(",", ":"))
+        return payload
+
+    @classmethod
+    def from_payload(cls, payload: str) -> "Invalidation":
+        body = json.loads(payload)
+        org_id = body.get("org_id")
+        return cls(
+            resource=body["resource"],
+            org_id=UUID(org_id) if org_id else None,
+            ids=frozenset(body.get("ids") or ()),
+        )
+
+
+Subscriber = Callable[[Invalidation], None]
+
+
+def coalesce(messages: Iterable[Invalidation], max_ids: int = 500) -> List[Invalidation]:
+    """
+    Merge messages per (resource, org): ids are unioned, and anything
+    without ids — or with more than `max_ids` — widens to the whole scope.
+    A message for every org absorbs all org-specific ones for its resource.
+    """
+    scopes: Dict[Tuple[str, Optional[UUID]], Optional[set]] = {}
+    for message in messages:
+        key = (message.resource, message.org_id)
+        if not message.ids:
+            scopes[key] = None
+        elif key not in scopes:
+            scopes[key] = set(message.ids)
+        elif scopes[key] is not None:
+            scopes[key] |= message.ids
+
+    global_resources = {resource for resource, org_id in scopes if org_id is None}
+    merged = []
+    for (resource, org_id), ids in scopes.items():
+        if org_id is not None and resource in global_resources:
+            continue
+        if ids is not None and len(ids) > max_ids:
+            ids = None
+        merged.append(Invalidation(resource, org_id, frozenset(ids or ())))
+    return merged
+
+
+# ---------------------------------------------------------
+# BUS
+# ---------------------------------------------------------
+class InvalidationBus:
+    def __init__(
+        self,
+        channel: str = CHANNEL,
+        *,
+        coalesce_window: float = 0.05,
+        max_ids: int = 500,
+        keepalive_interval: float = 30.0,
+        reconnect_max_delay: float = 30.0,
+    ):
+        self.channel = channel
+        self.coalesce_window = coalesce_window
+        self.max_ids = max_ids
+        self.keepalive_interval = keepalive_interval
+        self.reconnect_max_delay = reconnect_max_delay
+
+        self._subscribers: Dict[str, List[Subscriber]] = defaultdict(list)
+        self._dsn: Optional[str] = None
+        self._conn: Optional[asyncpg.Connection] = None
+        self._listening = False
+        self._lost = asyncio.Event()
+        self._supervisor: Optional[asyncio.Task] = None
+        self._pending: List[Invalidation] = []
+        self._drain_handle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def listening(self) -> bool:
+        return self._listening
+
+    # ---------------------------------------------------------
+    # SUBSCRIBE
+    # ---------------------------------------------------------
+    def subscribe(self, resource: str, callback: Subscriber) -> None:
+        self._subscribers[resource].append(callback)
+
+    # ---------------------------------------------------------
+    # PUBLISH (transactional)
+    # ---------------------------------------------------------
+    async def publish(
+        self,
+        session: AsyncSession,
+        resource: str,
+        org_id: Any = None,
+        ids: Iterable[Any] = (),
+    ) -> None:
+        """Queue a NOTIFY on the session's transaction; delivered on commit."""
+        message = Invalidation(
+            resource,
+            UUID(str(org_id)) if org_id else None,
+            frozenset(str(pk) for pk in ids),
+        )
+        await session.execute(select(func.pg_notify(self.channel, message.to_payload())))
+        # Drop this worker's copy now too, so it never serves the old value
+        # to its own next request while the notification is in flight
+        self._dispatch(message)
+
+    # ---------------------------------------------------------
+    # LIFECYCLE
+    # ---------------------------------------------------------
+    async def start(self, dsn: Optional[str] = None) -> None:
+        """Connect once inline (so caches are live when startup ends), then supervise."""
+        self._dsn = _asyncpg_dsn(dsn or settings.database_url_async)
+        try:
+            await self._connect()
+        except (OSError, asyncpg.PostgresError) as exc:
+            # Caches stay bypassed until the supervisor gets a connection
+            logger.warning("Invalidation listener unavailable, caches bypassed: %s", exc)
+        self._supervisor = asyncio.create_task(self._supervise())
+
+    async def stop(self) -> None:
+        self._listening = False
+        if self._supervisor is not None:
+            self._supervisor.cancel()
+            try:
+                await self._supervisor
+            except asyncio.CancelledError:
+                pass
+            self._supervisor = None
+        if self._drain_handle is not None:
+            self._drain_handle.cancel()
+            self._drain_handle = None
+        self._pending.clear()
+        await self._close()
+
+    async def _connect(self) -> None:
+        conn = await asyncpg.connect(self._dsn)
+        await conn.add_listener(self.channel, self._on_notify)
+        conn.add_termination_listener(self._on_terminated)
+        self._conn = conn
+        self._lost.clear()
+        # Anything published while we weren't listening was missed
+        self.flush_all()
+        self._listening = True
+
+    async def _close(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None and not conn.is_closed():
+            try:
+                await conn.close(timeout=5)
+            except (OSError, asyncpg.PostgresError, asyncio.TimeoutError):
+                conn.terminate()
+
+    def _on_terminated(self, _conn) -> None:
+        self._listening = False
+        self._lost.set()
+
+    async def _supervise(self) -> None:
+        delay = 0.5
+        while True:
+            if self._conn is None or self._conn.is_closed():
+                self._listening = False
+                try:
+                    await self._connect()
+                    logger.info("Invalidation listener connected")
+                    delay = 0.5
+                except (OSError, asyncpg.PostgresError) as exc:
+                    logger.warning("Invalidation listener reconnect failed (retry in %.1fs): %s", delay, exc)
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, self.reconnect_max_delay)
+                continue
+
+            try:
+                await asyncio.wait_for(self._lost.wait(), timeout=self.keepalive_interval)
+            except asyncio.TimeoutError:
+                # Quiet period: make sure the socket is actually alive
+                try:
+                    await self._conn.execute("SELECT 1", timeout=5)
+                    continue
+                except (OSError, asyncpg.PostgresError, asyncio.TimeoutError):
+                    pass
+
+            logger.warning("Invalidation listener lost; flushing caches and reconnecting")
+            self._listening = False
+            self.flush_all()
+            await self._close()
+
+    # ---------------------------------------------------------
+    # DISPATCH
+    # ---------------------------------------------------------
+    def flush_all(self) -> None:
+        """Tell every subscriber to drop everything it holds."""
+        for resource in list(self._subscribers):
+            self._dispatch(Invalidation(resource))
+
+    def _on_notify(self, _conn, _pid, _channel, payload: str) -> None:
+        try:
+            message = Invalidation.from_payload(payload)
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring malformed invalidation payload: %r", payload)
+            return
+
+        self._pending.append(message)
+        if self._drain_handle is None:
+            loop = asyncio.get_running_loop()
+            self._drain_handle = loop.call_later(self.coalesce_window, self._drain)
+
+    def _drain(self) -> None:
+        self._drain_handle = None
+        pending, self._pending = self._pending, []
+        for message in coalesce(pending, self.max_ids):
+            self._dispatch(message)
+
+    def _dispatch(self, message: Invalidation) -> None:
+        for callback in self._subscribers.get(message.resource, ()):
+            try:
+                callback(message)
+            except Exception:
+                logger.exception("Invalidation subscriber failed for %s", message.resource)
+
+
+invalidation_bus = InvalidationBus()
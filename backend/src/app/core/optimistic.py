@@ -0,0 +1,95 @@
+# backend/src/app/core/optimistic.py
+"""
+Optimistic concurrency for versioned rows.
+
+Models with a `version` column map it as SQLAlchemy's version_id_col, so
+every ORM flush that changes the row is a compare-and-swap:
+UPDATE ... SET version = :read + 1 WHERE pk = ? AND version = :read. The
+loser of a race gets StaleDataError instead of silently overwriting the
+winner, and nothing holds a row lock while Python recomputes.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from fastapi import Header, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
+
+from src.app.core.config import settings
+
+
+T = TypeVar("T")
+
+
+class VersionConflict(Exception):
+    """The row is no longer at the version the caller read (or sent in If-Match)."""
+
+    def __init__(self, current: Optional[int] = None) -> None:
+        super().__init__("Row was modified concurrently")
+        self.current = current
+
+
+def check_version(row: Any, expected: Optional[int]) -> None:
+    """Raise VersionConflict unless `expected` is None or the row's version."""
+    if expected is not None and row.version != expected:
+        raise VersionConflict(row.version)
+
+
+async def with_retries(
+    session: AsyncSession,
+    attempt: Callable[[], Awaitable[T]],
+    retries: Optional[int] = None,
+) -> T:
+    """
+    Run `attempt` (read, recompute, commit) and start it over from a fresh
+    read each time its write loses a version race, up to `retries` times.
+    A VersionConflict raised by check_version is not retried: the caller's
+    copy is stale and re-reading can't fix that.
+    """
+    retries = settings.occ_max_retries if retries is None else retries
+    for remaining in range(retries, -1, -1):
+        try:
+            return await attempt()
+        except StaleDataError:
+            await session.rollback()
+            if not remaining:
+                raise VersionConflict()
+    raise AssertionError("unreachable")
+
+
+# ---------------------------------------------------------
+# HTTP: ETag / If-Match
+# ---------------------------------------------------------
+def version_etag(version: int) -> str:
+    return f'"{version}"'
+
+
+def if_match_version(if_match: Optional[str] = Header(None)) -> Optional[int]:
+    """
+    Dependency: the version a PATCH is conditional on, from If-Match
+    (None when absent or "*"). Weak tags never match, as RFC 9110 requires
+    strong comparison for If-Match.
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+    tag = if_match.strip()
+    if tag.startswith('"') and tag.endswith('"') and tag[1:-1].isdigit():
+        return int(tag[1:-1])
+    raise HTTPException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        detail="If-Match must be a single ETag from this resource",
+    )
+
+
+def conflict_error(exc: VersionConflict, if_match: Optional[int]) -> HTTPException:
+    """412 for a failed If-Match, 409 when server-side retries ran out."""
+    if if_match is not None:
+        headers = {"ETag": version_etag(exc.current)} if exc.current is not None else None
+        return HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="Resource has changed; re-read it and retry",
+            headers=headers,
+        )
+    return HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
@@ -0,0 +1,74 @@
+# backend/src/app/core/projection.py
+"""
+Column projection for list routes, with optional sparse fieldsets
+(`GET /items?fields=name,default_price,barcode`).
+
+List routes SELECT only the Read schema's columns and get plain Rows back,
+so the ORM never builds (or tracks) an entity for them. The rows go
+straight to orjson: they come from typed columns that mirror the Read
+schema, so the response_model validation pass would only re-check what
+the database already guarantees.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Sequence, Tuple, Type
+
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel
+from sqlalchemy import inspect as sa_inspect
+
+from src.app.core.responses import ORJSONResponse
+
+
+class FieldSet:
+    """
+    FastAPI dependency resolving the `fields` query parameter for one resource
+    to the tuple of column names to select: the primary key (always present,
+    so clients can still key rows) followed by the requested fields in schema
+    order — or every column of the Read schema when `fields` is absent.
+    """
+
+    def __init__(self, schema: Type[BaseModel], model: Any):
+        self.schema = schema
+
+        mapper = sa_inspect(model)
+        self.primary_key = mapper.primary_key[0].key
+        columns = set(mapper.columns.keys())
+        # Schema fields not backed by a column (relationships, computed
+        # values) can't be projected
+        self.allowed: Tuple[str, ...] = tuple(
+            name for name in schema.model_fields if name in columns
+        )
+        self.default: Tuple[str, ...] = (self.primary_key,) + tuple(
+            name for name in self.allowed if name != self.primary_key
+        )
+
+    def __call__(
+        self,
+        fields: Optional[str] = Query(
+            None,
+            description="Comma-separated fields to return, e.g. `name,default_price`",
+        ),
+    ) -> Tuple[str, ...]:
+        if fields is None:
+            return self.default
+
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = requested.difference(self.allowed)
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown field(s): {', '.join(sorted(unknown))}. "
+                       f"Allowed: {', '.join(self.allowed)}",
+            )
+
+        return tuple(
+            name for name in self.default
+            if name == self.primary_key or name in requested
+        )
+
+    @staticmethod
+    def render(rows: Sequence[Any], headers: Optional[Dict[str, str]] = None) -> ORJSONResponse:
+        """Encode projected Rows directly, bypassing the route's response_model."""
+        return ORJSONResponse([row._asdict() for row in rows], headers=headers)
@@ -0,0 +1,45 @@
+# backend/src/app/core/responses.py
+"""
+orjson-backed JSON responses (the app-wide default response class).
+
+orjson encodes uuid.UUID and datetime natively. Decimal and asyncpg's own
+UUID subclass (what column-projected rows carry) take a one-line fallback
+to str, the same text Pydantic emits. OPT_UTC_Z renders UTC datetimes as
+"...Z", also matching Pydantic, so a page built from raw DB rows carries
+the same values as one built through a response_model.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+import orjson
+from asyncpg.pgproto.pgproto import UUID as PgUUID
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    # Exact type checks first: these two are nearly every fallback call
+    cls = type(obj)
+    if cls is Decimal or cls is PgUUID:
+        return str(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (Decimal, UUID)):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
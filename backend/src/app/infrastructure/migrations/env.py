@@ -88,10 +88,13 @@ def run_migrations_online(cfg):
     import src.app.inventory.models.location_models
     import src.app.inventory.models.stock_level_models
     import src.app.inventory.models.stock_movement_models
+    import src.app.inventory.models.stock_snapshot_models
+    import src.app.inventory.models.stocktake_models
 
     import src.app.pos.models.customer_models
     import src.app.pos.models.payment_models
     import src.app.pos.models.sale_models
+    import src.app.pos.models.sale_number_models
     import src.app.pos.models.terminal_models
     import src.app.pos.models.tax_rate_models
 
@@ -0,0 +1,166 @@
+"""
+Query indexes declared in the models
+
+Replaces the hand-run manual_sql/001_migration_index.sql with indexes that
+match the repository predicates and sort orders, including partial indexes
+for the soft-delete / archived filters.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+from alembic import op
+from sqlalchemy import text
+
+
+# ------------------------------------------------------------
+# REVISION METADATA
+# ------------------------------------------------------------
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels = None
+depends_on = None
+
+
+# ------------------------------------------------------------
+# INDEX DEFINITIONS (mirror the models' __table_args__)
+# (name, schema, table, columns, partial predicate)
+# ------------------------------------------------------------
+INDEXES = [
+    # core
+    ("idx_user_org_roles_user", "core", "user_org_roles", ["user_id"], None),
+
+    # pos
+    ("idx_terminals_org_created", "pos", "terminals", ["org_id", text("created_at DESC")], None),
+    ("idx_customers_org_created_live", "pos", "customers", ["org_id", text("created_at DESC")], "deleted_at IS NULL"),
+    ("idx_customers_org_email", "pos", "customers", ["org_id", "email"], None),
+    ("idx_customers_org_phone", "pos", "customers", ["org_id", "phone"], None),
+    ("idx_tax_rates_org_name", "pos", "tax_rates", ["org_id", "name"], None),
+    ("idx_sales_org_date_active", "pos", "sales", ["org_id", text("sale_date DESC")], "status <> 'archived'"),
+    ("idx_sales_customer", "pos", "sales", ["customer_id"], "customer_id IS NOT NULL"),
+    ("idx_sales_terminal", "pos", "sales", ["terminal_id"], None),
+    ("idx_sale_lines_org_created", "pos", "sale_lines", ["org_id", text("created_at DESC")], None),
+    ("idx_sale_lines_item", "pos", "sale_lines", ["item_id"], None),
+    ("idx_payments_sale", "pos", "payments", ["sale_id"], None),
+    ("idx_payments_org_created", "pos", "payments", ["org_id", text("created_at DESC")], None),
+
+    # inv
+    ("idx_items_org_name_live", "inv", "items", ["org_id", "name"], "deleted_at IS NULL"),
+    ("idx_items_org_sku", "inv", "items", ["org_id", "sku"], None),
+    ("idx_items_org_barcode", "inv", "items", ["org_id", "barcode"], "barcode IS NOT NULL"),
+    ("idx_locations_org_name_live", "inv", "locations", ["org_id", "name"], "deleted_at IS NULL"),
+    ("idx_stock_levels_org_updated", "inv", "stock_levels", ["org_id", text("updated_at DESC")], None),
+    ("idx_stock_movements_org_occurred", "inv", "stock_movements", ["org_id", text("occurred_at DESC")], None),
+    ("idx_stock_movements_org_item_date", "inv", "stock_movements", ["org_id", "item_id", "occurred_at"], None),
+    ("idx_stock_movements_source", "inv", "stock_movements", ["source_type", "source_id"], None),
+
+    # acct
+    ("idx_journal_entries_org_date", "acct", "journal_entries", ["org_id", "journal_date"], None),
+    ("idx_journal_entries_source", "acct", "journal_entries", ["source_type", "source_id"], None),
+    ("idx_journal_lines_account", "acct", "journal_lines", ["account_id"], None),
+    ("idx_journal_lines_org", "acct", "journal_lines", ["org_id"], None),
+]
+
+# Created by manual_sql/001_migration_index.sql under the same name and
+# definition as above; downgrade leaves them in place.
+MANUAL_SQL_INDEXES = {
+    "idx_user_org_roles_user",
+    "idx_sales_terminal",
+    "idx_sale_lines_item",
+    "idx_payments_sale",
+    "idx_stock_movements_org_item_date",
+    "idx_stock_movements_source",
+    "idx_journal_entries_org_date",
+    "idx_journal_entries_source",
+    "idx_journal_lines_account",
+    "idx_journal_lines_org",
+}
+
+# Indexes from manual_sql/001_migration_index.sql that are superseded by the
+# definitions above, duplicate a unique constraint's leading columns, or sit
+# on low-cardinality columns the planner never uses. Dropped if present, and
+# recreated as they were on downgrade.
+# (schema, name, table, columns)
+LEGACY_INDEXES = [
+    ("core", "idx_organizations_active", "organizations", ["is_active"]),
+    ("core", "idx_users_email", "users", ["email"]),
+    ("core", "idx_user_org_roles_org", "user_org_roles", ["org_id"]),
+    ("pos", "idx_terminals_org", "terminals", ["org_id"]),
+    ("pos", "idx_pos_customers_org", "customers", ["org_id"]),
+    ("pos", "idx_pos_customers_email", "customers", ["email"]),
+    ("pos", "idx_pos_customers_phone", "customers", ["phone"]),
+    ("pos", "idx_tax_rates_org", "tax_rates", ["org_id"]),
+    ("pos", "idx_sales_org", "sales", ["org_id"]),
+    ("pos", "idx_sales_org_date", "sales", ["org_id", "sale_date"]),
+    ("pos", "idx_sales_customer", "sales", ["customer_id"]),
+    ("pos", "idx_sales_status", "sales", ["status"]),
+    ("pos", "idx_sale_lines_sale", "sale_lines", ["sale_id"]),
+    ("pos", "idx_payments_method", "payments", ["payment_method"]),
+    # Declared on pos.payments.processed_at, which doesn't exist: it could
+    # never be created, so there is nothing to restore
+    ("pos", "idx_payments_org_date", "payments", None),
+    ("inv", "idx_items_org", "items", ["org_id"]),
+    ("inv", "idx_items_sku", "items", ["sku"]),
+    ("inv", "idx_items_barcode", "items", ["barcode"]),
+    ("inv", "idx_locations_org", "locations", ["org_id"]),
+    ("inv", "idx_stock_levels_org_item_location", "stock_levels", ["org_id", "item_id", "location_id"]),
+    ("acct", "idx_chart_of_accounts_org", "chart_of_accounts", ["org_id"]),
+    ("acct", "idx_chart_of_accounts_type", "chart_of_accounts", ["type"]),
+    ("acct", "idx_journal_entries_posted", "journal_entries", ["posted"]),
+    ("acct", "idx_journal_lines_journal", "journal_lines", ["journal_id"]),
+    ("acct", "idx_customer_balances_org_customer", "customer_balances", ["org_id", "customer_id"]),
+    ("acct", "idx_bank_accounts_org", "bank_accounts", ["org_id"]),
+]
+
+
+# ------------------------------------------------------------
+# UPGRADE
+# ------------------------------------------------------------
+def upgrade():
+    # CONCURRENTLY keeps sales / stock writes flowing while large tables are
+    # indexed; it cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for schema, name, _table, _columns in LEGACY_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {schema}.{name}")
+
+        # Fresh databases already have these from 0001's create_all
+        for name, schema, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                schema=schema,
+                postgresql_where=text(where) if where else None,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+# ------------------------------------------------------------
+# DOWNGRADE
+# ------------------------------------------------------------
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, schema, _table, _columns, _where in reversed(INDEXES):
+            if name in MANUAL_SQL_INDEXES:
+                continue
+            op.drop_index(
+                name,
+                schema=schema,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+        for schema, name, table, columns in LEGACY_INDEXES:
+            if columns is None:
+                continue
+            op.create_index(
+                name,
+                table,
+                columns,
+                schema=schema,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
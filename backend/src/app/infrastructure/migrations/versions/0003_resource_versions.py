@@ -0,0 +1,106 @@
+"""
+Per-org resource version counters for conditional GETs
+
+Adds core.resource_versions plus statement-level triggers that bump an
+org's counter whenever a statement inserts, updates or deletes that org's
+rows in one of the catalog tables. ETags are derived from the counter, so
+a poll that hits If-None-Match never reads the rows.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# ------------------------------------------------------------
+# REVISION METADATA
+# ------------------------------------------------------------
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels = None
+depends_on = None
+
+
+# ------------------------------------------------------------
+# VERSIONED TABLES (schema, table) — every one has an org_id column
+# ------------------------------------------------------------
+VERSIONED_TABLES = [
+    ("inv", "items"),
+    ("inv", "locations"),
+    ("pos", "tax_rates"),
+    ("pos", "terminals"),
+    ("core", "organization_settings"),
+]
+
+# Transition tables allow one event per trigger, hence three triggers
+EVENTS = [
+    ("ins", "INSERT", "NEW TABLE AS changed_rows"),
+    ("upd", "UPDATE", "NEW TABLE AS changed_rows"),
+    ("del", "DELETE", "OLD TABLE AS changed_rows"),
+]
+
+# One upsert per statement and org, however many rows the statement touched
+BUMP_FUNCTION = """
+CREATE OR REPLACE FUNCTION core.bump_resource_version() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO core.resource_versions AS rv (org_id, resource)
+    SELECT DISTINCT org_id, TG_TABLE_SCHEMA || '.' || TG_TABLE_NAME
+    FROM changed_rows
+    ON CONFLICT (org_id, resource) DO UPDATE
+        SET version = rv.version + 1,
+            updated_at = NOW();
+    RETURN NULL;
+END;
+$$
+"""
+
+
+# ------------------------------------------------------------
+# UPGRADE
+# ------------------------------------------------------------
+def upgrade():
+    # Fresh databases already have the table from 0001's create_all
+    op.create_table(
+        "resource_versions",
+        sa.Column("org_id", UUID(as_uuid=True), primary_key=True),
+        sa.Column("resource", sa.Text(), primary_key=True),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default=sa.text("1")),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        schema="core",
+        if_not_exists=True,
+    )
+
+    op.execute(BUMP_FUNCTION)
+
+    for schema, table in VERSIONED_TABLES:
+        for suffix, event, referencing in EVENTS:
+            name = f"trg_{table}_version_{suffix}"
+            op.execute(f"DROP TRIGGER IF EXISTS {name} ON {schema}.{table}")
+            op.execute(
+                f"CREATE TRIGGER {name} AFTER {event} ON {schema}.{table} "
+                f"REFERENCING {referencing} "
+                f"FOR EACH STATEMENT EXECUTE FUNCTION core.bump_resource_version()"
+            )
+
+
+# ------------------------------------------------------------
+# DOWNGRADE
+# ------------------------------------------------------------
+def downgrade():
+    for schema, table in VERSIONED_TABLES:
+        for suffix, _event, _referencing in EVENTS:
+            op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_version_{suffix} ON {schema}.{table}")
+
+    op.execute("DROP FUNCTION IF EXISTS core.bump_resource_version()")
+    op.drop_table("resource_versions", schema="core", if_exists=True)
@@ -0,0 +1,40 @@
+"""
+Cash rounding adjustment on sales
+
+Records how far the org's cash rounding moved each sale's grand_total, so
+subtotal + tax + rounding_adjustment still reconciles with the total.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+
+# ------------------------------------------------------------
+# REVISION METADATA
+# ------------------------------------------------------------
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels = None
+depends_on = None
+
+
+# ------------------------------------------------------------
+# UPGRADE
+# ------------------------------------------------------------
+def upgrade():
+    # Fresh databases already have the column from 0001's create_all
+    op.execute(
+        "ALTER TABLE pos.sales "
+        "ADD COLUMN IF NOT EXISTS rounding_adjustment NUMERIC(18, 4) NOT NULL DEFAULT 0"
+    )
+
+
+# ------------------------------------------------------------
+# DOWNGRADE
+# ------------------------------------------------------------
+def downgrade():
+    op.execute("ALTER TABLE pos.sales DROP COLUMN IF EXISTS rounding_adjustment")
@@ -0,0 +1,82 @@
+"""
+Tax groups (stacked / compound taxes)
+
+Adds pos.tax_groups with their ordered pos.tax_group_rates, and an optional
+tax_group_id on items and sale lines.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# ------------------------------------------------------------
+# REVISION METADATA
+# ------------------------------------------------------------
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels = None
+depends_on = None
+
+
+# ------------------------------------------------------------
+# UPGRADE
+# ------------------------------------------------------------
+def upgrade():
+    # Fresh databases already have all of this from 0001's create_all
+    op.create_table(
+        "tax_groups",
+        sa.Column("tax_group_id", UUID(as_uuid=True), primary_key=True, server_default=sa.text("gen_random_uuid()")),
+        sa.Column("org_id", UUID(as_uuid=True), sa.ForeignKey("core.organizations.org_id"), nullable=False),
+        sa.Column("name", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("NOW()")),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("NOW()")),
+        schema="pos",
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_tax_groups_org_name", "tax_groups", ["org_id", "name"],
+        schema="pos", if_not_exists=True,
+    )
+
+    op.create_table(
+        "tax_group_rates",
+        sa.Column(
+            "tax_group_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("pos.tax_groups.tax_group_id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("sequence", sa.Integer(), primary_key=True),
+        sa.Column("tax_id", UUID(as_uuid=True), sa.ForeignKey("pos.tax_rates.tax_id"), nullable=False),
+        schema="pos",
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_tax_group_rates_tax", "tax_group_rates", ["tax_id"],
+        schema="pos", if_not_exists=True,
+    )
+
+    for schema, table in [("inv", "items"), ("pos", "sale_lines")]:
+        op.execute(
+            f"ALTER TABLE {schema}.{table} ADD COLUMN IF NOT EXISTS tax_group_id UUID "
+            f"REFERENCES pos.tax_groups (tax_group_id)"
+        )
+
+
+# ------------------------------------------------------------
+# DOWNGRADE
+# ------------------------------------------------------------
+def downgrade():
+    for schema, table in [("inv", "items"), ("pos", "sale_lines")]:
+        op.execute(f"ALTER TABLE {schema}.{table} DROP COLUMN IF EXISTS tax_group_id")
+
+    op.drop_index("idx_tax_group_rates_tax", table_name="tax_group_rates", schema="pos", if_exists=True)
+    op.drop_table("tax_group_rates", schema="pos", if_exists=True)
+    op.drop_index("idx_tax_groups_org_name", table_name="tax_groups", schema="pos", if_exists=True)
+    op.drop_table("tax_groups", schema="pos", if_exists=True)
@@ -0,0 +1,100 @@
+"""
+Promotions
+
+Adds pos.promotions (percent-off, BOGO and mix-and-match rules with an
+optional time window) scoped to items through pos.promotion_items, and
+records the promotion a sale line received.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# ------------------------------------------------------------
+# REVISION METADATA
+# ------------------------------------------------------------
+revision: str = "0006"
+down_revision: Union[str, Sequence[str], None] = "0005"
+branch_labels = None
+depends_on = None
+
+
+# ------------------------------------------------------------
+# UPGRADE
+# ------------------------------------------------------------
+def upgrade():
+    # Fresh databases already have all of this from 0001's create_all
+    op.create_table(
+        "promotions",
+        sa.Column("promotion_id", UUID(as_uuid=True), primary_key=True, server_default=sa.text("gen_random_uuid()")),
+        sa.Column("org_id", UUID(as_uuid=True), sa.ForeignKey("core.organizations.org_id"), nullable=False),
+        sa.Column("name", sa.Text(), nullable=False),
+        sa.Column("kind", sa.Text(), nullable=False),
+        sa.Column("priority", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("is_active", sa.Boolean(), nullable=False, server_default=sa.text("TRUE")),
+        sa.Column("starts_at", sa.DateTime(timezone=True)),
+        sa.Column("ends_at", sa.DateTime(timezone=True)),
+        sa.Column("percent_off", sa.Numeric(9, 4)),
+        sa.Column("buy_quantity", sa.Integer()),
+        sa.Column("get_quantity", sa.Integer()),
+        sa.Column("bundle_quantity", sa.Integer()),
+        sa.Column("bundle_price", sa.Numeric(18, 4)),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("NOW()")),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("NOW()")),
+        schema="pos",
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_promotions_org_active", "promotions", ["org_id"],
+        schema="pos", postgresql_where=sa.text("is_active"), if_not_exists=True,
+    )
+
+    op.create_table(
+        "promotion_items",
+        sa.Column(
+            "promotion_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("pos.promotions.promotion_id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "item_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("inv.items.item_id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        schema="pos",
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_promotion_items_item", "promotion_items", ["item_id"],
+        schema="pos", if_not_exists=True,
+    )
+
+    op.execute(
+        "ALTER TABLE pos.sale_lines ADD COLUMN IF NOT EXISTS promotion_id UUID "
+        "REFERENCES pos.promotions (promotion_id) ON DELETE SET NULL"
+    )
+    op.execute(
+        "ALTER TABLE pos.sale_lines "
+        "ADD COLUMN IF NOT EXISTS promotion_discount NUMERIC(18, 4) NOT NULL DEFAULT 0"
+    )
+
+
+# ------------------------------------------------------------
+# DOWNGRADE
+# ------------------------------------------------------------
+def downgrade():
+    op.execute("ALTER TABLE pos.sale_lines DROP COLUMN IF EXISTS promotion_discount")
+    op.execute("ALTER TABLE pos.sale_lines DROP COLUMN IF EXISTS promotion_id")
+
+    op.drop_index("idx_promotion_items_item", table_name="promotion_items", schema="pos", if_exists=True)
+    op.drop_table("promotion_items", schema="pos", if_exists=True)
+    op.drop_index("idx_promotions_org_active", table_name="promotions", schema="pos", if_exists=True)
+    op.drop_table("promotions", schema="pos", if_exists=True)
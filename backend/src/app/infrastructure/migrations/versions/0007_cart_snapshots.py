@@ -0,0 +1,53 @@
+"""
+Cart snapshots
+
+Adds pos.cart_snapshots, the optional persisted copy of open carts
+(CART_PERSIST), so a cart outlives a restart of the worker holding it.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+
+# ------------------------------------------------------------
+# REVISION METADATA
+# ------------------------------------------------------------
+revision: str = "0007"
+down_revision: Union[str, Sequence[str], None] = "0006"
+branch_labels = None
+depends_on = None
+
+
+# ------------------------------------------------------------
+# UPGRADE
+# ------------------------------------------------------------
+def upgrade():
+    # Fresh databases already have this from 0001's create_all
+    op.create_table(
+        "cart_snapshots",
+        sa.Column("cart_id", UUID(as_uuid=True), primary_key=True),
+        sa.Column("org_id", UUID(as_uuid=True), sa.ForeignKey("core.organizations.org_id"), nullable=False),
+        sa.Column("data", JSONB(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("NOW()")),
+        schema="pos",
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_cart_snapshots_expires", "cart_snapshots", ["expires_at"],
+        schema="pos", if_not_exists=True,
+    )
+
+
+# ------------------------------------------------------------
+# DOWNGRADE
+# ------------------------------------------------------------
+def downgrade():
+    op.drop_index("idx_cart_snapshots_expires", table_name="cart_snapshots", schema="pos", if_exists=True)
+    op.drop_table("cart_snapshots", schema="pos", if_exists=True)
@@ -0,0 +1,85 @@
+"""
+Catalog change notifications
+
+The resource-version trigger from 0003 now also NOTIFYs the invalidation
+bus channel with {"resource": "<schema>.<table>", "org_id": ...}, once per
+org a statement touched. Per-worker catalog caches (items, tax rates) are
+then evicted by every write path, including bulk loads and raw SQL.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+
+# ------------------------------------------------------------
+# REVISION METADATA
+# ------------------------------------------------------------
+revision: str = "0008"
+down_revision: Union[str, Sequence[str], None] = "0007"
+branch_labels = None
+depends_on = None
+
+
+# Must match src.app.core.invalidation.CHANNEL
+CHANNEL = "arcoiris_invalidate"
+
+BUMP_AND_NOTIFY_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION core.bump_resource_version() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO core.resource_versions AS rv (org_id, resource)
+    SELECT DISTINCT org_id, TG_TABLE_SCHEMA || '.' || TG_TABLE_NAME
+    FROM changed_rows
+    ON CONFLICT (org_id, resource) DO UPDATE
+        SET version = rv.version + 1,
+            updated_at = NOW();
+
+    -- Delivered on commit; the listener coalesces bursts per org
+    PERFORM pg_notify(
+        '{CHANNEL}',
+        json_build_object(
+            'resource', TG_TABLE_SCHEMA || '.' || TG_TABLE_NAME,
+            'org_id', orgs.org_id,
+            'ids', '[]'::json
+        )::text
+    )
+    FROM (SELECT DISTINCT org_id FROM changed_rows) AS orgs;
+
+    RETURN NULL;
+END;
+$$
+"""
+
+# 0003's version of the function
+BUMP_FUNCTION = """
+CREATE OR REPLACE FUNCTION core.bump_resource_version() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO core.resource_versions AS rv (org_id, resource)
+    SELECT DISTINCT org_id, TG_TABLE_SCHEMA || '.' || TG_TABLE_NAME
+    FROM changed_rows
+    ON CONFLICT (org_id, resource) DO UPDATE
+        SET version = rv.version + 1,
+            updated_at = NOW();
+    RETURN NULL;
+END;
+$$
+"""
+
+
+# ------------------------------------------------------------
+# UPGRADE
+# ------------------------------------------------------------
+def upgrade():
+    op.execute(BUMP_AND_NOTIFY_FUNCTION)
+
+
+# ------------------------------------------------------------
+# DOWNGRADE
+# ------------------------------------------------------------
+def downgrade():
+    op.execute(BUMP_FUNCTION)
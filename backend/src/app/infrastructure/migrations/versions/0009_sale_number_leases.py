@@ -0,0 +1,78 @@
+"""
+Leased sale numbers
+
+Adds pos.sale_number_counters (per-org high-water mark) and
+pos.sale_number_leases (blocks of numbers leased to terminals), plus
+pos.sales.sale_seq, the numeric part of an allocated sale_number, unique
+per org.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# ------------------------------------------------------------
+# REVISION METADATA
+# ------------------------------------------------------------
+revision: str = "0009"
+down_revision: Union[str, Sequence[str], None] = "0008"
+branch_labels = None
+depends_on = None
+
+
+# ------------------------------------------------------------
+# UPGRADE
+# ------------------------------------------------------------
+def upgrade():
+    # Fresh databases already have these from 0001's create_all
+    op.create_table(
+        "sale_number_counters",
+        sa.Column("org_id", UUID(as_uuid=True), sa.ForeignKey("core.organizations.org_id"), primary_key=True),
+        sa.Column("high_water", sa.BigInteger(), nullable=False, server_default=sa.text("0")),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("NOW()")),
+        schema="pos",
+        if_not_exists=True,
+    )
+    op.create_table(
+        "sale_number_leases",
+        sa.Column("lease_id", UUID(as_uuid=True), primary_key=True, server_default=sa.text("gen_random_uuid()")),
+        sa.Column("org_id", UUID(as_uuid=True), sa.ForeignKey("core.organizations.org_id"), nullable=False),
+        sa.Column("terminal_id", UUID(as_uuid=True), sa.ForeignKey("pos.terminals.terminal_id")),
+        sa.Column("first_number", sa.BigInteger(), nullable=False),
+        sa.Column("last_number", sa.BigInteger(), nullable=False),
+        sa.Column("used_through", sa.BigInteger()),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("NOW()")),
+        sa.Column("closed_at", sa.DateTime(timezone=True)),
+        schema="pos",
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_sale_number_leases_org_first", "sale_number_leases", ["org_id", "first_number"],
+        schema="pos", if_not_exists=True,
+    )
+
+    op.execute("ALTER TABLE pos.sales ADD COLUMN IF NOT EXISTS sale_seq BIGINT")
+    op.create_index(
+        "uq_sales_org_seq", "sales", ["org_id", "sale_seq"],
+        unique=True,
+        postgresql_where=sa.text("sale_seq IS NOT NULL"),
+        schema="pos",
+        if_not_exists=True,
+    )
+
+
+# ------------------------------------------------------------
+# DOWNGRADE
+# ------------------------------------------------------------
+def downgrade():
+    op.drop_index("uq_sales_org_seq", table_name="sales", schema="pos", if_exists=True)
+    op.execute("ALTER TABLE pos.sales DROP COLUMN IF EXISTS sale_seq")
+    op.drop_index("idx_sale_number_leases_org_first", table_name="sale_number_leases", schema="pos", if_exists=True)
+    op.drop_table("sale_number_leases", schema="pos", if_exists=True)
+    op.drop_table("sale_number_counters", schema="pos", if_exists=True)
@@ -0,0 +1,43 @@
+"""
+Row versions for optimistic concurrency
+
+Adds a version counter to pos.sales and inv.stock_levels. The ORM maps it
+as version_id_col, so updates compare-and-swap on it instead of needing
+SELECT ... FOR UPDATE.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+
+# ------------------------------------------------------------
+# REVISION METADATA
+# ------------------------------------------------------------
+revision: str = "0010"
+down_revision: Union[str, Sequence[str], None] = "0009"
+branch_labels = None
+depends_on = None
+
+
+TABLES = ("pos.sales", "inv.stock_levels")
+
+
+# ------------------------------------------------------------
+# UPGRADE
+# ------------------------------------------------------------
+def upgrade():
+    # A constant default: no table rewrite on PostgreSQL 11+
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1")
+
+
+# ------------------------------------------------------------
+# DOWNGRADE
+# ------------------------------------------------------------
+def downgrade():
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS version")
@@ -0,0 +1,77 @@
+"""
+Stocktakes
+
+Adds inv.stocktakes (a physical count of one location) and
+inv.stocktake_counts (the uploaded count rows, by SKU or barcode).
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# ------------------------------------------------------------
+# REVISION METADATA
+# ------------------------------------------------------------
+revision: str = "0011"
+down_revision: Union[str, Sequence[str], None] = "0010"
+branch_labels = None
+depends_on = None
+
+
+# ------------------------------------------------------------
+# UPGRADE
+# ------------------------------------------------------------
+def upgrade():
+    # Fresh databases already have these from 0001's create_all
+    op.create_table(
+        "stocktakes",
+        sa.Column("stocktake_id", UUID(as_uuid=True), primary_key=True, server_default=sa.text("gen_random_uuid()")),
+        sa.Column("org_id", UUID(as_uuid=True), sa.ForeignKey("core.organizations.org_id"), nullable=False),
+        sa.Column("location_id", UUID(as_uuid=True), sa.ForeignKey("inv.locations.location_id"), nullable=False),
+        sa.Column("status", sa.Text(), nullable=False, server_default=sa.text("'open'")),
+        sa.Column("zero_uncounted", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+        sa.Column("notes", sa.Text()),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("NOW()")),
+        sa.Column("applied_at", sa.DateTime(timezone=True)),
+        schema="inv",
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_stocktakes_org_created", "stocktakes", ["org_id", "created_at"],
+        schema="inv", if_not_exists=True,
+    )
+
+    op.create_table(
+        "stocktake_counts",
+        sa.Column("count_id", sa.BigInteger(), sa.Identity(), primary_key=True),
+        sa.Column(
+            "stocktake_id", UUID(as_uuid=True),
+            sa.ForeignKey("inv.stocktakes.stocktake_id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("sku", sa.Text()),
+        sa.Column("barcode", sa.Text()),
+        sa.Column("counted_quantity", sa.Numeric(18, 4), nullable=False),
+        schema="inv",
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_stocktake_counts_stocktake", "stocktake_counts", ["stocktake_id"],
+        schema="inv", if_not_exists=True,
+    )
+
+
+# ------------------------------------------------------------
+# DOWNGRADE
+# ------------------------------------------------------------
+def downgrade():
+    op.drop_index("idx_stocktake_counts_stocktake", table_name="stocktake_counts", schema="inv", if_exists=True)
+    op.drop_table("stocktake_counts", schema="inv", if_exists=True)
+    op.drop_index("idx_stocktakes_org_created", table_name="stocktakes", schema="inv", if_exists=True)
+    op.drop_table("stocktakes", schema="inv", if_exists=True)
@@ -0,0 +1,77 @@
+"""
+Stock snapshots
+
+Adds inv.stock_snapshots / inv.stock_snapshot_levels (periodic per-org
+on-hand balances for point-in-time queries) and an (org_id, created_at)
+index on inv.stock_movements for finding movements recorded after a
+snapshot was taken.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# ------------------------------------------------------------
+# REVISION METADATA
+# ------------------------------------------------------------
+revision: str = "0012"
+down_revision: Union[str, Sequence[str], None] = "0011"
+branch_labels = None
+depends_on = None
+
+
+# ------------------------------------------------------------
+# UPGRADE
+# ------------------------------------------------------------
+def upgrade():
+    # Fresh databases already have these from 0001's create_all
+    op.create_table(
+        "stock_snapshots",
+        sa.Column("snapshot_id", UUID(as_uuid=True), primary_key=True, server_default=sa.text("gen_random_uuid()")),
+        sa.Column("org_id", UUID(as_uuid=True), sa.ForeignKey("core.organizations.org_id"), nullable=False),
+        sa.Column("cutoff_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("covered_through", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("level_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("NOW()")),
+        schema="inv",
+        if_not_exists=True,
+    )
+    op.create_index(
+        "uq_stock_snapshots_org_cutoff", "stock_snapshots", ["org_id", "cutoff_at"],
+        unique=True, schema="inv", if_not_exists=True,
+    )
+
+    op.create_table(
+        "stock_snapshot_levels",
+        sa.Column(
+            "snapshot_id", UUID(as_uuid=True),
+            sa.ForeignKey("inv.stock_snapshots.snapshot_id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("location_id", UUID(as_uuid=True), primary_key=True),
+        sa.Column("item_id", UUID(as_uuid=True), primary_key=True),
+        sa.Column("quantity_on_hand", sa.Numeric(18, 4), nullable=False),
+        schema="inv",
+        if_not_exists=True,
+    )
+
+    op.create_index(
+        "idx_stock_movements_org_created", "stock_movements", ["org_id", "created_at"],
+        schema="inv", if_not_exists=True,
+    )
+
+
+# ------------------------------------------------------------
+# DOWNGRADE
+# ------------------------------------------------------------
+def downgrade():
+    op.drop_index("idx_stock_movements_org_created", table_name="stock_movements", schema="inv", if_exists=True)
+    op.drop_table("stock_snapshot_levels", schema="inv", if_exists=True)
+    op.drop_index("uq_stock_snapshots_org_cutoff", table_name="stock_snapshots", schema="inv", if_exists=True)
+    op.drop_table("stock_snapshots", schema="inv", if_exists=True)
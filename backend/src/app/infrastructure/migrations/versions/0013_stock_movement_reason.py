@@ -0,0 +1,37 @@
+"""
+Stock movement reason
+
+Adds inv.stock_movements.reason: the free-text reason given for an admin
+stock adjustment.
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+
+# ------------------------------------------------------------
+# REVISION METADATA
+# ------------------------------------------------------------
+revision: str = "0013"
+down_revision: Union[str, Sequence[str], None] = "0012"
+branch_labels = None
+depends_on = None
+
+
+# ------------------------------------------------------------
+# UPGRADE
+# ------------------------------------------------------------
+def upgrade():
+    # Fresh databases already have the column from 0001's create_all
+    op.execute("ALTER TABLE inv.stock_movements ADD COLUMN IF NOT EXISTS reason TEXT")
+
+
+# ------------------------------------------------------------
+# DOWNGRADE
+# ------------------------------------------------------------
+def downgrade():
+    op.execute("ALTER TABLE inv.stock_movements DROP COLUMN IF EXISTS reason")
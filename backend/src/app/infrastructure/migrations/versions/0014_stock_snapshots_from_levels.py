@@ -0,0 +1,41 @@
+"""
+Stock snapshots from levels
+
+Snapshots are now taken from inv.stock_levels rather than summed from the
+movement ledger. The ones already taken were summed from the ledger, so
+they are wrong for any level without full ledger history: drop them, and
+the scheduler (or POST /stock-snapshots) takes new ones.
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+
+# ------------------------------------------------------------
+# REVISION METADATA
+# ------------------------------------------------------------
+revision: str = "0014"
+down_revision: Union[str, Sequence[str], None] = "0013"
+branch_labels = None
+depends_on = None
+
+
+# ------------------------------------------------------------
+# UPGRADE
+# ------------------------------------------------------------
+def upgrade():
+    # stock_snapshot_levels goes with them (ON DELETE CASCADE)
+    op.execute("DELETE FROM inv.stock_snapshots")
+
+
+# ------------------------------------------------------------
+# DOWNGRADE
+# ------------------------------------------------------------
+def downgrade():
+    # Snapshots taken from levels are still valid to the old as_of
+    # wherever the ledger is complete; nothing to undo
+    pass
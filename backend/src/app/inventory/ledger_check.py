@@ -0,0 +1,73 @@
+# backend/src/app/inventory/ledger_check.py
+"""
+Check stock levels against the movement ledger, as a scheduled job.
+
+    # Every active org; exit 1 if any level has drifted
+    python -m src.app.inventory.ledger_check
+
+    # Two orgs, fixing levels from the ledger, full report to a file
+    python -m src.app.inventory.ledger_check --org-id <uuid> --org-id <uuid> \\
+        --repair levels -o ledger-report.json
+
+Safe on a live system: each (org, item range) is one short transaction,
+and repairs skip levels written since they were scanned. With --repair,
+exit 1 only if some drift was left unrepaired.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from typing import Sequence
+from uuid import UUID
+
+from src.app.core.config import settings
+from src.app.core.database import engine
+from src.app.core.responses import dumps
+from src.app.inventory.services.stock_ledger import REPAIR_MODES, StockLedgerService
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Verify (and repair) stock levels against the movement ledger.")
+    parser.add_argument("--org-id", type=UUID, action="append", help="Only this org (repeatable; default: every active org)")
+    parser.add_argument("--repair", choices=REPAIR_MODES, help="levels: set levels to the ledger; ledger: post movements to match levels")
+    parser.add_argument("--partitions", type=int, default=settings.stock_ledger_partitions, help="Item-id ranges per org")
+    parser.add_argument("--concurrency", type=int, default=settings.stock_ledger_concurrency, help="Ranges checked at once")
+    parser.add_argument("--batch-rows", type=int, default=settings.stock_ledger_batch_rows)
+    parser.add_argument("--sample", type=int, default=20, help="Largest drifts kept per org")
+    parser.add_argument("-o", "--output", help="Write the JSON reports here (default: stdout)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = parse_args(argv)
+    engine.sync_engine.echo = False   # stdout carries the report
+
+    service = StockLedgerService(args.partitions, args.batch_rows, args.concurrency)
+    reports = asyncio.run(service.verify_all(args.org_id, repair=args.repair, sample=args.sample))
+
+    unresolved = 0
+    for report in reports:
+        if report["drift_count"]:
+            print(
+                f"{report['org_id']}: {report['drift_count']} drifted "
+                f"({report['missing_level_count']} without a level), net {report['net_drift']}"
+                + (f", repaired {report['repaired_count']}" if args.repair else ""),
+                file=sys.stderr,
+            )
+        unresolved += report["drift_count"] - report["repaired_count"]
+    print(f"{len(reports)} org(s) checked, {unresolved} drifted level(s) unresolved", file=sys.stderr)
+
+    body = dumps(reports)
+    if args.output:
+        with open(args.output, "wb") as fh:
+            fh.write(body)
+    else:
+        sys.stdout.buffer.write(body + b"\n")
+
+    sys.exit(1 if unresolved else 0)
+
+
+if __name__ == "__main__":
+    main()
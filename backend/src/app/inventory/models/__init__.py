@@ -2,5 +2,7 @@ from .item_models import Item
 from .location_models import Location
 from .stock_level_models import StockLevel
 from .stock_movement_models import StockMovement
+from .stock_snapshot_models import StockSnapshot, StockSnapshotLevel
+from .stocktake_models import Stocktake, StocktakeCount
 
-__all__ = ["Item", "Location", "StockLevel", "StockMovement"]
+__all__ = ["Item", "Location", "StockLevel", "StockMovement", "StockSnapshot", "StockSnapshotLevel", "Stocktake", "StocktakeCount"]
@@ -12,6 +12,7 @@ from sqlalchemy import (
     Numeric,
     Text,
     ForeignKey,
+    Index,
     text,
 )
 from sqlalchemy.dialects.postgresql import UUID
@@ -23,7 +24,23 @@ from src.app.pos.models.tax_rate_models import TaxRate
 
 class Item(Base):
     __tablename__ = "items"
-    __table_args__ = {"schema": "inv"}
+    __table_args__ = (
+        # ItemService.get_by_org: org_id = ? AND deleted_at IS NULL ORDER BY name
+        Index(
+            "idx_items_org_name_live",
+            "org_id",
+            "name",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index("idx_items_org_sku", "org_id", "sku"),
+        Index(
+            "idx_items_org_barcode",
+            "org_id",
+            "barcode",
+            postgresql_where=text("barcode IS NOT NULL"),
+        ),
+        {"schema": "inv"},
+    )
 
     item_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -58,6 +75,13 @@ class Item(Base):
         nullable=True,
     )
 
+    # Stacked taxes; takes precedence over tax_id when both are set
+    tax_group_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("pos.tax_groups.tax_group_id"),
+        nullable=True,
+    )
+
     is_active: Mapped[bool] = mapped_column(
         Boolean,
         nullable=False,
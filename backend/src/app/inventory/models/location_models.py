@@ -9,6 +9,7 @@ from sqlalchemy import (
     DateTime,
     Text,
     ForeignKey,
+    Index,
     text,
 )
 from sqlalchemy.dialects.postgresql import UUID
@@ -19,7 +20,15 @@ from src.app.core.base import Base
 
 class Location(Base):
     __tablename__ = "locations"
-    __table_args__ = {"schema": "inv"}
+    __table_args__ = (
+        Index(
+            "idx_locations_org_name_live",
+            "org_id",
+            "name",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        {"schema": "inv"},
+    )
 
     location_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
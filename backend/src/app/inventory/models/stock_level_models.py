@@ -9,8 +9,10 @@ from typing import Optional, List
 from sqlalchemy import (
     Boolean,
     DateTime,
+    Integer,
     Numeric,
     ForeignKey,
+    Index,
     UniqueConstraint,
     text,
 )
@@ -24,6 +26,7 @@ class StockLevel(Base):
     __tablename__ = "stock_levels"
     __table_args__ = (
         UniqueConstraint("org_id", "item_id", "location_id"),
+        Index("idx_stock_levels_org_updated", "org_id", text("updated_at DESC")),
         {"schema": "inv"},
     )
 
@@ -63,6 +66,10 @@ class StockLevel(Base):
         server_default=text("NOW()"),
     )
 
+    # Optimistic concurrency: ORM updates are UPDATE ... WHERE version = :read
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("1"))
+    __mapper_args__ = {"version_id_col": version}
+
     # -------------------------
     # Relationships
     # -------------------------
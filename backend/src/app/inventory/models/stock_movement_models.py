@@ -12,6 +12,7 @@ from sqlalchemy import (
     Numeric,
     Text,
     ForeignKey,
+    Index,
     text,
 )
 from sqlalchemy.dialects.postgresql import UUID
@@ -22,7 +23,14 @@ from src.app.core.base import Base
 
 class StockMovement(Base):
     __tablename__ = "stock_movements"
-    __table_args__ = {"schema": "inv"}
+    __table_args__ = (
+        Index("idx_stock_movements_org_occurred", "org_id", text("occurred_at DESC")),
+        Index("idx_stock_movements_org_item_date", "org_id", "item_id", "occurred_at"),
+        Index("idx_stock_movements_source", "source_type", "source_id"),
+        # Movements recorded since a snapshot's covered_through (late arrivals)
+        Index("idx_stock_movements_org_created", "org_id", "created_at"),
+        {"schema": "inv"},
+    )
 
     movement_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -70,6 +78,8 @@ class StockMovement(Base):
         Numeric(18, 4),
     )
 
+    reason: Mapped[Optional[str]] = mapped_column(Text)
+
     occurred_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
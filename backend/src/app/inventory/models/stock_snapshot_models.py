@@ -0,0 +1,68 @@
+# backend/src/app/inventory/models/stock_snapshot_models.py
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Numeric, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.app.core.base import Base
+
+
+class StockSnapshot(Base):
+    """
+    The org's on-hand quantities as of cutoff_at: each StockLevel as read
+    at the take, less the movements that occurred after cutoff_at or were
+    recorded after covered_through. Late (backdated) movements are folded
+    in as covered_through moves forward.
+    """
+
+    __tablename__ = "stock_snapshots"
+    __table_args__ = (
+        Index("uq_stock_snapshots_org_cutoff", "org_id", "cutoff_at", unique=True),
+        {"schema": "inv"},
+    )
+
+    snapshot_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
+
+    org_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("core.organizations.org_id"),
+        nullable=False,
+    )
+
+    cutoff_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    covered_through: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    level_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=text("NOW()")
+    )
+
+
+class StockSnapshotLevel(Base):
+    """
+    One (location, item) quantity in a snapshot. Derived rows, written in
+    bulk and only ever read by snapshot_id, so no FKs to items / locations.
+    """
+
+    __tablename__ = "stock_snapshot_levels"
+    __table_args__ = {"schema": "inv"}
+
+    snapshot_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("inv.stock_snapshots.snapshot_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    location_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    item_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+
+    quantity_on_hand: Mapped[Decimal] = mapped_column(Numeric(18, 4), nullable=False)
@@ -0,0 +1,81 @@
+# backend/src/app/inventory/models/stocktake_models.py
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import BigInteger, Boolean, DateTime, ForeignKey, Identity, Index, Numeric, Text, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.app.core.base import Base
+
+
+class Stocktake(Base):
+    """
+    A physical count of one location. Counts are uploaded while it is
+    "open"; applying it sets every counted StockLevel to the counted
+    quantity (and, with zero_uncounted, every uncounted one to zero).
+    """
+
+    __tablename__ = "stocktakes"
+    __table_args__ = (
+        Index("idx_stocktakes_org_created", "org_id", "created_at"),
+        {"schema": "inv"},
+    )
+
+    stocktake_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
+
+    org_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("core.organizations.org_id"),
+        nullable=False,
+    )
+
+    location_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("inv.locations.location_id"),
+        nullable=False,
+    )
+
+    status: Mapped[str] = mapped_column(Text, nullable=False, server_default=text("'open'"))
+    zero_uncounted: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=text("false"))
+    notes: Mapped[Optional[str]] = mapped_column(Text)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=text("NOW()")
+    )
+    applied_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+
+
+class StocktakeCount(Base):
+    """
+    One uploaded count row, as received: a SKU or a barcode and the
+    quantity found. Rows are resolved to items (and duplicates summed)
+    only when previewing or applying.
+    """
+
+    __tablename__ = "stocktake_counts"
+    __table_args__ = (
+        Index("idx_stocktake_counts_stocktake", "stocktake_id"),
+        {"schema": "inv"},
+    )
+
+    count_id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+
+    stocktake_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("inv.stocktakes.stocktake_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    sku: Mapped[Optional[str]] = mapped_column(Text)
+    barcode: Mapped[Optional[str]] = mapped_column(Text)
+    counted_quantity: Mapped[Decimal] = mapped_column(Numeric(18, 4), nullable=False)
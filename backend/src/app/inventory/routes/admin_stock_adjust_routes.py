@@ -36,17 +36,11 @@ async def adjust_stock(
     Only admins / managers / owners can do this.
     """
 
-    # ✔️ Correct org extraction
-    org_id = getattr(org_ctx, "org_id", None)
-
-    data = payload.dict()
-    data["org_id"] = org_id
+    org_id = org_ctx["org"].org_id
 
     try:
-        adjustment = await stock_adjustment_service.adjust(session, data)
-        await session.commit()
-        await session.refresh(adjustment)
-        return adjustment
+        # The service commits the level change and its movement together
+        return await stock_adjustment_service.adjust(session, payload, org_id=org_id)
 
     except ValueError as e:
         raise HTTPException(
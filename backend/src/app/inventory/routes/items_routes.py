@@ -6,7 +6,9 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.app.core.conditional import ConditionalGet
 from src.app.core.database import get_session
+from src.app.core.projection import FieldSet
 
 # ---------------------------------------------------------
 # ✔️ Corrected security imports (must live under src.app.auth.services)
@@ -17,7 +19,12 @@ from src.app.auth.services.dependencies import (
     require_admin_org,
 )
 
+from src.app.inventory.models.item_models import Item
 from src.app.inventory.schemas.inv_schemas import (
+    ItemBulkCreate,
+    ItemBulkDelete,
+    ItemBulkDeleteResult,
+    ItemBulkUpdate,
     ItemCreate,
     ItemRead,
     ItemUpdate,
@@ -27,6 +34,9 @@ from src.app.inventory.services.item_service import item_service
 
 router = APIRouter(prefix="/items", tags=["items"])
 
+item_cache = ConditionalGet(Item)
+item_fields = FieldSet(ItemRead, Item)
+
 
 # ---------------------------------------------------------
 # LIST ITEMS (any staff)
@@ -35,12 +45,77 @@ router = APIRouter(prefix="/items", tags=["items"])
 async def list_items(
     limit: int = 100,
     offset: int = 0,
+    fields = Depends(item_fields),
     session: AsyncSession = Depends(get_session),
     org_ctx = Depends(get_current_org),
     user    = Depends(require_any_staff_org),
+    cache   = Depends(item_cache),
+):
+    org_id = org_ctx["org"].org_id
+    rows = await item_service.get_by_org(session, org_id, limit, offset, fields=fields)
+    return item_fields.render(rows, headers=cache)
+
+
+# ---------------------------------------------------------
+# BULK CREATE ITEMS (one INSERT ... RETURNING)
+# ---------------------------------------------------------
+@router.post("/bulk", response_model=List[ItemRead], status_code=status.HTTP_201_CREATED)
+async def bulk_create_items(
+    payload: ItemBulkCreate,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user    = Depends(require_admin_org),
+):
+    org_id = org_ctx["org"].org_id
+
+    rows = [{**item.dict(), "org_id": org_id} for item in payload.items]
+
+    items = await item_service.create_many(session, rows)
+    await session.commit()
+    return items
+
+
+# ---------------------------------------------------------
+# BULK UPDATE ITEMS (same changes applied to every item)
+# ---------------------------------------------------------
+@router.patch("/bulk", response_model=List[ItemRead])
+async def bulk_update_items(
+    payload: ItemBulkUpdate,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user    = Depends(require_admin_org),
+):
+    org_id = org_ctx["org"].org_id
+
+    items = await item_service.update_many(
+        session,
+        payload.item_ids,
+        payload.changes.dict(exclude_unset=True),
+        where=[Item.org_id == org_id],
+    )
+    await session.commit()
+    return items
+
+
+# ---------------------------------------------------------
+# BULK DELETE ITEMS (soft delete)
+# ---------------------------------------------------------
+@router.post("/bulk/delete", response_model=ItemBulkDeleteResult)
+async def bulk_delete_items(
+    payload: ItemBulkDelete,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user    = Depends(require_admin_org),
 ):
     org_id = org_ctx["org"].org_id
-    return await item_service.get_by_org(session, org_id, limit, offset)
+
+    deleted_ids = await item_service.soft_delete_many(
+        session,
+        payload.item_ids,
+        where=[Item.org_id == org_id],
+    )
+    await session.commit()
+    return {"deleted_ids": deleted_ids}
 
 
 # ---------------------------------------------------------
@@ -80,9 +155,8 @@ async def create_item(
     data = payload.dict()
     data["org_id"] = org_id
 
-    item = await item_service.create(session, data)
+    item = await item_service.create_returning(session, data)
     await session.commit()
-    await session.refresh(item)
     return item
 
 
@@ -6,7 +6,9 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.app.core.conditional import ConditionalGet
 from src.app.core.database import get_session
+from src.app.core.projection import FieldSet
 
 # ---------------------------------------------------------
 # ✔️ Corrected security import paths (must be under src.app)
@@ -17,6 +19,7 @@ from src.app.auth.services.dependencies import (
     require_admin_org,
 )
 
+from src.app.inventory.models.location_models import Location
 from src.app.inventory.schemas.inv_schemas import (
     LocationCreate,
     LocationRead,
@@ -27,6 +30,9 @@ from src.app.inventory.services.location_service import location_service
 
 router = APIRouter(prefix="/locations", tags=["locations"])
 
+location_cache = ConditionalGet(Location)
+location_fields = FieldSet(LocationRead, Location)
+
 
 # ---------------------------------------------------------
 # LIST LOCATIONS (any staff)
@@ -35,12 +41,15 @@ router = APIRouter(prefix="/locations", tags=["locations"])
 async def list_locations(
     limit: int = 100,
     offset: int = 0,
+    fields = Depends(location_fields),
     session: AsyncSession = Depends(get_session),
     org_ctx = Depends(get_current_org),
     user    = Depends(require_any_staff_org),
+    cache   = Depends(location_cache),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
-    return await location_service.get_by_org(session, org_id, limit, offset)
+    org_id = org_ctx["org"].org_id
+    rows = await location_service.get_by_org(session, org_id, limit, offset, fields=fields)
+    return location_fields.render(rows, headers=cache)
 
 
 # ---------------------------------------------------------
@@ -53,7 +62,7 @@ async def get_location(
     org_ctx = Depends(get_current_org),
     user    = Depends(require_any_staff_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
     location = await location_service.get_by_id(session, location_id)
 
     if not location or location.org_id != org_id:
@@ -75,7 +84,7 @@ async def create_location(
     org_ctx = Depends(get_current_org),
     user    = Depends(require_admin_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
 
     data = payload.dict()
     data["org_id"] = org_id
@@ -97,7 +106,7 @@ async def update_location(
     org_ctx = Depends(get_current_org),
     user    = Depends(require_admin_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
     location = await location_service.get_by_id(session, location_id)
 
     if not location or location.org_id != org_id:
@@ -125,7 +134,7 @@ async def delete_location(
     org_ctx = Depends(get_current_org),
     user    = Depends(require_admin_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
     location = await location_service.get_by_id(session, location_id)
 
     if not location or location.org_id != org_id:
@@ -0,0 +1,50 @@
+# backend/src/app/inventory/routes/stock_ledger_routes.py
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core.database import get_session
+
+from src.app.auth.services.org_context import get_current_org
+from src.app.auth.services.dependencies import require_admin_org
+
+from src.app.inventory.schemas.inv_schemas import StockLedgerRepair, StockLedgerReport
+
+from src.app.inventory.services.stock_ledger import stock_ledger_service
+
+router = APIRouter(prefix="/stock-ledger", tags=["stock-ledger"])
+
+
+# ---------------------------------------------------------
+# VERIFY (admin / manager / owner)
+# ---------------------------------------------------------
+@router.get("/verify", response_model=StockLedgerReport)
+async def verify_stock_ledger(
+    sample: int = Query(100, ge=0, le=1000),
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user    = Depends(require_admin_org),
+):
+    """Levels whose quantity differs from the sum of their movements; largest drift first."""
+    org_id = org_ctx["org"].org_id
+    return await stock_ledger_service.verify_org(session, org_id, sample=sample)
+
+
+# ---------------------------------------------------------
+# REPAIR (admin / manager / owner)
+# ---------------------------------------------------------
+@router.post("/repair", response_model=StockLedgerReport)
+async def repair_stock_ledger(
+    payload: StockLedgerRepair,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user    = Depends(require_admin_org),
+):
+    """
+    Verify and fix each drifted level: "levels" sets it to its ledger
+    total, "ledger" posts a "ledger_repair" movement to match it.
+    """
+    org_id = org_ctx["org"].org_id
+    return await stock_ledger_service.verify_org(
+        session, org_id, repair=payload.repair, sample=payload.sample
+    )
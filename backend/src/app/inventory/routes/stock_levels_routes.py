@@ -1,12 +1,21 @@
 # backend/src/app/inventory/routes/stock_levels_routes.py
 
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.core.database import get_session
+from src.app.core.optimistic import (
+    VersionConflict,
+    conflict_error,
+    if_match_version,
+    version_etag,
+)
+from src.app.core.projection import FieldSet
 
 # ---------------------------------------------------------
 # ✔️ Correct security imports (must come from src.app.auth...)
@@ -17,16 +26,22 @@ from src.app.auth.services.dependencies import (
     require_admin_org,
 )
 
+from src.app.inventory.models.stock_level_models import StockLevel
 from src.app.inventory.schemas.inv_schemas import (
+    StockLevelBulkCreate,
+    StockLevelBulkUpdate,
     StockLevelCreate,
     StockLevelRead,
     StockLevelUpdate,
 )
 
 from src.app.inventory.services.stock_level_service import stock_level_service
+from src.app.inventory.services.stock_snapshots import stock_snapshot_service
 
 router = APIRouter(prefix="/stock-levels", tags=["stock-levels"])
 
+stock_level_fields = FieldSet(StockLevelRead, StockLevel)
+
 
 # ---------------------------------------------------------
 # LIST STOCK LEVELS (any staff)
@@ -35,12 +50,84 @@ router = APIRouter(prefix="/stock-levels", tags=["stock-levels"])
 async def list_stock_levels(
     limit: int = 100,
     offset: int = 0,
+    as_of: Optional[datetime] = Query(None, description="Levels as they stood at this time"),
+    location_id: Optional[UUID] = None,
+    item_id: Optional[UUID] = None,
+    fields = Depends(stock_level_fields),
     session: AsyncSession = Depends(get_session),
     org_ctx = Depends(get_current_org),
     user    = Depends(require_any_staff_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
-    return await stock_level_service.get_by_org(session, org_id, limit, offset)
+    """
+    With as_of, levels are worked out from the nearest stock snapshot
+    plus the movements after it (or the current levels less the
+    movements since, before the first snapshot) and each row is a
+    StockLevelAsOfRead: item_id, location_id, quantity_on_hand, ordered
+    by location then item. fields does not apply.
+    """
+    org_id = org_ctx["org"].org_id
+
+    if as_of is not None:
+        rows = await stock_snapshot_service.as_of(
+            session, org_id, as_of,
+            location_id=location_id, item_id=item_id, limit=limit, offset=offset,
+        )
+        return FieldSet.render(rows)
+
+    rows = await stock_level_service.get_by_org(
+        session, org_id, limit, offset, fields=fields,
+        location_id=location_id, item_id=item_id,
+    )
+    return stock_level_fields.render(rows)
+
+
+# ---------------------------------------------------------
+# BULK CREATE STOCK LEVELS (admin / manager / owner)
+# ---------------------------------------------------------
+@router.post("/bulk", response_model=List[StockLevelRead], status_code=status.HTTP_201_CREATED)
+async def bulk_create_stock_levels(
+    payload: StockLevelBulkCreate,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user    = Depends(require_admin_org),
+):
+    org_id = org_ctx["org"].org_id
+
+    rows = [{**level.dict(), "org_id": org_id} for level in payload.stock_levels]
+
+    try:
+        stock_levels = await stock_level_service.create_levels(session, rows)
+        await session.commit()
+    except IntegrityError:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Duplicate item/location pair, or unknown item or location",
+        )
+
+    return stock_levels
+
+
+# ---------------------------------------------------------
+# BULK UPDATE STOCK LEVELS (same changes applied to every row)
+# ---------------------------------------------------------
+@router.patch("/bulk", response_model=List[StockLevelRead])
+async def bulk_update_stock_levels(
+    payload: StockLevelBulkUpdate,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user    = Depends(require_admin_org),
+):
+    org_id = org_ctx["org"].org_id
+
+    stock_levels = await stock_level_service.update_levels(
+        session,
+        payload.stock_level_ids,
+        payload.changes.dict(exclude_unset=True),
+        org_id=org_id,
+    )
+    await session.commit()
+    return stock_levels
 
 
 # ---------------------------------------------------------
@@ -49,11 +136,12 @@ async def list_stock_levels(
 @router.get("/{stock_level_id}", response_model=StockLevelRead)
 async def get_stock_level(
     stock_level_id: UUID,
+    response: Response,
     session: AsyncSession = Depends(get_session),
     org_ctx = Depends(get_current_org),
     user    = Depends(require_any_staff_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
 
     stock_level = await stock_level_service.get_by_id(session, stock_level_id)
 
@@ -63,6 +151,7 @@ async def get_stock_level(
             detail="Stock level not found",
         )
 
+    response.headers["ETag"] = version_etag(stock_level.version)
     return stock_level
 
 
@@ -76,14 +165,13 @@ async def create_stock_level(
     org_ctx = Depends(get_current_org),
     user    = Depends(require_admin_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
 
     data = payload.dict()
     data["org_id"] = org_id
 
-    stock_level = await stock_level_service.create(session, data)
+    [stock_level] = await stock_level_service.create_levels(session, [data])
     await session.commit()
-    await session.refresh(stock_level)
     return stock_level
 
 
@@ -94,22 +182,35 @@ async def create_stock_level(
 async def update_stock_level(
     stock_level_id: UUID,
     payload: StockLevelUpdate,
+    response: Response,
+    if_match: Optional[int] = Depends(if_match_version),
     session: AsyncSession = Depends(get_session),
     org_ctx = Depends(get_current_org),
     user    = Depends(require_admin_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
-    stock_level = await stock_level_service.get_by_id(session, stock_level_id)
+    """
+    With If-Match, applied only if the row is still at that version (412
+    otherwise). The UPDATE is conditional on the version read, so a
+    concurrent write is never overwritten unseen.
+    """
+    org_id = org_ctx["org"].org_id
+
+    try:
+        stock_level = await stock_level_service.update_level(
+            session,
+            stock_level_id,
+            payload.dict(exclude_unset=True),
+            org_id=org_id,
+            if_match=if_match,
+        )
+    except VersionConflict as exc:
+        raise conflict_error(exc, if_match)
 
-    if not stock_level or stock_level.org_id != org_id:
+    if not stock_level:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Stock level not found",
         )
 
-    for field, value in payload.dict(exclude_unset=True).items():
-        setattr(stock_level, field, value)
-
-    await session.commit()
-    await session.refresh(stock_level)
+    response.headers["ETag"] = version_etag(stock_level.version)
     return stock_level
@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.core.database import get_session
+from src.app.core.projection import FieldSet
 
 # ✔️ Correct security paths
 from src.app.auth.services.org_context import get_current_org
@@ -15,6 +16,7 @@ from src.app.auth.services.dependencies import (
     require_admin_org,
 )
 
+from src.app.inventory.models.stock_movement_models import StockMovement
 from src.app.inventory.schemas.inv_schemas import (
     StockMovementCreate,
     StockMovementRead,
@@ -25,17 +27,21 @@ from src.app.inventory.services.stock_movement_service import stock_movement_ser
 
 router = APIRouter(prefix="/stock-movements", tags=["stock-movements"])
 
+stock_movement_fields = FieldSet(StockMovementRead, StockMovement)
+
 
 @router.get("/", response_model=List[StockMovementRead])
 async def list_stock_movements(
     limit: int = 100,
     offset: int = 0,
+    fields = Depends(stock_movement_fields),
     session: AsyncSession = Depends(get_session),
     org_ctx = Depends(get_current_org),
     user    = Depends(require_any_staff_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
-    return await stock_movement_service.get_by_org(session, org_id, limit, offset)
+    org_id = org_ctx["org"].org_id
+    rows = await stock_movement_service.get_by_org(session, org_id, limit, offset, fields=fields)
+    return stock_movement_fields.render(rows)
 
 
 @router.get("/{movement_id}", response_model=StockMovementRead)
@@ -45,7 +51,7 @@ async def get_stock_movement(
     org_ctx = Depends(get_current_org),
     user    = Depends(require_any_staff_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
 
     movement = await stock_movement_service.get_by_id(session, movement_id)
 
@@ -65,7 +71,7 @@ async def create_stock_movement(
     org_ctx = Depends(get_current_org),
     user    = Depends(require_admin_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
 
     data = payload.dict()
     data["org_id"] = org_id
@@ -0,0 +1,50 @@
+# backend/src/app/inventory/routes/stock_snapshots_routes.py
+
+from typing import List
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core.database import get_session
+
+from src.app.auth.services.org_context import get_current_org
+from src.app.auth.services.dependencies import require_admin_org
+
+from src.app.inventory.schemas.inv_schemas import StockSnapshotRead
+
+from src.app.inventory.services.stock_snapshots import stock_snapshot_service
+
+router = APIRouter(prefix="/stock-snapshots", tags=["stock-snapshots"])
+
+
+# ---------------------------------------------------------
+# LIST SNAPSHOTS (admin / manager / owner)
+# ---------------------------------------------------------
+@router.get("/", response_model=List[StockSnapshotRead])
+async def list_stock_snapshots(
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user    = Depends(require_admin_org),
+):
+    """Newest cutoff first."""
+    org_id = org_ctx["org"].org_id
+    return await stock_snapshot_service.list_for_org(session, org_id, limit, offset)
+
+
+# ---------------------------------------------------------
+# TAKE SNAPSHOT NOW (admin / manager / owner)
+# ---------------------------------------------------------
+@router.post("/", response_model=StockSnapshotRead, status_code=status.HTTP_201_CREATED)
+async def take_stock_snapshot(
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user    = Depends(require_admin_org),
+):
+    """
+    Snapshot now, outside the schedule (e.g. before a large as_of
+    report). The cutoff is stock_snapshot_settle_seconds ago.
+    """
+    org_id = org_ctx["org"].org_id
+    return await stock_snapshot_service.take(session, org_id)
@@ -0,0 +1,43 @@
+# backend/src/app/inventory/routes/stock_transfers_routes.py
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core.database import get_session
+
+from src.app.auth.services.org_context import get_current_org
+from src.app.auth.services.dependencies import require_admin_org
+
+from src.app.inventory.schemas.inv_schemas import (
+    StockTransferCreate,
+    StockTransferRead,
+)
+
+from src.app.inventory.services.stock_transfers import stock_transfer_service
+
+router = APIRouter(prefix="/stock-transfers", tags=["stock-transfers"])
+
+
+# ---------------------------------------------------------
+# TRANSFER STOCK BETWEEN LOCATIONS (admin / manager / owner)
+# ---------------------------------------------------------
+@router.post("/", response_model=StockTransferRead, status_code=status.HTTP_201_CREATED)
+async def create_stock_transfer(
+    payload: StockTransferCreate,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user    = Depends(require_admin_org),
+):
+    """
+    Apply many (item, from, to, quantity) lines atomically. The movements
+    written share source_type "transfer" and source_id = transfer_id.
+    """
+    org_id = org_ctx["org"].org_id
+
+    try:
+        return await stock_transfer_service.transfer(session, payload, org_id=org_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
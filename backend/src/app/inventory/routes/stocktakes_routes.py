@@ -0,0 +1,156 @@
+# backend/src/app/inventory/routes/stocktakes_routes.py
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core.database import get_session
+
+from src.app.auth.services.org_context import get_current_org
+from src.app.auth.services.dependencies import require_admin_org
+
+from src.app.inventory.schemas.inv_schemas import (
+    StocktakeApplyRead,
+    StocktakeCreate,
+    StocktakePreview,
+    StocktakeRead,
+    StocktakeUploadRead,
+)
+
+from src.app.inventory.services.stocktakes import stocktake_service
+
+router = APIRouter(prefix="/stocktakes", tags=["stocktakes"])
+
+
+def _not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Stocktake not found",
+    )
+
+
+# ---------------------------------------------------------
+# OPEN STOCKTAKE (admin / manager / owner)
+# ---------------------------------------------------------
+@router.post("/", response_model=StocktakeRead, status_code=status.HTTP_201_CREATED)
+async def create_stocktake(
+    payload: StocktakeCreate,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user    = Depends(require_admin_org),
+):
+    org_id = org_ctx["org"].org_id
+
+    try:
+        return await stocktake_service.open(session, payload, org_id=org_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+# ---------------------------------------------------------
+# GET STOCKTAKE (admin / manager / owner)
+# ---------------------------------------------------------
+@router.get("/{stocktake_id}", response_model=StocktakeRead)
+async def get_stocktake(
+    stocktake_id: UUID,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user    = Depends(require_admin_org),
+):
+    org_id = org_ctx["org"].org_id
+
+    stocktake = await stocktake_service.get_for_org(session, stocktake_id, org_id)
+    if not stocktake:
+        raise _not_found()
+    return stocktake
+
+
+# ---------------------------------------------------------
+# UPLOAD COUNTS (admin / manager / owner)
+# ---------------------------------------------------------
+@router.post("/{stocktake_id}/counts", response_model=StocktakeUploadRead)
+async def upload_stocktake_counts(
+    stocktake_id: UUID,
+    request: Request,
+    content_type: str = Header("text/csv"),
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user    = Depends(require_admin_org),
+):
+    """
+    Raw body, streamed: text/csv (header naming sku and/or barcode, and
+    quantity), application/x-ndjson or application/json (objects with
+    sku and/or barcode, and quantity). Uploads add up; send more than one
+    for a count taken in parts.
+    """
+    org_id = org_ctx["org"].org_id
+
+    try:
+        result = await stocktake_service.upload(
+            session, stocktake_id, request.stream(), content_type, org_id=org_id
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    if result is None:
+        raise _not_found()
+    return result
+
+
+# ---------------------------------------------------------
+# PREVIEW VARIANCES (admin / manager / owner)
+# ---------------------------------------------------------
+@router.get("/{stocktake_id}/preview", response_model=StocktakePreview)
+async def preview_stocktake(
+    stocktake_id: UUID,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user    = Depends(require_admin_org),
+):
+    """Summary plus one page of variance lines, largest variance first."""
+    org_id = org_ctx["org"].org_id
+
+    preview = await stocktake_service.preview(
+        session, stocktake_id, org_id=org_id, limit=limit, offset=offset
+    )
+    if preview is None:
+        raise _not_found()
+    return preview
+
+
+# ---------------------------------------------------------
+# APPLY (admin / manager / owner)
+# ---------------------------------------------------------
+@router.post("/{stocktake_id}/apply", response_model=StocktakeApplyRead)
+async def apply_stocktake(
+    stocktake_id: UUID,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user    = Depends(require_admin_org),
+):
+    """
+    Set every counted level to its count in one transaction. The movements
+    written share source_type "stocktake" and source_id = stocktake_id.
+    """
+    org_id = org_ctx["org"].org_id
+
+    try:
+        result = await stocktake_service.apply(session, stocktake_id, org_id=org_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    if result is None:
+        raise _not_found()
+    return result
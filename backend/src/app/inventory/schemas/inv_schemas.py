@@ -2,11 +2,13 @@
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import List, Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from src.app.core.config import settings
+
 
 # ====================================================
 # ITEMS
@@ -21,6 +23,7 @@ class ItemBase(BaseModel):
     default_price: Decimal = Decimal("0")
     cost_basis: Optional[Decimal] = None
     tax_id: Optional[UUID] = None
+    tax_group_id: Optional[UUID] = None
     is_active: bool = True
 
 
@@ -37,6 +40,7 @@ class ItemUpdate(BaseModel):
     default_price: Optional[Decimal] = None
     cost_basis: Optional[Decimal] = None
     tax_id: Optional[UUID] = None
+    tax_group_id: Optional[UUID] = None
     is_active: Optional[bool] = None
 
 
@@ -103,10 +107,18 @@ class StockLevelRead(BaseModel):
     location_id: UUID
     quantity_on_hand: Decimal
     updated_at: datetime
+    version: int   # send back as If-Match: "<version>" on PATCH
 
     model_config = {"from_attributes": True}
 
 
+class StockLevelAsOfRead(BaseModel):
+    """A level as it stood at ?as_of=: the current level less the movements since."""
+    item_id: UUID
+    location_id: UUID
+    quantity_on_hand: Decimal
+
+
 # ====================================================
 # STOCK MOVEMENTS
 # ====================================================
@@ -133,6 +145,21 @@ class StockMovementRead(StockMovementBase):
     model_config = {"from_attributes": True}
 
 
+# ====================================================
+# STOCK SNAPSHOTS
+# ====================================================
+
+class StockSnapshotRead(BaseModel):
+    snapshot_id: UUID
+    org_id: UUID
+    cutoff_at: datetime
+    covered_through: datetime
+    level_count: int
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
 # ====================================================
 # STOCK ADJUSTMENTS
 # ====================================================
@@ -154,3 +181,152 @@ class StockAdjustmentRead(StockAdjustmentBase):
     created_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+# ====================================================
+# STOCK TRANSFERS
+# ====================================================
+
+class StockTransferLine(BaseModel):
+    item_id: UUID
+    from_location_id: UUID
+    to_location_id: UUID
+    quantity: Decimal = Field(..., gt=0)
+
+
+class StockTransferCreate(BaseModel):
+    lines: List[StockTransferLine] = Field(..., min_length=1, max_length=settings.stock_transfer_max_lines)
+    occurred_at: Optional[datetime] = None
+    # Off: the transfer fails if it would leave a source location below zero
+    allow_negative: bool = False
+
+
+class StockTransferRead(BaseModel):
+    transfer_id: UUID      # source_id of every movement the transfer wrote
+    line_count: int
+    movement_count: int
+    stock_level_count: int
+    occurred_at: datetime
+
+
+# ====================================================
+# STOCKTAKES
+# ====================================================
+
+class StocktakeCreate(BaseModel):
+    location_id: UUID
+    # On: applying also sets every level at the location that was not counted to zero
+    zero_uncounted: bool = False
+    notes: Optional[str] = None
+
+
+class StocktakeRead(BaseModel):
+    stocktake_id: UUID
+    org_id: UUID
+    location_id: UUID
+    status: str            # "open" | "applied"
+    zero_uncounted: bool
+    notes: Optional[str] = None
+    created_at: datetime
+    applied_at: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
+
+
+class StocktakeUploadRead(BaseModel):
+    stocktake_id: UUID
+    rows_received: int     # in this upload
+    total_rows: int        # in the stocktake so far
+
+
+class StocktakeVarianceLine(BaseModel):
+    item_id: UUID
+    sku: Optional[str] = None
+    name: str
+    stock_level_id: Optional[UUID] = None   # None: no level yet, applying creates one
+    quantity_on_hand: Decimal
+    counted_quantity: Decimal
+    variance: Decimal      # counted - on hand
+
+
+class StocktakePreview(BaseModel):
+    stocktake_id: UUID
+    status: str
+    count_rows: int
+    unmatched_rows: int
+    unmatched_codes: List[str]   # a sample of SKUs / barcodes no live item has
+    item_count: int              # items the stocktake would set
+    variance_count: int          # ... of which differ from on hand
+    net_variance: Decimal
+    lines: List[StocktakeVarianceLine]
+
+
+class StocktakeApplyRead(BaseModel):
+    stocktake_id: UUID
+    applied_at: datetime
+    stock_level_count: int
+    movement_count: int
+
+
+# ====================================================
+# STOCK LEDGER (levels vs. movements)
+# ====================================================
+
+class StockLedgerRepair(BaseModel):
+    # "levels": set each drifted level to its ledger total
+    # "ledger": post a "ledger_repair" movement so the ledger matches the level
+    repair: Literal["levels", "ledger"]
+    sample: int = Field(100, ge=0, le=1000)
+
+
+class StockLedgerDrift(BaseModel):
+    item_id: UUID
+    location_id: UUID
+    stock_level_id: Optional[UUID] = None   # None: movements but no level
+    quantity_on_hand: Optional[Decimal] = None
+    ledger_quantity: Decimal
+    drift: Decimal         # on hand - ledger
+
+
+class StockLedgerReport(BaseModel):
+    org_id: UUID
+    checked_at: datetime
+    partitions: int
+    drift_count: int
+    missing_level_count: int     # ... of which have no level
+    net_drift: Decimal
+    repair: Optional[str] = None
+    repaired_count: int
+    skipped_count: int           # changed since the scan; left for the next run
+    sample: List[StockLedgerDrift]
+
+
+# ====================================================
+# BULK OPERATIONS
+# ====================================================
+
+class ItemBulkCreate(BaseModel):
+    items: List[ItemCreate] = Field(..., min_length=1, max_length=settings.bulk_max_rows)
+
+
+class ItemBulkUpdate(BaseModel):
+    item_ids: List[UUID] = Field(..., min_length=1, max_length=settings.bulk_max_rows)
+    changes: ItemUpdate
+
+
+class ItemBulkDelete(BaseModel):
+    item_ids: List[UUID] = Field(..., min_length=1, max_length=settings.bulk_max_rows)
+
+
+class ItemBulkDeleteResult(BaseModel):
+    deleted_ids: List[UUID]
+
+
+class StockLevelBulkCreate(BaseModel):
+    stock_levels: List[StockLevelCreate] = Field(..., min_length=1, max_length=settings.bulk_max_rows)
+
+
+class StockLevelBulkUpdate(BaseModel):
+    stock_level_ids: List[UUID] = Field(..., min_length=1, max_length=settings.bulk_max_rows)
+    changes: StockLevelUpdate
+
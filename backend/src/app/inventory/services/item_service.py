@@ -1,6 +1,6 @@
 # backend/src/app/inventory/services/items.py
 
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import select
@@ -20,9 +20,10 @@ class ItemService(BaseRepository[Item]):
         org_id: UUID,
         limit: int = 100,
         offset: int = 0,
+        fields: Optional[Sequence[str]] = None,
     ) -> List[Item]:
         stmt = (
-            select(Item)
+            self._select(fields)
             .where(
                 Item.org_id == org_id,
                 Item.deleted_at.is_(None),
@@ -32,7 +33,7 @@ class ItemService(BaseRepository[Item]):
             .offset(offset)
         )
         result = await session.execute(stmt)
-        return result.scalars().all()
+        return self._rows(result, fields)
 
     async def get_by_id(
         self,
@@ -1,6 +1,6 @@
 # backend/src/app/inventory/services/locations.py
 
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import select
@@ -20,9 +20,10 @@ class LocationService(BaseRepository[Location]):
         org_id: UUID,
         limit: int = 100,
         offset: int = 0,
+        fields: Optional[Sequence[str]] = None,
     ) -> List[Location]:
         stmt = (
-            select(Location)
+            self._select(fields)
             .where(
                 Location.org_id == org_id,
                 Location.deleted_at.is_(None),
@@ -32,7 +33,7 @@ class LocationService(BaseRepository[Location]):
             .offset(offset)
         )
         result = await session.execute(stmt)
-        return result.scalars().all()
+        return self._rows(result, fields)
 
     async def get_by_id(
         self,
@@ -4,7 +4,7 @@ from decimal import Decimal
 from uuid import UUID
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.inventory.models.stock_movement_models import StockMovement
@@ -17,48 +17,54 @@ class StockAdjustmentService:
         self,
         session: AsyncSession,
         payload: StockAdjustmentCreate,
+        *,
+        org_id: UUID,
     ):
         # ---------------------------------------------------------
-        # 1. Fetch StockLevel ORM row
+        # 1. Apply quantity adjustment in place
+        #    (a delta commutes: one UPDATE that also bumps the version
+        #    needs no read first, so there is nothing to compare-and-swap)
         # ---------------------------------------------------------
         stmt = (
-            select(StockLevel)
-            .where(StockLevel.org_id == payload.org_id)
+            update(StockLevel)
+            .where(StockLevel.org_id == org_id)
             .where(StockLevel.item_id == payload.item_id)
             .where(StockLevel.location_id == payload.location_id)
-            .where(StockLevel.deleted_at.is_(None))
+            .values(
+                quantity_on_hand=StockLevel.quantity_on_hand + payload.quantity_delta,
+                version=StockLevel.version + 1,
+                updated_at=func.now(),
+            )
+            .returning(StockLevel.stock_level_id)
+            .execution_options(synchronize_session=False)
         )
 
         result = await session.execute(stmt)
-        stock_level = result.scalar_one_or_none()
+        stock_level_id = result.scalar_one_or_none()
 
-        if not stock_level:
+        if not stock_level_id:
             raise ValueError("Stock level not found for org/item/location")
 
         # ---------------------------------------------------------
-        # 2. Apply quantity adjustment
-        # ---------------------------------------------------------
-        stock_level.quantity_on_hand += payload.quantity_delta
-
-        # ---------------------------------------------------------
-        # 3. Log stock movement record
+        # 2. Log stock movement record
         # ---------------------------------------------------------
         movement = StockMovement(
-            org_id=payload.org_id,
+            org_id=org_id,
             item_id=payload.item_id,
             location_id=payload.location_id,
+            stock_level_id=stock_level_id,
             source_type="admin_adjustment",
             source_id=None,
             quantity_delta=payload.quantity_delta,
             unit_cost=None,
+            reason=payload.reason,
             occurred_at=datetime.utcnow(),
-            notes=payload.reason,
         )
 
         session.add(movement)
 
         # ---------------------------------------------------------
-        # 4. Finalize transaction
+        # 3. Finalize transaction
         # ---------------------------------------------------------
         await session.commit()
         await session.refresh(movement)
@@ -0,0 +1,328 @@
+# backend/src/app/inventory/services/stock_ledger.py
+"""
+Stock level vs. movement ledger verification and repair.
+
+Transfers, admin adjustments, stocktakes and the stock-level create /
+PATCH routes change a StockLevel and write the matching StockMovement in
+one transaction, so a level should equal the sum of its (org, item,
+location) movements. POST /stock-movements writes a movement without
+touching the level, so levels touched through it drift by design, as do
+levels written before their routes kept the ledger. This finds the ones
+that don't match, whatever the cause.
+
+An org is checked in item_id ranges. Each range is one grouped scan of
+its movements, full-joined to its levels, with only the drifted rows
+streamed back (server-side cursor), in its own short transaction: memory
+and lock time stay bounded by the range, not the org. Ranges and orgs
+run concurrently in verify_all().
+
+Drift is read from one statement snapshot, in which a level and its
+movements are always consistent with each other, so checking needs no
+locks on a live system. Repairs are compare-and-swap on the level's
+version, and both repair modes bump it: a level written (or repaired)
+since the scan is skipped and picked up by the next run. Drift with no
+level is repaired under a per-key advisory lock, and only if the ledger
+total is still the one scanned.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core.config import settings
+from src.app.core.database import AsyncSessionLocal
+
+
+REPAIR_MODES = ("levels", "ledger")
+
+_UUID_SPACE = 1 << 128
+
+
+# ---------------------------------------------------------
+# SQL
+# ---------------------------------------------------------
+# Levels and ledger totals for one item range; only the rows that differ.
+# A missing level counts as 0, so movements summing to 0 aren't drift.
+_DRIFT_SQL = text("""
+    SELECT coalesce(l.item_id, g.item_id) AS item_id,
+           coalesce(l.location_id, g.location_id) AS location_id,
+           l.stock_level_id,
+           l.version,
+           l.quantity_on_hand,
+           coalesce(g.total, 0) AS ledger_quantity
+    FROM (
+        SELECT stock_level_id, version, item_id, location_id, quantity_on_hand
+        FROM inv.stock_levels
+        WHERE org_id = :org_id AND item_id BETWEEN :lo AND :hi
+    ) l
+    FULL JOIN (
+        SELECT item_id, location_id, sum(quantity_delta) AS total
+        FROM inv.stock_movements
+        WHERE org_id = :org_id AND item_id BETWEEN :lo AND :hi
+        GROUP BY item_id, location_id
+    ) g ON g.item_id = l.item_id AND g.location_id = l.location_id
+    WHERE coalesce(l.quantity_on_hand, 0) <> coalesce(g.total, 0)
+""")
+
+_DRIFTED = """
+    unnest(CAST(:stock_level_ids AS uuid[]), CAST(:versions AS int[]), CAST(:drifts AS numeric[]))
+        AS d(stock_level_id, version, drift)
+"""
+
+_UNLEVELLED = """
+    unnest(CAST(:item_ids AS uuid[]), CAST(:location_ids AS uuid[]), CAST(:quantities AS numeric[]))
+        AS d(item_id, location_id, quantity)
+"""
+
+# repair="levels": levels take their ledger totals
+_SET_LEVELS_SQL = text(f"""
+    UPDATE inv.stock_levels sl
+    SET quantity_on_hand = sl.quantity_on_hand - d.drift,
+        version = sl.version + 1,
+        updated_at = now()
+    FROM {_DRIFTED}
+    WHERE sl.stock_level_id = d.stock_level_id AND sl.version = d.version
+""")
+
+_CREATE_LEVELS_SQL = text(f"""
+    INSERT INTO inv.stock_levels (org_id, item_id, location_id, quantity_on_hand)
+    SELECT :org_id, d.item_id, d.location_id, d.quantity
+    FROM {_UNLEVELLED}
+    ON CONFLICT (org_id, item_id, location_id) DO NOTHING
+""")
+
+# repair="ledger": one movement per level, bringing the ledger to it. The
+# version bump is the claim: a concurrent or repeated repair of the same
+# scan finds the version moved on and posts nothing.
+_POST_LEDGER_SQL = text(f"""
+    WITH claimed AS (
+        UPDATE inv.stock_levels sl
+        SET version = sl.version + 1,
+            updated_at = now()
+        FROM {_DRIFTED}
+        WHERE sl.stock_level_id = d.stock_level_id AND sl.version = d.version
+        RETURNING sl.org_id, sl.item_id, sl.location_id, sl.stock_level_id, d.drift
+    )
+    INSERT INTO inv.stock_movements
+        (org_id, item_id, location_id, stock_level_id, source_type, quantity_delta, occurred_at)
+    SELECT org_id, item_id, location_id, stock_level_id, 'ledger_repair', drift, now()
+    FROM claimed
+""")
+
+# Movements with no level have no version to claim: serialize on the key
+# instead, then post only if the ledger still holds what was scanned.
+_LOCK_UNLEVELLED_SQL = text(f"""
+    SELECT pg_advisory_xact_lock(hashtextextended(CAST(:org_id AS uuid)::text || d.item_id::text || d.location_id::text, 0))
+    FROM {_UNLEVELLED}
+    ORDER BY d.item_id, d.location_id
+""")
+
+_CLEAR_LEDGER_SQL = text(f"""
+    INSERT INTO inv.stock_movements
+        (org_id, item_id, location_id, source_type, quantity_delta, occurred_at)
+    SELECT :org_id, d.item_id, d.location_id, 'ledger_repair', -d.quantity, now()
+    FROM {_UNLEVELLED}
+    WHERE NOT EXISTS (
+        SELECT 1 FROM inv.stock_levels sl
+        WHERE sl.org_id = :org_id AND sl.item_id = d.item_id AND sl.location_id = d.location_id
+    )
+    AND (
+        SELECT coalesce(sum(m.quantity_delta), 0) FROM inv.stock_movements m
+        WHERE m.org_id = :org_id AND m.item_id = d.item_id AND m.location_id = d.location_id
+    ) = d.quantity
+""")
+
+_ACTIVE_ORGS_SQL = text("SELECT org_id FROM core.organizations WHERE is_active ORDER BY org_id")
+
+
+def item_ranges(partitions: int) -> List[Tuple[UUID, UUID]]:
+    """`partitions` contiguous, inclusive item_id ranges covering every uuid."""
+    step = _UUID_SPACE // partitions
+    return [
+        (UUID(int=i * step), UUID(int=(i + 1) * step - 1 if i < partitions - 1 else _UUID_SPACE - 1))
+        for i in range(partitions)
+    ]
+
+
+class _Tally:
+    """One org's running report: counters plus the `sample` largest drifts."""
+
+    def __init__(self, org_id: UUID, partitions: int, repair: Optional[str], sample: int) -> None:
+        self.org_id = org_id
+        self.partitions = partitions
+        self.repair = repair
+        self.sample = sample
+        self.drift_count = 0
+        self.missing_level_count = 0
+        self.net_drift = Decimal(0)
+        self.repaired_count = 0
+        self._heap: List[Tuple[Decimal, int, Dict[str, Any]]] = []
+        self._seq = itertools.count()
+
+    def add(self, rows: Sequence[Any]) -> None:
+        for row in rows:
+            on_hand = row.quantity_on_hand
+            drift = (on_hand or 0) - row.ledger_quantity
+            self.drift_count += 1
+            self.net_drift += drift
+            if row.stock_level_id is None:
+                self.missing_level_count += 1
+            if self.sample:
+                entry = (abs(drift), next(self._seq), {
+                    "item_id": row.item_id,
+                    "location_id": row.location_id,
+                    "stock_level_id": row.stock_level_id,
+                    "quantity_on_hand": on_hand,
+                    "ledger_quantity": row.ledger_quantity,
+                    "drift": drift,
+                })
+                if len(self._heap) < self.sample:
+                    heapq.heappush(self._heap, entry)
+                elif entry[0] > self._heap[0][0]:
+                    heapq.heapreplace(self._heap, entry)
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "org_id": self.org_id,
+            "checked_at": datetime.now(timezone.utc),
+            "partitions": self.partitions,
+            "drift_count": self.drift_count,
+            "missing_level_count": self.missing_level_count,
+            "net_drift": self.net_drift,
+            "repair": self.repair,
+            "repaired_count": self.repaired_count,
+            "skipped_count": self.drift_count - self.repaired_count if self.repair else 0,
+            "sample": [entry[2] for entry in sorted(self._heap, key=lambda e: (-e[0], e[1]))],
+        }
+
+
+class StockLedgerService:
+    def __init__(self, partitions: int, batch_rows: int, concurrency: int) -> None:
+        self.partitions = partitions
+        self.batch_rows = batch_rows
+        self.concurrency = concurrency
+
+    # ---------------------------------------------------------
+    # ONE ITEM RANGE
+    # ---------------------------------------------------------
+    async def _scan(
+        self,
+        session: AsyncSession,
+        tally: _Tally,
+        lo: UUID,
+        hi: UUID,
+    ) -> None:
+        """Stream one range's drift into `tally`, repairing batch by batch; commits."""
+        try:
+            result = await session.stream(
+                _DRIFT_SQL,
+                {"org_id": tally.org_id, "lo": lo, "hi": hi},
+                execution_options={"yield_per": self.batch_rows},
+            )
+            async for rows in result.partitions():
+                tally.add(rows)
+                if tally.repair:
+                    tally.repaired_count += await self._repair(session, tally.org_id, rows, tally.repair)
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+    async def _repair(self, session: AsyncSession, org_id: UUID, rows: Iterable[Any], mode: str) -> int:
+        levelled = [row for row in rows if row.stock_level_id is not None]
+        unlevelled = [row for row in rows if row.stock_level_id is None]
+        repaired = 0
+
+        if levelled:
+            params = {
+                "stock_level_ids": [row.stock_level_id for row in levelled],
+                "versions": [row.version for row in levelled],
+                "drifts": [row.quantity_on_hand - row.ledger_quantity for row in levelled],
+            }
+            stmt = _SET_LEVELS_SQL if mode == "levels" else _POST_LEDGER_SQL
+            repaired += (await session.execute(stmt, params)).rowcount
+
+        if unlevelled:
+            params = {
+                "org_id": org_id,
+                "item_ids": [row.item_id for row in unlevelled],
+                "location_ids": [row.location_id for row in unlevelled],
+                "quantities": [row.ledger_quantity for row in unlevelled],
+            }
+            if mode == "levels":
+                repaired += (await session.execute(_CREATE_LEVELS_SQL, params)).rowcount
+            else:
+                await session.execute(_LOCK_UNLEVELLED_SQL, params)
+                repaired += (await session.execute(_CLEAR_LEDGER_SQL, params)).rowcount
+
+        return repaired
+
+    # ---------------------------------------------------------
+    # ONE ORG (request-scoped session)
+    # ---------------------------------------------------------
+    async def verify_org(
+        self,
+        session: AsyncSession,
+        org_id: UUID,
+        *,
+        repair: Optional[str] = None,
+        sample: int = 100,
+    ) -> Dict[str, Any]:
+        """Check (and with `repair`, fix) one org, range by range on `session`."""
+        if repair is not None and repair not in REPAIR_MODES:
+            raise ValueError(f"repair must be one of {', '.join(REPAIR_MODES)}")
+
+        tally = _Tally(org_id, self.partitions, repair, sample)
+        for lo, hi in item_ranges(self.partitions):
+            await self._scan(session, tally, lo, hi)
+        return tally.report()
+
+    # ---------------------------------------------------------
+    # MANY ORGS (scheduled job)
+    # ---------------------------------------------------------
+    async def verify_all(
+        self,
+        org_ids: Optional[Sequence[UUID]] = None,
+        *,
+        repair: Optional[str] = None,
+        sample: int = 100,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+    ) -> List[Dict[str, Any]]:
+        """
+        Check every active org (or `org_ids`). Each (org, item range) runs
+        in its own session, `concurrency` at a time.
+        """
+        if repair is not None and repair not in REPAIR_MODES:
+            raise ValueError(f"repair must be one of {', '.join(REPAIR_MODES)}")
+
+        if org_ids is None:
+            async with session_factory() as session:
+                org_ids = (await session.execute(_ACTIVE_ORGS_SQL)).scalars().all()
+
+        tallies = [_Tally(org_id, self.partitions, repair, sample) for org_id in org_ids]
+        ranges = item_ranges(self.partitions)
+        work = ((tally, lo, hi) for tally in tallies for lo, hi in ranges)
+
+        async def worker() -> None:
+            for tally, lo, hi in work:
+                async with session_factory() as session:
+                    await self._scan(session, tally, lo, hi)
+
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        return [tally.report() for tally in tallies]
+
+
+stock_ledger_service = StockLedgerService(
+    settings.stock_ledger_partitions,
+    settings.stock_ledger_batch_rows,
+    settings.stock_ledger_concurrency,
+)
@@ -1,19 +1,52 @@
 # backend/src/app/inventory/services/stock_levels.py
 
-from typing import List, Optional
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.inventory.models.stock_level_models import StockLevel
+from src.app.inventory.models.stock_movement_models import StockMovement
 from src.app.core.base_repository import BaseRepository
+from src.app.core.optimistic import check_version, with_retries
+
+
+# Movements written for quantities set directly on a level
+SOURCE_TYPE = "stock_level_edit"
 
 
 class StockLevelService(BaseRepository[StockLevel]):
     def __init__(self) -> None:
         super().__init__(StockLevel)
 
+    # ---------------------------------------------------------
+    # LEDGER: one movement per level whose quantity changed
+    # ---------------------------------------------------------
+    async def _record_movements(
+        self,
+        session: AsyncSession,
+        deltas: Iterable[Tuple[StockLevel, Decimal]],
+    ) -> None:
+        occurred_at = datetime.now(timezone.utc)
+        rows = [
+            {
+                "org_id": level.org_id,
+                "item_id": level.item_id,
+                "location_id": level.location_id,
+                "stock_level_id": level.stock_level_id,
+                "source_type": SOURCE_TYPE,
+                "quantity_delta": delta,
+                "occurred_at": occurred_at,
+            }
+            for level, delta in deltas
+            if delta
+        ]
+        if rows:
+            await session.execute(insert(StockMovement), rows)
+
     # ---------------------------------------------------------
     # LIST STOCK LEVELS BY ORG
     # ---------------------------------------------------------
@@ -23,21 +56,26 @@ class StockLevelService(BaseRepository[StockLevel]):
         org_id: UUID,
         limit: int = 100,
         offset: int = 0,
+        fields: Optional[Sequence[str]] = None,
+        location_id: Optional[UUID] = None,
+        item_id: Optional[UUID] = None,
     ) -> List[StockLevel]:
 
+        stmt = self._select(fields).where(StockLevel.org_id == org_id)
+        if location_id is not None:
+            stmt = stmt.where(StockLevel.location_id == location_id)
+        if item_id is not None:
+            stmt = stmt.where(StockLevel.item_id == item_id)
+
         stmt = (
-            select(StockLevel)
-            .where(
-                StockLevel.org_id == org_id,
-                StockLevel.deleted_at.is_(None),
-            )
+            stmt
             .order_by(StockLevel.updated_at.desc())
             .limit(limit)
             .offset(offset)
         )
 
         result = await session.execute(stmt)
-        return result.scalars().all()
+        return self._rows(result, fields)
 
     # ---------------------------------------------------------
     # GET SINGLE STOCK LEVEL
@@ -50,14 +88,109 @@ class StockLevelService(BaseRepository[StockLevel]):
 
         stmt = (
             select(StockLevel)
-            .where(
-                StockLevel.stock_level_id == stock_level_id,
-                StockLevel.deleted_at.is_(None),
-            )
+            .where(StockLevel.stock_level_id == stock_level_id)
         )
 
         result = await session.execute(stmt)
         return result.scalar_one_or_none()
 
 
+    # ---------------------------------------------------------
+    # CREATE STOCK LEVELS (opening quantity goes on the ledger)
+    # ---------------------------------------------------------
+    async def create_levels(
+        self,
+        session: AsyncSession,
+        rows: Sequence[Dict[str, Any]],
+    ) -> List[StockLevel]:
+        """
+        create_many() plus a movement for each nonzero opening quantity,
+        in the caller's transaction (the caller commits).
+        """
+        stock_levels = await self.create_many(session, rows)
+        await self._record_movements(
+            session, ((level, level.quantity_on_hand) for level in stock_levels)
+        )
+        return stock_levels
+
+    # ---------------------------------------------------------
+    # BULK UPDATE STOCK LEVELS (changes go on the ledger)
+    # ---------------------------------------------------------
+    async def update_levels(
+        self,
+        session: AsyncSession,
+        stock_level_ids: Sequence[UUID],
+        changes: Dict[str, Any],
+        *,
+        org_id: UUID,
+    ) -> List[StockLevel]:
+        """
+        update_many() scoped to the org, plus a movement for each level
+        whose quantity changed. The rows are locked before their old
+        quantities are read, so a concurrent write can't slip in between
+        and leave the delta wrong. The caller commits.
+        """
+        where = [StockLevel.org_id == org_id]
+        before: Dict[UUID, Decimal] = {}
+        if "quantity_on_hand" in changes and stock_level_ids:
+            locked = await session.execute(
+                select(StockLevel.stock_level_id, StockLevel.quantity_on_hand)
+                .where(StockLevel.stock_level_id.in_(set(stock_level_ids)), *where)
+                .order_by(StockLevel.stock_level_id)
+                .with_for_update()
+            )
+            before = dict(locked.all())
+
+        stock_levels = await self.update_many(session, stock_level_ids, changes, where=where)
+        await self._record_movements(session, (
+            (level, level.quantity_on_hand - before[level.stock_level_id])
+            for level in stock_levels
+            if level.stock_level_id in before
+        ))
+        return stock_levels
+
+    # ---------------------------------------------------------
+    # UPDATE SINGLE STOCK LEVEL (version-checked)
+    # ---------------------------------------------------------
+    async def update_level(
+        self,
+        session: AsyncSession,
+        stock_level_id: UUID,
+        changes: Dict[str, Any],
+        *,
+        org_id: UUID,
+        if_match: Optional[int] = None,
+    ) -> Optional[StockLevel]:
+        """
+        Apply `changes` if the row is at `if_match` (when given). Without
+        `if_match`, a write that loses a version race re-reads and
+        re-applies, up to settings.occ_max_retries times; with it, the race
+        is a VersionConflict. Only the stock-level PATCH comes through here:
+        stock adjustments apply their delta in one UPDATE, without retries.
+        A quantity change writes its movement in the same commit.
+        """
+
+        async def attempt() -> Optional[StockLevel]:
+            stock_level = await self.get_by_id(session, stock_level_id)
+            if not stock_level or stock_level.org_id != org_id:
+                return None
+            check_version(stock_level, if_match)
+            old_quantity = stock_level.quantity_on_hand
+
+            for field, value in changes.items():
+                setattr(stock_level, field, value)
+            stock_level.updated_at = func.now()
+
+            if "quantity_on_hand" in changes:
+                await self._record_movements(
+                    session, [(stock_level, stock_level.quantity_on_hand - old_quantity)]
+                )
+
+            await session.commit()
+            await session.refresh(stock_level)
+            return stock_level
+
+        return await with_retries(session, attempt)
+
+
 stock_level_service = StockLevelService()
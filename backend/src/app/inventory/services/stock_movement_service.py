@@ -1,6 +1,6 @@
 # backend/src/app/inventory/services/stock_movements.py
 
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import select
@@ -23,21 +23,19 @@ class StockMovementService(BaseRepository[StockMovement]):
         org_id: UUID,
         limit: int = 100,
         offset: int = 0,
+        fields: Optional[Sequence[str]] = None,
     ) -> List[StockMovement]:
 
         stmt = (
-            select(StockMovement)
-            .where(
-                StockMovement.org_id == org_id,
-                StockMovement.deleted_at.is_(None),
-            )
+            self._select(fields)
+            .where(StockMovement.org_id == org_id)
             .order_by(StockMovement.occurred_at.desc())
             .limit(limit)
             .offset(offset)
         )
 
         result = await session.execute(stmt)
-        return result.scalars().all()
+        return self._rows(result, fields)
 
     # ---------------------------------------------------------
     # GET SINGLE MOVEMENT
@@ -50,10 +48,7 @@ class StockMovementService(BaseRepository[StockMovement]):
 
         stmt = (
             select(StockMovement)
-            .where(
-                StockMovement.movement_id == movement_id,
-                StockMovement.deleted_at.is_(None),
-            )
+            .where(StockMovement.movement_id == movement_id)
         )
 
         result = await session.execute(stmt)
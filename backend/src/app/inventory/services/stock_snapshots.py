@@ -0,0 +1,363 @@
+# backend/src/app/inventory/services/stock_snapshots.py
+"""
+Point-in-time stock levels: periodic snapshots plus movement deltas.
+
+"The level as of T" is the StockLevel quantity now, less every movement
+that occurred after T. StockLevel is the source of truth: a level with
+no (or incomplete) ledger history still comes out at its real quantity,
+and a level with no movements at all is still there.
+
+A snapshot materializes that for its cutoff_at: each (location, item) is
+the level as read when the snapshot is taken, less the movements that
+occurred after the cutoff or were recorded (created_at) after it, so it
+holds exactly the movements that occurred and were recorded by
+covered_through. Both come from one statement, so the levels and the
+movements subtracted from them are consistent with each other.
+
+Each take() first folds movements recorded since the last take into the
+existing snapshots (a backdated movement updates every snapshot it falls
+before), then writes the new one. Cutoffs sit `settle` seconds behind
+now, so writes still in flight at the cutoff are recorded by the time
+it is taken.
+
+A query as of T reads the latest snapshot at or before T and adds the
+movements that occurred in (cutoff, T] plus the ones recorded since
+covered_through: the work is bounded by the snapshot interval, not by
+the age of the ledger. With no snapshot that early, it works back from
+the current levels instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, List, Optional
+from uuid import UUID
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core.base_repository import BaseRepository
+from src.app.core.config import settings
+from src.app.core.database import AsyncSessionLocal
+from src.app.inventory.models.stock_snapshot_models import StockSnapshot
+
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------
+# SQL
+# ---------------------------------------------------------
+# One take per org at a time, across workers
+_LOCK_SQL = text("SELECT pg_advisory_xact_lock(hashtextextended('inv.stock_snapshots:' || :org_key, 0))")
+
+_CUTOFF_SQL = text("SELECT now() - make_interval(secs => :settle)")
+
+# Movements recorded in (covered_through, :through] that occurred at or
+# before a snapshot's cutoff belong in it. One range scan of the recent
+# movements; only backdated ones (occurred before the newest cutoff) join.
+_FOLD_SQL = text("""
+    WITH late AS (
+        SELECT s.snapshot_id, m.location_id, m.item_id, sum(m.quantity_delta) AS quantity
+        FROM inv.stock_movements m
+        JOIN inv.stock_snapshots s
+          ON s.org_id = :org_id
+         AND m.occurred_at <= s.cutoff_at
+         AND m.created_at > s.covered_through
+        WHERE m.org_id = :org_id
+          AND m.created_at > :since AND m.created_at <= :through
+          AND m.occurred_at <= :max_cutoff
+        GROUP BY s.snapshot_id, m.location_id, m.item_id
+    ),
+    upserted AS (
+        INSERT INTO inv.stock_snapshot_levels (snapshot_id, location_id, item_id, quantity_on_hand)
+        SELECT snapshot_id, location_id, item_id, quantity FROM late
+        ON CONFLICT (snapshot_id, location_id, item_id) DO UPDATE
+        SET quantity_on_hand = inv.stock_snapshot_levels.quantity_on_hand + EXCLUDED.quantity_on_hand
+        RETURNING snapshot_id, (xmax = 0) AS inserted
+    ),
+    added AS (
+        SELECT snapshot_id, count(*) FILTER (WHERE inserted) AS n
+        FROM upserted
+        GROUP BY snapshot_id
+    )
+    UPDATE inv.stock_snapshots s
+    SET covered_through = :through,
+        level_count = s.level_count + coalesce((SELECT n FROM added a WHERE a.snapshot_id = s.snapshot_id), 0)
+    WHERE s.org_id = :org_id
+""")
+
+# Current levels less the movements that occurred or were recorded after
+# the cutoff. Bounded by the org's levels plus the movements since the cutoff.
+_NEW_SQL = text("""
+    WITH levels AS (
+        INSERT INTO inv.stock_snapshot_levels (snapshot_id, location_id, item_id, quantity_on_hand)
+        SELECT :snapshot_id, location_id, item_id, sum(quantity)
+        FROM (
+            SELECT location_id, item_id, quantity_on_hand AS quantity
+            FROM inv.stock_levels
+            WHERE org_id = :org_id
+            UNION ALL
+            SELECT location_id, item_id, -quantity_delta
+            FROM inv.stock_movements
+            WHERE org_id = :org_id AND occurred_at > :cutoff
+            UNION ALL
+            SELECT location_id, item_id, -quantity_delta
+            FROM inv.stock_movements
+            WHERE org_id = :org_id AND created_at > :cutoff AND occurred_at <= :cutoff
+        ) t
+        GROUP BY location_id, item_id
+        RETURNING 1
+    )
+    INSERT INTO inv.stock_snapshots (snapshot_id, org_id, cutoff_at, covered_through, level_count)
+    VALUES (:snapshot_id, :org_id, :cutoff, :cutoff, (SELECT count(*) FROM levels))
+""")
+
+_RETENTION_SQL = text("""
+    DELETE FROM inv.stock_snapshots
+    WHERE snapshot_id IN (
+        SELECT snapshot_id FROM inv.stock_snapshots
+        WHERE org_id = :org_id
+        ORDER BY cutoff_at DESC
+        OFFSET :keep
+    )
+""")
+
+_DUE_ORGS_SQL = text("""
+    SELECT o.org_id
+    FROM core.organizations o
+    WHERE o.is_active
+      AND NOT EXISTS (
+          SELECT 1 FROM inv.stock_snapshots s
+          WHERE s.org_id = o.org_id
+            AND s.cutoff_at > now() - make_interval(secs => :age)
+      )
+""")
+
+
+@lru_cache(maxsize=None)
+def _as_of_sql(from_snapshot: bool, by_location: bool, by_item: bool):
+    """The as_of query, with only the filters in use (each keeps its index)."""
+    where = ""
+    if by_location:
+        where += " AND location_id = :location_id"
+    if by_item:
+        where += " AND item_id = :item_id"
+
+    if from_snapshot:
+        parts = f"""
+            SELECT location_id, item_id, quantity_on_hand AS quantity
+            FROM inv.stock_snapshot_levels
+            WHERE snapshot_id = :snapshot_id{where}
+            UNION ALL
+            SELECT location_id, item_id, quantity_delta
+            FROM inv.stock_movements
+            WHERE org_id = :org_id AND occurred_at > :cutoff AND occurred_at <= :as_of{where}
+            UNION ALL
+            SELECT location_id, item_id, quantity_delta
+            FROM inv.stock_movements
+            WHERE org_id = :org_id AND created_at > :covered_through AND occurred_at <= :cutoff{where}
+        """
+    else:
+        parts = f"""
+            SELECT location_id, item_id, quantity_on_hand AS quantity
+            FROM inv.stock_levels
+            WHERE org_id = :org_id{where}
+            UNION ALL
+            SELECT location_id, item_id, -quantity_delta
+            FROM inv.stock_movements
+            WHERE org_id = :org_id AND occurred_at > :as_of{where}
+        """
+
+    return text(f"""
+        SELECT item_id, location_id, sum(quantity) AS quantity_on_hand
+        FROM ({parts}) t
+        GROUP BY location_id, item_id
+        ORDER BY location_id, item_id
+        LIMIT :limit OFFSET :offset
+    """)
+
+
+class StockSnapshotService(BaseRepository[StockSnapshot]):
+    def __init__(self, settle_seconds: int, keep: int) -> None:
+        super().__init__(StockSnapshot)
+        self.settle_seconds = settle_seconds
+        self.keep = keep
+
+    # ---------------------------------------------------------
+    # LIST / LATEST
+    # ---------------------------------------------------------
+    async def list_for_org(
+        self, session: AsyncSession, org_id: UUID, limit: int = 100, offset: int = 0
+    ) -> List[StockSnapshot]:
+        stmt = (
+            select(StockSnapshot)
+            .where(StockSnapshot.org_id == org_id)
+            .order_by(StockSnapshot.cutoff_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        return list((await session.execute(stmt)).scalars().all())
+
+    async def latest(
+        self, session: AsyncSession, org_id: UUID, at: Optional[datetime] = None
+    ) -> Optional[StockSnapshot]:
+        """The newest snapshot, or the newest with cutoff_at <= `at`."""
+        stmt = select(StockSnapshot).where(StockSnapshot.org_id == org_id)
+        if at is not None:
+            stmt = stmt.where(StockSnapshot.cutoff_at <= at)
+        stmt = stmt.order_by(StockSnapshot.cutoff_at.desc()).limit(1)
+        return (await session.execute(stmt)).scalar_one_or_none()
+
+    # ---------------------------------------------------------
+    # TAKE
+    # ---------------------------------------------------------
+    async def take(
+        self, session: AsyncSession, org_id: UUID, *, min_age: Optional[float] = None
+    ) -> Optional[StockSnapshot]:
+        """
+        Fold late movements into the org's snapshots, write a new one, drop
+        the ones past `keep`, and commit. With `min_age`, does nothing
+        (returns None) unless the latest cutoff is at least that old.
+        """
+        await session.execute(_LOCK_SQL, {"org_key": str(org_id)})
+        cutoff = (await session.execute(_CUTOFF_SQL, {"settle": self.settle_seconds})).scalar_one()
+
+        prev = await self.latest(session, org_id)
+        if prev is not None:
+            age = (cutoff - prev.cutoff_at).total_seconds()
+            if age <= 0 or (min_age is not None and age < min_age):
+                await session.rollback()
+                return None if min_age is not None else prev
+
+            since = (await session.execute(
+                select(StockSnapshot.covered_through)
+                .where(StockSnapshot.org_id == org_id)
+                .order_by(StockSnapshot.covered_through)
+                .limit(1)
+            )).scalar_one()
+            await session.execute(_FOLD_SQL, {
+                "org_id": org_id,
+                "since": since,
+                "through": cutoff,
+                "max_cutoff": prev.cutoff_at,
+            })
+
+        snapshot_id = uuid.uuid4()
+        await session.execute(_NEW_SQL, {
+            "snapshot_id": snapshot_id,
+            "org_id": org_id,
+            "cutoff": cutoff,
+        })
+        await session.execute(_RETENTION_SQL, {"org_id": org_id, "keep": self.keep})
+        await session.commit()
+
+        return await session.get(StockSnapshot, snapshot_id, populate_existing=True)
+
+    # ---------------------------------------------------------
+    # AS OF
+    # ---------------------------------------------------------
+    async def as_of(
+        self,
+        session: AsyncSession,
+        org_id: UUID,
+        at: datetime,
+        *,
+        location_id: Optional[UUID] = None,
+        item_id: Optional[UUID] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[Any]:
+        """(item_id, location_id, quantity_on_hand) rows as they stood at `at`."""
+        snapshot = await self.latest(session, org_id, at)
+        params = {
+            "org_id": org_id,
+            "as_of": at,
+            "location_id": location_id,
+            "item_id": item_id,
+            "limit": limit,
+            "offset": offset,
+        }
+        if snapshot is not None:
+            params.update(
+                snapshot_id=snapshot.snapshot_id,
+                cutoff=snapshot.cutoff_at,
+                covered_through=snapshot.covered_through,
+            )
+
+        stmt = _as_of_sql(snapshot is not None, location_id is not None, item_id is not None)
+        return list((await session.execute(stmt, params)).all())
+
+    # ---------------------------------------------------------
+    # SCHEDULED
+    # ---------------------------------------------------------
+    async def take_due(
+        self,
+        interval_seconds: float,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+    ) -> int:
+        """Snapshot every active org whose latest cutoff is an interval old; returns how many."""
+        async with session_factory() as session:
+            org_ids = (await session.execute(
+                _DUE_ORGS_SQL, {"age": interval_seconds + self.settle_seconds}
+            )).scalars().all()
+
+        taken = 0
+        for org_id in org_ids:
+            try:
+                async with session_factory() as session:
+                    if await self.take(session, org_id, min_age=interval_seconds):
+                        taken += 1
+            except Exception:
+                logger.exception("Stock snapshot failed for org %s", org_id)
+        return taken
+
+
+class StockSnapshotScheduler:
+    """
+    Per-worker loop calling take_due(). Every worker may run one: the
+    per-org advisory lock and the age re-check inside take() mean each
+    interval produces one snapshot per org.
+    """
+
+    def __init__(self, service: StockSnapshotService, interval_seconds: int) -> None:
+        self.service = service
+        self.interval_seconds = interval_seconds
+        self.poll_seconds = min(interval_seconds, 300)
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self.interval_seconds > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                taken = await self.service.take_due(self.interval_seconds)
+                if taken:
+                    logger.info("Took %d stock snapshot(s)", taken)
+            except Exception:
+                logger.exception("Stock snapshot pass failed")
+            await asyncio.sleep(self.poll_seconds)
+
+
+stock_snapshot_service = StockSnapshotService(
+    settings.stock_snapshot_settle_seconds, settings.stock_snapshot_keep
+)
+stock_snapshot_scheduler = StockSnapshotScheduler(
+    stock_snapshot_service, settings.stock_snapshot_interval_seconds
+)
@@ -0,0 +1,164 @@
+# backend/src/app/inventory/services/stock_transfers.py
+
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.inventory.schemas.inv_schemas import StockTransferCreate
+
+
+# Lines travel as four parallel arrays: one bind each, whatever the size
+_LINES_CTE = """
+    lines AS (
+        SELECT *
+        FROM unnest(
+            CAST(:item_ids AS uuid[]),
+            CAST(:from_ids AS uuid[]),
+            CAST(:to_ids AS uuid[]),
+            CAST(:quantities AS numeric[])
+        ) WITH ORDINALITY AS t(item_id, from_location_id, to_location_id, quantity, n)
+    )
+"""
+
+# Lines naming another org's (or a deleted) item / location, or a no-op move
+_INVALID_LINES_SQL = text(f"""
+    WITH {_LINES_CTE}
+    SELECT l.n
+    FROM lines l
+    LEFT JOIN inv.items i
+           ON i.item_id = l.item_id AND i.org_id = :org_id AND i.deleted_at IS NULL
+    LEFT JOIN inv.locations f
+           ON f.location_id = l.from_location_id AND f.org_id = :org_id AND f.deleted_at IS NULL
+    LEFT JOIN inv.locations t
+           ON t.location_id = l.to_location_id AND t.org_id = :org_id AND t.deleted_at IS NULL
+    WHERE i.item_id IS NULL
+       OR f.location_id IS NULL
+       OR t.location_id IS NULL
+       OR l.from_location_id = l.to_location_id
+    ORDER BY l.n
+    LIMIT 10
+""")
+
+# Every line is two legs (out of `from`, into `to`). Stock levels take the
+# net delta per (item, location) in one upsert, in key order so concurrent
+# transfers lock rows in the same order; movements get one row per leg.
+_APPLY_SQL = text(f"""
+    WITH {_LINES_CTE},
+    legs AS (
+        SELECT n, item_id, from_location_id AS location_id, -quantity AS delta FROM lines
+        UNION ALL
+        SELECT n, item_id, to_location_id, quantity FROM lines
+    ),
+    net AS (
+        SELECT item_id, location_id, sum(delta) AS delta
+        FROM legs
+        GROUP BY item_id, location_id
+    ),
+    levels AS (
+        INSERT INTO inv.stock_levels AS sl (org_id, item_id, location_id, quantity_on_hand)
+        SELECT :org_id, item_id, location_id, delta
+        FROM net
+        ORDER BY item_id, location_id
+        ON CONFLICT (org_id, item_id, location_id) DO UPDATE
+            SET quantity_on_hand = sl.quantity_on_hand + EXCLUDED.quantity_on_hand,
+                version = sl.version + 1,
+                updated_at = NOW()
+        RETURNING sl.stock_level_id, sl.item_id, sl.location_id, sl.quantity_on_hand
+    ),
+    movements AS (
+        INSERT INTO inv.stock_movements
+            (org_id, item_id, location_id, stock_level_id, source_type, source_id, quantity_delta, occurred_at)
+        SELECT :org_id, g.item_id, g.location_id, v.stock_level_id, 'transfer', :transfer_id, g.delta, :occurred_at
+        FROM legs g
+        JOIN levels v USING (item_id, location_id)
+        ORDER BY g.n, g.delta
+        RETURNING 1
+    )
+    SELECT
+        (SELECT count(*) FROM movements) AS movement_count,
+        (SELECT count(*) FROM levels) AS stock_level_count,
+        (
+            SELECT json_agg(s)
+            FROM (
+                SELECT v.item_id, v.location_id, v.quantity_on_hand
+                FROM levels v
+                JOIN net USING (item_id, location_id)
+                WHERE net.delta < 0 AND v.quantity_on_hand < 0
+                ORDER BY v.item_id, v.location_id
+                LIMIT 10
+            ) s
+        ) AS shortfalls
+""")
+
+
+class StockTransferService:
+    """
+    Moves stock between locations. A transfer of any size is one validating
+    SELECT plus one statement that upserts every affected StockLevel and
+    writes both StockMovement legs of every line, all in one transaction:
+    either every line is applied or none is.
+    """
+
+    async def transfer(
+        self,
+        session: AsyncSession,
+        payload: StockTransferCreate,
+        *,
+        org_id: UUID,
+    ) -> Dict[str, Any]:
+        params = {
+            "org_id": org_id,
+            "item_ids": [line.item_id for line in payload.lines],
+            "from_ids": [line.from_location_id for line in payload.lines],
+            "to_ids": [line.to_location_id for line in payload.lines],
+            "quantities": [line.quantity for line in payload.lines],
+        }
+
+        # ---------------------------------------------------------
+        # 1. Validate every line against the org's items / locations
+        # ---------------------------------------------------------
+        invalid: List[int] = list((await session.execute(_INVALID_LINES_SQL, params)).scalars())
+        if invalid:
+            raise ValueError(
+                "Unknown item or location, or same source and destination, on line(s) "
+                + ", ".join(str(n) for n in invalid)
+            )
+
+        # ---------------------------------------------------------
+        # 2. Apply: stock levels + paired movements
+        # ---------------------------------------------------------
+        transfer_id = uuid.uuid4()
+        occurred_at = payload.occurred_at or datetime.now(timezone.utc)
+
+        row = (await session.execute(
+            _APPLY_SQL,
+            {**params, "transfer_id": transfer_id, "occurred_at": occurred_at},
+        )).one()
+
+        if row.shortfalls and not payload.allow_negative:
+            await session.rollback()
+            shortfalls = ", ".join(
+                f"item {s['item_id']} at {s['location_id']} ({s['quantity_on_hand']})"
+                for s in row.shortfalls
+            )
+            raise ValueError(f"Transfer would leave stock below zero: {shortfalls}")
+
+        # ---------------------------------------------------------
+        # 3. Finalize transaction
+        # ---------------------------------------------------------
+        await session.commit()
+
+        return {
+            "transfer_id": transfer_id,
+            "line_count": len(payload.lines),
+            "movement_count": row.movement_count,
+            "stock_level_count": row.stock_level_count,
+            "occurred_at": occurred_at,
+        }
+
+
+stock_transfer_service = StockTransferService()
@@ -0,0 +1,458 @@
+# backend/src/app/inventory/services/stocktakes.py
+"""
+Stocktake (physical count) reconciliation.
+
+Counted quantities arrive as a streamed CSV / NDJSON / JSON body, keyed by
+SKU or barcode. They are parsed as the body streams in and COPYed into
+inv.stocktake_counts in batches, as received: a 100k-row count never sits
+in memory and costs a handful of COPY round-trips.
+
+Preview is one statement over the staged rows: codes resolve to the org's
+live items (duplicates summed per item) and join to the location's
+StockLevels for the variances. Apply runs two: one creating any missing
+levels, one writing every StockLevel change and StockMovement row.
+"""
+
+import csv
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+import orjson
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core.base_repository import BaseRepository
+from src.app.core.config import settings
+from src.app.inventory.models.location_models import Location
+from src.app.inventory.models.stocktake_models import Stocktake, StocktakeCount
+from src.app.inventory.schemas.inv_schemas import StocktakeCreate
+
+
+CountRow = Tuple[Optional[str], Optional[str], Decimal]   # sku, barcode, quantity
+
+_MAX_QUANTITY = Decimal("1e14")
+
+UPLOAD_TYPES = ("text/csv", "application/x-ndjson", "application/json")
+
+
+# ---------------------------------------------------------
+# SQL
+# ---------------------------------------------------------
+# Staged rows -> items -> variances against the location's levels. Each
+# row resolves by index probe (SKU first, then barcode), so the cost stays
+# linear however stale the planner's row estimates for a fresh upload are.
+# A code shared by several live items resolves to the first by id.
+_VARIANCES_CTE = """
+    counts AS (
+        SELECT c.sku, c.barcode, c.counted_quantity, coalesce(s.item_id, b.item_id) AS item_id
+        FROM inv.stocktake_counts c
+        LEFT JOIN LATERAL (
+            SELECT item_id FROM inv.items
+            WHERE org_id = :org_id AND sku = c.sku AND deleted_at IS NULL
+            ORDER BY item_id
+            LIMIT 1
+        ) s ON true
+        LEFT JOIN LATERAL (
+            SELECT item_id FROM inv.items
+            WHERE org_id = :org_id AND barcode = c.barcode AND deleted_at IS NULL
+            ORDER BY item_id
+            LIMIT 1
+        ) b ON s.item_id IS NULL
+        WHERE c.stocktake_id = :stocktake_id
+    ),
+    counted AS (
+        SELECT item_id, sum(counted_quantity) AS counted_quantity
+        FROM counts
+        WHERE item_id IS NOT NULL
+        GROUP BY item_id
+    ),
+    variances AS (
+        SELECT coalesce(c.item_id, sl.item_id) AS item_id,
+               sl.stock_level_id,
+               coalesce(sl.quantity_on_hand, 0) AS quantity_on_hand,
+               coalesce(c.counted_quantity, 0) AS counted_quantity,
+               coalesce(c.counted_quantity, 0) - coalesce(sl.quantity_on_hand, 0) AS variance
+        FROM counted c
+        FULL JOIN (
+            SELECT stock_level_id, item_id, quantity_on_hand
+            FROM inv.stock_levels
+            WHERE org_id = :org_id AND location_id = :location_id
+        ) sl ON sl.item_id = c.item_id
+        WHERE c.item_id IS NOT NULL OR CAST(:zero_uncounted AS boolean)
+    )
+"""
+
+_PREVIEW_SQL = text(f"""
+    WITH {_VARIANCES_CTE}
+    SELECT
+        (SELECT count(*) FROM counts) AS count_rows,
+        (SELECT count(*) FROM counts WHERE item_id IS NULL) AS unmatched_rows,
+        (
+            SELECT coalesce(array_agg(code), '{{}}')
+            FROM (
+                SELECT DISTINCT coalesce(sku, barcode) AS code
+                FROM counts
+                WHERE item_id IS NULL
+                ORDER BY code
+                LIMIT 20
+            ) u
+        ) AS unmatched_codes,
+        (SELECT count(*) FROM variances) AS item_count,
+        (SELECT count(*) FROM variances WHERE variance <> 0) AS variance_count,
+        (SELECT coalesce(sum(variance), 0) FROM variances) AS net_variance,
+        (
+            SELECT coalesce(json_agg(l), '[]')
+            FROM (
+                SELECT v.item_id, i.sku, i.name, v.stock_level_id,
+                       v.quantity_on_hand::text AS quantity_on_hand,
+                       v.counted_quantity::text AS counted_quantity,
+                       v.variance::text AS variance
+                FROM variances v
+                JOIN inv.items i USING (item_id)
+                WHERE v.variance <> 0
+                ORDER BY abs(v.variance) DESC, v.item_id
+                LIMIT :limit OFFSET :offset
+            ) l
+        ) AS lines
+""")
+
+# Apply is two statements. First, counted items with no level at the
+# location get one at zero (no movement needed: zero is their ledger sum).
+_MISSING_LEVELS_SQL = text(f"""
+    WITH {_VARIANCES_CTE}
+    INSERT INTO inv.stock_levels (org_id, item_id, location_id, quantity_on_hand)
+    SELECT :org_id, item_id, :location_id, 0
+    FROM variances
+    WHERE stock_level_id IS NULL AND variance <> 0
+    ORDER BY item_id
+    ON CONFLICT (org_id, item_id, location_id) DO NOTHING
+""")
+
+# Then every changed level takes its variance as a delta, with the level
+# and its movement written together so the ledger stays in step. Variances
+# are taken against the levels as this statement reads them, not as they
+# stood at count time (no versions are kept from the count): a sale posted
+# between the count and the apply is overwritten by the count. The UPDATE
+# returns each variance straight into its movement row: every join is by
+# primary key, whatever the row estimates.
+_APPLY_SQL = text(f"""
+    WITH {_VARIANCES_CTE},
+    levels AS (
+        UPDATE inv.stock_levels sl
+        SET quantity_on_hand = sl.quantity_on_hand + v.variance,
+            version = sl.version + 1,
+            updated_at = NOW()
+        FROM variances v
+        WHERE sl.stock_level_id = v.stock_level_id AND v.variance <> 0
+        RETURNING sl.stock_level_id, sl.item_id, v.variance
+    ),
+    movements AS (
+        INSERT INTO inv.stock_movements
+            (org_id, item_id, location_id, stock_level_id, source_type, source_id, quantity_delta, occurred_at)
+        SELECT :org_id, item_id, :location_id, stock_level_id, 'stocktake', :stocktake_id, variance, :applied_at
+        FROM levels
+        ORDER BY item_id
+        RETURNING 1
+    )
+    SELECT
+        (SELECT count(*) FROM levels) AS stock_level_count,
+        (SELECT count(*) FROM movements) AS movement_count
+""")
+
+
+# ---------------------------------------------------------
+# UPLOAD PARSING
+# ---------------------------------------------------------
+def _code(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return str(value).strip() or None
+
+
+def _count_row(n: int, sku: Any, barcode: Any, quantity: Any) -> CountRow:
+    sku, barcode = _code(sku), _code(barcode)
+    if sku is None and barcode is None:
+        raise ValueError(f"Row {n}: needs a sku or a barcode")
+
+    try:
+        counted = Decimal(str(quantity).strip())
+    except (InvalidOperation, ValueError):
+        raise ValueError(f"Row {n}: invalid quantity {quantity!r}")
+    # inv.stocktake_counts.counted_quantity is NUMERIC(18, 4)
+    if not counted.is_finite() or counted < 0 or counted >= _MAX_QUANTITY:
+        raise ValueError(f"Row {n}: invalid quantity {quantity!r}")
+
+    return sku, barcode, counted
+
+
+async def _lines(body: AsyncIterator[bytes]) -> AsyncIterator[List[str]]:
+    """The body's complete lines, one list per chunk received."""
+    pending = b""
+    async for chunk in body:
+        *lines, pending = (pending + chunk).split(b"\n")
+        if lines:
+            yield [line.decode("utf-8-sig").rstrip("\r") for line in lines]
+    if pending:
+        yield [pending.decode("utf-8-sig").rstrip("\r")]
+
+
+async def _parse_csv(body: AsyncIterator[bytes]) -> AsyncIterator[CountRow]:
+    """Header row naming sku and/or barcode, and quantity; any column order."""
+    columns: Optional[Dict[str, int]] = None
+    n = 0
+    async for lines in _lines(body):
+        for record in csv.reader(lines):
+            n += 1
+            if not record or not any(record):
+                continue
+            if columns is None:
+                columns = {name.strip().lower(): i for i, name in enumerate(record)}
+                if "quantity" not in columns or not ({"sku", "barcode"} & columns.keys()):
+                    raise ValueError("CSV header must name a quantity column and a sku or barcode column")
+                continue
+
+            def field(name: str) -> Optional[str]:
+                i = columns.get(name)
+                return record[i] if i is not None and i < len(record) else None
+
+            yield _count_row(n, field("sku"), field("barcode"), field("quantity"))
+
+
+async def _parse_ndjson(body: AsyncIterator[bytes]) -> AsyncIterator[CountRow]:
+    n = 0
+    async for lines in _lines(body):
+        for line in lines:
+            n += 1
+            if not line.strip():
+                continue
+            try:
+                obj = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                raise ValueError(f"Row {n}: invalid JSON")
+            if not isinstance(obj, dict):
+                raise ValueError(f"Row {n}: expected an object")
+            yield _count_row(n, obj.get("sku"), obj.get("barcode"), obj.get("quantity"))
+
+
+async def _parse_json(body: AsyncIterator[bytes]) -> AsyncIterator[CountRow]:
+    """A JSON array of objects: read whole (use NDJSON for very large counts)."""
+    raw = b"".join([chunk async for chunk in body])
+    try:
+        rows = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        raise ValueError("Invalid JSON body")
+    if not isinstance(rows, list):
+        raise ValueError("Expected a JSON array of count rows")
+    for n, obj in enumerate(rows, start=1):
+        if not isinstance(obj, dict):
+            raise ValueError(f"Row {n}: expected an object")
+        yield _count_row(n, obj.get("sku"), obj.get("barcode"), obj.get("quantity"))
+
+
+_PARSERS = {
+    "text/csv": _parse_csv,
+    "application/x-ndjson": _parse_ndjson,
+    "application/json": _parse_json,
+}
+
+
+# ---------------------------------------------------------
+# SERVICE
+# ---------------------------------------------------------
+class StocktakeService(BaseRepository[Stocktake]):
+    """
+    Open a stocktake for a location, upload counts (any number of
+    uploads; rows add up), preview the variances, then apply them.
+    """
+
+    def __init__(self, max_rows: int, batch_rows: int) -> None:
+        super().__init__(Stocktake)
+        self.max_rows = max_rows
+        self.batch_rows = batch_rows
+
+    async def get_for_org(
+        self,
+        session: AsyncSession,
+        stocktake_id: UUID,
+        org_id: UUID,
+        *,
+        for_update: bool = False,
+    ) -> Optional[Stocktake]:
+        stmt = select(Stocktake).where(
+            Stocktake.stocktake_id == stocktake_id,
+            Stocktake.org_id == org_id,
+        )
+        if for_update:
+            stmt = stmt.with_for_update()
+        return (await session.execute(stmt)).scalar_one_or_none()
+
+    async def _get_open(self, session: AsyncSession, stocktake_id: UUID, org_id: UUID) -> Optional[Stocktake]:
+        # Locked: uploads and apply on one stocktake take turns
+        stocktake = await self.get_for_org(session, stocktake_id, org_id, for_update=True)
+        if stocktake is not None and stocktake.status != "open":
+            raise ValueError(f"Stocktake is already {stocktake.status}")
+        return stocktake
+
+    async def _row_count(self, session: AsyncSession, stocktake_id: UUID) -> int:
+        return (await session.execute(
+            select(func.count()).where(StocktakeCount.stocktake_id == stocktake_id)
+        )).scalar_one()
+
+    # ---------------------------------------------------------
+    # CREATE
+    # ---------------------------------------------------------
+    async def open(self, session: AsyncSession, payload: StocktakeCreate, *, org_id: UUID) -> Stocktake:
+        location = (await session.execute(
+            select(Location.location_id).where(
+                Location.location_id == payload.location_id,
+                Location.org_id == org_id,
+                Location.deleted_at.is_(None),
+            )
+        )).scalar_one_or_none()
+        if location is None:
+            raise ValueError("Unknown location")
+
+        stocktake = await self.create_returning(session, {**payload.dict(), "org_id": org_id})
+        await session.commit()
+        return stocktake
+
+    # ---------------------------------------------------------
+    # UPLOAD COUNTS
+    # ---------------------------------------------------------
+    async def upload(
+        self,
+        session: AsyncSession,
+        stocktake_id: UUID,
+        body: AsyncIterator[bytes],
+        content_type: str,
+        *,
+        org_id: UUID,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Stream `body` into the stocktake's staged counts. The upload is one
+        transaction: a bad row anywhere rejects the whole upload.
+        """
+        parse = _PARSERS.get(content_type.split(";")[0].strip().lower())
+        if parse is None:
+            raise ValueError(f"Unsupported upload type; send one of {', '.join(UPLOAD_TYPES)}")
+
+        stocktake = await self._get_open(session, stocktake_id, org_id)
+        if stocktake is None:
+            return None
+
+        room = self.max_rows - await self._row_count(session, stocktake_id)
+
+        # COPY on the session's own connection, inside its transaction
+        connection = await (await session.connection()).get_raw_connection()
+        driver = connection.driver_connection
+
+        async def copy(rows: Iterable[CountRow]) -> None:
+            await driver.copy_records_to_table(
+                "stocktake_counts",
+                schema_name="inv",
+                columns=["stocktake_id", "sku", "barcode", "counted_quantity"],
+                records=[(stocktake_id, *row) for row in rows],
+            )
+
+        received = 0
+        batch: List[CountRow] = []
+        try:
+            async for row in parse(body):
+                received += 1
+                if received > room:
+                    raise ValueError(f"A stocktake holds at most {self.max_rows} count rows")
+                batch.append(row)
+                if len(batch) >= self.batch_rows:
+                    await copy(batch)
+                    batch = []
+            if batch:
+                await copy(batch)
+        except ValueError:
+            await session.rollback()
+            raise
+
+        await session.commit()
+
+        return {
+            "stocktake_id": stocktake_id,
+            "rows_received": received,
+            "total_rows": self.max_rows - room + received,
+        }
+
+    # ---------------------------------------------------------
+    # PREVIEW
+    # ---------------------------------------------------------
+    def _params(self, stocktake: Stocktake) -> Dict[str, Any]:
+        return {
+            "stocktake_id": stocktake.stocktake_id,
+            "org_id": stocktake.org_id,
+            "location_id": stocktake.location_id,
+            "zero_uncounted": stocktake.zero_uncounted,
+        }
+
+    async def preview(
+        self,
+        session: AsyncSession,
+        stocktake_id: UUID,
+        *,
+        org_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Summary of what apply would do against stock as it is now, and one
+        page of the variance lines, largest first.
+        """
+        stocktake = await self.get_for_org(session, stocktake_id, org_id)
+        if stocktake is None:
+            return None
+
+        row = (await session.execute(
+            _PREVIEW_SQL, {**self._params(stocktake), "limit": limit, "offset": offset}
+        )).one()
+
+        return {
+            "stocktake_id": stocktake.stocktake_id,
+            "status": stocktake.status,
+            **row._asdict(),
+        }
+
+    # ---------------------------------------------------------
+    # APPLY
+    # ---------------------------------------------------------
+    async def apply(
+        self,
+        session: AsyncSession,
+        stocktake_id: UUID,
+        *,
+        org_id: UUID,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Set each counted item's level at the location to its counted
+        quantity, writing a "stocktake" movement (source_id = stocktake_id)
+        for every level that changes. Applies once.
+        """
+        stocktake = await self._get_open(session, stocktake_id, org_id)
+        if stocktake is None:
+            return None
+
+        params = self._params(stocktake)
+        applied_at = datetime.now(timezone.utc)
+        await session.execute(_MISSING_LEVELS_SQL, params)
+        row = (await session.execute(_APPLY_SQL, {**params, "applied_at": applied_at})).one()
+
+        stocktake.status = "applied"
+        stocktake.applied_at = applied_at
+        await session.commit()
+
+        return {
+            "stocktake_id": stocktake_id,
+            "applied_at": applied_at,
+            "stock_level_count": row.stock_level_count,
+            "movement_count": row.movement_count,
+        }
+
+
+stocktake_service = StocktakeService(settings.stocktake_max_rows, settings.stocktake_batch_rows)
@@ -2,14 +2,40 @@
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.openapi.utils import get_openapi
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+
+from src.app.core.config import settings
+from src.app.core.invalidation import invalidation_bus
+from src.app.core.responses import ORJSONResponse
+from src.app.inventory.services.stock_snapshots import stock_snapshot_scheduler
+from src.app.pos.services.pricing_executor import pricing_executor
+from src.app.pos.services.sale_number_service import sale_number_service
 
 # ✔ This is correct for your project structure
 from src.app.api_router import api_router
 
 
+# ---------------------------------------------------------
+# LIFESPAN (one invalidation listener and snapshot scheduler per worker process)
+# ---------------------------------------------------------
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await invalidation_bus.start()
+    stock_snapshot_scheduler.start()
+    try:
+        yield
+    finally:
+        await stock_snapshot_scheduler.stop()
+        await invalidation_bus.stop()
+        pricing_executor.shutdown()
+        await sale_number_service.release_all()
+
+
 # ---------------------------------------------------------
 # FASTAPI INITIALIZATION
 # ---------------------------------------------------------
@@ -17,6 +43,8 @@ app = FastAPI(
     title="ArcoirisPOS API",
     description="Backend API for Arcoiris POS System",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 
@@ -42,6 +70,17 @@ app.add_middleware(
 )
 
 
+# ---------------------------------------------------------
+# COMPRESSION (optional; large list pages compress ~5-10x)
+# ---------------------------------------------------------
+if settings.gzip_min_bytes:
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=settings.gzip_min_bytes,
+        compresslevel=settings.gzip_level,
+    )
+
+
 # ---------------------------------------------------------
 # ROUTERS (all mounted under /api via api_router)
 # ---------------------------------------------------------
@@ -1,2 +1,3 @@
 from .organization_models import Organization
 from .role_models import UserOrgRole, UserRole
+from .resource_version_model import ResourceVersion
@@ -0,0 +1,43 @@
+# backend/src/app/org/models/resource_version_model.py
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Text, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.app.core.base import Base
+
+
+class ResourceVersion(Base):
+    """
+    Per-org change counter for a table ("inv.items", "pos.tax_rates", ...).
+
+    Maintained only by the statement-level triggers installed in migration
+    0003 — any INSERT / UPDATE / DELETE touching an org's rows bumps that
+    org's counter once per statement, whoever issued it. Conditional GETs
+    derive their ETags from it without reading the rows themselves.
+    """
+
+    __tablename__ = "resource_versions"
+    __table_args__ = {"schema": "core"}
+
+    # No FK to organizations: the triggers fire during an org's cascading
+    # delete, and a counter row must never be able to block a write
+    org_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    resource: Mapped[str] = mapped_column(Text, primary_key=True)
+
+    version: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        server_default=text("1"),
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("NOW()"),
+    )
@@ -12,6 +12,7 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     ForeignKey,
+    Index,
     text,
 )
 from sqlalchemy.dialects.postgresql import UUID
@@ -33,6 +34,8 @@ class UserOrgRole(Base):
     __tablename__ = "user_org_roles"
     __table_args__ = (
         UniqueConstraint("org_id", "user_id", "role"),
+        # The unique constraint covers org_id lookups; this covers user -> orgs
+        Index("idx_user_org_roles_user", "user_id"),
         {"schema": "core"},
     )
 
@@ -1,11 +1,17 @@
 # backend/src/app/org/routes/organization_settings_routes.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.app.core.database import get_async_session
-from src.app.auth.services.dependencies import get_current_user
+from src.app.core.conditional import ConditionalGet
+from src.app.core.database import get_session
+from src.app.auth.services.org_context import get_current_org
+from src.app.auth.services.dependencies import (
+    require_any_staff_org,
+    require_admin_org,
+)
+from src.app.org.models.organization_settings_model import OrganizationSettings
 from src.app.org.services.organization_settings_service import (
     get_or_create_org_settings,
     update_org_settings_service,
@@ -21,44 +27,52 @@ router = APIRouter(
     tags=["Organization Settings"],
 )
 
+settings_cache = ConditionalGet(OrganizationSettings)
+
 
 # ---------------------------------------------------------
-# GET /org/settings  → fetch settings for user's org
+# GET /org/settings  → fetch settings for the X-Org-ID org
 # ---------------------------------------------------------
 @router.get("/", response_model=OrganizationSettingsRead)
 async def get_settings(
-    session: AsyncSession = Depends(get_async_session),
-    current_user=Depends(get_current_user),
+    response: Response,
+    session: AsyncSession = Depends(get_session),
+    org_ctx=Depends(get_current_org),
+    user=Depends(require_any_staff_org),
+    cache=Depends(settings_cache),
 ):
     """
-    Returns settings for the authenticated user's active organization.
+    Returns settings for the current organization.
+    Terminals poll this; send If-None-Match to get a 304 when unchanged.
     """
-
-    # TODO: Replace once you support multi-org selection
-    org_id: UUID = current_user.active_org_id
+    org_id: UUID = org_ctx["org"].org_id
 
     settings = await get_or_create_org_settings(session, org_id)
+    await session.commit()  # persists the defaults on first read
+
+    response.headers.update(cache)
     return settings
 
 
 # ---------------------------------------------------------
-# PUT /org/settings  → update settings for user's org
+# PUT /org/settings  → update settings for the X-Org-ID org
 # ---------------------------------------------------------
 @router.put("/", response_model=OrganizationSettingsRead)
 async def update_settings(
     payload: OrganizationSettingsUpdate,
-    session: AsyncSession = Depends(get_async_session),
-    current_user=Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+    org_ctx=Depends(get_current_org),
+    user=Depends(require_admin_org),
 ):
     """
     Allows an org admin to update rounding, inventory modes, and other behavior.
     """
+    org_id: UUID = org_ctx["org"].org_id
 
-    # TODO: Role enforcement (owner/admin only)
-    # if current_user.role not in ["owner", "admin"]:
-    #     raise HTTPException(status_code=403, detail="Insufficient permissions")
-
-    org_id: UUID = current_user.active_org_id
+    try:
+        updated = await update_org_settings_service(session, org_id, payload)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
 
-    updated = await update_org_settings_service(session, org_id, payload)
+    await session.commit()
     return updated
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+from typing import Dict, Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.app.core.invalidation import Invalidation, invalidation_bus
 from src.app.org.models.organization_settings_model import OrganizationSettings
 from src.app.org.repositories.organization_settings_repository import (
+    create_default_settings,
     get_settings_by_org_id,
     update_settings,
-    ensure_settings_exist,
 )
 from src.app.org.schemas.organization_settings_schema import (
+    OrganizationSettingsCreate,
+    OrganizationSettingsRead,
     OrganizationSettingsUpdate,
 )
 from src.app.org.enums.models import (
@@ -26,14 +30,76 @@ ROUNDING_TARGETS = [e.value for e in RoundingApplyToEnum]
 INVENTORY_MODES = [e.value for e in InventoryModeEnum]
 
 
+SETTINGS_RESOURCE = "org.settings"
+
+
+# ---------------------------------------------------------
+# Read-through cache (per worker, invalidated over LISTEN/NOTIFY)
+# ---------------------------------------------------------
+_settings_cache: Dict[UUID, OrganizationSettingsRead] = {}
+_generation = 0   # bumped on every invalidation
+
+
+def _invalidate(message: Invalidation) -> None:
+    global _generation
+    _generation += 1
+    if message.org_id is None:
+        _settings_cache.clear()
+    else:
+        _settings_cache.pop(message.org_id, None)
+
+
+invalidation_bus.subscribe(SETTINGS_RESOURCE, _invalidate)
+
+
+# ---------------------------------------------------------
+# Get settings for an organization (read-only)
+# ---------------------------------------------------------
+async def get_org_settings(
+    session: AsyncSession,
+    org_id: UUID,
+) -> Optional[OrganizationSettingsRead]:
+    """
+    Cached snapshot of the org's settings; a hit costs no query. None when
+    the org has no settings row yet (nothing is created).
+    """
+    listening = invalidation_bus.listening
+    if listening:
+        cached = _settings_cache.get(org_id)
+        if cached is not None:
+            return cached
+
+    generation = _generation
+    existing = await get_settings_by_org_id(session, org_id)
+    if existing is None:
+        return None
+
+    snapshot = OrganizationSettingsRead.model_validate(existing)
+    # An invalidation that landed while we were reading means the row we
+    # read may already be stale; serve it, but don't cache it
+    if listening and generation == _generation:
+        _settings_cache[org_id] = snapshot
+    return snapshot
+
+
 # ---------------------------------------------------------
 # Get or create settings for an organization
 # ---------------------------------------------------------
 async def get_or_create_org_settings(
     session: AsyncSession,
     org_id: UUID,
-) -> OrganizationSettings:
-    return await ensure_settings_exist(session, org_id)
+) -> OrganizationSettingsRead:
+    """
+    As get_org_settings, but creates the defaults when missing. They are
+    returned uncached — the caller must commit them.
+    """
+    snapshot = await get_org_settings(session, org_id)
+    if snapshot is not None:
+        return snapshot
+
+    created = await create_default_settings(session, org_id, OrganizationSettingsCreate())
+    await session.refresh(created)  # load server defaults (ids, timestamps)
+    return OrganizationSettingsRead.model_validate(created)
 
 
 # ---------------------------------------------------------
@@ -89,4 +155,7 @@ async def update_org_settings_service(
     if not updated:
         raise RuntimeError("Failed to update organization settings")
 
+    # Every worker drops its cached copy once this transaction commits
+    await invalidation_bus.publish(session, SETTINGS_RESOURCE, org_id)
+
     return updated
@@ -1,7 +1,11 @@
 from .terminal_models import Terminal
 from .customer_models import Customer
 from .tax_rate_models import TaxRate
+from .tax_group_models import TaxGroup, TaxGroupRate
+from .promotion_models import Promotion, PromotionItem
+from .cart_models import CartSnapshot
+from .sale_number_models import SaleNumberCounter, SaleNumberLease
 from .sale_models import Sale, SaleLine
 from .payment_models import Payment
 
-__all__ = ["Terminal", "Customer", "TaxRate", "Sale", "SaleLine", "Payment"]
+__all__ = ["Terminal", "Customer", "TaxRate", "TaxGroup", "TaxGroupRate", "Promotion", "PromotionItem", "CartSnapshot", "SaleNumberCounter", "SaleNumberLease", "Sale", "SaleLine", "Payment"]
@@ -0,0 +1,42 @@
+# backend/src/app/pos/models/cart_models.py
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from typing import Any, Dict
+
+from sqlalchemy import DateTime, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.app.core.base import Base
+
+
+class CartSnapshot(Base):
+    """
+    Persisted copy of an open cart's inputs (only written when
+    CART_PERSIST is on). Totals are not stored; they are rebuilt when the
+    cart is restored.
+    """
+
+    __tablename__ = "cart_snapshots"
+    __table_args__ = (
+        Index("idx_cart_snapshots_expires", "expires_at"),
+        {"schema": "pos"},
+    )
+
+    cart_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+
+    org_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("core.organizations.org_id"),
+        nullable=False,
+    )
+
+    data: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=text("NOW()")
+    )
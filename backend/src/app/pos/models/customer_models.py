@@ -10,6 +10,7 @@ from sqlalchemy import (
     DateTime,
     Text,
     ForeignKey,
+    Index,
     text,
 )
 from sqlalchemy.dialects.postgresql import UUID, CITEXT
@@ -20,7 +21,18 @@ from src.app.core.base import Base
 
 class Customer(Base):
     __tablename__ = "customers"
-    __table_args__ = {"schema": "pos"}
+    __table_args__ = (
+        # CustomerService.get_by_org: org_id = ? AND deleted_at IS NULL ORDER BY created_at DESC
+        Index(
+            "idx_customers_org_created_live",
+            "org_id",
+            text("created_at DESC"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index("idx_customers_org_email", "org_id", "email"),
+        Index("idx_customers_org_phone", "org_id", "phone"),
+        {"schema": "pos"},
+    )
 
     customer_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
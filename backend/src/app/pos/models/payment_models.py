@@ -12,6 +12,7 @@ from sqlalchemy import (
     Numeric,
     Text,
     ForeignKey,
+    Index,
     text,
 )
 from sqlalchemy.dialects.postgresql import UUID
@@ -22,7 +23,11 @@ from src.app.core.base import Base
 
 class Payment(Base):
     __tablename__ = "payments"
-    __table_args__ = {"schema": "pos"}
+    __table_args__ = (
+        Index("idx_payments_sale", "sale_id"),
+        Index("idx_payments_org_created", "org_id", text("created_at DESC")),
+        {"schema": "pos"},
+    )
 
     payment_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
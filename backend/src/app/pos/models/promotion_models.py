@@ -0,0 +1,102 @@
+# backend/src/app/pos/models/promotion_models.py
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, Numeric, Text, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from src.app.core.base import Base
+
+
+class Promotion(Base):
+    """
+    A server-side discount rule scoped to a set of items.
+
+    kind:
+      - percent_off:   percent_off off each matching line
+      - bogo:          buy `buy_quantity`, get `get_quantity` of the same item
+                       at percent_off off (100 = free)
+      - mix_and_match: any `bundle_quantity` matching units for `bundle_price`
+
+    The rule only applies to sales dated inside [starts_at, ends_at).
+    """
+
+    __tablename__ = "promotions"
+    __table_args__ = (
+        Index("idx_promotions_org_active", "org_id", postgresql_where=text("is_active")),
+        {"schema": "pos"},
+    )
+
+    promotion_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
+
+    org_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("core.organizations.org_id"),
+        nullable=False,
+    )
+
+    name: Mapped[str] = mapped_column(Text, nullable=False)
+    kind: Mapped[str] = mapped_column(Text, nullable=False)
+
+    # Higher goes first; a sale line takes at most one promotion
+    priority: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+
+    is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=text("TRUE"))
+    starts_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    ends_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+
+    percent_off: Mapped[Optional[Numeric]] = mapped_column(Numeric(9, 4))
+    buy_quantity: Mapped[Optional[int]] = mapped_column(Integer)
+    get_quantity: Mapped[Optional[int]] = mapped_column(Integer)
+    bundle_quantity: Mapped[Optional[int]] = mapped_column(Integer)
+    bundle_price: Mapped[Optional[Numeric]] = mapped_column(Numeric(18, 4))
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("NOW()"),
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("NOW()"),
+    )
+
+    # ------------------------------------------------------
+    # Relationships
+    # ------------------------------------------------------
+    items: Mapped[List["PromotionItem"]] = relationship(
+        "PromotionItem",
+        cascade="all, delete-orphan",
+        lazy="selectin",
+    )
+
+
+class PromotionItem(Base):
+    __tablename__ = "promotion_items"
+    __table_args__ = (
+        Index("idx_promotion_items_item", "item_id"),
+        {"schema": "pos"},
+    )
+
+    promotion_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("pos.promotions.promotion_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    item_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("inv.items.item_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
@@ -7,12 +7,14 @@ from datetime import datetime
 from typing import List, Optional
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     DateTime,
     Integer,
     Numeric,
     Text,
     ForeignKey,
+    Index,
     UniqueConstraint,
     text,
 )
@@ -27,7 +29,30 @@ from src.app.core.base import Base
 # ============================================================
 class Sale(Base):
     __tablename__ = "sales"
-    __table_args__ = {"schema": "pos"}
+    __table_args__ = (
+        # SalesService.get_by_org: org_id = ? AND status <> 'archived' ORDER BY sale_date DESC
+        Index(
+            "idx_sales_org_date_active",
+            "org_id",
+            text("sale_date DESC"),
+            postgresql_where=text("status <> 'archived'"),
+        ),
+        Index(
+            "idx_sales_customer",
+            "customer_id",
+            postgresql_where=text("customer_id IS NOT NULL"),
+        ),
+        Index("idx_sales_terminal", "terminal_id"),
+        # Allocated sale numbers are unique per org (client-supplied ones have no seq)
+        Index(
+            "uq_sales_org_seq",
+            "org_id",
+            "sale_seq",
+            unique=True,
+            postgresql_where=text("sale_seq IS NOT NULL"),
+        ),
+        {"schema": "pos"},
+    )
 
     sale_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -52,6 +77,7 @@ class Sale(Base):
     )
 
     sale_number: Mapped[Optional[str]] = mapped_column(Text)
+    sale_seq: Mapped[Optional[int]] = mapped_column(BigInteger)   # numeric part of an allocated sale_number
     status: Mapped[str] = mapped_column(Text, nullable=False)
 
     sale_type: Mapped[str] = mapped_column(
@@ -63,6 +89,7 @@ class Sale(Base):
     subtotal: Mapped[Numeric] = mapped_column(Numeric(18, 4), nullable=False, server_default=text("0"))
     tax_total: Mapped[Numeric] = mapped_column(Numeric(18, 4), nullable=False, server_default=text("0"))
     discount_total: Mapped[Numeric] = mapped_column(Numeric(18, 4), nullable=False, server_default=text("0"))
+    rounding_adjustment: Mapped[Numeric] = mapped_column(Numeric(18, 4), nullable=False, server_default=text("0"))
     grand_total: Mapped[Numeric] = mapped_column(Numeric(18, 4), nullable=False, server_default=text("0"))
     amount_paid: Mapped[Numeric] = mapped_column(Numeric(18, 4), nullable=False, server_default=text("0"))
     balance_due: Mapped[Numeric] = mapped_column(Numeric(18, 4), nullable=False, server_default=text("0"))
@@ -83,6 +110,10 @@ class Sale(Base):
     )
     deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
+    # Optimistic concurrency: ORM updates are UPDATE ... WHERE version = :read
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("1"))
+    __mapper_args__ = {"version_id_col": version}
+
     # Relationships
     organization: Mapped["Organization"] = relationship("Organization", back_populates="sales")
     terminal: Mapped[Optional["Terminal"]] = relationship("Terminal", back_populates="sales")
@@ -103,7 +134,10 @@ class Sale(Base):
 class SaleLine(Base):
     __tablename__ = "sale_lines"
     __table_args__ = (
+        # The unique constraint also serves get_by_sale (sale_id ORDER BY line_number)
         UniqueConstraint("sale_id", "line_number"),
+        Index("idx_sale_lines_org_created", "org_id", text("created_at DESC")),
+        Index("idx_sale_lines_item", "item_id"),
         {"schema": "pos"},
     )
 
@@ -149,6 +183,19 @@ class SaleLine(Base):
         ForeignKey("pos.tax_rates.tax_id"),
     )
 
+    tax_group_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("pos.tax_groups.tax_group_id"),
+    )
+
+    # Server-applied promotion; kept apart from the client's discount_amount
+    # so recalculating a sale re-evaluates it instead of stacking it twice
+    promotion_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("pos.promotions.promotion_id", ondelete="SET NULL"),
+    )
+    promotion_discount: Mapped[Numeric] = mapped_column(Numeric(18, 4), nullable=False, server_default=text("0"))
+
     tax_amount: Mapped[Numeric] = mapped_column(Numeric(18, 4), nullable=False, server_default=text("0"))
     line_total: Mapped[Numeric] = mapped_column(Numeric(18, 4), nullable=False)
 
@@ -0,0 +1,75 @@
+# backend/src/app/pos/models/sale_number_models.py
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.app.core.base import Base
+
+
+class SaleNumberCounter(Base):
+    """
+    Per-org high-water mark: the last sale number handed out in a block.
+    Touched once per leased block, never per sale.
+    """
+
+    __tablename__ = "sale_number_counters"
+    __table_args__ = {"schema": "pos"}
+
+    org_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("core.organizations.org_id"),
+        primary_key=True,
+    )
+
+    high_water: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=text("0"))
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=text("NOW()")
+    )
+
+
+class SaleNumberLease(Base):
+    """
+    A block of sale numbers [first_number, last_number] leased to one
+    terminal (by one API worker). used_through is recorded when the lease
+    is closed; numbers after it were never issued.
+    """
+
+    __tablename__ = "sale_number_leases"
+    __table_args__ = (
+        Index("idx_sale_number_leases_org_first", "org_id", "first_number"),
+        {"schema": "pos"},
+    )
+
+    lease_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
+
+    org_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("core.organizations.org_id"),
+        nullable=False,
+    )
+
+    terminal_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("pos.terminals.terminal_id"),
+    )
+
+    first_number: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    last_number: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    used_through: Mapped[Optional[int]] = mapped_column(BigInteger)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=text("NOW()")
+    )
+    closed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
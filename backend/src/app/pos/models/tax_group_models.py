@@ -0,0 +1,86 @@
+# backend/src/app/pos/models/tax_group_models.py
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Text, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from src.app.core.base import Base
+
+
+class TaxGroup(Base):
+    """
+    An ordered stack of tax rates charged together (e.g. state + county +
+    city). Rates flagged is_compound are charged on the price plus every
+    tax before them in the stack.
+    """
+
+    __tablename__ = "tax_groups"
+    __table_args__ = (
+        Index("idx_tax_groups_org_name", "org_id", "name"),
+        {"schema": "pos"},
+    )
+
+    tax_group_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
+
+    org_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("core.organizations.org_id"),
+        nullable=False,
+    )
+
+    name: Mapped[str] = mapped_column(Text, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("NOW()"),
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("NOW()"),
+    )
+
+    # ------------------------------------------------------
+    # Relationships
+    # ------------------------------------------------------
+    rates: Mapped[List["TaxGroupRate"]] = relationship(
+        "TaxGroupRate",
+        order_by="TaxGroupRate.sequence",
+        cascade="all, delete-orphan",
+        lazy="selectin",
+    )
+
+
+class TaxGroupRate(Base):
+    __tablename__ = "tax_group_rates"
+    __table_args__ = (
+        Index("idx_tax_group_rates_tax", "tax_id"),
+        {"schema": "pos"},
+    )
+
+    tax_group_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("pos.tax_groups.tax_group_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    # Position in the stack; compound rates see every lower sequence
+    sequence: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    tax_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("pos.tax_rates.tax_id"),
+        nullable=False,
+    )
@@ -6,7 +6,7 @@ import uuid
 from datetime import datetime
 from typing import List
 
-from sqlalchemy import Boolean, DateTime, Numeric, Text, ForeignKey, text
+from sqlalchemy import Boolean, DateTime, Numeric, Text, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -15,7 +15,10 @@ from src.app.core.base import Base
 
 class TaxRate(Base):
     __tablename__ = "tax_rates"
-    __table_args__ = {"schema": "pos"}
+    __table_args__ = (
+        Index("idx_tax_rates_org_name", "org_id", "name"),
+        {"schema": "pos"},
+    )
 
     tax_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
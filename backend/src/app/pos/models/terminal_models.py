@@ -6,7 +6,7 @@ import uuid
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import Boolean, DateTime, Text, ForeignKey, text
+from sqlalchemy import Boolean, DateTime, Text, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -15,7 +15,10 @@ from src.app.core.base import Base
 
 class Terminal(Base):
     __tablename__ = "terminals"
-    __table_args__ = {"schema": "pos"}
+    __table_args__ = (
+        Index("idx_terminals_org_created", "org_id", text("created_at DESC")),
+        {"schema": "pos"},
+    )
 
     terminal_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -0,0 +1,193 @@
+# backend/src/app/pos/routes/carts_routes.py
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core.database import get_session
+
+from src.app.auth.services.org_context import get_current_org
+from src.app.auth.services.dependencies import require_any_staff_org
+
+from src.app.pos.schemas.pos_schemas import (
+    CartCommit,
+    CartCreate,
+    CartLineAdd,
+    CartLineUpdate,
+    CartRead,
+    SaleLineRead,
+    SaleRead,
+    SaleReadWithLinesAndPayments,
+)
+from src.app.pos.services.cart_service import cart_service
+
+
+router = APIRouter(prefix="/carts", tags=["carts"])
+
+
+async def _get_org_cart(session: AsyncSession, cart_id: UUID, org_id: UUID):
+    cart = await cart_service.get_cart(session, org_id, cart_id)
+    if cart is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Cart not found or expired",
+        )
+    return cart
+
+
+def _line_not_found():
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Cart line not found",
+    )
+
+
+# ---------------------------------------------------------
+# OPEN CART
+# ---------------------------------------------------------
+@router.post("/", response_model=CartRead, status_code=status.HTTP_201_CREATED)
+async def create_cart(
+    payload: CartCreate,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user=Depends(require_any_staff_org),
+):
+    org_id = org_ctx["org"].org_id
+    cart = await cart_service.create_cart(session, org_id, payload.dict(), created_by=user.user_id)
+    await session.commit()
+    return await cart_service.to_read(session, cart)
+
+
+# ---------------------------------------------------------
+# GET CART
+# ---------------------------------------------------------
+@router.get("/{cart_id}", response_model=CartRead)
+async def get_cart(
+    cart_id: UUID,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user=Depends(require_any_staff_org),
+):
+    org_id = org_ctx["org"].org_id
+    cart = await _get_org_cart(session, cart_id, org_id)
+    return await cart_service.to_read(session, cart)
+
+
+# ---------------------------------------------------------
+# ADD LINE
+# ---------------------------------------------------------
+@router.post("/{cart_id}/lines", response_model=CartRead)
+async def add_cart_line(
+    cart_id: UUID,
+    payload: CartLineAdd,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user=Depends(require_any_staff_org),
+):
+    org_id = org_ctx["org"].org_id
+    cart = await _get_org_cart(session, cart_id, org_id)
+
+    try:
+        await cart_service.add_line(session, cart, payload.dict())
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+    await session.commit()
+    return await cart_service.to_read(session, cart)
+
+
+# ---------------------------------------------------------
+# CHANGE LINE (quantity / discount)
+# ---------------------------------------------------------
+@router.patch("/{cart_id}/lines/{line_number}", response_model=CartRead)
+async def update_cart_line(
+    cart_id: UUID,
+    line_number: int,
+    payload: CartLineUpdate,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user=Depends(require_any_staff_org),
+):
+    org_id = org_ctx["org"].org_id
+    cart = await _get_org_cart(session, cart_id, org_id)
+
+    try:
+        await cart_service.update_line(session, cart, line_number, payload.dict(exclude_unset=True))
+    except KeyError:
+        raise _line_not_found()
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+    await session.commit()
+    return await cart_service.to_read(session, cart)
+
+
+# ---------------------------------------------------------
+# REMOVE LINE
+# ---------------------------------------------------------
+@router.delete("/{cart_id}/lines/{line_number}", response_model=CartRead)
+async def remove_cart_line(
+    cart_id: UUID,
+    line_number: int,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user=Depends(require_any_staff_org),
+):
+    org_id = org_ctx["org"].org_id
+    cart = await _get_org_cart(session, cart_id, org_id)
+
+    try:
+        await cart_service.remove_line(session, cart, line_number)
+    except KeyError:
+        raise _line_not_found()
+
+    await session.commit()
+    return await cart_service.to_read(session, cart)
+
+
+# ---------------------------------------------------------
+# DISCARD CART
+# ---------------------------------------------------------
+@router.delete("/{cart_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def discard_cart(
+    cart_id: UUID,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user=Depends(require_any_staff_org),
+):
+    org_id = org_ctx["org"].org_id
+    cart = await _get_org_cart(session, cart_id, org_id)
+
+    await cart_service.discard(session, cart)
+    await session.commit()
+    return None
+
+
+# ---------------------------------------------------------
+# COMMIT CART → SALE
+# ---------------------------------------------------------
+@router.post(
+    "/{cart_id}/commit",
+    response_model=SaleReadWithLinesAndPayments,
+    status_code=status.HTTP_201_CREATED,
+)
+async def commit_cart(
+    cart_id: UUID,
+    payload: CartCommit,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user=Depends(require_any_staff_org),
+):
+    org_id = org_ctx["org"].org_id
+    cart = await _get_org_cart(session, cart_id, org_id)
+
+    try:
+        sale, lines = await cart_service.commit(session, cart, payload.dict())
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+    return SaleReadWithLinesAndPayments(
+        **SaleRead.model_validate(sale).model_dump(),
+        lines=[SaleLineRead.model_validate(line) for line in lines],
+    )
@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.core.database import get_session
+from src.app.core.projection import FieldSet
 
 # ---------------------------------------------------------
 # Correct security imports
@@ -20,14 +21,20 @@ from src.app.auth.services.dependencies import (
 # ---------------------------------------------------------
 # Correct service + schema imports
 # ---------------------------------------------------------
+from src.app.pos.models.customer_models import Customer
 from src.app.pos.services.customer_service import customer_service
 from src.app.pos.schemas.pos_schemas import (
+    CustomerBulkCreate,
+    CustomerBulkDelete,
+    CustomerBulkDeleteResult,
     CustomerCreate,
     CustomerRead,
 )
 
 router = APIRouter(prefix="/customers", tags=["customers"])
 
+customer_fields = FieldSet(CustomerRead, Customer)
+
 
 # ---------------------------------------------------------
 # CREATE CUSTOMER (any staff)
@@ -39,27 +46,71 @@ async def create_customer(
     org_ctx = Depends(get_current_org),
     user    = Depends(require_any_staff_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
 
     data = payload.dict()
     data["org_id"] = org_id
 
-    customer = await customer_service.create(session, data)
+    customer = await customer_service.create_returning(session, data)
     await session.commit()
     return customer
 
 
+# ---------------------------------------------------------
+# BULK CREATE CUSTOMERS (any staff — one INSERT ... RETURNING)
+# ---------------------------------------------------------
+@router.post("/bulk", response_model=List[CustomerRead], status_code=status.HTTP_201_CREATED)
+async def bulk_create_customers(
+    payload: CustomerBulkCreate,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user    = Depends(require_any_staff_org),
+):
+    org_id = org_ctx["org"].org_id
+
+    rows = [{**customer.dict(), "org_id": org_id} for customer in payload.customers]
+
+    customers = await customer_service.create_many(session, rows)
+    await session.commit()
+    return customers
+
+
+# ---------------------------------------------------------
+# BULK DELETE CUSTOMERS (admin only — soft delete)
+# ---------------------------------------------------------
+@router.post("/bulk/delete", response_model=CustomerBulkDeleteResult)
+async def bulk_delete_customers(
+    payload: CustomerBulkDelete,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user    = Depends(require_admin_org),
+):
+    org_id = org_ctx["org"].org_id
+
+    deleted_ids = await customer_service.soft_delete_many(
+        session,
+        payload.customer_ids,
+        where=[Customer.org_id == org_id],
+    )
+    await session.commit()
+    return {"deleted_ids": deleted_ids}
+
+
 # ---------------------------------------------------------
 # LIST CUSTOMERS (any staff)
 # ---------------------------------------------------------
 @router.get("/", response_model=List[CustomerRead])
 async def list_customers(
+    limit: int = 100,
+    offset: int = 0,
+    fields = Depends(customer_fields),
     session: AsyncSession = Depends(get_session),
     org_ctx = Depends(get_current_org),
     user    = Depends(require_any_staff_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
-    return await customer_service.get_by_org(session, org_id)
+    org_id = org_ctx["org"].org_id
+    rows = await customer_service.get_by_org(session, org_id, limit, offset, fields=fields)
+    return customer_fields.render(rows)
 
 
 # ---------------------------------------------------------
@@ -72,7 +123,7 @@ async def get_customer(
     org_ctx = Depends(get_current_org),
     user    = Depends(require_any_staff_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
 
     customer = await customer_service.get_by_id(session, customer_id)
 
@@ -95,7 +146,7 @@ async def delete_customer(
     org_ctx = Depends(get_current_org),
     user    = Depends(require_admin_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
 
     customer = await customer_service.get_by_id(session, customer_id)
     if not customer or customer.org_id != org_id:
@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.core.database import get_session
+from src.app.core.projection import FieldSet
 
 # ---------------------------------------------------------
 # Correct security imports
@@ -21,6 +22,7 @@ from src.app.auth.services.dependencies import (
 # Correct service + schema imports
 # ---------------------------------------------------------
 from src.app.pos.services.payment_service import payment_service
+from src.app.pos.models.payment_models import Payment
 from src.app.pos.schemas.pos_schemas import (
     PaymentCreate,
     PaymentRead,
@@ -29,6 +31,8 @@ from src.app.pos.schemas.pos_schemas import (
 
 router = APIRouter(prefix="/payments", tags=["payments"])
 
+payment_fields = FieldSet(PaymentRead, Payment)
+
 
 # ---------------------------------------------------------
 # LIST PAYMENTS (any staff)
@@ -37,12 +41,14 @@ router = APIRouter(prefix="/payments", tags=["payments"])
 async def list_payments(
     limit: int = 100,
     offset: int = 0,
+    fields = Depends(payment_fields),
     session: AsyncSession = Depends(get_session),
     org_ctx = Depends(get_current_org),
     user    = Depends(require_any_staff_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
-    return await payment_service.get_by_org(session, org_id, limit, offset)
+    org_id = org_ctx["org"].org_id
+    rows = await payment_service.get_by_org(session, org_id, limit, offset, fields=fields)
+    return payment_fields.render(rows)
 
 
 # ---------------------------------------------------------
@@ -69,7 +75,7 @@ async def get_payment(
     org_ctx = Depends(get_current_org),
     user    = Depends(require_any_staff_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
     payment = await payment_service.get_by_id(session, payment_id)
 
     if not payment or payment.org_id != org_id:
@@ -91,7 +97,7 @@ async def create_payment(
     org_ctx = Depends(get_current_org),
     user    = Depends(require_admin_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
 
     data = payload.dict()
     data["org_id"] = org_id
@@ -113,7 +119,7 @@ async def update_payment(
     org_ctx = Depends(get_current_org),
     user    = Depends(require_admin_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
 
     payment = await payment_service.get_by_id(session, payment_id)
     if not payment or payment.org_id != org_id:
@@ -140,7 +146,7 @@ async def delete_payment(
     org_ctx = Depends(get_current_org),
     user    = Depends(require_admin_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
 
     payment = await payment_service.get_by_id(session, payment_id)
     if not payment or payment.org_id != org_id:
@@ -0,0 +1,133 @@
+# backend/src/app/pos/routes/promotions_routes.py
+
+from typing import List
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core.database import get_session
+
+from src.app.auth.services.org_context import get_current_org
+from src.app.auth.services.dependencies import (
+    require_any_staff_org,
+    require_admin_org,
+)
+
+from src.app.pos.schemas.pos_schemas import (
+    PromotionCreate,
+    PromotionRead,
+    PromotionUpdate,
+)
+from src.app.pos.services.promotion_service import promotion_service
+
+
+router = APIRouter(prefix="/promotions", tags=["promotions"])
+
+
+async def _get_org_promotion(session: AsyncSession, promotion_id: UUID, org_id: UUID):
+    promotion = await promotion_service.get_by_id(session, promotion_id)
+    if not promotion or promotion.org_id != org_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Promotion not found",
+        )
+    return promotion
+
+
+# ---------------------------------------------------------
+# LIST PROMOTIONS (any staff)
+# ---------------------------------------------------------
+@router.get("/", response_model=List[PromotionRead])
+async def list_promotions(
+    limit: int = 100,
+    offset: int = 0,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user=Depends(require_any_staff_org),
+):
+    org_id = org_ctx["org"].org_id
+    promotions = await promotion_service.get_by_org(session, org_id, limit, offset)
+    return [promotion_service.to_read(p) for p in promotions]
+
+
+# ---------------------------------------------------------
+# GET SINGLE PROMOTION (any staff)
+# ---------------------------------------------------------
+@router.get("/{promotion_id}", response_model=PromotionRead)
+async def get_promotion(
+    promotion_id: UUID,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user=Depends(require_any_staff_org),
+):
+    org_id = org_ctx["org"].org_id
+    promotion = await _get_org_promotion(session, promotion_id, org_id)
+    return promotion_service.to_read(promotion)
+
+
+# ---------------------------------------------------------
+# CREATE PROMOTION (admin / manager / owner)
+# ---------------------------------------------------------
+@router.post("/", response_model=PromotionRead, status_code=status.HTTP_201_CREATED)
+async def create_promotion(
+    payload: PromotionCreate,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user=Depends(require_admin_org),
+):
+    org_id = org_ctx["org"].org_id
+
+    data = payload.dict()
+    data.pop("org_id")
+
+    try:
+        promotion = await promotion_service.create_promotion(session, org_id, data)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+    await session.commit()
+    return promotion_service.to_read(promotion)
+
+
+# ---------------------------------------------------------
+# UPDATE PROMOTION (admin / manager / owner)
+# ---------------------------------------------------------
+@router.patch("/{promotion_id}", response_model=PromotionRead)
+async def update_promotion(
+    promotion_id: UUID,
+    payload: PromotionUpdate,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user=Depends(require_admin_org),
+):
+    org_id = org_ctx["org"].org_id
+    promotion = await _get_org_promotion(session, promotion_id, org_id)
+
+    try:
+        promotion = await promotion_service.update_promotion(
+            session, promotion, payload.dict(exclude_unset=True)
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+    await session.commit()
+    return promotion_service.to_read(promotion)
+
+
+# ---------------------------------------------------------
+# DELETE PROMOTION (admin / manager / owner)
+# ---------------------------------------------------------
+@router.delete("/{promotion_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_promotion(
+    promotion_id: UUID,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user=Depends(require_admin_org),
+):
+    org_id = org_ctx["org"].org_id
+    promotion = await _get_org_promotion(session, promotion_id, org_id)
+
+    await promotion_service.delete_promotion(session, promotion)
+    await session.commit()
+    return None
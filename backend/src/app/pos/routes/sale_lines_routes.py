@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.core.database import get_session
+from src.app.core.projection import FieldSet
 
 # ---------------------------------------------------------
 # Correct security imports
@@ -21,6 +22,7 @@ from src.app.auth.services.dependencies import (
 # Correct service + schema imports
 # ---------------------------------------------------------
 from src.app.pos.services.sale_line_service import sale_line_service
+from src.app.pos.models.sale_models import SaleLine
 from src.app.pos.schemas.pos_schemas import (
     SaleLineCreate,
     SaleLineRead,
@@ -29,6 +31,8 @@ from src.app.pos.schemas.pos_schemas import (
 
 router = APIRouter(prefix="/sale-lines", tags=["sale-lines"])
 
+sale_line_fields = FieldSet(SaleLineRead, SaleLine)
+
 
 # ---------------------------------------------------------
 # LIST BY ORG (any staff)
@@ -37,12 +41,14 @@ router = APIRouter(prefix="/sale-lines", tags=["sale-lines"])
 async def list_sale_lines(
     limit: int = 100,
     offset: int = 0,
+    fields = Depends(sale_line_fields),
     session: AsyncSession = Depends(get_session),
     org_ctx = Depends(get_current_org),
     user    = Depends(require_any_staff_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
-    return await sale_line_service.get_by_org(session, org_id, limit, offset)
+    org_id = org_ctx["org"].org_id
+    rows = await sale_line_service.get_by_org(session, org_id, limit, offset, fields=fields)
+    return sale_line_fields.render(rows)
 
 
 # ---------------------------------------------------------
@@ -68,7 +74,7 @@ async def get_sale_line(
     org_ctx = Depends(get_current_org),
     user    = Depends(require_any_staff_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
     sl = await sale_line_service.get_by_id(session, sale_line_id)
 
     if not sl or sl.org_id != org_id:
@@ -90,7 +96,7 @@ async def create_sale_line(
     org_ctx = Depends(get_current_org),
     user    = Depends(require_admin_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
 
     data = payload.dict()
     data["org_id"] = org_id
@@ -112,7 +118,7 @@ async def update_sale_line(
     org_ctx = Depends(get_current_org),
     user    = Depends(require_admin_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
     sl = await sale_line_service.get_by_id(session, sale_line_id)
 
     if not sl or sl.org_id != org_id:
@@ -139,7 +145,7 @@ async def delete_sale_line(
     org_ctx = Depends(get_current_org),
     user    = Depends(require_admin_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
     sl = await sale_line_service.get_by_id(session, sale_line_id)
 
     if not sl or sl.org_id != org_id:
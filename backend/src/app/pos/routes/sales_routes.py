@@ -1,12 +1,15 @@
 # backend/src/app/pos/routes/sales_routes.py
 
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.core.database import get_session
+from src.app.core.optimistic import VersionConflict, conflict_error, if_match_version, version_etag
+from src.app.core.projection import FieldSet
+from src.app.core.responses import ORJSONResponse
 
 # ---------------------------------------------------------
 # Security & Org Context
@@ -20,17 +23,26 @@ from src.app.auth.services.dependencies import (
 # ---------------------------------------------------------
 # Schemas & Services
 # ---------------------------------------------------------
+from src.app.pos.models.sale_models import Sale
 from src.app.pos.schemas.pos_schemas import (
     SaleCreate,
+    SaleNumberGap,
+    SaleQuote,
+    SaleQuoteBatch,
+    SaleQuoteResult,
     SaleRead,
     SaleReadWithLinesAndPayments,
     SaleUpdate,
 )
 
+from src.app.pos.services.quote_service import quote_service
+from src.app.pos.services.sale_number_service import sale_number_service
 from src.app.pos.services.sales_service import sales_service
 
 router = APIRouter(prefix="/sales", tags=["sales"])
 
+sale_fields = FieldSet(SaleRead, Sale)
+
 
 # ---------------------------------------------------------
 # LIST SALES
@@ -39,6 +51,7 @@ router = APIRouter(prefix="/sales", tags=["sales"])
 async def list_sales(
     limit: int = 100,
     offset: int = 0,
+    fields = Depends(sale_fields),
     session: AsyncSession = Depends(get_session),
     org_ctx=Depends(get_current_org),
     user=Depends(require_any_staff_org),
@@ -47,8 +60,29 @@ async def list_sales(
     Returns a paginated list of sales for the current organization.
     Archived sales are automatically filtered by the service layer.
     """
-    org_id = getattr(org_ctx, "org_id", None)
-    return await sales_service.get_by_org(session, org_id, limit, offset)
+    org_id = org_ctx["org"].org_id
+    rows = await sales_service.get_by_org(session, org_id, limit, offset, fields=fields)
+    return sale_fields.render(rows)
+
+
+# ---------------------------------------------------------
+# SALE NUMBER GAPS (declared before /{sale_id})
+# ---------------------------------------------------------
+@router.get("/number-gaps", response_model=List[SaleNumberGap])
+async def sale_number_gaps(
+    from_number: int = 0,
+    limit: int = 100,
+    session: AsyncSession = Depends(get_session),
+    org_ctx=Depends(get_current_org),
+    user=Depends(require_admin_org),
+):
+    """
+    Allocated sale numbers with no sale, per leased block: void (handed
+    out, sale never written), unissued (released unused) or open (lease
+    still held).
+    """
+    org_id = org_ctx["org"].org_id
+    return await sale_number_service.gaps(session, org_id, from_number, limit)
 
 
 # ---------------------------------------------------------
@@ -57,11 +91,12 @@ async def list_sales(
 @router.get("/{sale_id}", response_model=SaleReadWithLinesAndPayments)
 async def get_sale(
     sale_id: UUID,
+    response: Response,
     session: AsyncSession = Depends(get_session),
     org_ctx=Depends(get_current_org),
     user=Depends(require_any_staff_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
     sale = await sales_service.get_with_relations(session, sale_id)
 
     if not sale or sale.org_id != org_id:
@@ -70,6 +105,7 @@ async def get_sale(
             detail="Sale not found",
         )
 
+    response.headers["ETag"] = version_etag(sale.version)
     return sale
 
 
@@ -91,10 +127,48 @@ async def create_sale(
     Creates a new sale using the checkout engine.
     Cashiers are allowed (any staff in the org).
     """
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
     return await sales_service.create_sale(session, payload, org_id=org_id)
 
 
+# ---------------------------------------------------------
+# QUOTE (price only — nothing is written)
+# ---------------------------------------------------------
+@router.post("/quote", response_model=SaleQuote)
+async def quote_sale(
+    payload: SaleCreate,
+    session: AsyncSession = Depends(get_session),
+    org_ctx=Depends(get_current_org),
+    user=Depends(require_any_staff_org),
+):
+    """
+    Same body as POST /sales, same totals, but served from the per-worker
+    catalog cache and never committed. The engine's output is already
+    plain data, so it skips response_model validation.
+    """
+    org_id = org_ctx["org"].org_id
+
+    try:
+        quote = await quote_service.quote(session, org_id, payload)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+    return ORJSONResponse(quote)
+
+
+@router.post("/quote/batch", response_model=List[SaleQuoteResult])
+async def quote_sales(
+    payload: SaleQuoteBatch,
+    session: AsyncSession = Depends(get_session),
+    org_ctx=Depends(get_current_org),
+    user=Depends(require_any_staff_org),
+):
+    """One {"quote"} or {"error"} per sale, in order; one bad cart fails only itself."""
+    org_id = org_ctx["org"].org_id
+    results = await quote_service.quote_many(session, org_id, payload.sales)
+    return ORJSONResponse(results)
+
+
 # ---------------------------------------------------------
 # UPDATE SALE (PATCH + RECALCULATION)
 # ---------------------------------------------------------
@@ -105,13 +179,23 @@ async def create_sale(
 async def update_sale(
     sale_id: UUID,
     payload: SaleUpdate,
+    response: Response,
+    if_match: Optional[int] = Depends(if_match_version),
     session: AsyncSession = Depends(get_session),
     org_ctx=Depends(get_current_org),
     user=Depends(require_admin_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    """
+    Send the sale's ETag as If-Match to update only the version you read
+    (412 if it has changed). Without it, a concurrent update makes the
+    server re-read and recalculate; 409 if it keeps losing.
+    """
+    org_id = org_ctx["org"].org_id
 
-    sale = await sales_service.update_sale(session, sale_id, payload, org_id=org_id)
+    try:
+        sale = await sales_service.update_sale(session, sale_id, payload, org_id=org_id, if_match=if_match)
+    except VersionConflict as exc:
+        raise conflict_error(exc, if_match)
 
     if not sale or sale.org_id != org_id:
         raise HTTPException(
@@ -119,6 +203,7 @@ async def update_sale(
             detail="Sale not found or archived",
         )
 
+    response.headers["ETag"] = version_etag(sale.version)
     return sale
 
 
@@ -132,8 +217,11 @@ async def archive_sale(
     org_ctx=Depends(get_current_org),
     user=Depends(require_admin_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
-    sale = await sales_service.archive_sale(session, sale_id, org_id=org_id)
+    org_id = org_ctx["org"].org_id
+    try:
+        sale = await sales_service.archive_sale(session, sale_id, org_id=org_id)
+    except VersionConflict as exc:
+        raise conflict_error(exc, None)
 
     if not sale or sale.org_id != org_id:
         raise HTTPException(
@@ -0,0 +1,141 @@
+# backend/src/app/pos/routes/tax_groups_routes.py
+
+from typing import List
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core.database import get_session
+
+from src.app.auth.services.org_context import get_current_org
+from src.app.auth.services.dependencies import (
+    require_any_staff_org,
+    require_admin_org,
+)
+
+from src.app.pos.schemas.pos_schemas import (
+    TaxGroupCreate,
+    TaxGroupRead,
+    TaxGroupUpdate,
+)
+from src.app.pos.services.tax_group_service import tax_group_service
+
+
+router = APIRouter(prefix="/tax-groups", tags=["tax-groups"])
+
+
+async def _get_org_group(session: AsyncSession, tax_group_id: UUID, org_id: UUID):
+    group = await tax_group_service.get_by_id(session, tax_group_id)
+    if not group or group.org_id != org_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tax group not found",
+        )
+    return group
+
+
+# ---------------------------------------------------------
+# LIST TAX GROUPS (any staff)
+# ---------------------------------------------------------
+@router.get("/", response_model=List[TaxGroupRead])
+async def list_tax_groups(
+    limit: int = 100,
+    offset: int = 0,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user=Depends(require_any_staff_org),
+):
+    org_id = org_ctx["org"].org_id
+    groups = await tax_group_service.get_by_org(session, org_id, limit, offset)
+    compiled = await tax_group_service.compiled(session, org_id, [g.tax_group_id for g in groups])
+    return [tax_group_service.to_read(g, compiled.get(g.tax_group_id)) for g in groups]
+
+
+# ---------------------------------------------------------
+# GET SINGLE TAX GROUP (any staff)
+# ---------------------------------------------------------
+@router.get("/{tax_group_id}", response_model=TaxGroupRead)
+async def get_tax_group(
+    tax_group_id: UUID,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user=Depends(require_any_staff_org),
+):
+    org_id = org_ctx["org"].org_id
+    group = await _get_org_group(session, tax_group_id, org_id)
+    compiled = await tax_group_service.compiled(session, org_id, [tax_group_id])
+    return tax_group_service.to_read(group, compiled.get(tax_group_id))
+
+
+# ---------------------------------------------------------
+# CREATE TAX GROUP (admin / manager / owner)
+# ---------------------------------------------------------
+@router.post("/", response_model=TaxGroupRead, status_code=status.HTTP_201_CREATED)
+async def create_tax_group(
+    payload: TaxGroupCreate,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user=Depends(require_admin_org),
+):
+    org_id = org_ctx["org"].org_id
+
+    try:
+        group = await tax_group_service.create_group(session, org_id, payload.name, payload.tax_ids)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+    compiled = await tax_group_service.compiled(session, org_id, [group.tax_group_id])
+    await session.commit()
+    return tax_group_service.to_read(group, compiled.get(group.tax_group_id))
+
+
+# ---------------------------------------------------------
+# UPDATE TAX GROUP (admin / manager / owner)
+# ---------------------------------------------------------
+@router.patch("/{tax_group_id}", response_model=TaxGroupRead)
+async def update_tax_group(
+    tax_group_id: UUID,
+    payload: TaxGroupUpdate,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user=Depends(require_admin_org),
+):
+    org_id = org_ctx["org"].org_id
+    group = await _get_org_group(session, tax_group_id, org_id)
+
+    try:
+        group = await tax_group_service.update_group(session, group, payload.name, payload.tax_ids)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+    compiled = await tax_group_service.compiled(session, org_id, [tax_group_id])
+    await session.commit()
+    return tax_group_service.to_read(group, compiled.get(tax_group_id))
+
+
+# ---------------------------------------------------------
+# DELETE TAX GROUP (admin / manager / owner)
+# ---------------------------------------------------------
+@router.delete("/{tax_group_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_tax_group(
+    tax_group_id: UUID,
+    session: AsyncSession = Depends(get_session),
+    org_ctx = Depends(get_current_org),
+    user=Depends(require_admin_org),
+):
+    org_id = org_ctx["org"].org_id
+    group = await _get_org_group(session, tax_group_id, org_id)
+
+    try:
+        await tax_group_service.delete_group(session, group)
+        await session.commit()
+    except IntegrityError:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Tax group is still used by items or sale lines",
+        )
+
+    return None
@@ -6,7 +6,9 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.app.core.conditional import ConditionalGet
 from src.app.core.database import get_session
+from src.app.core.projection import FieldSet
 
 # ---------------------------------------------------------
 # Correct security imports
@@ -20,6 +22,7 @@ from src.app.auth.services.dependencies import (
 # ---------------------------------------------------------
 # Schemas + Services
 # ---------------------------------------------------------
+from src.app.pos.models.tax_rate_models import TaxRate
 from src.app.pos.schemas.pos_schemas import (
     TaxRateCreate,
     TaxRateRead,
@@ -30,6 +33,9 @@ from src.app.pos.services.tax_rate_service import tax_rate_service
 
 router = APIRouter(prefix="/tax-rates", tags=["tax-rates"])
 
+tax_rate_cache = ConditionalGet(TaxRate)
+tax_rate_fields = FieldSet(TaxRateRead, TaxRate)
+
 
 # ---------------------------------------------------------
 # LIST TAX RATES (any staff)
@@ -38,12 +44,15 @@ router = APIRouter(prefix="/tax-rates", tags=["tax-rates"])
 async def list_tax_rates(
     limit: int = 100,
     offset: int = 0,
+    fields = Depends(tax_rate_fields),
     session: AsyncSession = Depends(get_session),
     org_ctx = Depends(get_current_org),
     user=Depends(require_any_staff_org),
+    cache = Depends(tax_rate_cache),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
-    return await tax_rate_service.get_by_org(session, org_id, limit, offset)
+    org_id = org_ctx["org"].org_id
+    rows = await tax_rate_service.get_by_org(session, org_id, limit, offset, fields=fields)
+    return tax_rate_fields.render(rows, headers=cache)
 
 
 # ---------------------------------------------------------
@@ -56,7 +65,7 @@ async def get_tax_rate(
     org_ctx = Depends(get_current_org),
     user=Depends(require_any_staff_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
     tax_rate = await tax_rate_service.get_by_id(session, tax_id)
 
     if not tax_rate or tax_rate.org_id != org_id:
@@ -78,7 +87,7 @@ async def create_tax_rate(
     org_ctx = Depends(get_current_org),
     user=Depends(require_admin_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
 
     data = payload.dict()
     data["org_id"] = org_id
@@ -100,7 +109,7 @@ async def update_tax_rate(
     org_ctx = Depends(get_current_org),
     user=Depends(require_admin_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
     tax_rate = await tax_rate_service.get_by_id(session, tax_id)
 
     if not tax_rate or tax_rate.org_id != org_id:
@@ -109,8 +118,7 @@ async def update_tax_rate(
             detail="Tax rate not found",
         )
 
-    for field, value in payload.dict(exclude_unset=True).items():
-        setattr(tax_rate, field, value)
+    await tax_rate_service.update_tax_rate(session, tax_rate, payload.dict(exclude_unset=True))
 
     await session.commit()
     await session.refresh(tax_rate)
@@ -127,7 +135,7 @@ async def delete_tax_rate(
     org_ctx = Depends(get_current_org),
     user=Depends(require_admin_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
     tax_rate = await tax_rate_service.get_by_id(session, tax_id)
 
     if not tax_rate or tax_rate.org_id != org_id:
@@ -6,7 +6,9 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.app.core.conditional import ConditionalGet
 from src.app.core.database import get_session
+from src.app.core.projection import FieldSet
 
 # ---------------------------------------------------------
 # Security dependencies
@@ -20,6 +22,7 @@ from src.app.auth.services.dependencies import (
 # ---------------------------------------------------------
 # Schemas & Services
 # ---------------------------------------------------------
+from src.app.pos.models.terminal_models import Terminal
 from src.app.pos.schemas.pos_schemas import (
     TerminalCreate,
     TerminalRead,
@@ -31,6 +34,9 @@ from src.app.pos.services.terminal_service import terminal_service
 
 router = APIRouter(prefix="/terminals", tags=["terminals"])
 
+terminal_cache = ConditionalGet(Terminal)
+terminal_fields = FieldSet(TerminalRead, Terminal)
+
 
 # ---------------------------------------------------------
 # LIST TERMINALS (any staff)
@@ -39,12 +45,15 @@ router = APIRouter(prefix="/terminals", tags=["terminals"])
 async def list_terminals(
     limit: int = 100,
     offset: int = 0,
+    fields = Depends(terminal_fields),
     session: AsyncSession = Depends(get_session),
     org_ctx=Depends(get_current_org),
     user=Depends(require_any_staff_org),
+    cache=Depends(terminal_cache),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
-    return await terminal_service.get_by_org(session, org_id, limit, offset)
+    org_id = org_ctx["org"].org_id
+    rows = await terminal_service.get_by_org(session, org_id, limit, offset, fields=fields)
+    return terminal_fields.render(rows, headers=cache)
 
 
 # ---------------------------------------------------------
@@ -57,7 +66,7 @@ async def get_terminal(
     org_ctx=Depends(get_current_org),
     user=Depends(require_any_staff_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
     terminal = await terminal_service.get_by_id(session, terminal_id)
 
     if not terminal or terminal.org_id != org_id:
@@ -79,7 +88,7 @@ async def create_terminal(
     org_ctx=Depends(get_current_org),
     user=Depends(require_admin_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
 
     data = payload.dict()
     data["org_id"] = org_id
@@ -101,7 +110,7 @@ async def update_terminal(
     org_ctx=Depends(get_current_org),
     user=Depends(require_admin_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
     terminal = await terminal_service.get_by_id(session, terminal_id)
 
     if not terminal or terminal.org_id != org_id:
@@ -128,7 +137,7 @@ async def delete_terminal(
     org_ctx=Depends(get_current_org),
     user=Depends(require_admin_org),
 ):
-    org_id = getattr(org_ctx, "org_id", None)
+    org_id = org_ctx["org"].org_id
     terminal = await terminal_service.get_by_id(session, terminal_id)
 
     if not terminal or terminal.org_id != org_id:
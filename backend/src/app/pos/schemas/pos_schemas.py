@@ -2,10 +2,12 @@
 
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import List, Literal, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import AliasChoices, BaseModel, EmailStr, Field
+
+from src.app.core.config import settings
 
 
 # ============================================================
@@ -15,13 +17,15 @@ from pydantic import BaseModel, EmailStr, Field
 
 class CustomerBase(BaseModel):
     org_id: UUID
-    full_name: str
-    external_ref: Optional[str] = None
+    first_name: str
+    middle_name: Optional[str] = None
+    last_name: str
     email: Optional[EmailStr] = None
     phone: Optional[str] = None
-    billing_address: Optional[dict] = None
-    shipping_address: Optional[dict] = None
-    notes: Optional[str] = None
+    street_address: Optional[str] = None
+    city: Optional[str] = None
+    state: Optional[str] = None
+    zip: Optional[str] = None
 
 
 class CustomerCreate(CustomerBase):
@@ -29,24 +33,41 @@ class CustomerCreate(CustomerBase):
 
 
 class CustomerUpdate(BaseModel):
-    full_name: Optional[str] = None
-    external_ref: Optional[str] = None
+    first_name: Optional[str] = None
+    middle_name: Optional[str] = None
+    last_name: Optional[str] = None
     email: Optional[EmailStr] = None
     phone: Optional[str] = None
-    billing_address: Optional[dict] = None
-    shipping_address: Optional[dict] = None
-    notes: Optional[str] = None
+    street_address: Optional[str] = None
+    city: Optional[str] = None
+    state: Optional[str] = None
+    zip: Optional[str] = None
 
 
 class CustomerRead(CustomerBase):
     customer_id: UUID
     created_at: datetime
     updated_at: datetime
+    created_by: Optional[UUID] = None
+    last_edited_by: Optional[UUID] = None
+    last_edited_at: Optional[datetime] = None
     deleted_at: Optional[datetime] = None
 
     model_config = {"from_attributes": True}
 
 
+class CustomerBulkCreate(BaseModel):
+    customers: List[CustomerCreate] = Field(..., min_length=1, max_length=settings.bulk_max_rows)
+
+
+class CustomerBulkDelete(BaseModel):
+    customer_ids: List[UUID] = Field(..., min_length=1, max_length=settings.bulk_max_rows)
+
+
+class CustomerBulkDeleteResult(BaseModel):
+    deleted_ids: List[UUID]
+
+
 # ============================================================
 # TERMINALS
 # ============================================================
@@ -109,6 +130,81 @@ class TaxRateRead(TaxRateBase):
     model_config = {"from_attributes": True}
 
 
+# ============================================================
+# TAX GROUPS
+# ============================================================
+
+
+class TaxGroupBase(BaseModel):
+    org_id: UUID
+    name: str
+    tax_ids: List[UUID] = Field(..., min_length=1, description="Applied in this order")
+
+
+class TaxGroupCreate(TaxGroupBase):
+    pass
+
+
+class TaxGroupUpdate(BaseModel):
+    name: Optional[str] = None
+    tax_ids: Optional[List[UUID]] = Field(None, min_length=1)
+
+
+class TaxGroupRead(TaxGroupBase):
+    tax_group_id: UUID
+    effective_rate_percent: Decimal = Field(..., description="Single rate equal to the whole stack")
+    created_at: datetime
+    updated_at: datetime
+
+
+# ============================================================
+# PROMOTIONS
+# ============================================================
+
+
+PromotionKind = Literal["percent_off", "bogo", "mix_and_match"]
+
+
+class PromotionBase(BaseModel):
+    org_id: UUID
+    name: str
+    kind: PromotionKind
+    priority: int = 0
+    is_active: bool = True
+    starts_at: Optional[datetime] = None
+    ends_at: Optional[datetime] = None
+    percent_off: Optional[Decimal] = Field(None, description="percent_off, and bogo (default 100 = free)")
+    buy_quantity: Optional[int] = Field(None, description="bogo")
+    get_quantity: Optional[int] = Field(None, description="bogo")
+    bundle_quantity: Optional[int] = Field(None, description="mix_and_match")
+    bundle_price: Optional[Decimal] = Field(None, description="mix_and_match")
+
+
+class PromotionCreate(PromotionBase):
+    item_ids: List[UUID] = Field(..., min_length=1)
+
+
+class PromotionUpdate(BaseModel):
+    name: Optional[str] = None
+    priority: Optional[int] = None
+    is_active: Optional[bool] = None
+    starts_at: Optional[datetime] = None
+    ends_at: Optional[datetime] = None
+    percent_off: Optional[Decimal] = None
+    buy_quantity: Optional[int] = None
+    get_quantity: Optional[int] = None
+    bundle_quantity: Optional[int] = None
+    bundle_price: Optional[Decimal] = None
+    item_ids: Optional[List[UUID]] = Field(None, min_length=1)
+
+
+class PromotionRead(PromotionBase):
+    promotion_id: UUID
+    item_ids: List[UUID]
+    created_at: datetime
+    updated_at: datetime
+
+
 # ============================================================
 # SALE LINES
 # ============================================================
@@ -123,6 +219,7 @@ class SaleLineBase(BaseModel):
     unit_price: Decimal
     discount_amount: Decimal = Decimal("0")
     tax_id: Optional[UUID] = None
+    tax_group_id: Optional[UUID] = None
     tax_amount: Decimal = Decimal("0")
     line_total: Decimal
 
@@ -137,6 +234,7 @@ class SaleLineUpdate(BaseModel):
     unit_price: Optional[Decimal] = None
     discount_amount: Optional[Decimal] = None
     tax_id: Optional[UUID] = None
+    tax_group_id: Optional[UUID] = None
     tax_amount: Optional[Decimal] = None
     line_total: Optional[Decimal] = None
 
@@ -144,6 +242,8 @@ class SaleLineUpdate(BaseModel):
 class SaleLineRead(SaleLineBase):
     sale_line_id: UUID
     sale_id: UUID
+    promotion_id: Optional[UUID] = None
+    promotion_discount: Decimal = Decimal("0")
     created_at: datetime
 
     model_config = {"from_attributes": True}
@@ -180,6 +280,10 @@ class PaymentRead(PaymentBase):
     sale_id: UUID
     created_at: datetime
 
+    # Stored as pos.payments.reference / created_at
+    external_ref: Optional[str] = Field(None, validation_alias=AliasChoices("external_ref", "reference"))
+    processed_at: datetime = Field(validation_alias=AliasChoices("processed_at", "created_at"))
+
     model_config = {"from_attributes": True}
 
 
@@ -198,6 +302,7 @@ class SaleBase(BaseModel):
     subtotal: Decimal = Decimal("0")
     tax_total: Decimal = Decimal("0")
     discount_total: Decimal = Decimal("0")
+    rounding_adjustment: Decimal = Decimal("0")
     grand_total: Decimal = Decimal("0")
     amount_paid: Decimal = Decimal("0")
     balance_due: Decimal = Decimal("0")
@@ -260,6 +365,7 @@ class SaleUpdate(BaseModel):
         else:
             merged_lines = [
                 SaleLineCreate(
+                    org_id=line.org_id,
                     item_id=line.item_id,
                     line_number=line.line_number,
                     description=line.description,
@@ -267,6 +373,7 @@ class SaleUpdate(BaseModel):
                     unit_price=line.unit_price,
                     discount_amount=line.discount_amount,
                     tax_id=line.tax_id,
+                    tax_group_id=line.tax_group_id,
                     tax_amount=line.tax_amount,
                     line_total=line.line_total,
                 )
@@ -282,9 +389,8 @@ class SaleUpdate(BaseModel):
                     org_id=payment.org_id,
                     payment_method=payment.payment_method,
                     amount=payment.amount,
-                    currency=payment.currency,
-                    external_ref=payment.external_ref,
-                    processed_at=payment.processed_at,
+                    external_ref=payment.reference,
+                    processed_at=payment.created_at,
                     sale_id=existing_sale.sale_id,
                 )
                 for payment in existing_sale.payments
@@ -306,12 +412,128 @@ class SaleRead(SaleBase):
     created_at: datetime
     updated_at: datetime
     deleted_at: Optional[datetime] = None
+    version: int   # send back as If-Match: "<version>" on PATCH
 
     model_config = {"from_attributes": True}
 
 
 class SaleReadWithLinesAndPayments(SaleRead):
-    lines: List[SaleLineRead] = []
+    # Sale.sale_lines on the model
+    lines: List[SaleLineRead] = Field([], validation_alias=AliasChoices("lines", "sale_lines"))
     payments: List[PaymentRead] = []
 
     model_config = {"from_attributes": True}
+
+
+# ============================================================
+# QUOTES (priced, never written)
+# ============================================================
+
+
+class TaxBreakdownRead(BaseModel):
+    tax_id: UUID
+    tax_amount: Decimal
+
+
+class SaleQuoteLine(BaseModel):
+    quantity: Decimal
+    unit_price: Decimal
+    discount_amount: Decimal
+    promotion_id: Optional[UUID] = None
+    promotion_discount: Decimal
+    line_subtotal: Decimal
+    tax_amount: Decimal
+    line_total: Decimal
+
+
+class SaleQuote(BaseModel):
+    subtotal: Decimal
+    tax_total: Decimal
+    tax_breakdown: List[TaxBreakdownRead]
+    discount_total: Decimal
+    rounding_adjustment: Decimal
+    grand_total: Decimal
+    amount_paid: Decimal
+    balance_due: Decimal
+    lines: List[SaleQuoteLine]
+
+
+class SaleQuoteBatch(BaseModel):
+    sales: List[SaleCreate] = Field(..., min_length=1, max_length=settings.bulk_max_rows)
+
+
+class SaleQuoteResult(BaseModel):
+    quote: Optional[SaleQuote] = None
+    error: Optional[str] = None
+
+
+class SaleNumberGap(BaseModel):
+    terminal_id: Optional[UUID] = None
+    first_number: str
+    last_number: str
+    count: int
+    reason: Literal["void", "unissued", "open"]
+
+
+# ============================================================
+# CARTS (open sales held server-side)
+# ============================================================
+
+
+class CartCreate(BaseModel):
+    terminal_id: Optional[UUID] = None
+    customer_id: Optional[UUID] = None
+    notes: Optional[str] = None
+
+
+class CartLineAdd(BaseModel):
+    item_id: UUID
+    quantity: Decimal = Decimal("1")
+    unit_price: Optional[Decimal] = None   # defaults to the item's price
+    discount_amount: Decimal = Decimal("0")
+    tax_id: Optional[UUID] = None          # defaults to the item's tax
+    tax_group_id: Optional[UUID] = None
+    description: Optional[str] = None
+
+
+class CartLineUpdate(BaseModel):
+    quantity: Optional[Decimal] = None
+    discount_amount: Optional[Decimal] = None
+
+
+class CartLineRead(BaseModel):
+    line_number: int
+    item_id: UUID
+    description: Optional[str] = None
+    quantity: Decimal
+    unit_price: Decimal
+    discount_amount: Decimal
+    promotion_id: Optional[UUID] = None
+    promotion_discount: Decimal
+    tax_id: Optional[UUID] = None
+    tax_group_id: Optional[UUID] = None
+    line_subtotal: Decimal
+    tax_amount: Decimal
+    line_total: Decimal
+
+
+class CartRead(BaseModel):
+    cart_id: UUID
+    org_id: UUID
+    terminal_id: Optional[UUID] = None
+    customer_id: Optional[UUID] = None
+    notes: Optional[str] = None
+    lines: List[CartLineRead]
+    subtotal: Decimal
+    tax_total: Decimal
+    tax_breakdown: List[TaxBreakdownRead]
+    discount_total: Decimal
+    rounding_adjustment: Decimal
+    grand_total: Decimal
+    expires_at: Optional[datetime] = None
+
+
+class CartCommit(BaseModel):
+    status: str = "completed"
+    sale_number: Optional[str] = None
+    notes: Optional[str] = None
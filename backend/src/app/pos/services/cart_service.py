@@ -0,0 +1,325 @@
+# backend/src/app/pos/services/cart_service.py
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core.base_repository import BaseRepository
+from src.app.core.config import settings
+from src.app.pos.models.cart_models import CartSnapshot
+from src.app.pos.models.sale_models import Sale, SaleLine
+from src.app.pos.schemas.pos_schemas import CartLineRead, CartRead, TaxBreakdownRead
+from src.app.pos.services.carts import Cart, CartLine, CartStore
+from src.app.pos.services.checkout_service import checkout_service
+from src.app.pos.services.compiled_tax import NO_TAX, CompiledTax, compile_rate
+from src.app.pos.services.money import to_decimal
+from src.app.pos.services.pricing_policy import policy_for
+from src.app.pos.services.promotion_service import promotion_service
+from src.app.pos.services.sales_service import sales_service
+from src.app.pos.services.tax_group_service import tax_group_service
+from src.app.org.services.organization_settings_service import get_org_settings
+
+
+# Open carts live in the worker that created them (sticky per terminal)
+cart_store = CartStore(settings.cart_ttl_seconds, settings.cart_max_open)
+
+
+def _uuid(value: Optional[str]) -> Optional[UUID]:
+    return UUID(value) if value is not None else None
+
+
+class CartService(BaseRepository[CartSnapshot]):
+    """
+    Open carts: each change prices one line and moves the running totals
+    (see carts.Cart). Item, tax and promotion lookups go through the same
+    loaders and per-worker caches as checkout_service.
+    """
+
+    def __init__(self, store: CartStore, persist: bool) -> None:
+        super().__init__(CartSnapshot)
+        self.store = store
+        self.persist = persist
+
+    # ---------------------------------------------------------
+    # LOOKUP
+    # ---------------------------------------------------------
+    async def get_cart(
+        self,
+        session: AsyncSession,
+        org_id: UUID,
+        cart_id: UUID,
+    ) -> Optional[Cart]:
+        cart = self.store.get(cart_id)
+        if cart is None and self.persist:
+            cart = await self._restore(session, cart_id)
+        if cart is None or cart.org_id != org_id:
+            return None
+        return cart
+
+    # ---------------------------------------------------------
+    # TAX RESOLUTION
+    # ---------------------------------------------------------
+    async def _taxes(
+        self,
+        session: AsyncSession,
+        org_id: UUID,
+        specs: Sequence[Tuple[Optional[UUID], Optional[UUID]]],
+    ) -> List[CompiledTax]:
+        """Compiled tax for each (tax_id, tax_group_id); a group wins over a rate."""
+        group_ids = {group_id for _, group_id in specs if group_id is not None}
+        tax_ids = [tax_id for tax_id, group_id in specs if tax_id is not None and group_id is None]
+
+        groups = await tax_group_service.compiled(session, org_id, group_ids) if group_ids else {}
+        rates = {
+            rate.tax_id: compile_rate(rate)
+            for rate in await checkout_service.load_tax_rates(session, org_id, tax_ids)
+        }
+
+        taxes = []
+        for tax_id, group_id in specs:
+            if group_id is not None:
+                tax = groups.get(group_id)
+                if tax is None:
+                    raise ValueError(f"Invalid tax group: {group_id}")
+            elif tax_id is not None:
+                tax = rates.get(tax_id)
+                if tax is None:
+                    raise ValueError(f"Invalid tax rate: {tax_id}")
+            else:
+                tax = NO_TAX
+            taxes.append(tax)
+        return taxes
+
+    # ---------------------------------------------------------
+    # CART OPERATIONS
+    # ---------------------------------------------------------
+    async def create_cart(
+        self,
+        session: AsyncSession,
+        org_id: UUID,
+        data: Dict[str, Any],
+        created_by: Optional[UUID] = None,
+    ) -> Cart:
+        cart = Cart(org_id, created_by=created_by, **data)
+        self.store.put(cart)
+
+        if self.persist:
+            await session.execute(delete(CartSnapshot).where(CartSnapshot.expires_at < func.now()))
+            await self._save(session, cart)
+        return cart
+
+    async def add_line(
+        self,
+        session: AsyncSession,
+        cart: Cart,
+        data: Dict[str, Any],
+    ) -> CartLine:
+        items = await checkout_service.load_items(session, cart.org_id, [data["item_id"]])
+        if not items:
+            raise ValueError(f"Item not found or not in this org: {data['item_id']}")
+        item = items[0]
+
+        # Same fallback as the checkout engine: the item's group, else its rate
+        tax_id, tax_group_id = data.get("tax_id"), data.get("tax_group_id")
+        if tax_id is None and tax_group_id is None:
+            tax_group_id = item.tax_group_id
+            if tax_group_id is None:
+                tax_id = item.tax_id
+        (tax,) = await self._taxes(session, cart.org_id, [(tax_id, tax_group_id)])
+
+        unit_price = data.get("unit_price")
+        line = cart.add_line(CartLine(
+            item_id=item.item_id,
+            quantity=Decimal(data["quantity"]),
+            unit_price=Decimal(unit_price if unit_price is not None else item.default_price),
+            discount_amount=Decimal(data.get("discount_amount") or 0),
+            tax=tax,
+            tax_id=tax_id,
+            tax_group_id=tax_group_id,
+            description=data.get("description") or item.name,
+        ))
+
+        await self._settle(session, cart)
+        return line
+
+    async def update_line(
+        self,
+        session: AsyncSession,
+        cart: Cart,
+        line_number: int,
+        data: Dict[str, Any],
+    ) -> CartLine:
+        """Raises KeyError for a line the cart doesn't have."""
+        line = cart.update_line(
+            line_number,
+            quantity=data.get("quantity"),
+            discount_amount=data.get("discount_amount"),
+        )
+        await self._settle(session, cart)
+        return line
+
+    async def remove_line(
+        self,
+        session: AsyncSession,
+        cart: Cart,
+        line_number: int,
+    ) -> CartLine:
+        """Raises KeyError for a line the cart doesn't have."""
+        line = cart.remove_line(line_number)
+        await self._settle(session, cart)
+        return line
+
+    async def discard(self, session: AsyncSession, cart: Cart) -> None:
+        self.store.pop(cart.cart_id)
+        if self.persist:
+            await session.execute(delete(CartSnapshot).where(CartSnapshot.cart_id == cart.cart_id))
+
+    async def _settle(self, session: AsyncSession, cart: Cart) -> None:
+        """After a line change: re-run promotions, then snapshot if enabled."""
+        promotions = await promotion_service.index_for(session, cart.org_id)
+        cart.apply_promotions(promotions, datetime.now(timezone.utc))
+        if self.persist:
+            await self._save(session, cart)
+
+    # ---------------------------------------------------------
+    # COMMIT → SALE
+    # ---------------------------------------------------------
+    async def commit(
+        self,
+        session: AsyncSession,
+        cart: Cart,
+        data: Dict[str, Any],
+    ) -> Tuple[Sale, List[SaleLine]]:
+        if not cart.lines:
+            raise ValueError("A sale must contain at least one line.")
+
+        sale_date = datetime.now(timezone.utc)
+
+        # A promotion may have started or ended since the last change
+        promotions = await promotion_service.index_for(session, cart.org_id)
+        cart.apply_promotions(promotions, sale_date)
+
+        sale, lines = await sales_service.create_from_cart(
+            session,
+            cart,
+            status=data["status"],
+            sale_date=sale_date,
+            rounding_adjustment=await self._rounding_adjustment(session, cart),
+            sale_number=data.get("sale_number"),
+            notes=data.get("notes"),
+        )
+        if self.persist:
+            await session.execute(delete(CartSnapshot).where(CartSnapshot.cart_id == cart.cart_id))
+
+        await session.commit()
+        self.store.pop(cart.cart_id)
+        return sale, lines
+
+    # ---------------------------------------------------------
+    # PERSISTENCE (CART_PERSIST)
+    # ---------------------------------------------------------
+    async def _save(self, session: AsyncSession, cart: Cart) -> None:
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=self.store.ttl_seconds)
+        stmt = insert(CartSnapshot).values(
+            cart_id=cart.cart_id,
+            org_id=cart.org_id,
+            data=cart.to_snapshot(),
+            expires_at=expires_at,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CartSnapshot.cart_id],
+            set_={"data": stmt.excluded.data, "expires_at": stmt.excluded.expires_at, "updated_at": func.now()},
+        )
+        await session.execute(stmt)
+
+    async def _restore(self, session: AsyncSession, cart_id: UUID) -> Optional[Cart]:
+        stmt = select(CartSnapshot).where(
+            CartSnapshot.cart_id == cart_id,
+            CartSnapshot.expires_at > func.now(),
+        )
+        snapshot = (await session.execute(stmt)).scalar_one_or_none()
+        if snapshot is None:
+            return None
+
+        data = snapshot.data
+        cart = Cart(
+            snapshot.org_id,
+            terminal_id=_uuid(data["terminal_id"]),
+            customer_id=_uuid(data["customer_id"]),
+            created_by=_uuid(data["created_by"]),
+            notes=data["notes"],
+            cart_id=snapshot.cart_id,
+        )
+
+        entries = data["lines"]
+        taxes = await self._taxes(session, cart.org_id, [
+            (_uuid(entry["tax_id"]), _uuid(entry["tax_group_id"])) for entry in entries
+        ])
+        for entry, tax in zip(entries, taxes):
+            cart.add_line(CartLine(
+                item_id=UUID(entry["item_id"]),
+                quantity=Decimal(entry["quantity"]),
+                unit_price=Decimal(entry["unit_price"]),
+                discount_amount=Decimal(entry["discount_amount"]),
+                tax=tax,
+                tax_id=_uuid(entry["tax_id"]),
+                tax_group_id=_uuid(entry["tax_group_id"]),
+                description=entry["description"],
+                line_number=entry["line_number"],
+            ))
+        cart.next_line_number = max(cart.next_line_number, data["next_line_number"])
+
+        promotions = await promotion_service.index_for(session, cart.org_id)
+        cart.apply_promotions(promotions, datetime.now(timezone.utc))
+
+        self.store.put(cart)
+        return cart
+
+    # ---------------------------------------------------------
+    # READ MODEL
+    # ---------------------------------------------------------
+    async def _rounding_adjustment(self, session: AsyncSession, cart: Cart) -> Decimal:
+        # No payments on a cart: cash_only rounding waits for the tender
+        policy = policy_for(await get_org_settings(session, cart.org_id))
+        return policy.rounding_adjustment(to_decimal(cart.grand_total), ())
+
+    async def to_read(self, session: AsyncSession, cart: Cart) -> CartRead:
+        rounding_adjustment = await self._rounding_adjustment(session, cart)
+        return CartRead(
+            cart_id=cart.cart_id,
+            org_id=cart.org_id,
+            terminal_id=cart.terminal_id,
+            customer_id=cart.customer_id,
+            notes=cart.notes,
+            lines=[
+                CartLineRead(
+                    line_number=line.line_number,
+                    item_id=line.item_id,
+                    description=line.description,
+                    tax_id=line.tax_id,
+                    tax_group_id=line.tax_group_id,
+                    **line.result.as_dict(),
+                )
+                for line in cart.lines.values()
+            ],
+            subtotal=to_decimal(cart.subtotal),
+            tax_total=to_decimal(cart.tax_total),
+            tax_breakdown=[
+                TaxBreakdownRead(tax_id=tax_id, tax_amount=to_decimal(amount))
+                for tax_id, amount in cart.tax_breakdown().items()
+            ],
+            discount_total=to_decimal(cart.discount_total),
+            rounding_adjustment=rounding_adjustment,
+            grand_total=to_decimal(cart.grand_total) + rounding_adjustment,
+            expires_at=self.store.expires_at(cart.cart_id),
+        )
+
+
+cart_service = CartService(cart_store, persist=settings.cart_persist)
@@ -0,0 +1,328 @@
+# backend/src/app/pos/services/carts.py
+"""
+Open carts held in process, with running totals.
+
+Adding, changing or removing a line prices that one line (with the same
+math as CheckoutCalculator) and moves the cart's aggregates by the
+difference. Promotions are re-run over the cart after each change, but only
+lines whose promotion or discount actually changed are re-priced.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from uuid import UUID, uuid4
+
+from src.app.pos.services.checkout import CheckoutCalculator, LineResult
+from src.app.pos.services.compiled_tax import NO_TAX, CompiledTax
+from src.app.pos.services.money import Money, scale
+from src.app.pos.services.promotions import PromoLine, PromotionIndex
+
+
+_ZERO = Decimal("0")
+
+
+# ---------------------------------------------------------
+# CART LINE
+# ---------------------------------------------------------
+class CartLine:
+    """One priced line; inputs plus the result it contributed to the totals."""
+
+    __slots__ = (
+        "line_number", "item_id", "description", "quantity", "unit_price",
+        "discount_amount", "tax_id", "tax_group_id", "tax",
+        "promotion_id", "promotion_discount", "result",
+    )
+
+    def __init__(
+        self,
+        item_id: UUID,
+        quantity: Decimal,
+        unit_price: Decimal,
+        discount_amount: Decimal = _ZERO,
+        tax: CompiledTax = NO_TAX,
+        tax_id: Optional[UUID] = None,
+        tax_group_id: Optional[UUID] = None,
+        description: Optional[str] = None,
+        line_number: Optional[int] = None,
+    ):
+        self.line_number = line_number
+        self.item_id = item_id
+        self.description = description
+        self.quantity = quantity
+        self.unit_price = unit_price
+        self.discount_amount = discount_amount
+        self.tax_id = tax_id
+        self.tax_group_id = tax_group_id
+        self.tax = tax
+        self.promotion_id: Optional[UUID] = None
+        self.promotion_discount = _ZERO
+        self.result: Optional[LineResult] = None
+
+    @property
+    def base(self) -> Decimal:
+        """Amount a promotion can discount (after the line's own discount)."""
+        return self.quantity * self.unit_price - self.discount_amount
+
+    def price(self) -> None:
+        self.result = CheckoutCalculator.price_line(
+            self.quantity,
+            self.unit_price,
+            self.discount_amount,
+            self.promotion_id,
+            self.promotion_discount,
+            self.tax,
+        )
+
+
+# ---------------------------------------------------------
+# CART
+# ---------------------------------------------------------
+class Cart:
+    """
+    An open sale. Totals are kept as running sums of line contributions
+    (int minor units, like the engine's), so a change costs one line, not
+    the whole cart.
+    """
+
+    __slots__ = (
+        "cart_id", "org_id", "terminal_id", "customer_id", "created_by", "notes",
+        "lines", "next_line_number",
+        "subtotal", "tax_total", "discount_total", "grand_total", "taxable_bases",
+    )
+
+    def __init__(
+        self,
+        org_id: UUID,
+        terminal_id: Optional[UUID] = None,
+        customer_id: Optional[UUID] = None,
+        created_by: Optional[UUID] = None,
+        notes: Optional[str] = None,
+        cart_id: Optional[UUID] = None,
+    ):
+        self.cart_id = cart_id or uuid4()
+        self.org_id = org_id
+        self.terminal_id = terminal_id
+        self.customer_id = customer_id
+        self.created_by = created_by
+        self.notes = notes
+        self.lines: Dict[int, CartLine] = {}
+        self.next_line_number = 1
+
+        self.subtotal = 0
+        self.tax_total = 0
+        self.discount_total = 0
+        self.grand_total = 0
+        # Pre-tax amount charged under each distinct rate/group
+        self.taxable_bases: Dict[CompiledTax, int] = {}
+
+    # -------------------------------------------------------
+    # AGGREGATES
+    # -------------------------------------------------------
+    def _contribute(self, line: CartLine, sign: int) -> None:
+        result = line.result
+        self.subtotal += sign * result.line_subtotal
+        self.tax_total += sign * result.tax_amount
+        self.discount_total += sign * (result.discount_amount + result.promotion_discount)
+        self.grand_total += sign * result.line_total
+
+        if line.tax is not NO_TAX:
+            base = self.taxable_bases.get(line.tax, 0) + sign * result.line_subtotal
+            if base:
+                self.taxable_bases[line.tax] = base
+            else:
+                self.taxable_bases.pop(line.tax, None)
+
+    def _reprice(self, line: CartLine, **changes: Any) -> None:
+        """Swap a line's contribution for its contribution after `changes`."""
+        def value(name: str) -> Any:
+            return changes.get(name, getattr(line, name))
+
+        # Raises before anything is touched if the change is invalid
+        result = CheckoutCalculator.price_line(
+            value("quantity"),
+            value("unit_price"),
+            value("discount_amount"),
+            value("promotion_id"),
+            value("promotion_discount"),
+            line.tax,
+        )
+
+        self._contribute(line, -1)
+        for name, new in changes.items():
+            setattr(line, name, new)
+        line.result = result
+        self._contribute(line, 1)
+
+    def tax_breakdown(self) -> Dict[UUID, Money]:
+        breakdown: Dict[UUID, Money] = {}
+        for tax, base in self.taxable_bases.items():
+            for tax_id, share in tax.components:
+                breakdown[tax_id] = breakdown.get(tax_id, 0) + scale(base, share.as_integer_ratio())
+        return breakdown
+
+    # -------------------------------------------------------
+    # LINE OPERATIONS
+    # -------------------------------------------------------
+    def add_line(self, line: CartLine) -> CartLine:
+        if line.quantity <= 0:
+            raise ValueError("Quantity must be greater than 0")
+        if line.discount_amount < 0:
+            raise ValueError("Discount amount cannot be negative")
+
+        line.price()
+
+        # Restored lines keep their number; new ones take the next free one
+        if line.line_number is None:
+            line.line_number = self.next_line_number
+        self.next_line_number = max(self.next_line_number, line.line_number + 1)
+
+        self.lines[line.line_number] = line
+        self._contribute(line, 1)
+        return line
+
+    def update_line(
+        self,
+        line_number: int,
+        quantity: Optional[Decimal] = None,
+        discount_amount: Optional[Decimal] = None,
+    ) -> CartLine:
+        line = self.lines[line_number]
+
+        changes: Dict[str, Any] = {}
+        if quantity is not None:
+            if quantity <= 0:
+                raise ValueError("Quantity must be greater than 0")
+            changes["quantity"] = quantity
+        if discount_amount is not None:
+            if discount_amount < 0:
+                raise ValueError("Discount amount cannot be negative")
+            changes["discount_amount"] = discount_amount
+
+        if changes:
+            # A promotion sized for the old quantity is settled by apply_promotions
+            if line.promotion_discount:
+                changes.update(promotion_id=None, promotion_discount=_ZERO)
+            self._reprice(line, **changes)
+        return line
+
+    def remove_line(self, line_number: int) -> CartLine:
+        line = self.lines.pop(line_number)
+        self._contribute(line, -1)
+        return line
+
+    def apply_promotions(self, promotions: PromotionIndex, at: datetime) -> None:
+        """Re-run the org's promotions; re-price only lines whose outcome changed."""
+        applied = {}
+        if len(promotions):
+            promo_lines = [
+                PromoLine(number, line.item_id, line.quantity, line.unit_price, line.base)
+                for number, line in self.lines.items()
+                if line.base > 0
+            ]
+            if promo_lines:
+                applied = promotions.apply(promo_lines, at)
+
+        for number, line in self.lines.items():
+            promotion_id, discount = applied.get(number, (None, _ZERO))
+            if promotion_id != line.promotion_id or discount != line.promotion_discount:
+                self._reprice(line, promotion_id=promotion_id, promotion_discount=discount)
+
+    # -------------------------------------------------------
+    # SNAPSHOT (inputs only; totals are rebuilt on restore)
+    # -------------------------------------------------------
+    def to_snapshot(self) -> Dict[str, Any]:
+        def _id(value: Optional[UUID]) -> Optional[str]:
+            return str(value) if value is not None else None
+
+        return {
+            "terminal_id": _id(self.terminal_id),
+            "customer_id": _id(self.customer_id),
+            "created_by": _id(self.created_by),
+            "notes": self.notes,
+            "next_line_number": self.next_line_number,
+            "lines": [
+                {
+                    "line_number": line.line_number,
+                    "item_id": str(line.item_id),
+                    "description": line.description,
+                    "quantity": str(line.quantity),
+                    "unit_price": str(line.unit_price),
+                    "discount_amount": str(line.discount_amount),
+                    "tax_id": _id(line.tax_id),
+                    "tax_group_id": _id(line.tax_group_id),
+                }
+                for line in self.lines.values()
+            ],
+        }
+
+
+# ---------------------------------------------------------
+# STORE (TTL + size bound)
+# ---------------------------------------------------------
+class CartStore:
+    """
+    cart_id -> Cart with a sliding TTL. Every access moves a cart to the
+    back, so the front is always the next to expire; eviction stops at the
+    first live cart. Past `max_carts`, the least recently used go first.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_carts: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_carts = max_carts
+        self._clock = clock
+        self._carts: "OrderedDict[UUID, List[Any]]" = OrderedDict()   # id -> [deadline, cart]
+
+    def __len__(self) -> int:
+        return len(self._carts)
+
+    def __iter__(self) -> Iterator[Cart]:
+        return (entry[1] for entry in self._carts.values())
+
+    def evict_expired(self) -> int:
+        now = self._clock()
+        evicted = 0
+        while self._carts:
+            cart_id, (deadline, _) = next(iter(self._carts.items()))
+            if deadline > now:
+                break
+            del self._carts[cart_id]
+            evicted += 1
+        return evicted
+
+    def get(self, cart_id: UUID) -> Optional[Cart]:
+        self.evict_expired()
+        entry = self._carts.get(cart_id)
+        if entry is None:
+            return None
+        entry[0] = self._clock() + self.ttl_seconds
+        self._carts.move_to_end(cart_id)
+        return entry[1]
+
+    def put(self, cart: Cart) -> None:
+        self.evict_expired()
+        self._carts[cart.cart_id] = [self._clock() + self.ttl_seconds, cart]
+        self._carts.move_to_end(cart.cart_id)
+        while len(self._carts) > self.max_carts:
+            self._carts.popitem(last=False)
+
+    def pop(self, cart_id: UUID) -> Optional[Cart]:
+        entry = self._carts.pop(cart_id, None)
+        return entry[1] if entry else None
+
+    def expires_at(self, cart_id: UUID) -> Optional[datetime]:
+        """Wall-clock expiry of a cart (the store itself runs on a monotonic clock)."""
+        entry = self._carts.get(cart_id)
+        if entry is None:
+            return None
+        remaining = max(0.0, entry[0] - self._clock())
+        return datetime.now(timezone.utc) + timedelta(seconds=remaining)
@@ -0,0 +1,130 @@
+# backend/src/app/pos/services/catalog_cache.py
+"""
+Per-worker cache of the catalog fields pricing needs.
+
+Entries are plain tuples read by column (no ORM hydration), shaped so the
+checkout engine can use them in place of Item / TaxRate. Writes to
+inv.items or pos.tax_rates bump the org's resource version, and the
+trigger that does that also NOTIFYs the invalidation bus (migration 0008),
+so every write path evicts the org's entries, bulk loads included.
+
+Eviction lands when the notification does, shortly after the write
+commits. Quotes may be that far behind; sales still price from the DB.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Dict, Iterable, List, NamedTuple, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core.invalidation import Invalidation, invalidation_bus
+from src.app.inventory.models.item_models import Item
+from src.app.pos.models.tax_rate_models import TaxRate
+
+
+ITEMS_RESOURCE = Item.__table__.fullname          # "inv.items"
+TAX_RATES_RESOURCE = TaxRate.__table__.fullname  # "pos.tax_rates"
+
+
+class CatalogItem(NamedTuple):
+    item_id: UUID
+    default_price: Decimal
+    tax_id: Optional[UUID]
+    tax_group_id: Optional[UUID]
+
+
+class CatalogTaxRate(NamedTuple):
+    tax_id: UUID
+    rate_percent: Decimal
+
+
+# ---------------------------------------------------------
+# Caches (per worker, per org)
+# ---------------------------------------------------------
+_items: Dict[UUID, Dict[UUID, CatalogItem]] = {}        # org -> items seen so far
+_tax_rates: Dict[UUID, List[CatalogTaxRate]] = {}       # org -> all its rates
+_items_generation = 0       # bumped on every invalidation
+_tax_rates_generation = 0
+
+
+def _invalidate_items(message: Invalidation) -> None:
+    global _items_generation
+    _items_generation += 1
+    if message.org_id is None:
+        _items.clear()
+    else:
+        _items.pop(message.org_id, None)
+
+
+def _invalidate_tax_rates(message: Invalidation) -> None:
+    global _tax_rates_generation
+    _tax_rates_generation += 1
+    if message.org_id is None:
+        _tax_rates.clear()
+    else:
+        _tax_rates.pop(message.org_id, None)
+
+
+invalidation_bus.subscribe(ITEMS_RESOURCE, _invalidate_items)
+invalidation_bus.subscribe(TAX_RATES_RESOURCE, _invalidate_tax_rates)
+
+
+class CatalogCache:
+    async def items(
+        self,
+        session: AsyncSession,
+        org_id: UUID,
+        item_ids: Iterable[UUID],
+    ) -> List[CatalogItem]:
+        """The org's items among `item_ids`; misses are loaded with one query."""
+        listening = invalidation_bus.listening
+        cached = _items.get(org_id, {}) if listening else {}
+
+        found: List[CatalogItem] = []
+        missing: List[UUID] = []
+        for item_id in set(item_ids):
+            hit = cached.get(item_id)
+            if hit is None:
+                missing.append(item_id)
+            else:
+                found.append(hit)
+
+        if not missing:
+            return found
+
+        generation = _items_generation
+        stmt = select(
+            Item.item_id, Item.default_price, Item.tax_id, Item.tax_group_id
+        ).where(Item.org_id == org_id, Item.item_id.in_(missing))
+        loaded = [CatalogItem(*row) for row in (await session.execute(stmt)).all()]
+
+        # A change that landed mid-read may have made these stale; use, don't cache
+        if listening and generation == _items_generation:
+            org_items = _items.setdefault(org_id, {})
+            for item in loaded:
+                org_items[item.item_id] = item
+
+        return found + loaded
+
+    async def tax_rates(self, session: AsyncSession, org_id: UUID) -> List[CatalogTaxRate]:
+        """Every tax rate of the org (a handful of rows, loaded together)."""
+        listening = invalidation_bus.listening
+        if listening:
+            cached = _tax_rates.get(org_id)
+            if cached is not None:
+                return cached
+
+        generation = _tax_rates_generation
+        stmt = select(TaxRate.tax_id, TaxRate.rate_percent).where(TaxRate.org_id == org_id)
+        rates = [CatalogTaxRate(*row) for row in (await session.execute(stmt)).all()]
+
+        if listening and generation == _tax_rates_generation:
+            _tax_rates[org_id] = rates
+        return rates
+
+
+catalog_cache = CatalogCache()
@@ -1,7 +1,7 @@
 # backend/src/app/pos/services/checkout.py
 
 from decimal import Decimal
-from typing import List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 from uuid import UUID
 from datetime import datetime
 
@@ -14,6 +14,75 @@ from src.app.pos.schemas.pos_schemas import (
 # FIXED IMPORTS
 from src.app.inventory.models.item_models import Item
 from src.app.pos.models.tax_rate_models import TaxRate
+from src.app.pos.services.compiled_tax import NO_TAX, CompiledTax, compile_rate
+from src.app.pos.services.money import ZERO, Money, scale, to_decimal, to_money
+from src.app.pos.services.pricing_policy import NO_ROUNDING, PricingPolicy
+from src.app.pos.services.promotions import EMPTY_INDEX, PromoLine, PromotionIndex
+
+
+# -------------------------------------------------------
+# RESULTS (Money fields are minor units, see money.py)
+# -------------------------------------------------------
+class LineResult(NamedTuple):
+    """One priced line. quantity / unit_price are the inputs as given."""
+    quantity: Decimal
+    unit_price: Decimal
+    discount_amount: Money
+    promotion_id: Optional[UUID]
+    promotion_discount: Money
+    line_subtotal: Money
+    tax_amount: Money
+    line_total: Money
+
+    def columns(self) -> Dict[str, Any]:
+        """SaleLine column values."""
+        return {
+            "quantity": self.quantity,
+            "unit_price": self.unit_price,
+            "discount_amount": to_decimal(self.discount_amount),
+            "promotion_id": self.promotion_id,
+            "promotion_discount": to_decimal(self.promotion_discount),
+            "tax_amount": to_decimal(self.tax_amount),
+            "line_total": to_decimal(self.line_total),
+        }
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {**self.columns(), "line_subtotal": to_decimal(self.line_subtotal)}
+
+
+class SaleResult(NamedTuple):
+    subtotal: Money
+    tax_total: Money
+    tax_breakdown: Tuple[Tuple[UUID, Money], ...]
+    discount_total: Money
+    rounding_adjustment: Money
+    grand_total: Money
+    amount_paid: Money
+    balance_due: Money
+    lines: List[LineResult]
+
+    def totals(self) -> Dict[str, Decimal]:
+        """Sale column values."""
+        return {
+            "subtotal": to_decimal(self.subtotal),
+            "tax_total": to_decimal(self.tax_total),
+            "discount_total": to_decimal(self.discount_total),
+            "rounding_adjustment": to_decimal(self.rounding_adjustment),
+            "grand_total": to_decimal(self.grand_total),
+            "amount_paid": to_decimal(self.amount_paid),
+            "balance_due": to_decimal(self.balance_due),
+        }
+
+    def as_dict(self) -> Dict[str, Any]:
+        """The SaleQuote shape."""
+        return {
+            **self.totals(),
+            "tax_breakdown": [
+                {"tax_id": tax_id, "tax_amount": to_decimal(amount)}
+                for tax_id, amount in self.tax_breakdown
+            ],
+            "lines": [line.as_dict() for line in self.lines],
+        }
 
 
 class CheckoutCalculator:
@@ -23,8 +92,13 @@ class CheckoutCalculator:
     Responsibilities:
       - Validate sale line values
       - Auto-fill defaults from Item
-      - Use TaxRate when available
+      - Use TaxRate / TaxGroup when available (one multiplier per line)
+      - Apply the org's promotions (indexed by item) across the whole cart
+      - Apply the org's PricingPolicy (cash rounding) to the sale total
       - Return pure calculation results (no DB access)
+
+    Money is summed as int minor units: each line's amounts are rounded to
+    0.0001 once, so the totals are exactly the sum of the stored lines.
     """
 
     # -------------------------------------------------------
@@ -51,47 +125,75 @@ class CheckoutCalculator:
     # -------------------------------------------------------
     # LINE CALCULATION
     # -------------------------------------------------------
-    def calculate_line(
-        self,
-        line: SaleLineCreate,
-        item: Item,
-        tax_rate: Optional[TaxRate],
-    ):
-        """
-        Hybrid calculation:
-        - Defaults unit_price from Item if not supplied
-        - Auto-use tax_rate if provided
-        """
+    @staticmethod
+    def unit_price(line: SaleLineCreate, item: Item) -> Decimal:
+        """Line price if supplied, else the item's default price."""
+        if line.unit_price is not None:
+            return Decimal(line.unit_price)
+        return Decimal(item.default_price)
 
-        qty = Decimal(line.quantity)
-        price = (
-            Decimal(line.unit_price)
-            if line.unit_price is not None
-            else Decimal(item.default_price)
-        )
-        discount = Decimal(line.discount_amount or 0)
+    @staticmethod
+    def default_tax(line: SaleLineCreate, item: Item) -> None:
+        """A line with no tax of its own takes the item's (a group wins over a single rate)."""
+        if line.tax_id is None and line.tax_group_id is None:
+            line.tax_group_id = item.tax_group_id
+            if line.tax_group_id is None:
+                line.tax_id = item.tax_id
+
+    @staticmethod
+    def price_line(
+        qty: Decimal,
+        price: Decimal,
+        discount: Decimal,
+        promotion_id: Optional[UUID],
+        promotion_discount: Decimal,
+        tax: CompiledTax,
+    ) -> LineResult:
+        """Price one line's numbers; amounts are rounded into minor units here."""
+        discount_amount = to_money(discount)
+        promotion_amount = to_money(promotion_discount)
 
         # Pre-tax amount
-        line_subtotal = qty * price - discount
+        line_subtotal = to_money(qty * price) - discount_amount - promotion_amount
         if line_subtotal < 0:
             raise ValueError("Line subtotal cannot be negative (discount too large)")
 
         # Tax calculation
-        if tax_rate:
-            tax_amount = (line_subtotal * Decimal(tax_rate.rate_percent)) / Decimal("100")
-        else:
-            tax_amount = Decimal("0")
+        tax_amount = scale(line_subtotal, tax.ratio)
 
-        line_total = line_subtotal + tax_amount
+        return LineResult(
+            qty,
+            price,
+            discount_amount,
+            promotion_id,
+            promotion_amount,
+            line_subtotal,
+            tax_amount,
+            line_subtotal + tax_amount,
+        )
 
-        return {
-            "quantity": qty,
-            "unit_price": price,
-            "discount_amount": discount,
-            "line_subtotal": line_subtotal,
-            "tax_amount": tax_amount,
-            "line_total": line_total,
-        }
+    def calculate_line(
+        self,
+        line: SaleLineCreate,
+        item: Item,
+        tax: CompiledTax = NO_TAX,
+        promotion_id: Optional[UUID] = None,
+        promotion_discount: Decimal = Decimal("0"),
+    ) -> LineResult:
+        """
+        Hybrid calculation:
+        - Defaults unit_price from Item if not supplied
+        - Promotion discount comes on top of the line's own discount_amount
+        - Tax is one multiply by the compiled rate/group, however many rates it stacks
+        """
+        return self.price_line(
+            Decimal(line.quantity),
+            self.unit_price(line, item),
+            Decimal(line.discount_amount or 0),
+            promotion_id,
+            promotion_discount,
+            tax,
+        )
 
     # -------------------------------------------------------
     # SALE CALCULATION
@@ -101,60 +203,104 @@ class CheckoutCalculator:
         sale: SaleCreate,
         items: List[Item],
         tax_rates: List[TaxRate],
-    ):
+        policy: PricingPolicy = NO_ROUNDING,
+        tax_groups: Optional[Dict[UUID, CompiledTax]] = None,
+        promotions: PromotionIndex = EMPTY_INDEX,
+    ) -> SaleResult:
         # Fast lookup maps
-        item_map = {str(item.item_id): item for item in items}
-        tax_map = {str(tax.tax_id): tax for tax in tax_rates}
+        item_map = {item.item_id: item for item in items}
+        tax_map = {tax.tax_id: tax for tax in tax_rates}
+        tax_groups = tax_groups or {}
+        compiled_rates: Dict[UUID, CompiledTax] = {}
+
+        # Pre-tax amount charged under each distinct rate/group
+        taxable_bases: Dict[CompiledTax, int] = {}
+
+        subtotal = 0
+        tax_total = 0
+        discount_total = 0
 
-        subtotal = Decimal("0")
-        tax_total = Decimal("0")
-        discount_total = Decimal("0")
-        grand_total = Decimal("0")
+        calculated_lines: List[LineResult] = []
 
-        calculated_lines = []
+        # Pass 1: resolve item + tax per line (promotions need the whole cart)
+        resolved = []
+        promo_lines = []
 
-        for line in sale.lines:
-            item = item_map.get(str(line.item_id))
+        for index, line in enumerate(sale.lines):
+            item = item_map.get(line.item_id)
             if not item:
                 raise ValueError(f"Item not found or not in this org: {line.item_id}")
 
             # Validate fields & rules
             self.validate_line(line, item)
 
-            # Auto-fill tax_id from item if missing
-            if line.tax_id is None:
-                line.tax_id = item.tax_id
+            # Auto-fill tax from item if missing
+            self.default_tax(line, item)
+
+            # Resolve tax
+            tax = NO_TAX
+            if line.tax_group_id:
+                tax = tax_groups.get(line.tax_group_id)
+                if tax is None:
+                    raise ValueError(f"Invalid tax group: {line.tax_group_id}")
+            elif line.tax_id:
+                tax = compiled_rates.get(line.tax_id)
+                if tax is None:
+                    tax_rate = tax_map.get(line.tax_id)
+                    if not tax_rate:
+                        raise ValueError(f"Invalid tax rate: {line.tax_id}")
+                    tax = compiled_rates[line.tax_id] = compile_rate(tax_rate)
+
+            resolved.append((line, item, tax))
+            if len(promotions):
+                qty = Decimal(line.quantity)
+                price = self.unit_price(line, item)
+                base = qty * price - Decimal(line.discount_amount or 0)
+                if base > 0:
+                    promo_lines.append(PromoLine(index, line.item_id, qty, price, base))
 
-            # Resolve tax rate
-            tax_rate = None
-            if line.tax_id:
-                tax_rate = tax_map.get(str(line.tax_id))
-                if not tax_rate:
-                    raise ValueError(f"Invalid tax rate: {line.tax_id}")
+        # Promotions: only the rules indexed under this cart's items are looked at
+        applied = promotions.apply(promo_lines, sale.sale_date) if promo_lines else {}
 
-            # Perform calculation
-            calc = self.calculate_line(line, item, tax_rate)
+        # Pass 2: price every line
+        for index, (line, item, tax) in enumerate(resolved):
+            promotion_id, promotion_discount = applied.get(index, (None, ZERO))
 
-            subtotal += calc["line_subtotal"]
-            tax_total += calc["tax_amount"]
-            discount_total += calc["discount_amount"]
-            grand_total += calc["line_total"]
+            result = self.calculate_line(line, item, tax, promotion_id, promotion_discount)
+            if tax is not NO_TAX:
+                taxable_bases[tax] = taxable_bases.get(tax, 0) + result.line_subtotal
 
-            calculated_lines.append(calc)
+            subtotal += result.line_subtotal
+            tax_total += result.tax_amount
+            discount_total += result.discount_amount + result.promotion_discount
+
+            calculated_lines.append(result)
+
+        # Per-rate split, from the taxable base of each distinct rate/group
+        tax_breakdown: Dict[UUID, int] = {}
+        for tax, base in taxable_bases.items():
+            for tax_id, share in tax.components:
+                tax_breakdown[tax_id] = tax_breakdown.get(tax_id, 0) + scale(base, share.as_integer_ratio())
+
+        # Cash rounding moves the total itself; lines stay exact
+        grand_total = subtotal + tax_total
+        rounding_adjustment = to_money(policy.rounding_adjustment(to_decimal(grand_total), sale.payments))
+        grand_total += rounding_adjustment
 
         # Payments
-        amount_paid = sum(Decimal(p.amount) for p in sale.payments)
-        balance_due = grand_total - amount_paid
+        amount_paid = sum(to_money(p.amount) for p in sale.payments)
 
-        return {
-            "subtotal": subtotal,
-            "tax_total": tax_total,
-            "discount_total": discount_total,
-            "grand_total": grand_total,
-            "amount_paid": amount_paid,
-            "balance_due": balance_due,
-            "lines": calculated_lines,
-        }
+        return SaleResult(
+            subtotal=subtotal,
+            tax_total=tax_total,
+            tax_breakdown=tuple(tax_breakdown.items()),
+            discount_total=discount_total,
+            rounding_adjustment=rounding_adjustment,
+            grand_total=grand_total,
+            amount_paid=amount_paid,
+            balance_due=grand_total - amount_paid,
+            lines=calculated_lines,
+        )
 
 
 checkout_engine = CheckoutCalculator()
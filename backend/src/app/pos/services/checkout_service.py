@@ -1,11 +1,11 @@
 # backend/src/app/pos/services/checkout_service.py
 
-from typing import List
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 from uuid import UUID
-from decimal import Decimal
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # ✔ FIXED: Import only Item from inventory
@@ -14,78 +14,81 @@ from src.app.inventory.models.item_models import Item
 # ✔ FIXED: Import TaxRate from POS where it actually exists
 from src.app.pos.models.tax_rate_models import TaxRate
 
-from src.app.pos.schemas.pos_schemas import (
-    SaleCreate,
-    SaleLineCreate,
-    PaymentCreate,
-)
+from src.app.pos.schemas.pos_schemas import SaleCreate
+from src.app.pos.services.checkout import SaleResult, checkout_engine
+from src.app.pos.services.compiled_tax import CompiledTax
+from src.app.pos.services.pricing_executor import pricing_executor
+from src.app.pos.services.pricing_policy import NO_ROUNDING, PricingPolicy, policy_for
+from src.app.pos.services.promotion_service import promotion_service
+from src.app.pos.services.promotions import EMPTY_INDEX, PromotionIndex
+from src.app.pos.services.tax_group_service import tax_group_service
+from src.app.org.services.organization_settings_service import get_or_create_org_settings
 
-# Placeholder — you can plug in real engine later
-checkout_engine = None
 
-
-class CheckoutService:
+@dataclass
+class CheckoutContext:
     """
-    Service layer:
-    - Pulls items/tax rates from DB
-    - Validates sale input
-    - Delegates all math to CheckoutCalculator
+    Everything a sale is validated and priced against, loaded once.
+
+    Validation and the engine both raise ValueError; CheckoutService turns
+    that into the one HTTP error path.
     """
 
+    items: Dict[UUID, Any]                  # item_id -> Item (or any row with its pricing fields)
+    tax_rates: Dict[UUID, Any]              # tax_id -> TaxRate
+    tax_groups: Dict[UUID, CompiledTax] = field(default_factory=dict)
+    policy: PricingPolicy = NO_ROUNDING
+    promotions: PromotionIndex = EMPTY_INDEX
+
     # ---------------------------------------------------------
     # VALIDATION
     # ---------------------------------------------------------
-    async def validate(self, session: AsyncSession, sale: SaleCreate):
-
+    def validate(self, sale: SaleCreate) -> None:
         # Basic required fields
         if len(sale.lines) == 0:
-            raise HTTPException(
-                status_code=400,
-                detail="A sale must contain at least one line."
-            )
-
-        # Collect item IDs + tax IDs
-        item_ids = [line.item_id for line in sale.lines]
-        tax_ids = [line.tax_id for line in sale.lines if line.tax_id is not None]
-
-        # Load from DB
-        db_items = await self.load_items(session, sale.org_id, item_ids)
-        db_taxes = await self.load_tax_rates(session, sale.org_id, tax_ids)
-
-        # ---- Validate Items ----
-        db_item_map = {item.item_id: item for item in db_items}
+            raise ValueError("A sale must contain at least one line.")
 
         for line in sale.lines:
-            if line.item_id not in db_item_map:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Item not found: {line.item_id}"
-                )
+            if line.item_id not in self.items:
+                raise ValueError(f"Item not found: {line.item_id}")
             if line.quantity <= 0:
-                raise HTTPException(
-                    status_code=400,
-                    detail="Quantity must be greater than zero."
-                )
+                raise ValueError("Quantity must be greater than zero.")
+            if line.tax_id and line.tax_id not in self.tax_rates:
+                raise ValueError(f"Tax rate not found: {line.tax_id}")
+            if line.tax_group_id and line.tax_group_id not in self.tax_groups:
+                raise ValueError(f"Tax group not found: {line.tax_group_id}")
 
-        # ---- Validate Tax Rates ----
-        db_tax_map = {tax.tax_id: tax for tax in db_taxes}
+        # ---- Validate Payments ----
+        if sum(p.amount for p in sale.payments) < 0:
+            raise ValueError("Payment amounts cannot be negative.")
 
-        for line in sale.lines:
-            if line.tax_id and line.tax_id not in db_tax_map:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Tax rate not found: {line.tax_id}"
-                )
+    # ---------------------------------------------------------
+    # CALCULATION (DELEGATES TO checkout_engine)
+    # ---------------------------------------------------------
+    def calculate(self, sale: SaleCreate) -> SaleResult:
+        # The engine maps whatever it is given, so hand it only this sale's items
+        items = [
+            self.items[item_id]
+            for item_id in {line.item_id for line in sale.lines}
+            if item_id in self.items
+        ]
+        return checkout_engine.calculate_sale(
+            sale,
+            items,
+            list(self.tax_rates.values()),
+            self.policy,
+            self.tax_groups,
+            self.promotions,
+        )
 
-        # ---- Validate Payments ----
-        total_payments = sum([p.amount for p in sale.payments])
-        if total_payments < 0:
-            raise HTTPException(
-                status_code=400,
-                detail="Payment amounts cannot be negative."
-            )
 
-        return True
+class CheckoutService:
+    """
+    Service layer:
+    - Loads a CheckoutContext (items + their taxes in one query)
+    - Validates and prices the sale against it
+    - Delegates all math to CheckoutCalculator
+    """
 
     # ---------------------------------------------------------
     # LOADERS
@@ -114,24 +117,73 @@ class CheckoutService:
         result = await session.execute(stmt)
         return list(result.scalars().all())
 
-    # ---------------------------------------------------------
-    # CALCULATION (DELEGATES TO checkout_engine)
-    # ---------------------------------------------------------
-    async def calculate(self, session: AsyncSession, sale: SaleCreate) -> dict:
-
-        item_ids = [line.item_id for line in sale.lines]
-        tax_ids = [line.tax_id for line in sale.lines if line.tax_id is not None]
-
-        items = await self.load_items(session, sale.org_id, item_ids)
-        tax_rates = await self.load_tax_rates(session, sale.org_id, tax_ids)
-
-        if checkout_engine is None:
-            raise HTTPException(
-                status_code=500,
-                detail="Checkout engine is not initialized."
+    async def load_context(self, session: AsyncSession, sale: SaleCreate, org_id: UUID) -> CheckoutContext:
+        """
+        Items and their default tax rates in one query (items LEFT JOIN
+        tax_rates). Only a line naming a rate that none of the sale's items
+        default to costs a second one. Groups, settings and promotions come
+        from their per-worker caches. Everything is scoped to `org_id`, the
+        caller's org, never to the org named in the payload.
+        """
+        items: Dict[UUID, Item] = {}
+        tax_rates: Dict[UUID, TaxRate] = {}
+
+        item_ids = list({line.item_id for line in sale.lines})
+        if item_ids:
+            stmt = (
+                select(Item, TaxRate)
+                .outerjoin(TaxRate, and_(TaxRate.tax_id == Item.tax_id, TaxRate.org_id == org_id))
+                .where(Item.org_id == org_id, Item.item_id.in_(item_ids))
             )
+            for item, tax_rate in (await session.execute(stmt)).all():
+                items[item.item_id] = item
+                if tax_rate is not None:
+                    tax_rates[tax_rate.tax_id] = tax_rate
+
+        extra_tax_ids = {
+            line.tax_id for line in sale.lines
+            if line.tax_id is not None and line.tax_id not in tax_rates
+        }
+        for tax_rate in await self.load_tax_rates(session, org_id, list(extra_tax_ids)):
+            tax_rates[tax_rate.tax_id] = tax_rate
+
+        # Compiled group multipliers are cached per worker
+        group_ids = {line.tax_group_id for line in sale.lines if line.tax_group_id is not None}
+        group_ids.update(item.tax_group_id for item in items.values() if item.tax_group_id is not None)
+        tax_groups = await tax_group_service.compiled(session, org_id, group_ids)
+
+        # Cached per worker; no query unless the org's settings changed
+        settings = await get_or_create_org_settings(session, org_id)
+
+        return CheckoutContext(
+            items=items,
+            tax_rates=tax_rates,
+            tax_groups=tax_groups,
+            policy=policy_for(settings),
+            # The org's compiled promotion index, cached per worker
+            promotions=await promotion_service.index_for(session, org_id),
+        )
 
-        return checkout_engine.calculate_sale(sale, items, tax_rates)
+    # ---------------------------------------------------------
+    # VALIDATE + CALCULATE (one context, one error path)
+    # ---------------------------------------------------------
+    async def calculate(
+        self,
+        session: AsyncSession,
+        sale: SaleCreate,
+        *,
+        org_id: UUID,
+        context: Optional[CheckoutContext] = None,
+    ) -> SaleResult:
+        if context is None:
+            context = await self.load_context(session, sale, org_id)
+
+        try:
+            context.validate(sale)
+            # Inline, or in the process pool for a very large sale
+            return await pricing_executor.calculate(context, sale)
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
 
 
 checkout_service = CheckoutService()
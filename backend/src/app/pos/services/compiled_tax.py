@@ -0,0 +1,66 @@
+# backend/src/app/pos/services/compiled_tax.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Iterable, Tuple
+from uuid import UUID
+
+
+_HUNDRED = Decimal("100")
+
+
+@dataclass(frozen=True)
+class CompiledTax:
+    """
+    A tax rate or tax group reduced to one multiplier on the pre-tax amount.
+
+    `components` keeps each rate's own share of the multiplier, in stack
+    order, so a sale can split its tax per rate from the taxable base alone.
+    `ratio` is the multiplier as an exact integer fraction, for the
+    engine's minor-unit math.
+    """
+
+    multiplier: Decimal
+    components: Tuple[Tuple[UUID, Decimal], ...]
+    ratio: Tuple[int, int] = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "ratio", self.multiplier.as_integer_ratio())
+        # Keys the per-rate taxable bases of every sale: hash the fields once
+        object.__setattr__(self, "_hash", hash((self.multiplier, self.components)))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    @property
+    def rate_percent(self) -> Decimal:
+        return self.multiplier * _HUNDRED
+
+
+NO_TAX = CompiledTax(Decimal("0"), ())
+
+
+def compile_rates(rates: Iterable[Tuple[UUID, Any, bool]]) -> CompiledTax:
+    """
+    Fold (tax_id, rate_percent, is_compound) in stack order.
+
+    A simple rate is charged on the price: share = r.
+    A compound rate is charged on the price plus every tax before it:
+    share = r * (1 + shares so far).
+    """
+    total = Decimal("0")
+    components = []
+    for tax_id, rate_percent, is_compound in rates:
+        rate = Decimal(rate_percent) / _HUNDRED
+        share = rate * (1 + total) if is_compound else rate
+        components.append((tax_id, share))
+        total += share
+    return CompiledTax(total, tuple(components))
+
+
+def compile_rate(tax_rate) -> CompiledTax:
+    """A single TaxRate is a one-rate stack (is_compound is moot on its own)."""
+    return compile_rates([(tax_rate.tax_id, tax_rate.rate_percent, False)])
@@ -1,6 +1,6 @@
 # backend/src/services/pos/customers.py
 
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import select
@@ -20,9 +20,10 @@ class CustomerService(BaseRepository[Customer]):
         org_id: UUID,
         limit: int = 100,
         offset: int = 0,
+        fields: Optional[Sequence[str]] = None,
     ) -> List[Customer]:
         stmt = (
-            select(Customer)
+            self._select(fields)
             .where(Customer.org_id == org_id)
             .where(Customer.deleted_at.is_(None))  # hide soft-deleted rows
             .order_by(Customer.created_at.desc())
@@ -30,7 +31,7 @@ class CustomerService(BaseRepository[Customer]):
             .offset(offset)
         )
         result = await session.execute(stmt)
-        return result.scalars().all()
+        return self._rows(result, fields)
 
     async def get_by_id(
         self,
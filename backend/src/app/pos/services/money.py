@@ -0,0 +1,49 @@
+# backend/src/app/pos/services/money.py
+"""
+Fixed-point money for the checkout engine.
+
+An amount is an int of minor units at the scale of the amount columns
+(Numeric(18, 4)), so 1 == 0.0001. Decimals are rounded into minor units
+once, half up, where they enter the engine (to_money) and turned back into
+Decimals where results leave it (to_decimal); everything in between is
+int arithmetic.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Any, NewType, Tuple
+
+
+SCALE = 4
+UNIT = 10 ** SCALE
+
+Money = NewType("Money", int)
+
+ZERO = Money(0)
+
+
+def to_money(amount: Any) -> Money:
+    """Decimal (or int / str) -> minor units, rounded half up."""
+    if not amount:
+        return ZERO
+    return Money(int((Decimal(amount) * UNIT).to_integral_value(ROUND_HALF_UP)))
+
+
+def to_decimal(amount: int) -> Decimal:
+    """Minor units -> Decimal with the column's four places."""
+    return Decimal(amount).scaleb(-SCALE)
+
+
+def round_div(numerator: int, denominator: int) -> int:
+    """numerator / denominator (denominator > 0), rounded half up like ROUND_HALF_UP."""
+    quotient, remainder = divmod(abs(numerator), denominator)
+    if 2 * remainder >= denominator:
+        quotient += 1
+    return quotient if numerator >= 0 else -quotient
+
+
+def scale(amount: int, ratio: Tuple[int, int]) -> Money:
+    """amount * numerator / denominator, rounded to the minor unit."""
+    numerator, denominator = ratio
+    return Money(round_div(amount * numerator, denominator))
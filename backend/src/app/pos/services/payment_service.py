@@ -1,6 +1,6 @@
 # backend/src/services/pos/payments.py
 
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import select
@@ -20,16 +20,17 @@ class PaymentService(BaseRepository[Payment]):
         org_id: UUID,
         limit: int = 100,
         offset: int = 0,
+        fields: Optional[Sequence[str]] = None,
     ) -> List[Payment]:
         stmt = (
-            select(Payment)
+            self._select(fields)
             .where(Payment.org_id == org_id)
             .order_by(Payment.created_at.desc())
             .limit(limit)
             .offset(offset)
         )
         result = await session.execute(stmt)
-        return result.scalars().all()
+        return self._rows(result, fields)
 
     async def get_by_sale(
         self,
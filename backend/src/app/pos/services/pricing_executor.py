@@ -0,0 +1,270 @@
+# backend/src/app/pos/services/pricing_executor.py
+"""
+Moves large pricing jobs off the event loop.
+
+Sales are priced inline, as before, until a call carries `min_lines` lines
+(one big B2B order, or a batch being re-priced). Past that, the sales are
+split into one chunk per worker and priced by the same engine in a
+ProcessPoolExecutor.
+
+What crosses the process boundary is kept small: UUIDs travel as ints and
+Decimals as str, a chunk carries only the catalog rows and promotion rules
+its own lines touch, and workers send back only the computed minor-unit
+ints. The parent rebuilds LineResult / SaleResult around its own inputs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, List, NamedTuple, Optional, Sequence, Union
+from uuid import UUID
+
+from src.app.core.config import settings
+from src.app.pos.schemas.pos_schemas import SaleCreate
+from src.app.pos.services.catalog_cache import CatalogItem, CatalogTaxRate
+from src.app.pos.services.checkout import CheckoutCalculator, LineResult, SaleResult, checkout_engine
+from src.app.pos.services.compiled_tax import CompiledTax
+from src.app.pos.services.promotions import PromotionIndex
+
+if TYPE_CHECKING:
+    from src.app.pos.services.checkout_service import CheckoutContext
+
+
+def _int(value: Optional[UUID]) -> Optional[int]:
+    return value.int if value is not None else None
+
+
+def _str(value: Any) -> Optional[str]:
+    return str(value) if value is not None else None
+
+
+# ---------------------------------------------------------
+# WORKER SIDE (ids stay ints; the engine only compares them)
+# ---------------------------------------------------------
+class _Line:
+    """The SaleLineCreate fields the engine reads (it fills tax ids in place)."""
+
+    __slots__ = ("item_id", "org_id", "quantity", "unit_price", "discount_amount", "tax_id", "tax_group_id")
+
+    def __init__(self, item_id, org_id, quantity, unit_price, discount_amount, tax_id, tax_group_id):
+        self.item_id = item_id
+        self.org_id = org_id
+        self.quantity = Decimal(quantity)
+        self.unit_price = Decimal(unit_price) if unit_price is not None else None
+        self.discount_amount = Decimal(discount_amount) if discount_amount is not None else None
+        self.tax_id = tax_id
+        self.tax_group_id = tax_group_id
+
+
+class _Payment(NamedTuple):
+    payment_method: str
+    amount: Decimal
+
+
+class _Sale(NamedTuple):
+    sale_date: datetime
+    payments: List[_Payment]
+    lines: List[_Line]
+
+
+def _price_chunk(catalog: tuple, sales: Sequence[tuple]) -> List[Union[tuple, str]]:
+    """Runs in a worker: packed catalog + sales -> packed result (or error text) per sale."""
+    items, tax_rates, tax_groups, policy, rules = catalog
+    items = [CatalogItem(item_id, Decimal(price), tax_id, group_id) for item_id, price, tax_id, group_id in items]
+    tax_rates = [CatalogTaxRate(tax_id, Decimal(rate)) for tax_id, rate in tax_rates]
+    tax_groups = {
+        group_id: CompiledTax(Decimal(multiplier), tuple((tax_id, Decimal(share)) for tax_id, share in components))
+        for group_id, multiplier, components in tax_groups
+    }
+    promotions = PromotionIndex(rules)
+
+    results: List[Union[tuple, str]] = []
+    for sale_date, payments, lines in sales:
+        sale = _Sale(
+            sale_date,
+            [_Payment(method, Decimal(amount)) for method, amount in payments],
+            [_Line(*line) for line in lines],
+        )
+        try:
+            result = checkout_engine.calculate_sale(sale, items, tax_rates, policy, tax_groups, promotions)
+        except ValueError as exc:
+            results.append(str(exc))
+            continue
+
+        results.append((
+            result.subtotal,
+            result.tax_total,
+            result.tax_breakdown,
+            result.discount_total,
+            result.rounding_adjustment,
+            result.grand_total,
+            result.amount_paid,
+            result.balance_due,
+            [line[2:] for line in result.lines],   # quantity / unit_price are the parent's
+        ))
+    return results
+
+
+# ---------------------------------------------------------
+# EXECUTOR
+# ---------------------------------------------------------
+class PricingExecutor:
+    """
+    Prices sales against a CheckoutContext, inline or in a process pool.
+    Results (or the ValueError a sale failed with) come back in order.
+    """
+
+    def __init__(self, min_lines: int, workers: Optional[int] = None) -> None:
+        self.min_lines = min_lines
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn: forking a process that holds DB connections and an event loop isn't safe
+            self._pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+        return self._pool
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def calculate(self, context: "CheckoutContext", sale: SaleCreate) -> SaleResult:
+        (result,) = await self.calculate_many(context, [sale])
+        if isinstance(result, ValueError):
+            raise result
+        return result
+
+    async def calculate_many(
+        self,
+        context: "CheckoutContext",
+        sales: Sequence[SaleCreate],
+    ) -> List[Union[SaleResult, ValueError]]:
+        total_lines = sum(len(sale.lines) for sale in sales)
+        if self.workers <= 0 or total_lines < self.min_lines:
+            return [self._calculate_inline(context, sale) for sale in sales]
+
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        chunks = self._chunks(sales, total_lines)
+        try:
+            packed = await asyncio.gather(*(
+                loop.run_in_executor(pool, _price_chunk, self._pack_catalog(context, chunk), self._pack_sales(context, chunk))
+                for chunk in chunks
+            ))
+        except BrokenProcessPool:
+            # A worker died (OOM kill etc.): start a fresh pool next time, price this call here
+            self.shutdown()
+            return [self._calculate_inline(context, sale) for sale in sales]
+
+        results: List[Union[SaleResult, ValueError]] = []
+        for chunk, chunk_results in zip(chunks, packed):
+            for sale, result in zip(chunk, chunk_results):
+                if isinstance(result, str):
+                    results.append(ValueError(result))
+                else:
+                    results.append(self._unpack_result(context, sale, result))
+        return results
+
+    @staticmethod
+    def _calculate_inline(context: "CheckoutContext", sale: SaleCreate) -> Union[SaleResult, ValueError]:
+        try:
+            return context.calculate(sale)
+        except ValueError as exc:
+            return exc
+
+    def _chunks(self, sales: Sequence[SaleCreate], total_lines: int) -> List[List[SaleCreate]]:
+        """Consecutive runs of sales with about the same number of lines each."""
+        target = -(-total_lines // self.workers)
+        chunks: List[List[SaleCreate]] = [[]]
+        lines = 0
+        for sale in sales:
+            if lines >= target:
+                chunks.append([])
+                lines = 0
+            chunks[-1].append(sale)
+            lines += len(sale.lines)
+        return chunks
+
+    # ---------------------------------------------------------
+    # PACKING
+    # ---------------------------------------------------------
+    @staticmethod
+    def _pack_catalog(context: "CheckoutContext", sales: Sequence[SaleCreate]) -> tuple:
+        item_ids = {line.item_id for sale in sales for line in sale.lines}
+        items = [context.items[item_id] for item_id in item_ids if item_id in context.items]
+
+        return (
+            [
+                (item.item_id.int, str(item.default_price), _int(item.tax_id), _int(item.tax_group_id))
+                for item in items
+            ],
+            [(rate.tax_id.int, str(rate.rate_percent)) for rate in context.tax_rates.values()],
+            [
+                (group_id.int, str(tax.multiplier), [(tax_id.int, str(share)) for tax_id, share in tax.components])
+                for group_id, tax in context.tax_groups.items()
+            ],
+            context.policy,
+            [
+                (promo, [item_id.int for item_id in scope])
+                for promo, scope in context.promotions.rules_for(item_ids)
+            ],
+        )
+
+    @staticmethod
+    def _pack_sales(context: "CheckoutContext", sales: Sequence[SaleCreate]) -> List[tuple]:
+        packed = []
+        for sale in sales:
+            lines = []
+            for line in sale.lines:
+                # Filled here, so the parent's lines end up as the engine would leave them
+                item = context.items.get(line.item_id)
+                if item is not None:
+                    CheckoutCalculator.default_tax(line, item)
+                lines.append((
+                    line.item_id.int,
+                    _int(line.org_id),
+                    str(line.quantity),
+                    _str(line.unit_price),
+                    _str(line.discount_amount),
+                    _int(line.tax_id),
+                    _int(line.tax_group_id),
+                ))
+            payments = [(p.payment_method, str(p.amount)) for p in sale.payments]
+            packed.append((sale.sale_date, payments, lines))
+        return packed
+
+    @staticmethod
+    def _unpack_result(context: "CheckoutContext", sale: SaleCreate, packed: tuple) -> SaleResult:
+        *totals, computed_lines = packed
+        subtotal, tax_total, breakdown, discount_total, rounding, grand_total, paid, balance = totals
+
+        lines = [
+            LineResult(
+                Decimal(line.quantity),
+                CheckoutCalculator.unit_price(line, context.items[line.item_id]),
+                *computed,
+            )
+            for line, computed in zip(sale.lines, computed_lines)
+        ]
+        return SaleResult(
+            subtotal=subtotal,
+            tax_total=tax_total,
+            tax_breakdown=tuple((UUID(int=tax_id), amount) for tax_id, amount in breakdown),
+            discount_total=discount_total,
+            rounding_adjustment=rounding,
+            grand_total=grand_total,
+            amount_paid=paid,
+            balance_due=balance,
+            lines=lines,
+        )
+
+
+pricing_executor = PricingExecutor(settings.pricing_pool_min_lines, settings.pricing_pool_workers)
@@ -0,0 +1,109 @@
+# backend/src/app/pos/services/pricing_policy.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, Iterable, Optional, Tuple
+
+from src.app.org.enums.models import RoundingApplyToEnum, RoundingModeEnum
+from src.app.org.schemas.organization_settings_schema import OrganizationSettingsRead
+from src.app.pos.schemas.pos_schemas import PaymentCreate
+
+
+# ---------------------------------------------------------
+# CONSTANTS
+# ---------------------------------------------------------
+ZERO = Decimal("0")
+_ONE = Decimal("1")
+
+ROUNDING_INCREMENTS: Dict[str, Optional[Decimal]] = {
+    RoundingModeEnum.NONE.value: None,
+    RoundingModeEnum.NICKEL.value: Decimal("0.05"),
+    RoundingModeEnum.DIME.value: Decimal("0.10"),
+    RoundingModeEnum.QUARTER.value: Decimal("0.25"),
+    RoundingModeEnum.DOLLAR.value: Decimal("1.00"),
+}
+
+# payment_method is free text; these are the values treated as cash
+CASH_METHODS = frozenset({"cash"})
+
+
+def is_cash(payment_method: str) -> bool:
+    return payment_method.strip().lower() in CASH_METHODS
+
+
+# ---------------------------------------------------------
+# POLICY
+# ---------------------------------------------------------
+@dataclass(frozen=True)
+class PricingPolicy:
+    """
+    An org's pricing rules, resolved once from its settings.
+
+    Rounding is "Swedish" rounding of the amount tendered: the total is
+    moved to the nearest increment (ties away from zero) and the difference
+    is reported as rounding_adjustment. With cash_only, only the part of the
+    total left for cash after non-cash payments is rounded, and only when
+    the sale has a cash payment.
+    """
+
+    rounding_mode: str = RoundingModeEnum.NONE.value
+    rounding_apply_to: str = RoundingApplyToEnum.NONE.value
+    increment: Optional[Decimal] = None
+
+    @property
+    def rounds(self) -> bool:
+        return self.increment is not None and self.rounding_apply_to != RoundingApplyToEnum.NONE.value
+
+    def round_amount(self, amount: Decimal) -> Decimal:
+        if self.increment is None:
+            return amount
+        return (amount / self.increment).quantize(_ONE, rounding=ROUND_HALF_UP) * self.increment
+
+    def rounding_adjustment(self, total: Decimal, payments: Iterable[PaymentCreate]) -> Decimal:
+        """Amount to add to `total` so the tendered amount lands on the increment."""
+        if not self.rounds:
+            return ZERO
+
+        if self.rounding_apply_to == RoundingApplyToEnum.ALL_PAYMENTS.value:
+            return self.round_amount(total) - total
+
+        # cash_only: round what is left for cash once card etc. are applied
+        has_cash = False
+        non_cash = ZERO
+        for payment in payments:
+            if is_cash(payment.payment_method):
+                has_cash = True
+            else:
+                non_cash += Decimal(payment.amount)
+
+        if not has_cash:
+            return ZERO
+
+        cash_due = total - non_cash
+        return self.round_amount(cash_due) - cash_due
+
+
+# ---------------------------------------------------------
+# PRECOMPILED TABLE
+# ---------------------------------------------------------
+# Every (mode, apply_to) combination is built at import, so resolving an
+# org's policy from its (cached) settings is a dict lookup per sale
+_POLICIES: Dict[Tuple[str, str], PricingPolicy] = {
+    (mode.value, apply_to.value): PricingPolicy(
+        rounding_mode=mode.value,
+        rounding_apply_to=apply_to.value,
+        increment=ROUNDING_INCREMENTS[mode.value],
+    )
+    for mode in RoundingModeEnum
+    for apply_to in RoundingApplyToEnum
+}
+
+NO_ROUNDING = _POLICIES[(RoundingModeEnum.NONE.value, RoundingApplyToEnum.NONE.value)]
+
+
+def policy_for(settings: Optional[OrganizationSettingsRead]) -> PricingPolicy:
+    if settings is None:
+        return NO_ROUNDING
+    return _POLICIES[(settings.rounding_mode, settings.rounding_apply_to)]
@@ -0,0 +1,251 @@
+# backend/src/app/pos/services/promotion_service.py
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core.base_repository import BaseRepository
+from src.app.core.invalidation import Invalidation, invalidation_bus
+from src.app.inventory.models.item_models import Item
+from src.app.pos.models.promotion_models import Promotion, PromotionItem
+from src.app.pos.schemas.pos_schemas import PromotionRead
+from src.app.pos.services.promotions import (
+    BOGO,
+    MIX_AND_MATCH,
+    PERCENT_OFF,
+    CompiledPromotion,
+    PromotionIndex,
+)
+
+
+PROMOTIONS_RESOURCE = "pos.promotions"
+
+# Columns the index needs (no ORM hydration for thousands of rules)
+_INDEX_COLUMNS = (
+    Promotion.promotion_id,
+    Promotion.kind,
+    Promotion.priority,
+    Promotion.percent_off,
+    Promotion.buy_quantity,
+    Promotion.get_quantity,
+    Promotion.bundle_quantity,
+    Promotion.bundle_price,
+    Promotion.starts_at,
+    Promotion.ends_at,
+)
+
+_RULE_FIELDS = (
+    "kind", "starts_at", "ends_at", "percent_off",
+    "buy_quantity", "get_quantity", "bundle_quantity", "bundle_price",
+)
+
+
+# ---------------------------------------------------------
+# Compiled index cache (per worker, one index per org)
+# ---------------------------------------------------------
+_indexes: Dict[UUID, PromotionIndex] = {}
+_generation = 0   # bumped on every invalidation
+
+
+def _invalidate(message: Invalidation) -> None:
+    global _generation
+    _generation += 1
+    if message.org_id is None:
+        _indexes.clear()
+    else:
+        _indexes.pop(message.org_id, None)
+
+
+invalidation_bus.subscribe(PROMOTIONS_RESOURCE, _invalidate)
+
+
+def validate_rule(rule: Dict[str, Any]) -> None:
+    """Raise ValueError unless the kind-specific parameters make sense."""
+    kind = rule["kind"]
+    percent = rule.get("percent_off")
+
+    if percent is not None and not (Decimal("0") < Decimal(percent) <= Decimal("100")):
+        raise ValueError("percent_off must be greater than 0 and at most 100")
+
+    if kind == PERCENT_OFF and percent is None:
+        raise ValueError("percent_off promotions need percent_off")
+
+    if kind == BOGO and not ((rule.get("buy_quantity") or 0) >= 1 and (rule.get("get_quantity") or 0) >= 1):
+        raise ValueError("bogo promotions need buy_quantity and get_quantity of at least 1")
+
+    if kind == MIX_AND_MATCH:
+        if (rule.get("bundle_quantity") or 0) < 2:
+            raise ValueError("mix_and_match promotions need bundle_quantity of at least 2")
+        if rule.get("bundle_price") is None or Decimal(rule["bundle_price"]) < 0:
+            raise ValueError("mix_and_match promotions need a non-negative bundle_price")
+
+    starts_at, ends_at = rule.get("starts_at"), rule.get("ends_at")
+    if starts_at and ends_at and starts_at >= ends_at:
+        raise ValueError("starts_at must be before ends_at")
+
+
+class PromotionService(BaseRepository[Promotion]):
+    def __init__(self) -> None:
+        super().__init__(Promotion)
+
+    # ---------------------------------------------------------
+    # READS
+    # ---------------------------------------------------------
+    async def get_by_org(
+        self,
+        session: AsyncSession,
+        org_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[Promotion]:
+        stmt = (
+            select(Promotion)
+            .where(Promotion.org_id == org_id)
+            .order_by(Promotion.priority.desc(), Promotion.name.asc())
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_by_id(
+        self,
+        session: AsyncSession,
+        promotion_id: UUID,
+    ) -> Optional[Promotion]:
+        stmt = select(Promotion).where(Promotion.promotion_id == promotion_id)
+        result = await session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    # ---------------------------------------------------------
+    # INDEX (cached)
+    # ---------------------------------------------------------
+    async def index_for(self, session: AsyncSession, org_id: UUID) -> PromotionIndex:
+        """The org's active promotions, compiled and keyed by item_id."""
+        listening = invalidation_bus.listening
+        if listening:
+            cached = _indexes.get(org_id)
+            if cached is not None:
+                return cached
+
+        generation = _generation
+        stmt = (
+            select(*_INDEX_COLUMNS, PromotionItem.item_id)
+            .join(PromotionItem, PromotionItem.promotion_id == Promotion.promotion_id)
+            .where(Promotion.org_id == org_id, Promotion.is_active.is_(True))
+        )
+        result = await session.execute(stmt)
+
+        compiled: Dict[UUID, CompiledPromotion] = {}
+        scopes: Dict[UUID, List[UUID]] = {}
+        for row in result.all():
+            promotion_id = row.promotion_id
+            if promotion_id not in compiled:
+                compiled[promotion_id] = CompiledPromotion.from_row(row)
+                scopes[promotion_id] = []
+            scopes[promotion_id].append(row.item_id)
+
+        index = PromotionIndex((compiled[pid], scopes[pid]) for pid in compiled)
+
+        # A change that landed mid-read may have made this stale; use, don't cache
+        if listening and generation == _generation:
+            _indexes[org_id] = index
+        return index
+
+    # ---------------------------------------------------------
+    # WRITES
+    # ---------------------------------------------------------
+    async def _check_items(
+        self,
+        session: AsyncSession,
+        org_id: UUID,
+        item_ids: Sequence[UUID],
+    ) -> None:
+        unique = set(item_ids)
+        stmt = select(func.count()).where(Item.org_id == org_id, Item.item_id.in_(unique))
+        if await session.scalar(stmt) != len(unique):
+            raise ValueError("Unknown item in item_ids")
+
+    async def create_promotion(
+        self,
+        session: AsyncSession,
+        org_id: UUID,
+        data: Dict[str, Any],
+    ) -> Promotion:
+        item_ids = data.pop("item_ids")
+        validate_rule(data)
+        await self._check_items(session, org_id, item_ids)
+
+        promotion = Promotion(
+            **data,
+            org_id=org_id,
+            items=[PromotionItem(item_id=item_id) for item_id in dict.fromkeys(item_ids)],
+        )
+        session.add(promotion)
+        await session.flush()
+        await session.refresh(promotion)
+
+        await invalidation_bus.publish(session, PROMOTIONS_RESOURCE, org_id)
+        return promotion
+
+    async def update_promotion(
+        self,
+        session: AsyncSession,
+        promotion: Promotion,
+        data: Dict[str, Any],
+    ) -> Promotion:
+        item_ids = data.pop("item_ids", None)
+        validate_rule({**{f: getattr(promotion, f) for f in _RULE_FIELDS}, **data})
+
+        for field, value in data.items():
+            setattr(promotion, field, value)
+
+        if item_ids is not None:
+            await self._check_items(session, promotion.org_id, item_ids)
+            promotion.items.clear()
+            await session.flush()
+            promotion.items.extend(PromotionItem(item_id=item_id) for item_id in dict.fromkeys(item_ids))
+
+        promotion.updated_at = func.now()
+        await session.flush()
+        await session.refresh(promotion)
+
+        await invalidation_bus.publish(session, PROMOTIONS_RESOURCE, promotion.org_id)
+        return promotion
+
+    async def delete_promotion(self, session: AsyncSession, promotion: Promotion) -> None:
+        await session.delete(promotion)
+        await session.flush()
+        await invalidation_bus.publish(session, PROMOTIONS_RESOURCE, promotion.org_id)
+
+    # ---------------------------------------------------------
+    # READ MODEL
+    # ---------------------------------------------------------
+    @staticmethod
+    def to_read(promotion: Promotion) -> PromotionRead:
+        return PromotionRead(
+            promotion_id=promotion.promotion_id,
+            org_id=promotion.org_id,
+            name=promotion.name,
+            kind=promotion.kind,
+            priority=promotion.priority,
+            is_active=promotion.is_active,
+            starts_at=promotion.starts_at,
+            ends_at=promotion.ends_at,
+            percent_off=promotion.percent_off,
+            buy_quantity=promotion.buy_quantity,
+            get_quantity=promotion.get_quantity,
+            bundle_quantity=promotion.bundle_quantity,
+            bundle_price=promotion.bundle_price,
+            item_ids=[link.item_id for link in promotion.items],
+            created_at=promotion.created_at,
+            updated_at=promotion.updated_at,
+        )
+
+
+promotion_service = PromotionService()
@@ -0,0 +1,238 @@
+# backend/src/app/pos/services/promotions.py
+"""
+Promotion rules compiled into a per-org index keyed by item_id.
+
+Evaluating a cart only looks at the rules indexed under the cart's own
+items, so its cost follows the cart, not the number of active promotions.
+
+Rules run highest priority first, and each sale line takes at most one
+promotion: the lines a rule uses (including the "buy" half of a BOGO)
+are no longer available to rules after it.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+from uuid import UUID
+
+
+PERCENT_OFF = "percent_off"
+BOGO = "bogo"
+MIX_AND_MATCH = "mix_and_match"
+PROMOTION_KINDS = (PERCENT_OFF, BOGO, MIX_AND_MATCH)
+
+_ZERO = Decimal("0")
+_CENT = Decimal("0.01")
+_HUNDRED = Decimal("100")
+
+
+def _cents(amount: Decimal) -> Decimal:
+    return amount.quantize(_CENT, rounding=ROUND_HALF_UP)
+
+
+def _utc(at: Optional[datetime]) -> Optional[datetime]:
+    """Naive datetimes (e.g. a sale_date sent without an offset) are taken as UTC."""
+    if at is None or at.tzinfo is not None:
+        return at
+    return at.replace(tzinfo=timezone.utc)
+
+
+# ---------------------------------------------------------
+# COMPILED RULE
+# ---------------------------------------------------------
+@dataclass(frozen=True)
+class CompiledPromotion:
+    promotion_id: UUID
+    kind: str
+    priority: int = 0
+    fraction_off: Decimal = _ZERO          # percent_off / 100
+    buy_quantity: int = 0
+    get_quantity: int = 0
+    bundle_quantity: int = 0
+    bundle_price: Decimal = _ZERO
+    starts_at: Optional[datetime] = None
+    ends_at: Optional[datetime] = None
+
+    @classmethod
+    def from_row(cls, promotion) -> "CompiledPromotion":
+        percent = promotion.percent_off
+        if percent is None and promotion.kind == BOGO:
+            percent = _HUNDRED
+        return cls(
+            promotion_id=promotion.promotion_id,
+            kind=promotion.kind,
+            priority=promotion.priority or 0,
+            fraction_off=Decimal(percent or 0) / _HUNDRED,
+            buy_quantity=promotion.buy_quantity or 0,
+            get_quantity=promotion.get_quantity or 0,
+            bundle_quantity=promotion.bundle_quantity or 0,
+            bundle_price=Decimal(promotion.bundle_price or 0),
+            starts_at=_utc(promotion.starts_at),
+            ends_at=_utc(promotion.ends_at),
+        )
+
+    def active_at(self, at: datetime) -> bool:
+        at = _utc(at)
+        if self.starts_at is not None and at < self.starts_at:
+            return False
+        if self.ends_at is not None and at >= self.ends_at:
+            return False
+        return True
+
+    @property
+    def sort_key(self):
+        return (-self.priority, self.promotion_id)
+
+
+class PromoLine(NamedTuple):
+    """The parts of a priced sale line a promotion needs."""
+    index: int
+    item_id: UUID
+    quantity: Decimal
+    unit_price: Decimal
+    base: Decimal          # quantity * unit_price - manual discount
+
+
+# ---------------------------------------------------------
+# EVALUATORS: eligible lines -> {line index: discount}
+# Every key is claimed, including lines discounted by 0.
+# ---------------------------------------------------------
+def _percent_off(promo: CompiledPromotion, lines: Sequence[PromoLine]) -> Dict[int, Decimal]:
+    return {line.index: min(line.base, _cents(line.base * promo.fraction_off)) for line in lines}
+
+
+def _bogo(promo: CompiledPromotion, lines: Sequence[PromoLine]) -> Dict[int, Decimal]:
+    set_size = promo.buy_quantity + promo.get_quantity
+    if promo.get_quantity <= 0 or set_size <= 0:
+        return {}
+
+    by_item: Dict[UUID, List[PromoLine]] = defaultdict(list)
+    for line in lines:
+        by_item[line.item_id].append(line)
+
+    discounts: Dict[int, Decimal] = {}
+    for item_lines in by_item.values():
+        units = sum(int(line.quantity) for line in item_lines)
+        free_units = (units // set_size) * promo.get_quantity
+        if free_units == 0:
+            continue
+
+        # The free units are the cheapest ones (matters with price overrides)
+        for line in sorted(item_lines, key=lambda l: l.unit_price):
+            take = min(free_units, int(line.quantity))
+            free_units -= take
+            discount = _cents(take * line.unit_price * promo.fraction_off)
+            discounts[line.index] = min(line.base, discount)
+
+    return discounts
+
+
+def _mix_and_match(promo: CompiledPromotion, lines: Sequence[PromoLine]) -> Dict[int, Decimal]:
+    if promo.bundle_quantity <= 0:
+        return {}
+
+    units = sum(int(line.quantity) for line in lines)
+    bundles = units // promo.bundle_quantity
+    if bundles == 0:
+        return {}
+
+    # Fill the bundles with the most expensive units
+    remaining = bundles * promo.bundle_quantity
+    taken: List[Tuple[PromoLine, Decimal]] = []
+    for line in sorted(lines, key=lambda l: l.unit_price, reverse=True):
+        if remaining == 0:
+            break
+        take = min(remaining, int(line.quantity))
+        if take:
+            taken.append((line, take * line.unit_price))
+            remaining -= take
+
+    bundled_value = sum((value for _, value in taken), _ZERO)
+    total_discount = _cents(bundled_value - bundles * promo.bundle_price)
+    if total_discount <= 0:
+        return {}
+
+    # Spread the discount over the lines in proportion to what they put in;
+    # the last line takes the rounding remainder
+    discounts: Dict[int, Decimal] = {}
+    left = total_discount
+    for position, (line, value) in enumerate(taken):
+        if position == len(taken) - 1:
+            share = left
+        else:
+            share = _cents(total_discount * value / bundled_value)
+        share = min(line.base, share)
+        discounts[line.index] = share
+        left -= share
+    return discounts
+
+
+_EVALUATORS: Dict[str, Callable[[CompiledPromotion, Sequence[PromoLine]], Dict[int, Decimal]]] = {
+    PERCENT_OFF: _percent_off,
+    BOGO: _bogo,
+    MIX_AND_MATCH: _mix_and_match,
+}
+
+
+# ---------------------------------------------------------
+# INDEX
+# ---------------------------------------------------------
+class PromotionIndex:
+    """Immutable item_id -> rules map for one org's active promotions."""
+
+    def __init__(self, promotions: Iterable[Tuple[CompiledPromotion, Iterable[UUID]]] = ()):
+        by_item: Dict[UUID, List[CompiledPromotion]] = defaultdict(list)
+        count = 0
+        for promo, item_ids in promotions:
+            count += 1
+            for item_id in item_ids:
+                by_item[item_id].append(promo)
+
+        self._by_item: Dict[UUID, Tuple[CompiledPromotion, ...]] = {
+            item_id: tuple(promos) for item_id, promos in by_item.items()
+        }
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def rules_for(self, item_ids: Iterable[UUID]) -> List[Tuple[CompiledPromotion, List[UUID]]]:
+        """The rules that can apply to `item_ids`, each scoped to just those items."""
+        scoped: Dict[UUID, Tuple[CompiledPromotion, List[UUID]]] = {}
+        for item_id in set(item_ids):
+            for promo in self._by_item.get(item_id, ()):
+                scoped.setdefault(promo.promotion_id, (promo, []))[1].append(item_id)
+        return list(scoped.values())
+
+    def apply(
+        self,
+        lines: Sequence[PromoLine],
+        at: datetime,
+    ) -> Dict[int, Tuple[UUID, Decimal]]:
+        """{line index: (promotion_id, discount)} for the lines a promotion took."""
+        at = _utc(at)
+        promos: Dict[UUID, CompiledPromotion] = {}
+        lines_by_promo: Dict[UUID, List[PromoLine]] = defaultdict(list)
+
+        for line in lines:
+            for promo in self._by_item.get(line.item_id, ()):
+                if promo.active_at(at):
+                    promos[promo.promotion_id] = promo
+                    lines_by_promo[promo.promotion_id].append(line)
+
+        applied: Dict[int, Tuple[UUID, Decimal]] = {}
+        for promo in sorted(promos.values(), key=lambda p: p.sort_key):
+            eligible = [line for line in lines_by_promo[promo.promotion_id] if line.index not in applied]
+            if not eligible:
+                continue
+            for index, discount in _EVALUATORS[promo.kind](promo, eligible).items():
+                applied[index] = (promo.promotion_id, discount)
+
+        return applied
+
+
+EMPTY_INDEX = PromotionIndex()
@@ -0,0 +1,93 @@
+# backend/src/app/pos/services/quote_service.py
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Sequence
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.pos.schemas.pos_schemas import SaleCreate
+from src.app.pos.services.catalog_cache import catalog_cache
+from src.app.pos.services.checkout_service import CheckoutContext
+from src.app.pos.services.pricing_executor import pricing_executor
+from src.app.pos.services.pricing_policy import policy_for
+from src.app.pos.services.promotion_service import promotion_service
+from src.app.pos.services.tax_group_service import tax_group_service
+from src.app.org.services.organization_settings_service import get_org_settings
+
+
+class QuoteService:
+    """
+    Prices sales without writing anything. Every input (items, tax rates,
+    tax groups, settings, promotions) comes from a per-worker cache, so a
+    warm quote runs no SQL at all.
+    """
+
+    async def quote_many(
+        self,
+        session: AsyncSession,
+        org_id: UUID,
+        sales: Sequence[SaleCreate],
+    ) -> List[Dict[str, Any]]:
+        """
+        One result per sale, in order: {"quote": <totals>} or {"error": <why>}.
+        The catalog is looked up once for the whole batch, and every sale is
+        validated and priced against the same CheckoutContext (in the process
+        pool when the batch is large enough).
+        """
+        item_ids = {line.item_id for sale in sales for line in sale.lines}
+        items = await catalog_cache.items(session, org_id, item_ids)
+        tax_rates = await catalog_cache.tax_rates(session, org_id)
+
+        group_ids = {
+            line.tax_group_id for sale in sales for line in sale.lines if line.tax_group_id is not None
+        }
+        group_ids.update(item.tax_group_id for item in items if item.tax_group_id is not None)
+        tax_groups = await tax_group_service.compiled(session, org_id, group_ids)
+
+        context = CheckoutContext(
+            items={item.item_id: item for item in items},
+            tax_rates={rate.tax_id: rate for rate in tax_rates},
+            tax_groups=tax_groups,
+            # An org without a settings row prices with the defaults
+            policy=policy_for(await get_org_settings(session, org_id)),
+            promotions=await promotion_service.index_for(session, org_id),
+        )
+
+        results: List[Dict[str, Any]] = []
+        valid: List[SaleCreate] = []
+        for sale in sales:
+            sale.org_id = org_id
+            try:
+                context.validate(sale)
+            except ValueError as exc:
+                results.append({"error": str(exc)})
+            else:
+                results.append({})
+                valid.append(sale)
+
+        priced = iter(await pricing_executor.calculate_many(context, valid))
+        for result in results:
+            if not result:
+                outcome = next(priced)
+                if isinstance(outcome, ValueError):
+                    result["error"] = str(outcome)
+                else:
+                    result["quote"] = outcome.as_dict()
+        return results
+
+    async def quote(
+        self,
+        session: AsyncSession,
+        org_id: UUID,
+        sale: SaleCreate,
+    ) -> Dict[str, Any]:
+        """Totals for one sale; raises ValueError if it can't be priced."""
+        (result,) = await self.quote_many(session, org_id, [sale])
+        if "error" in result:
+            raise ValueError(result["error"])
+        return result["quote"]
+
+
+quote_service = QuoteService()
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import select
@@ -40,16 +40,17 @@ class SaleLineService(BaseRepository[SaleLine]):
         org_id: UUID,
         limit: int = 100,
         offset: int = 0,
+        fields: Optional[Sequence[str]] = None,
     ) -> List[SaleLine]:
         stmt = (
-            select(SaleLine)
+            self._select(fields)
             .where(SaleLine.org_id == org_id)
             .order_by(SaleLine.created_at.desc())
             .limit(limit)
             .offset(offset)
         )
         result = await session.execute(stmt)
-        return result.scalars().all()
+        return self._rows(result, fields)
 
 
 sale_line_service = SaleLineService()
@@ -0,0 +1,212 @@
+# backend/src/app/pos/services/sale_number_service.py
+"""
+Sale numbers without a per-sale round-trip.
+
+Each worker leases blocks of `block_size` numbers per (org, terminal) by
+bumping the org's high-water mark in pos.sale_number_counters, records
+the block in pos.sale_number_leases, and then hands numbers out of memory.
+Numbers are unique and increase per terminal; across terminals (and
+workers) they interleave by block.
+
+Every number that never became a sale is accounted for: a lease closed
+normally records how far it got (used_through), so gaps() can tell a
+void number (handed out, sale never written) from an unissued tail.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core.base_repository import BaseRepository
+from src.app.core.config import settings
+from src.app.core.database import AsyncSessionLocal
+from src.app.pos.models.sale_number_models import SaleNumberCounter, SaleNumberLease
+
+
+LeaseKey = Tuple[UUID, Optional[UUID]]
+
+
+class _Lease:
+    __slots__ = ("lease_id", "next", "last")
+
+    def __init__(self, lease_id: UUID, first: int, last: int) -> None:
+        self.lease_id = lease_id
+        self.next = first
+        self.last = last
+
+
+_GAPS_SQL = text("""
+    WITH leases AS (
+        SELECT lease_id, terminal_id, first_number, last_number, used_through, closed_at
+        FROM pos.sale_number_leases
+        WHERE org_id = :org_id AND last_number >= :from_number
+        ORDER BY first_number
+        LIMIT :limit
+    ),
+    bounds AS (
+        SELECT lease_id, first_number - 1 AS seq FROM leases
+        UNION ALL
+        SELECT l.lease_id, s.sale_seq
+        FROM leases l
+        JOIN pos.sales s
+          ON s.org_id = :org_id AND s.sale_seq BETWEEN l.first_number AND l.last_number
+        UNION ALL
+        SELECT lease_id, last_number + 1 FROM leases
+    ),
+    runs AS (
+        SELECT lease_id, seq, lead(seq) OVER (PARTITION BY lease_id ORDER BY seq) AS next_seq
+        FROM bounds
+    )
+    SELECT l.terminal_id, l.last_number, l.used_through, l.closed_at,
+           r.seq + 1 AS gap_start, r.next_seq - 1 AS gap_end
+    FROM runs r
+    JOIN leases l USING (lease_id)
+    WHERE r.next_seq > r.seq + 1
+    ORDER BY gap_start
+""")
+
+
+class SaleNumberService(BaseRepository[SaleNumberLease]):
+    """
+    Per-worker sale number allocator. Leases commit in their own session
+    (`session_factory`), so a number stays taken even if the sale that
+    got it is rolled back.
+    """
+
+    def __init__(
+        self,
+        block_size: int,
+        width: int,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+    ) -> None:
+        super().__init__(SaleNumberLease)
+        self.block_size = block_size
+        self.width = width
+        self.session_factory = session_factory
+        self._leases: Dict[LeaseKey, _Lease] = {}
+        # Leasing is once per block; one lock keeps it to one connection at a time
+        self._lock = asyncio.Lock()
+
+    def format(self, seq: int) -> str:
+        return f"{seq:0{self.width}d}"
+
+    # ---------------------------------------------------------
+    # ALLOCATE
+    # ---------------------------------------------------------
+    async def allocate(self, org_id: UUID, terminal_id: Optional[UUID] = None) -> Tuple[int, str]:
+        """Next (sale_seq, sale_number) for the terminal; a DB round-trip only per block."""
+        key = (org_id, terminal_id)
+        lease = self._leases.get(key)
+        if lease is None or lease.next > lease.last:
+            async with self._lock:
+                lease = self._leases.get(key)
+                if lease is None or lease.next > lease.last:
+                    lease = await self._lease(org_id, terminal_id, lease)
+                    self._leases[key] = lease
+
+        seq = lease.next
+        lease.next += 1
+        return seq, self.format(seq)
+
+    async def _lease(self, org_id: UUID, terminal_id: Optional[UUID], spent: Optional[_Lease]) -> _Lease:
+        counter = SaleNumberCounter.__table__
+        bump = (
+            pg_insert(counter)
+            .values(org_id=org_id, high_water=self.block_size)
+            .on_conflict_do_update(
+                index_elements=[counter.c.org_id],
+                set_={
+                    "high_water": counter.c.high_water + self.block_size,
+                    "updated_at": func.now(),
+                },
+            )
+            .returning(counter.c.high_water)
+        )
+
+        async with self.session_factory() as session:
+            last = (await session.execute(bump)).scalar_one()
+            if spent is not None:
+                await self._close(session, spent, spent.last)
+            new = await self.create_returning(session, {
+                "org_id": org_id,
+                "terminal_id": terminal_id,
+                "first_number": last - self.block_size + 1,
+                "last_number": last,
+            })
+            lease = _Lease(new.lease_id, new.first_number, new.last_number)
+            await session.commit()
+
+        return lease
+
+    async def _close(self, session: AsyncSession, lease: _Lease, used_through: int) -> None:
+        await session.execute(
+            update(SaleNumberLease)
+            .where(SaleNumberLease.lease_id == lease.lease_id)
+            .values(used_through=used_through, closed_at=func.now())
+        )
+
+    # ---------------------------------------------------------
+    # RELEASE (worker shutdown)
+    # ---------------------------------------------------------
+    async def release_all(self) -> None:
+        """Close every held lease at the last number handed out."""
+        if not self._leases:
+            return
+        async with self._lock:
+            leases, self._leases = list(self._leases.values()), {}
+            async with self.session_factory() as session:
+                for lease in leases:
+                    await self._close(session, lease, lease.next - 1)
+                await session.commit()
+
+    # ---------------------------------------------------------
+    # GAP REPORT
+    # ---------------------------------------------------------
+    async def gaps(
+        self,
+        session: AsyncSession,
+        org_id: UUID,
+        from_number: int = 0,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """
+        Numbers missing from pos.sales, over the first `limit` leases that
+        end at or after `from_number`. Each gap is
+          - void:     handed out, but the sale was never written
+          - unissued: never handed out (the tail of a closed lease)
+          - open:     the tail of a lease still held (or lost in a crash)
+        """
+        result = await session.execute(
+            _GAPS_SQL, {"org_id": org_id, "from_number": from_number, "limit": limit}
+        )
+
+        gaps: List[Dict[str, Any]] = []
+
+        def add(row, start: int, end: int, reason: str) -> None:
+            gaps.append({
+                "terminal_id": row.terminal_id,
+                "first_number": self.format(start),
+                "last_number": self.format(end),
+                "count": end - start + 1,
+                "reason": reason,
+            })
+
+        for row in result:
+            start, end = row.gap_start, row.gap_end
+            if row.closed_at is None:
+                add(row, start, end, "open" if end == row.last_number else "void")
+                continue
+            if start <= row.used_through:
+                add(row, start, min(end, row.used_through), "void")
+            if end > row.used_through:
+                add(row, max(start, row.used_through + 1), end, "unissued")
+        return gaps
+
+
+sale_number_service = SaleNumberService(settings.sale_number_block_size, settings.sale_number_width)
@@ -1,18 +1,25 @@
 # backend/src/app/pos/services/sales.py
 
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from src.app.core.base_repository import BaseRepository
+from src.app.core.optimistic import check_version, with_retries
 from src.app.pos.models.sale_models import Sale, SaleLine
 from src.app.pos.models.payment_models import Payment
 from src.app.pos.schemas.pos_schemas import SaleCreate
 
 # ✔️ Corrected import
 from src.app.pos.services.checkout_service import checkout_service
+from src.app.pos.services.carts import Cart
+from src.app.pos.services.money import to_decimal
+from src.app.pos.services.sale_line_service import sale_line_service
+from src.app.pos.services.sale_number_service import sale_number_service
 
 
 class SalesService(BaseRepository[Sale]):
@@ -28,10 +35,11 @@ class SalesService(BaseRepository[Sale]):
         org_id: UUID,
         limit: int = 100,
         offset: int = 0,
+        fields: Optional[Sequence[str]] = None,
     ) -> List[Sale]:
 
         stmt = (
-            select(Sale)
+            self._select(fields)
             .where(
                 Sale.org_id == org_id,
                 Sale.status != "archived"
@@ -42,7 +50,7 @@ class SalesService(BaseRepository[Sale]):
         )
 
         result = await session.execute(stmt)
-        return result.scalars().all()
+        return self._rows(result, fields)
 
     # ---------------------------------------------------------
     # GET SINGLE SALE + RELATIONS (EXCLUDES ARCHIVED)
@@ -59,16 +67,26 @@ class SalesService(BaseRepository[Sale]):
                 Sale.sale_id == sale_id,
                 Sale.status != "archived"
             )
+            # Lazy loads can't run under asyncio; fetch both collections up front
+            .options(selectinload(Sale.sale_lines), selectinload(Sale.payments))
+            .execution_options(populate_existing=True)
         )
 
         result = await session.execute(stmt)
-        sale = result.scalar_one_or_none()
-
-        if sale:
-            _ = sale.sale_lines
-            _ = sale.payments
+        return result.scalar_one_or_none()
 
-        return sale
+    # ---------------------------------------------------------
+    # SALE NUMBER (client-supplied numbers are kept as-is, without a seq)
+    # ---------------------------------------------------------
+    @staticmethod
+    async def _number(
+        org_id: UUID,
+        terminal_id: Optional[UUID],
+        sale_number: Optional[str],
+    ) -> Tuple[Optional[int], str]:
+        if sale_number:
+            return None, sale_number
+        return await sale_number_service.allocate(org_id, terminal_id)
 
     # ---------------------------------------------------------
     # CREATE SALE — uses checkout engine
@@ -82,67 +100,118 @@ class SalesService(BaseRepository[Sale]):
     ) -> Sale:
 
         # Let engine calculate totals
-        calc = await checkout_service.calculate(session, payload)
+        calc = await checkout_service.calculate(session, payload, org_id=org_id)
+        sale_seq, sale_number = await self._number(org_id, payload.terminal_id, payload.sale_number)
 
         sale = Sale(
             org_id=org_id,
             terminal_id=payload.terminal_id,
             customer_id=payload.customer_id,
-            sale_number=payload.sale_number,
+            sale_number=sale_number,
+            sale_seq=sale_seq,
             status=payload.status,
             sale_type=payload.sale_type,
-            subtotal=calc["subtotal"],
-            tax_total=calc["tax_total"],
-            discount_total=calc["discount_total"],
-            grand_total=calc["grand_total"],
-            amount_paid=calc["amount_paid"],
-            balance_due=calc["balance_due"],
             sale_date=payload.sale_date,
             notes=payload.notes,
             created_by=payload.created_by,
+            **calc.totals(),
         )
 
         session.add(sale)
         await session.flush()
 
         # Sale lines
-        for raw_in, calc_out in zip(payload.lines, calc["lines"]):
+        for raw_in, calc_out in zip(payload.lines, calc.lines):
             line = SaleLine(
                 sale_id=sale.sale_id,
                 org_id=org_id,
                 item_id=raw_in.item_id,
                 line_number=raw_in.line_number,
                 description=raw_in.description,
-                quantity=calc_out["quantity"],
-                unit_price=calc_out["unit_price"],
-                discount_amount=calc_out["discount_amount"],
                 tax_id=raw_in.tax_id,
-                tax_amount=calc_out["tax_amount"],
-                line_total=calc_out["line_total"],
+                tax_group_id=raw_in.tax_group_id,
+                **calc_out.columns(),
             )
             session.add(line)
 
-        # Payments
+        # Payments (the table keeps external_ref as `reference`, and no
+        # currency or processed_at)
         for p in payload.payments:
             pay = Payment(
                 sale_id=sale.sale_id,
                 org_id=org_id,
                 payment_method=p.payment_method,
                 amount=p.amount,
-                currency=p.currency,
-                external_ref=p.external_ref,
-                processed_at=p.processed_at,
+                reference=p.external_ref,
+                terminal_id=payload.terminal_id,
             )
             session.add(pay)
 
         await session.commit()
+        # Server defaults, then both collections: lazy loads can't run under asyncio
         await session.refresh(sale)
-
-        _ = sale.sale_lines
-        _ = sale.payments
+        await session.refresh(sale, ["sale_lines", "payments"])
 
         return sale
 
+    # ---------------------------------------------------------
+    # CREATE SALE FROM CART — totals are already priced
+    # ---------------------------------------------------------
+    async def create_from_cart(
+        self,
+        session: AsyncSession,
+        cart: Cart,
+        *,
+        status: str,
+        sale_date: datetime,
+        rounding_adjustment,
+        sale_number: Optional[str] = None,
+        notes: Optional[str] = None,
+    ) -> Tuple[Sale, List[SaleLine]]:
+        """
+        Write a cart as a sale: one INSERT for the sale, one for all its
+        lines. Flushes only; the caller commits.
+        """
+        grand_total = to_decimal(cart.grand_total) + rounding_adjustment
+        sale_seq, sale_number = await self._number(cart.org_id, cart.terminal_id, sale_number)
+
+        sale = await self.create_returning(session, {
+            "org_id": cart.org_id,
+            "terminal_id": cart.terminal_id,
+            "customer_id": cart.customer_id,
+            "sale_number": sale_number,
+            "sale_seq": sale_seq,
+            "status": status,
+            "sale_type": "pos",
+            "subtotal": to_decimal(cart.subtotal),
+            "tax_total": to_decimal(cart.tax_total),
+            "discount_total": to_decimal(cart.discount_total),
+            "rounding_adjustment": rounding_adjustment,
+            "grand_total": grand_total,
+            "amount_paid": 0,
+            "balance_due": grand_total,
+            "sale_date": sale_date,
+            "notes": notes if notes is not None else cart.notes,
+            "created_by": cart.created_by,
+        })
+
+        lines = await sale_line_service.create_many(session, [
+            {
+                "sale_id": sale.sale_id,
+                "org_id": cart.org_id,
+                "item_id": line.item_id,
+                "line_number": position,
+                "description": line.description,
+                "tax_id": line.tax_id,
+                "tax_group_id": line.tax_group_id,
+                **line.result.columns(),
+            }
+            # Cart line numbers have gaps where lines were removed
+            for position, line in enumerate(cart.lines.values(), start=1)
+        ])
+
+        return sale, lines
+
     # ---------------------------------------------------------
     # UPDATE SALE (PATCH + RECALC)
     # ---------------------------------------------------------
@@ -153,72 +222,74 @@ class SalesService(BaseRepository[Sale]):
         payload,
         *,
         org_id: UUID,
+        if_match: Optional[int] = None,
     ) -> Optional[Sale]:
-
-        existing_sale = await self.get_with_relations(session, sale_id)
-        if not existing_sale or existing_sale.status == "archived":
-            return None
-
-        full_payload = payload.to_recalculate_payload(existing_sale)
-        calc = await checkout_service.calculate(session, full_payload)
-
-        # Top-level updates
-        existing_sale.terminal_id = full_payload.terminal_id
-        existing_sale.customer_id = full_payload.customer_id
-        existing_sale.status      = full_payload.status
-        existing_sale.sale_type   = full_payload.sale_type
-        existing_sale.sale_date   = full_payload.sale_date
-        existing_sale.notes       = full_payload.notes
-
-        # Totals
-        existing_sale.subtotal       = calc["subtotal"]
-        existing_sale.tax_total      = calc["tax_total"]
-        existing_sale.discount_total = calc["discount_total"]
-        existing_sale.grand_total    = calc["grand_total"]
-        existing_sale.amount_paid    = calc["amount_paid"]
-        existing_sale.balance_due    = calc["balance_due"]
-
-        # Replace sale lines
-        for line in list(existing_sale.sale_lines):
-            await session.delete(line)
-
-        for raw, eng in zip(full_payload.lines, calc["lines"]):
-            session.add(SaleLine(
-                sale_id=existing_sale.sale_id,
-                org_id=org_id,
-                item_id=raw.item_id,
-                line_number=raw.line_number,
-                description=raw.description,
-                quantity=eng["quantity"],
-                unit_price=eng["unit_price"],
-                discount_amount=eng["discount_amount"],
-                tax_id=raw.tax_id,
-                tax_amount=eng["tax_amount"],
-                line_total=eng["line_total"],
-            ))
-
-        # Replace payments
-        for p in list(existing_sale.payments):
-            await session.delete(p)
-
-        for p in full_payload.payments:
-            session.add(Payment(
-                sale_id=existing_sale.sale_id,
-                org_id=org_id,
-                payment_method=p.payment_method,
-                amount=p.amount,
-                currency=p.currency,
-                external_ref=p.external_ref,
-                processed_at=p.processed_at,
-            ))
-
-        await session.commit()
-        await session.refresh(existing_sale)
-
-        _ = existing_sale.sale_lines
-        _ = existing_sale.payments
-
-        return existing_sale
+        """
+        Recalculate and save the sale. The write is conditional on the
+        version read (and on `if_match`, when given); a lost race re-reads
+        and recalculates, up to settings.occ_max_retries times.
+        """
+
+        async def attempt() -> Optional[Sale]:
+            existing_sale = await self.get_with_relations(session, sale_id)
+            if not existing_sale or existing_sale.org_id != org_id:
+                return None
+            check_version(existing_sale, if_match)
+
+            full_payload = payload.to_recalculate_payload(existing_sale)
+            calc = await checkout_service.calculate(session, full_payload, org_id=org_id)
+
+            # Top-level updates
+            existing_sale.terminal_id = full_payload.terminal_id
+            existing_sale.customer_id = full_payload.customer_id
+            existing_sale.status      = full_payload.status
+            existing_sale.sale_type   = full_payload.sale_type
+            existing_sale.sale_date   = full_payload.sale_date
+            existing_sale.notes       = full_payload.notes
+            # Always UPDATE the header, so replacing only lines still bumps the version
+            existing_sale.updated_at  = func.now()
+
+            # Totals
+            for column, value in calc.totals().items():
+                setattr(existing_sale, column, value)
+
+            # Replace sale lines (DELETEs flushed first: line numbers are unique per sale)
+            for line in list(existing_sale.sale_lines):
+                await session.delete(line)
+            await session.flush()
+
+            for raw, eng in zip(full_payload.lines, calc.lines):
+                session.add(SaleLine(
+                    sale_id=existing_sale.sale_id,
+                    org_id=org_id,
+                    item_id=raw.item_id,
+                    line_number=raw.line_number,
+                    description=raw.description,
+                    tax_id=raw.tax_id,
+                    tax_group_id=raw.tax_group_id,
+                    **eng.columns(),
+                ))
+
+            # Replace payments
+            for p in list(existing_sale.payments):
+                await session.delete(p)
+
+            for p in full_payload.payments:
+                session.add(Payment(
+                    sale_id=existing_sale.sale_id,
+                    org_id=org_id,
+                    payment_method=p.payment_method,
+                    amount=p.amount,
+                    reference=p.external_ref,
+                    terminal_id=full_payload.terminal_id,
+                ))
+
+            await session.commit()
+            await session.refresh(existing_sale, ["version", "updated_at", "sale_lines", "payments"])
+
+            return existing_sale
+
+        return await with_retries(session, attempt)
 
     # ---------------------------------------------------------
     # ARCHIVE SALE
@@ -231,15 +302,18 @@ class SalesService(BaseRepository[Sale]):
         org_id: UUID,
     ) -> Optional[Sale]:
 
-        sale = await self.get_with_relations(session, sale_id)
-        if not sale or sale.org_id != org_id:
-            return None
+        async def attempt() -> Optional[Sale]:
+            sale = await self.get_with_relations(session, sale_id)
+            if not sale or sale.org_id != org_id:
+                return None
 
-        sale.status = "archived"
+            sale.status = "archived"
 
-        await session.commit()
-        await session.refresh(sale)
-        return sale
+            await session.commit()
+            await session.refresh(sale)
+            return sale
+
+        return await with_retries(session, attempt)
 
 
 sales_service = SalesService()
@@ -0,0 +1,217 @@
+# backend/src/app/pos/services/tax_group_service.py
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core.base_repository import BaseRepository
+from src.app.core.invalidation import Invalidation, invalidation_bus
+from src.app.pos.models.tax_group_models import TaxGroup, TaxGroupRate
+from src.app.pos.models.tax_rate_models import TaxRate
+from src.app.pos.schemas.pos_schemas import TaxGroupRead
+from src.app.pos.services.compiled_tax import CompiledTax, compile_rates
+
+
+TAX_GROUPS_RESOURCE = "pos.tax_groups"
+
+
+# ---------------------------------------------------------
+# Compiled group cache (per worker, keyed by org + group)
+# ---------------------------------------------------------
+_compiled: Dict[Tuple[UUID, UUID], CompiledTax] = {}
+_generation = 0   # bumped on every invalidation
+
+
+def _invalidate(message: Invalidation) -> None:
+    global _generation
+    _generation += 1
+    if message.org_id is None:
+        _compiled.clear()
+        return
+
+    group_ids = {UUID(i) for i in message.ids}
+    for key in [k for k in _compiled if k[0] == message.org_id]:
+        if not group_ids or key[1] in group_ids:
+            del _compiled[key]
+
+
+invalidation_bus.subscribe(TAX_GROUPS_RESOURCE, _invalidate)
+
+
+class TaxGroupService(BaseRepository[TaxGroup]):
+    def __init__(self) -> None:
+        super().__init__(TaxGroup)
+
+    # ---------------------------------------------------------
+    # READS
+    # ---------------------------------------------------------
+    async def get_by_org(
+        self,
+        session: AsyncSession,
+        org_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[TaxGroup]:
+        stmt = (
+            select(TaxGroup)
+            .where(TaxGroup.org_id == org_id)
+            .order_by(TaxGroup.name.asc())
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_by_id(
+        self,
+        session: AsyncSession,
+        tax_group_id: UUID,
+    ) -> Optional[TaxGroup]:
+        stmt = select(TaxGroup).where(TaxGroup.tax_group_id == tax_group_id)
+        result = await session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    # ---------------------------------------------------------
+    # COMPILED MULTIPLIERS (cached)
+    # ---------------------------------------------------------
+    async def compiled(
+        self,
+        session: AsyncSession,
+        org_id: UUID,
+        tax_group_ids: Iterable[UUID],
+    ) -> Dict[UUID, CompiledTax]:
+        """
+        Compiled multiplier for each of the org's groups in `tax_group_ids`,
+        keyed by tax_group_id. Misses are loaded with one query; ids that
+        are not the org's groups are left out.
+        """
+        listening = invalidation_bus.listening
+        found: Dict[UUID, CompiledTax] = {}
+        missing: List[UUID] = []
+
+        for group_id in set(tax_group_ids):
+            hit = _compiled.get((org_id, group_id)) if listening else None
+            if hit is None:
+                missing.append(group_id)
+            else:
+                found[group_id] = hit
+
+        if not missing:
+            return found
+
+        generation = _generation
+        stmt = (
+            select(
+                TaxGroupRate.tax_group_id,
+                TaxRate.tax_id,
+                TaxRate.rate_percent,
+                TaxRate.is_compound,
+            )
+            .join(TaxGroup, TaxGroup.tax_group_id == TaxGroupRate.tax_group_id)
+            .join(TaxRate, TaxRate.tax_id == TaxGroupRate.tax_id)
+            .where(TaxGroup.org_id == org_id, TaxGroupRate.tax_group_id.in_(missing))
+            .order_by(TaxGroupRate.tax_group_id, TaxGroupRate.sequence)
+        )
+        result = await session.execute(stmt)
+
+        stacks = defaultdict(list)
+        for group_id, tax_id, rate_percent, is_compound in result.all():
+            stacks[group_id].append((tax_id, rate_percent, is_compound))
+
+        # A change that landed mid-read may have made these stale; use, don't cache
+        cache = listening and generation == _generation
+        for group_id, stack in stacks.items():
+            compiled = compile_rates(stack)
+            found[group_id] = compiled
+            if cache:
+                _compiled[(org_id, group_id)] = compiled
+
+        return found
+
+    # ---------------------------------------------------------
+    # WRITES
+    # ---------------------------------------------------------
+    async def _check_rates(
+        self,
+        session: AsyncSession,
+        org_id: UUID,
+        tax_ids: Sequence[UUID],
+    ) -> None:
+        if len(set(tax_ids)) != len(tax_ids):
+            raise ValueError("A tax rate can appear only once in a group")
+
+        stmt = select(func.count()).where(TaxRate.org_id == org_id, TaxRate.tax_id.in_(tax_ids))
+        if await session.scalar(stmt) != len(tax_ids):
+            raise ValueError("Unknown tax rate in tax_ids")
+
+    async def create_group(
+        self,
+        session: AsyncSession,
+        org_id: UUID,
+        name: str,
+        tax_ids: Sequence[UUID],
+    ) -> TaxGroup:
+        await self._check_rates(session, org_id, tax_ids)
+
+        group = TaxGroup(
+            org_id=org_id,
+            name=name,
+            rates=[TaxGroupRate(sequence=i, tax_id=tax_id) for i, tax_id in enumerate(tax_ids)],
+        )
+        session.add(group)
+        await session.flush()
+        await session.refresh(group)
+        return group
+
+    async def update_group(
+        self,
+        session: AsyncSession,
+        group: TaxGroup,
+        name: Optional[str] = None,
+        tax_ids: Optional[Sequence[UUID]] = None,
+    ) -> TaxGroup:
+        if name is not None:
+            group.name = name
+
+        if tax_ids is not None:
+            await self._check_rates(session, group.org_id, tax_ids)
+            group.rates.clear()
+            await session.flush()  # old positions must go before new ones reuse them
+            group.rates.extend(
+                TaxGroupRate(sequence=i, tax_id=tax_id) for i, tax_id in enumerate(tax_ids)
+            )
+
+        group.updated_at = func.now()
+        await session.flush()
+        await session.refresh(group)
+
+        await invalidation_bus.publish(session, TAX_GROUPS_RESOURCE, group.org_id, ids=[group.tax_group_id])
+        return group
+
+    async def delete_group(self, session: AsyncSession, group: TaxGroup) -> None:
+        await session.delete(group)
+        await session.flush()
+        await invalidation_bus.publish(session, TAX_GROUPS_RESOURCE, group.org_id, ids=[group.tax_group_id])
+
+    # ---------------------------------------------------------
+    # READ MODEL
+    # ---------------------------------------------------------
+    @staticmethod
+    def to_read(group: TaxGroup, compiled: Optional[CompiledTax]) -> TaxGroupRead:
+        return TaxGroupRead(
+            tax_group_id=group.tax_group_id,
+            org_id=group.org_id,
+            name=group.name,
+            tax_ids=[rate.tax_id for rate in group.rates],
+            effective_rate_percent=compiled.rate_percent if compiled else 0,
+            created_at=group.created_at,
+            updated_at=group.updated_at,
+        )
+
+
+tax_group_service = TaxGroupService()
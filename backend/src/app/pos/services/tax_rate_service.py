@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import select
@@ -6,6 +6,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.pos.models.tax_rate_models import TaxRate
 from src.app.core.base_repository import BaseRepository
+from src.app.core.invalidation import invalidation_bus
+from src.app.pos.services.tax_group_service import TAX_GROUPS_RESOURCE
 
 
 class TaxRateService(BaseRepository[TaxRate]):
@@ -18,16 +20,17 @@ class TaxRateService(BaseRepository[TaxRate]):
         org_id: UUID,
         limit: int = 100,
         offset: int = 0,
+        fields: Optional[Sequence[str]] = None,
     ) -> List[TaxRate]:
         stmt = (
-            select(TaxRate)
+            self._select(fields)
             .where(TaxRate.org_id == org_id)
             .order_by(TaxRate.name.asc())
             .limit(limit)
             .offset(offset)
         )
         result = await session.execute(stmt)
-        return result.scalars().all()
+        return self._rows(result, fields)
 
     async def get_by_id(
         self,
@@ -38,5 +41,32 @@ class TaxRateService(BaseRepository[TaxRate]):
         result = await session.execute(stmt)
         return result.scalar_one_or_none()
 
+    # ---------------------------------------------------------
+    # WRITES (compiled tax groups embed rates, so drop the org's)
+    # ---------------------------------------------------------
+    async def update_tax_rate(
+        self,
+        session: AsyncSession,
+        tax_rate: TaxRate,
+        values: Dict[str, Any],
+    ) -> TaxRate:
+        for field, value in values.items():
+            setattr(tax_rate, field, value)
+
+        await session.flush()
+        await invalidation_bus.publish(session, TAX_GROUPS_RESOURCE, tax_rate.org_id)
+        return tax_rate
+
+    async def delete_tax_rate(
+        self,
+        session: AsyncSession,
+        tax_id: UUID,
+    ) -> Optional[TaxRate]:
+        tax_rate = await self.delete(session, tax_id)
+        if tax_rate is not None:
+            await session.flush()
+            await invalidation_bus.publish(session, TAX_GROUPS_RESOURCE, tax_rate.org_id)
+        return tax_rate
+
 
 tax_rate_service = TaxRateService()
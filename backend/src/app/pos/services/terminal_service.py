@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import select
@@ -18,16 +18,17 @@ class TerminalService(BaseRepository[Terminal]):
         org_id: UUID,
         limit: int = 100,
         offset: int = 0,
+        fields: Optional[Sequence[str]] = None,
     ) -> List[Terminal]:
         stmt = (
-            select(Terminal)
+            self._select(fields)
             .where(Terminal.org_id == org_id)
             .order_by(Terminal.created_at.desc())
             .limit(limit)
             .offset(offset)
         )
         result = await session.execute(stmt)
-        return result.scalars().all()
+        return self._rows(result, fields)
 
     async def get_by_id(
         self,
@@ -0,0 +1,12 @@
+# backend/tests/conftest.py
+"""
+Unit tests for the pure engines need no database; route tests use the one
+at DATABASE_URL_ASYNC and skip when it can't be reached. Settings still
+validate at import, so placeholder URLs stand in when the environment has
+none.
+"""
+
+import os
+
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/arcoirispos_test")
+os.environ.setdefault("DATABASE_URL_ASYNC", "postgresql+asyncpg://localhost/arcoirispos_test")
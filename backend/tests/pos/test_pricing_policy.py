@@ -0,0 +1,165 @@
+# backend/tests/pos/test_pricing_policy.py
+"""
+Cash rounding: PricingPolicy and the minor-unit checkout engine against a
+plain Decimal.quantize reference, for every increment x apply_to.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal, ROUND_HALF_UP
+from types import SimpleNamespace
+
+import pytest
+from hypothesis import given, settings, strategies as st
+
+from src.app.org.enums.models import RoundingApplyToEnum, RoundingModeEnum
+from src.app.pos.schemas.pos_schemas import PaymentCreate, SaleCreate
+from src.app.pos.services.checkout import CheckoutCalculator
+from src.app.pos.services.money import to_decimal
+from src.app.pos.services.pricing_policy import NO_ROUNDING, policy_for
+
+
+ORG_ID = uuid.UUID(int=1)
+SALE_ID = uuid.UUID(int=2)
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+PLACES = Decimal("0.0001")
+
+INCREMENTS = {
+    "nickel": Decimal("0.05"),
+    "dime": Decimal("0.10"),
+    "quarter": Decimal("0.25"),
+    "dollar": Decimal("1"),
+}
+ROUNDING_MODES = list(INCREMENTS)
+APPLY_TO = [RoundingApplyToEnum.CASH_ONLY.value, RoundingApplyToEnum.ALL_PAYMENTS.value]
+
+amounts = st.decimals(min_value=-10000, max_value=10000, places=4, allow_nan=False, allow_infinity=False)
+tenders = st.lists(
+    st.tuples(
+        st.sampled_from(["cash", "Cash ", "card", "gift_card"]),
+        st.decimals(min_value=0, max_value=5000, places=2, allow_nan=False, allow_infinity=False),
+    ),
+    max_size=4,
+)
+
+
+def _policy(mode: str, apply_to: str):
+    return policy_for(SimpleNamespace(rounding_mode=mode, rounding_apply_to=apply_to))
+
+
+def _payments(tendered):
+    return [
+        PaymentCreate(
+            org_id=ORG_ID, sale_id=SALE_ID, payment_method=method, amount=amount, processed_at=NOW
+        )
+        for method, amount in tendered
+    ]
+
+
+def reference_adjustment(total: Decimal, tendered, mode: str, apply_to: str) -> Decimal:
+    """Round the amount due in cash to the increment, ties away from zero."""
+    increment = INCREMENTS[mode]
+    due = total
+    if apply_to == RoundingApplyToEnum.CASH_ONLY.value:
+        if not any(method.strip().lower() == "cash" for method, _ in tendered):
+            return Decimal(0)
+        due = total - sum((amount for method, amount in tendered if method.strip().lower() != "cash"), Decimal(0))
+    steps = (due / increment).quantize(Decimal(1), rounding=ROUND_HALF_UP)
+    return steps * increment - due
+
+
+# ---------------------------------------------------------
+# POLICY
+# ---------------------------------------------------------
+@pytest.mark.parametrize("mode", ROUNDING_MODES)
+@pytest.mark.parametrize("apply_to", APPLY_TO)
+@given(total=amounts, tendered=tenders)
+def test_adjustment_matches_reference(mode, apply_to, total, tendered):
+    policy = _policy(mode, apply_to)
+    assert policy.rounding_adjustment(total, _payments(tendered)) == reference_adjustment(
+        total, tendered, mode, apply_to
+    )
+
+
+@pytest.mark.parametrize("mode", ROUNDING_MODES)
+@given(total=amounts)
+def test_rounded_total_is_nearest_increment(mode, total):
+    increment = INCREMENTS[mode]
+    adjustment = _policy(mode, RoundingApplyToEnum.ALL_PAYMENTS.value).rounding_adjustment(total, ())
+
+    assert (total + adjustment) % increment == 0
+    assert abs(adjustment) * 2 <= increment
+    if abs(adjustment) * 2 == increment:
+        # A tie goes away from zero, for refunds as for sales
+        assert (adjustment > 0) == (total > 0)
+
+
+@pytest.mark.parametrize("mode", ROUNDING_MODES)
+@given(total=amounts, tendered=tenders)
+def test_cash_only_leaves_cashless_sales_alone(mode, total, tendered):
+    cashless = [(method, amount) for method, amount in tendered if method.strip().lower() != "cash"]
+    policy = _policy(mode, RoundingApplyToEnum.CASH_ONLY.value)
+    assert policy.rounding_adjustment(total, _payments(cashless)) == 0
+
+
+@pytest.mark.parametrize("mode", [m.value for m in RoundingModeEnum])
+@given(total=amounts, tendered=tenders)
+def test_no_rounding_policies(mode, total, tendered):
+    payments = _payments(tendered)
+    assert _policy(mode, RoundingApplyToEnum.NONE.value).rounding_adjustment(total, payments) == 0
+    assert _policy(RoundingModeEnum.NONE.value, RoundingApplyToEnum.ALL_PAYMENTS.value).rounding_adjustment(
+        total, payments
+    ) == 0
+    assert NO_ROUNDING.rounding_adjustment(total, payments) == 0
+
+
+# ---------------------------------------------------------
+# ENGINE (int minor units)
+# ---------------------------------------------------------
+lines = st.lists(
+    st.tuples(
+        st.decimals(min_value="0.001", max_value=50, places=3, allow_nan=False, allow_infinity=False),
+        st.decimals(min_value=0, max_value=999, places=4, allow_nan=False, allow_infinity=False),
+    ),
+    min_size=1,
+    max_size=5,
+)
+
+
+@settings(max_examples=200)
+@given(
+    mode=st.sampled_from(ROUNDING_MODES),
+    apply_to=st.sampled_from(APPLY_TO),
+    priced=lines,
+    tendered=tenders,
+)
+def test_engine_totals_match_reference(mode, apply_to, priced, tendered):
+    items = [
+        SimpleNamespace(item_id=uuid.UUID(int=100 + i), default_price=Decimal(0), tax_id=None, tax_group_id=None)
+        for i in range(len(priced))
+    ]
+    sale = SaleCreate(
+        org_id=ORG_ID,
+        status="completed",
+        sale_date=NOW,
+        lines=[
+            {
+                "org_id": ORG_ID,
+                "item_id": item.item_id,
+                "line_number": n,
+                "quantity": quantity,
+                "unit_price": price,
+                "line_total": 0,
+            }
+            for n, (item, (quantity, price)) in enumerate(zip(items, priced), start=1)
+        ],
+        payments=_payments(tendered),
+    )
+
+    result = CheckoutCalculator().calculate_sale(sale, items, [], policy=_policy(mode, apply_to))
+
+    total = sum(((q * p).quantize(PLACES, rounding=ROUND_HALF_UP) for q, p in priced), Decimal(0))
+    adjustment = reference_adjustment(total, tendered, mode, apply_to)
+    assert to_decimal(result.subtotal) == total
+    assert to_decimal(result.rounding_adjustment) == adjustment
+    assert to_decimal(result.grand_total) == total + adjustment
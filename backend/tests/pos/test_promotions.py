@@ -0,0 +1,103 @@
+# backend/tests/pos/test_promotions.py
+"""
+Promotion windows are timestamptz; a sale_date sent without an offset is
+taken as UTC rather than failing the comparison.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from src.app.pos.schemas.pos_schemas import SaleCreate
+from src.app.pos.services.checkout import CheckoutCalculator
+from src.app.pos.services.money import to_decimal
+from src.app.pos.services.pricing_executor import _price_chunk
+from src.app.pos.services.pricing_policy import NO_ROUNDING
+from src.app.pos.services.promotions import PERCENT_OFF, CompiledPromotion, PromotionIndex
+
+
+ORG_ID = uuid.UUID(int=1)
+ITEM_ID = uuid.UUID(int=100)
+
+STARTS = datetime(2026, 10, 1, tzinfo=timezone.utc)
+ENDS = datetime(2026, 11, 1, tzinfo=timezone.utc)
+
+PROMO = CompiledPromotion(
+    promotion_id=uuid.UUID(int=200),
+    kind=PERCENT_OFF,
+    fraction_off=Decimal("0.10"),
+    starts_at=STARTS,
+    ends_at=ENDS,
+)
+
+INSIDE = datetime(2026, 10, 19, 12, 0)            # naive
+BEFORE = datetime(2026, 9, 30, 23, 59)            # naive
+AT_END = datetime(2026, 11, 1, 0, 0)              # naive, == ends_at in UTC
+
+
+@pytest.mark.parametrize("at, active", [(INSIDE, True), (BEFORE, False), (AT_END, False)])
+def test_active_at_accepts_naive_datetimes(at, active):
+    assert PROMO.active_at(at) is active
+    assert PROMO.active_at(at.replace(tzinfo=timezone.utc)) is active
+
+
+def test_from_row_normalizes_naive_window():
+    row = SimpleNamespace(
+        promotion_id=uuid.UUID(int=201),
+        kind=PERCENT_OFF,
+        priority=0,
+        percent_off=Decimal("10"),
+        buy_quantity=None,
+        get_quantity=None,
+        bundle_quantity=None,
+        bundle_price=None,
+        starts_at=STARTS.replace(tzinfo=None),
+        ends_at=None,
+    )
+    promo = CompiledPromotion.from_row(row)
+    assert promo.starts_at == STARTS
+    assert promo.active_at(INSIDE.replace(tzinfo=timezone.utc))
+
+
+@pytest.mark.parametrize("sale_date, discount", [(INSIDE, Decimal("1.0000")), (BEFORE, Decimal("0"))])
+def test_calculate_sale_with_naive_sale_date(sale_date, discount):
+    item = SimpleNamespace(item_id=ITEM_ID, default_price=Decimal("10"), tax_id=None, tax_group_id=None)
+    sale = SaleCreate(
+        org_id=ORG_ID,
+        status="completed",
+        sale_date=sale_date,
+        lines=[{
+            "org_id": ORG_ID,
+            "item_id": ITEM_ID,
+            "line_number": 1,
+            "quantity": 1,
+            "unit_price": "10",
+            "line_total": 0,
+        }],
+    )
+    index = PromotionIndex([(PROMO, [ITEM_ID])])
+
+    result = CheckoutCalculator().calculate_sale(sale, [item], [], promotions=index)
+
+    assert sale.sale_date.tzinfo is None
+    assert to_decimal(result.discount_total) == discount
+
+
+def test_pool_worker_with_naive_sale_date():
+    catalog = (
+        [(ITEM_ID.int, "10", None, None)],
+        [],
+        [],
+        NO_ROUNDING,
+        [(PROMO, [ITEM_ID.int])],
+    )
+    line = (ITEM_ID.int, ORG_ID.int, "1", "10", None, None, None)
+
+    (result,) = _price_chunk(catalog, [(INSIDE, [], [line])])
+
+    assert not isinstance(result, str)
+    discount_total = result[3]
+    assert to_decimal(discount_total) == Decimal("1.0000")
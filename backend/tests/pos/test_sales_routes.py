@@ -0,0 +1,111 @@
+# backend/tests/pos/test_sales_routes.py
+"""
+POST /sales/ against a live database (skipped when there is none): the
+sale comes back with its lines and payments, and is written exactly once.
+"""
+
+import asyncio
+import uuid
+from decimal import Decimal
+
+import httpx
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from src.app.auth.services.dependencies import require_any_staff_org
+from src.app.auth.services.org_context import get_current_org
+from src.app.core.database import AsyncSessionLocal, engine
+from src.app.inventory.models.item_models import Item
+from src.app.main import app
+from src.app.org.models.organization_models import Organization
+
+
+# Children first; the org's rows are all this test's own
+_CLEANUP = [
+    "DELETE FROM pos.payments WHERE org_id = :org_id",
+    "DELETE FROM pos.sale_lines WHERE org_id = :org_id",
+    "DELETE FROM pos.sales WHERE org_id = :org_id",
+    "DELETE FROM pos.sale_number_leases WHERE org_id = :org_id",
+    "DELETE FROM pos.sale_number_counters WHERE org_id = :org_id",
+    "DELETE FROM inv.items WHERE org_id = :org_id",
+    "DELETE FROM core.organization_settings WHERE org_id = :org_id",
+    "DELETE FROM core.organizations WHERE org_id = :org_id",
+]
+
+
+async def _post_sale():
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    except (OSError, DBAPIError):
+        await engine.dispose()
+        pytest.skip("no database")
+
+    async with AsyncSessionLocal() as session:
+        org = Organization(name="test_sales_routes")
+        session.add(org)
+        await session.flush()
+        item = Item(org_id=org.org_id, sku="TSR-1", name="Test item", item_type="product", default_price=Decimal("4.50"))
+        session.add(item)
+        await session.commit()
+        org_id, item_id = org.org_id, item.item_id
+
+    app.dependency_overrides[get_current_org] = lambda: {
+        "org_id": org_id,
+        "org": Organization(org_id=org_id, name="test_sales_routes"),
+        "role": "cashier",
+    }
+    app.dependency_overrides[require_any_staff_org] = lambda: None
+
+    body = {
+        "org_id": str(org_id),
+        "status": "completed",
+        "sale_date": "2026-10-19T10:00:00Z",
+        "lines": [{
+            "org_id": str(org_id),
+            "item_id": str(item_id),
+            "line_number": 1,
+            "quantity": "2",
+            "unit_price": "4.50",
+            "line_total": "0",
+        }],
+        "payments": [{
+            "org_id": str(org_id),
+            "sale_id": str(uuid.uuid4()),   # required by the schema, replaced on write
+            "payment_method": "cash",
+            "amount": "9.00",
+            "processed_at": "2026-10-19T10:00:00Z",
+        }],
+    }
+
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/sales/", json=body)
+        async with AsyncSessionLocal() as session:
+            sale_count = (await session.execute(
+                text("SELECT count(*) FROM pos.sales WHERE org_id = :org_id"), {"org_id": org_id},
+            )).scalar()
+    finally:
+        app.dependency_overrides.pop(get_current_org, None)
+        app.dependency_overrides.pop(require_any_staff_org, None)
+        async with AsyncSessionLocal() as session:
+            for stmt in _CLEANUP:
+                await session.execute(text(stmt), {"org_id": org_id})
+            await session.commit()
+        await engine.dispose()
+
+    return response, sale_count
+
+
+def test_create_sale_returns_lines_and_payments():
+    response, sale_count = asyncio.run(_post_sale())
+
+    assert response.status_code == 201, response.text
+    sale = response.json()
+    assert Decimal(sale["subtotal"]) == Decimal("9.00")
+    assert [Decimal(line["quantity"]) for line in sale["lines"]] == [Decimal("2")]
+    assert [Decimal(p["amount"]) for p in sale["payments"]] == [Decimal("9.00")]
+    assert Decimal(sale["balance_due"]) == 0
+    assert sale_count == 1